@@ -8,9 +8,10 @@ File Access API Endpoints
 """
 import logging
 import uuid
-from typing import Optional
+from email.utils import formatdate
+from typing import Dict, Optional
 from fastapi import APIRouter, Depends, Request, Response
-from fastapi.responses import RedirectResponse
+from fastapi.responses import RedirectResponse, StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from backend.core.config import settings
@@ -25,17 +26,20 @@ from backend.core.database.session import get_db_readonly
 from backend.core.auth.dependencies import get_optional_user_object
 from backend.core.dependencies import (
     get_storage_service,
-    get_cache_service,
     get_tts_service,
 )
 from backend.core.services.file_access import FileAccessService
 from backend.core.services.file_cache import FileCacheService
 from backend.features.auth.models import User
-from backend.infrastructure.storage.base import AbstractStorageService
-from backend.core.cache.service import CacheService
+from backend.infrastructure.storage.base import AbstractStorageService, FileStat
+from backend.core.cache.media import MediaCache, get_media_cache
 from backend.features.tts.service import TTSService
+from backend.features.tts.word_store import WordAudioEntry, WordAudioIndex, get_word_audio_index
 from backend.api.v1.endpoints.files_helper import (
+    extract_book_id_from_path,
     get_cdn_url_with_permission,
+    parse_range_header,
+    RangeNotSatisfiable,
 )
 
 logger = logging.getLogger(__name__)
@@ -114,6 +118,24 @@ async def extract_voice_id_from_path(path: str, db: AsyncSession) -> Optional[st
     return None
 
 
+async def resolve_word_audio(path: str, word_index: WordAudioIndex) -> Optional[WordAudioEntry]:
+    """
+    Book별 단어 오디오 경로를 책 간 공유 오디오로 해석 (Redis 조회 1회)
+
+    Args:
+        path: 파일 경로 (예: shared/books/{book_id}/words/a.mp3)
+        word_index: 단어 오디오 인덱스
+
+    Returns:
+        Optional[WordAudioEntry]: 공유 오디오 위치, 인덱스에 없으면 None
+    """
+    book_id = extract_book_id_from_path(path)
+    word = extract_word_from_path(path)
+    if not book_id or not word:
+        return None
+    return await word_index.resolve(book_id, word)
+
+
 def get_content_type(file_path: str) -> str:
     """
     파일 경로에서 Content-Type 추출
@@ -153,6 +175,40 @@ def get_filename(file_path: str) -> str:
     return file_path.split('/')[-1]
 
 
+def get_file_headers(
+    file_path: str,
+    file_stat: FileStat,
+    cache_control: str,
+    x_cache: Optional[str] = None,
+) -> Dict[str, str]:
+    """
+    파일 응답 공통 헤더 생성
+
+    Args:
+        file_path: 파일 경로
+        file_stat: 파일 메타데이터 (ETag, 수정 시각)
+        cache_control: Cache-Control 값
+        x_cache: X-Cache 값 (HIT, MISS, STREAM), None이면 생략
+
+    Returns:
+        Dict[str, str]: 응답 헤더
+    """
+    headers = {
+        "Cache-Control": cache_control,
+        "Content-Disposition": f'inline; filename="{get_filename(file_path)}"',
+        "Accept-Ranges": "bytes",
+        "Access-Control-Allow-Origin": "*",
+        "Access-Control-Expose-Headers": "Content-Length, Content-Type, Content-Range, Accept-Ranges, ETag",
+    }
+    if x_cache:
+        headers["X-Cache"] = x_cache
+    if file_stat.etag:
+        headers["ETag"] = f'"{file_stat.etag}"'
+    if file_stat.last_modified:
+        headers["Last-Modified"] = formatdate(file_stat.last_modified, usegmt=True)
+    return headers
+
+
 @router.head(
     "/files/{file_path:path}",
     summary="파일 메타데이터 확인 (HEAD 요청)",
@@ -197,26 +253,39 @@ async def head_file(
         access_service = FileAccessService(db)
         await access_service.check_file_access(file_path, current_user_id)
         
-        # 2. 파일 존재 여부 확인
-        file_exists = await storage_service.exists(file_path)
-        if not file_exists:
-            raise HTTPException(
-                status_code=404,
-                detail=f"File not found: {file_path}"
+        # 2. 파일 메타데이터 조회 (본문을 읽지 않음, 단어 오디오는 공유 오디오 기준)
+        serve_path = file_path
+        if is_word_audio_path(file_path):
+            entry = await resolve_word_audio(file_path, get_word_audio_index())
+            if entry is not None:
+                serve_path = entry.path
+
+        try:
+            file_stat = await storage_service.stat(serve_path)
+        except FileNotFoundError:
+            raise NotFoundException(
+                error_code=ErrorCode.BIZ_RESOURCE_NOT_FOUND,
+                message=f"File not found: {file_path}"
             )
-        
-        # 3. 파일 메타데이터 반환 (본문 없음)
-        return Response(
-            status_code=200,
-            headers={
-                "Content-Type": get_content_type(file_path),
-                "Accept-Ranges": "bytes",
-                "Cache-Control": "public, max-age=86400, immutable",
-                "Access-Control-Allow-Origin": "*",
-                "Access-Control-Expose-Headers": "Content-Length, Content-Type, Accept-Ranges",
-            }
+
+        # 3. 파일 메타데이터 반환 (본문 없음, Content-Length는 실제 파일 크기)
+        headers = get_file_headers(
+            file_path,
+            file_stat,
+            cache_control="private, max-age=3600, must-revalidate"
+            if current_user_id
+            else "public, max-age=86400, immutable",
         )
+        headers["Content-Type"] = get_content_type(file_path)
+        headers["Content-Length"] = str(file_stat.size)
+        return Response(status_code=200, headers=headers)
     
+    except PermissionError as e:
+        logger.warning(f"File access denied (HEAD): {file_path}, user: {current_user_id}, error: {e}")
+        raise AuthorizationException(
+            error_code=ErrorCode.authz_forbidden,
+            message=str(e)
+        )
     except NotFoundException:
         raise
     except Exception as e:
@@ -237,6 +306,7 @@ async def head_file(
         401: {"description": "인증 필요"},
         403: {"description": "접근 권한 없음"},
         404: {"description": "파일을 찾을 수 없음"},
+        416: {"description": "Range Not Satisfiable"},
     },
 )
 async def get_file(
@@ -245,25 +315,27 @@ async def get_file(
     db: AsyncSession = Depends(get_db_readonly),
     current_user: Optional[User] = Depends(get_optional_user_object),
     storage_service: AbstractStorageService = Depends(get_storage_service),
-    cache_service: CacheService = Depends(get_cache_service),
+    media_cache: MediaCache = Depends(get_media_cache),
     tts_service: TTSService = Depends(get_tts_service),
 ):
     """
     파일 접근 제어 API (하이브리드 캐싱)
     
-    - 공개 책: 인증 없이 접근 가능, Redis 캐싱 적용
+    - 공개 책: 인증 없이 접근 가능, 작은 파일은 Redis 캐싱 적용
     - 비공개 책: 인증된 소유자만 접근 가능, Redis 캐싱 안 함
+    - Range 요청: 206 Partial Content로 요청 범위만 스트리밍 (오디오/비디오 탐색)
+    - 대용량/비공개 파일: 청크 단위 스트리밍 (파일 전체를 메모리에 올리지 않음)
     
     Args:
         file_path: 파일 경로 (예: users/{user_id}/books/{book_id}/images/page_1.png)
-        request: FastAPI Request 객체 (If-None-Match 헤더 확인용)
+        request: FastAPI Request 객체 (If-None-Match / Range / If-Range 헤더 확인용)
         db: 데이터베이스 세션
         current_user: 현재 사용자 (Optional, 비인증 사용자 가능)
         storage_service: 스토리지 서비스
-        cache_service: 캐시 서비스
+        media_cache: 미디어 캐시 (메모리 LRU + Redis)
     
     Returns:
-        Response: 파일 데이터 또는 304 Not Modified
+        Response: 파일 데이터 (200/206), 304 Not Modified 또는 416 Range Not Satisfiable
     """
     # 보안: 운영 환경(R2/S3)에서는 로컬 파일 엔드포인트 접근 차단
     # Exception: Word Audio (On-demand generation 때문에 허용)
@@ -281,57 +353,40 @@ async def get_file(
         await access_service.check_file_access(file_path, current_user_id)
         
         # 2. 파일 캐싱 서비스 초기화
-        file_cache = FileCacheService(cache_service)
-
-        # 3. Redis 캐시 확인 (공개 파일만, 단어 TTS 제외)
-        # 단어 TTS는 CDN 캐싱으로 처리하므로 Redis 캐싱 불필요
-        cached_file = None
+        # 캐싱은 작은 공개 파일만 (단어 TTS는 CDN 캐싱으로 처리하므로 제외)
+        file_cache = FileCacheService(media_cache)
         is_word_audio = is_word_audio_path(file_path)
+        is_cacheable = not current_user_id and not is_word_audio
+        cache_control = (
+            "private, max-age=3600, must-revalidate"
+            if current_user_id
+            else "public, max-age=86400, immutable"
+        )
 
-        if not current_user_id and not is_word_audio:  # 공개 파일만 Redis 캐싱 (단어 TTS 제외)
-            cached_file = await file_cache.get_file(file_path)
-
-            if cached_file:
-                # ETag 생성
-                etag = file_cache.get_etag(cached_file)
-
-                # 304 Not Modified 확인
-                if_none_match = request.headers.get("If-None-Match")
-                if if_none_match and if_none_match.strip('"') == etag:
-                    return Response(
-                        status_code=304,
-                        headers={
-                            "ETag": f'"{etag}"',
-                            "Cache-Control": "public, max-age=86400, immutable",
-                            "X-Cache": "HIT",
-                        }
-                    )
+        # 304 판단은 항상 stat() ETag 기준 (같은 경로에 다시 저장된 파일에 캐시된 ETag로 304를 주지 않음)
+        if_none_match = request.headers.get("If-None-Match")
 
-                # 캐시된 파일 반환
-                return Response(
-                    content=cached_file,
-                    media_type=get_content_type(file_path),
-                    headers={
-                        "X-Cache": "HIT",
-                        "ETag": f'"{etag}"',
-                        "Cache-Control": "public, max-age=86400, immutable",
-                        "Content-Disposition": f'inline; filename="{get_filename(file_path)}"',
-                        "Accept-Ranges": "bytes",
-                        "Access-Control-Allow-Origin": "*",
-                        "Access-Control-Expose-Headers": "Content-Length, Content-Type, Accept-Ranges, ETag",
-                    }
-                )
-        
-        # 4. 스토리지에서 파일 읽기
+        # 단어 오디오: Book별 인덱스로 책 간 공유 오디오 조회 (Redis 1회, exists() 없음)
+        serve_path = file_path
+        if is_word_audio:
+            entry = await resolve_word_audio(file_path, tts_service.word_index)
+            if entry is not None:
+                if settings.storage_provider != "local":
+                    cdn_url = await get_cdn_url_with_permission(entry.path, db, storage_service)
+                    return RedirectResponse(url=cdn_url, status_code=307)
+                serve_path = entry.path
+
+        # 3. 파일 메타데이터 조회 (본문은 읽지 않음)
         try:
             # Smart Redirect: R2 사용 시 파일이 존재하면 바로 CDN으로 리다이렉트 (Zero Egress)
-            if settings.storage_provider != "local" and await storage_service.exists(file_path):
+            if settings.storage_provider != "local" and await storage_service.exists(serve_path):
                 # 모든 파일 (단어 TTS 포함) CDN 리다이렉트
                 # DB 조회 후 올바른 CDN URL 생성 (공개/비공개 구분)
-                cdn_url = await get_cdn_url_with_permission(file_path, db, storage_service)
+                cdn_url = await get_cdn_url_with_permission(serve_path, db, storage_service)
                 return RedirectResponse(url=cdn_url, status_code=307)
 
-            file_data = await storage_service.get(file_path)
+            # 단어 오디오는 인덱스로 해석한 공유 오디오 기준 (Range / 스트리밍 적용)
+            file_stat = await storage_service.stat(serve_path)
         except FileNotFoundError:
             # 단어 오디오 파일이면 자동 생성 시도
             if is_word_audio_path(file_path):
@@ -354,11 +409,12 @@ async def get_file(
                         # voice_id가 없으면 기본값 사용
                         voice_id = None
 
-                    # TTS 생성 및 저장 (Redis lock으로 중복 방지)
-                    file_data = await tts_service.generate_and_save_word_audio(
+                    # 전역 단어 저장소 조회 / TTS 생성 (Redis lock으로 중복 방지, Book 인덱스 연결)
+                    entry, file_data = await tts_service.get_or_create_word_audio(
                         word=word,
-                        file_path=file_path,
-                        voice_id=voice_id
+                        voice_id=voice_id,
+                        book_id=extract_book_id_from_path(file_path),
+                        load=settings.storage_provider == "local",
                     )
 
                     logger.info(f"Successfully generated word audio on-demand: {file_path}, word={word}")
@@ -370,17 +426,12 @@ async def get_file(
 
                     if settings.storage_provider != "local":
                         # R2/S3 환경: CDN 리다이렉트
-                        cdn_url = await get_cdn_url_with_permission(file_path, db, storage_service)
+                        cdn_url = await get_cdn_url_with_permission(entry.path, db, storage_service)
                         logger.info(f"Word audio generated, redirecting to CDN: {cdn_url[:80]}...")
                         return RedirectResponse(url=cdn_url, status_code=307)
                     else:
                         # Local 환경: 파일 직접 반환
-                        etag = FileCacheService(cache_service).get_etag(file_data)
-                        cache_control = (
-                            "private, max-age=3600, must-revalidate"
-                            if current_user_id
-                            else "public, max-age=86400, immutable"
-                        )
+                        etag = file_cache.get_etag(file_data)
 
                         return Response(
                             content=file_data,
@@ -410,17 +461,10 @@ async def get_file(
                 message=f"File not found: {file_path}"
             )
         
-        # 5. Redis 캐시에 저장 (공개 파일만, 단어 TTS 제외)
-        # 단어 TTS는 CDN 캐싱으로 처리
-        if not current_user_id and not is_word_audio:
-            await file_cache.cache_file(file_path, file_data, ttl=86400)  # 24시간
-        
-        # 6. ETag 생성
-        etag = file_cache.get_etag(file_data)
-        
-        # 7. 304 Not Modified 확인
-        if_none_match = request.headers.get("If-None-Match")
-        if if_none_match and if_none_match.strip('"') == etag:
+        etag = file_stat.etag
+
+        # 4. 304 Not Modified 확인
+        if etag and if_none_match and if_none_match.strip('"') == etag:
             return Response(
                 status_code=304,
                 headers={
@@ -429,26 +473,68 @@ async def get_file(
                     "X-Cache": "MISS",
                 }
             )
-        
-        # 8. 응답 반환
-        cache_control = (
-            "private, max-age=3600, must-revalidate" 
-            if current_user_id 
-            else "public, max-age=86400, immutable"
-        )
-        
-        return Response(
-            content=file_data,
+
+        # 5. Range 요청 → 206 Partial Content (요청 범위만 스트리밍)
+        try:
+            byte_range = parse_range_header(request.headers.get("Range"), file_stat.size)
+        except RangeNotSatisfiable:
+            return Response(
+                status_code=416,
+                headers={
+                    "Content-Range": f"bytes */{file_stat.size}",
+                    "Accept-Ranges": "bytes",
+                }
+            )
+
+        # If-Range: 파일이 바뀌었으면 Range 무시하고 전체 응답
+        if_range = request.headers.get("If-Range")
+        if byte_range and if_range and if_range.strip('"') != etag:
+            byte_range = None
+
+        if byte_range:
+            start, end = byte_range
+            headers = get_file_headers(file_path, file_stat, cache_control, x_cache="STREAM")
+            headers["Content-Range"] = f"bytes {start}-{end}/{file_stat.size}"
+            headers["Content-Length"] = str(end - start + 1)
+            return StreamingResponse(
+                storage_service.stream(serve_path, start=start, end=end),
+                status_code=206,
+                media_type=get_content_type(file_path),
+                headers=headers,
+            )
+
+        # 6. 작은 공개 파일: 미디어 캐시 (단어 TTS 제외)
+        if is_cacheable and file_stat.size <= settings.file_cache_max_size:
+            cached = await file_cache.get_file(file_path)
+
+            if cached is not None and cached.etag == etag:
+                file_data = cached.data
+                x_cache = "HIT"
+            else:
+                # 캐시 미스 또는 파일 변경 (ETag 불일치)
+                file_data = await storage_service.get(file_path)
+                await file_cache.cache_file(
+                    file_path,
+                    file_data,
+                    etag=etag,
+                    content_type=get_content_type(file_path),
+                    ttl=86400,  # 24시간
+                )
+                x_cache = "MISS"
+
+            return Response(
+                content=file_data,
+                media_type=get_content_type(file_path),
+                headers=get_file_headers(file_path, file_stat, cache_control, x_cache=x_cache),
+            )
+
+        # 7. 그 외 (비공개 / 대용량 파일): 청크 단위 스트리밍 (메모리에 전체를 올리지 않음)
+        headers = get_file_headers(file_path, file_stat, cache_control, x_cache="STREAM")
+        headers["Content-Length"] = str(file_stat.size)
+        return StreamingResponse(
+            storage_service.stream(serve_path),
             media_type=get_content_type(file_path),
-            headers={
-                "X-Cache": "MISS",
-                "ETag": f'"{etag}"',
-                "Cache-Control": cache_control,
-                "Content-Disposition": f'inline; filename="{get_filename(file_path)}"',
-                "Accept-Ranges": "bytes",
-                "Access-Control-Allow-Origin": "*",
-                "Access-Control-Expose-Headers": "Content-Length, Content-Type, Accept-Ranges, ETag",
-            }
+            headers=headers,
         )
     
     except PermissionError as e:
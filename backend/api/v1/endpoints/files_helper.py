@@ -4,7 +4,7 @@ File Access Helper Functions
 """
 import uuid
 import logging
-from typing import Optional
+from typing import Optional, Tuple
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from backend.infrastructure.storage.base import AbstractStorageService
@@ -57,6 +57,61 @@ def get_content_type_from_path(path: str) -> str:
         return 'default'
 
 
+
+class RangeNotSatisfiable(Exception):
+    """요청한 Range가 파일 범위를 벗어남 (416)"""
+
+
+def parse_range_header(range_header: Optional[str], file_size: int) -> Optional[Tuple[int, int]]:
+    """
+    HTTP Range 헤더 파싱 (단일 byte range만 지원)
+
+    - "bytes=100-199": 100 ~ 199
+    - "bytes=100-": 100 ~ 끝
+    - "bytes=-500": 마지막 500 bytes
+    - 여러 범위("bytes=0-1,5-9") 또는 형식 오류는 무시 (전체 파일 응답, RFC 9110 허용)
+
+    Args:
+        range_header: Range 헤더 값
+        file_size: 파일 크기 (bytes)
+
+    Returns:
+        Optional[Tuple[int, int]]: (start, end) - end 포함, Range 미적용 시 None
+
+    Raises:
+        RangeNotSatisfiable: 범위가 파일 크기를 벗어난 경우
+    """
+    if not range_header:
+        return None
+
+    unit, _, spec = range_header.strip().partition("=")
+    if unit.strip().lower() != "bytes" or "," in spec:
+        return None
+
+    start_str, sep, end_str = spec.strip().partition("-")
+    if not sep:
+        return None
+
+    try:
+        if not start_str:
+            # suffix range: 마지막 N bytes
+            suffix = int(end_str)
+            if suffix <= 0 or file_size == 0:
+                raise RangeNotSatisfiable(range_header)
+            return max(file_size - suffix, 0), file_size - 1
+
+        start = int(start_str)
+        end = int(end_str) if end_str else file_size - 1
+    except ValueError:
+        return None
+
+    if start >= file_size:
+        raise RangeNotSatisfiable(range_header)
+    if end < start:
+        return None
+
+    return start, min(end, file_size - 1)
+
 async def get_cdn_url_with_permission(
     file_path: str,
     db: AsyncSession,
@@ -3,8 +3,13 @@ Metrics API Endpoints
 메트릭 조회 API
 """
 
-from fastapi import APIRouter
-from backend.core.cache.metrics import cache_metrics
+from fastapi import APIRouter, Depends
+from backend.core.cache.metrics import cache_metrics, media_cache_metrics
+from backend.core.dependencies import get_event_bus
+from backend.core.limiters import get_limiters
+from backend.core.events.redis_streams_bus import RedisStreamsEventBus
+from backend.features.tts.worker import collect_tts_metrics
+from backend.infrastructure.ai.factory import AIProviderFactory
 
 router = APIRouter()
 
@@ -30,6 +35,29 @@ async def get_cache_metrics():
     return cache_metrics.get_stats()
 
 
+@router.get("/cache/media")
+async def get_media_cache_metrics():
+    """
+    미디어 캐시 (메모리 LRU + Redis) 메트릭 조회
+
+    Returns:
+        dict: 미디어 캐시 통계 정보
+            - memory_hits: 메모리 티어 히트 횟수
+            - redis_hits: Redis 티어 히트 횟수
+            - misses: 캐시 미스 횟수
+            - hit_rate: 전체 히트율 (0.0 ~ 1.0)
+            - memory_hit_rate: 메모리 티어 히트율 (0.0 ~ 1.0)
+            - sets: 저장 횟수
+            - evictions: 메모리 티어 LRU 제거 횟수
+            - rejected: 크기 제한 초과로 캐싱하지 않은 횟수
+            - errors: 오류 횟수
+            - bytes_served: 캐시에서 응답한 총 바이트 수
+            - memory_bytes: 메모리 티어 현재 사용량 (bytes)
+            - memory_entries: 메모리 티어 현재 항목 수
+    """
+    return media_cache_metrics.get_stats()
+
+
 @router.get("/cache/{key}")
 async def get_cache_key_metrics(key: str):
     """
@@ -47,3 +75,61 @@ async def get_cache_key_metrics(key: str):
     """
     return cache_metrics.get_key_stats(key)
 
+
+
+@router.get("/http")
+async def get_http_pool_metrics():
+    """
+    AI Provider HTTP 연결 풀 메트릭 조회
+
+    Returns:
+        dict: 클라이언트 이름(runware, kling, google_ai, cdn)별 통계
+            - max_connections: 최대 연결 수
+            - http2: HTTP/2 사용 여부
+            - connections: 현재 연결 수
+            - in_use: 사용 중인 연결 수
+            - idle: 유휴(Keep-Alive) 연결 수
+            - active_requests: 처리 중인 요청 수
+            - queued_requests: 연결을 기다리는 요청 수
+            - requests: 누적 요청 수
+            - errors: 누적 오류 수
+            - avg_wait_time_ms: 평균 연결 획득 대기 시간 (밀리초)
+            - max_wait_time_ms: 최대 연결 획득 대기 시간 (밀리초)
+    """
+    return AIProviderFactory.http_clients.get_stats()
+
+
+@router.get("/tts")
+async def get_tts_worker_metrics(event_bus: RedisStreamsEventBus = Depends(get_event_bus)):
+    """
+    TTS 작업 큐 및 워커 메트릭 조회 (전용 워커 프로세스 포함)
+
+    Returns:
+        dict: TTS 큐/워커 통계
+            - stream_length: Stream에 남아 있는 전체 메시지 수
+            - pending: 전달되었지만 ACK되지 않은 메시지 수
+            - lag: 아직 전달되지 않은 메시지 수 (Redis 7 미만이면 null)
+            - queue_depth: 처리 대기 중인 메시지 수 (pending + lag)
+            - dead_letter_length: Dead-letter Stream 메시지 수
+            - in_flight: 전체 워커에서 처리 중인 메시지 수
+            - workers: 워커별 통계 (consumer, in_flight, processed, failed, reclaimed,
+              dead_lettered, avg_latency_ms, max_latency_ms, avg_queue_time_ms)
+    """
+    return await collect_tts_metrics(event_bus.redis)
+
+
+@router.get("/rate-limits")
+async def get_rate_limit_metrics():
+    """
+    외부 API Rate Limiter 메트릭 조회 (이 프로세스 기준)
+
+    Returns:
+        dict: provider:operation(runware:image, elevenlabs:tts 등)별 통계
+            - acquired: 슬롯 획득 횟수
+            - throttled: 429 감지 횟수
+            - slow: latency_target 초과 횟수
+            - fallback: Redis 장애로 로컬 제한을 사용한 횟수
+            - avg_wait_time_ms: 평균 슬롯 대기 시간 (밀리초)
+            - factor: 현재 허용량 비율 (1.0 = 정책 100%)
+    """
+    return get_limiters().get_stats()
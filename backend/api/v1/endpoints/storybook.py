@@ -1,4 +1,5 @@
-from fastapi import APIRouter, Depends, status, File, Form, UploadFile, Body
+from fastapi import APIRouter, Depends, status, File, Form, UploadFile, Body, Query, Request, Response
+from fastapi.responses import StreamingResponse
 from typing import List, Optional
 from uuid import UUID
 
@@ -17,7 +18,14 @@ from backend.features.storybook.schemas import (
     BookListResponse,
     BookSummaryResponse,
 )
-from backend.features.storybook.models import Book
+from backend.features.storybook.cache import (
+    BookResponseCache,
+    compute_etag,
+    get_book_response_cache,
+)
+from backend.features.storybook.models import Book, BookStatus
+from backend.features.storybook.progress import get_progress_notifier, stream_book_events
+from backend.core.logging import get_logger
 from backend.features.storybook.dependencies import (
     get_book_service_readonly,
     get_book_service_write,
@@ -28,6 +36,10 @@ from backend.features.storybook.exceptions import (
 )
 
 router = APIRouter()
+logger = get_logger(__name__)
+
+# 공유 책: 공개 캐시 허용, 사용 전 ETag 재검증
+SHARED_BOOK_CACHE_CONTROL = "public, no-cache"
 
 
 def convert_book_urls_to_api_format(
@@ -85,6 +97,30 @@ def convert_book_urls_to_api_format(
     return book
 
 
+def etag_response(
+    request: Request, body: bytes, etag: str, cache_control: str = "private, no-cache"
+) -> Response:
+    """
+    JSON 응답 + ETag (If-None-Match 일치 시 304)
+
+    서명 URL이 시간 버킷 동안 같으므로 본문도 데이터가 바뀌거나 버킷이 넘어가기 전까지 같습니다.
+
+    Args:
+        request: If-None-Match 헤더 확인용
+        body: 직렬화된 JSON 본문
+        etag: 본문 ETag (따옴표 포함)
+        cache_control: Cache-Control 값
+
+    Returns:
+        Response: 200 (JSON 본문) 또는 304 (본문 없음)
+    """
+    headers = {"ETag": etag, "Cache-Control": cache_control}
+
+    if request.headers.get("If-None-Match") == etag:
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    return Response(content=body, media_type="application/json", headers=headers)
+
+
 @router.post(
     "/create",
     response_model=BookResponse,
@@ -206,7 +242,7 @@ async def create_book_with_images(
             - pages: 업로드된 이미지와 스토리가 포함된 페이지 목록
 
     Raises:
-        HTTPException 400: 스토리와 이미지 개수가 일치하지 않음
+        HTTPException 400: 스토리와 이미지 개수가 일치하지 않음 / 이미지 크기 초과
         HTTPException 401: 인증 실패
         HTTPException 500: 파일 업로드 또는 처리 실패
 
@@ -214,6 +250,7 @@ async def create_book_with_images(
         - Content-Type: multipart/form-data
         - 이미지와 스토리 배열의 길이가 동일해야 함
         - 지원 이미지 형식: JPG, PNG, WEBP
+        - 이미지당 최대 크기: settings.max_upload_image_bytes
     """
 
     # 지원 언어 검증
@@ -236,16 +273,11 @@ async def create_book_with_images(
     # else:
     #     parsed_stories = stories
 
-    _images = []
-    for image in images:
-        _byte = await image.read()
-        _images.append(_byte)
-
     book = await service.create_storybook_async(
         user_id=current_user.id,
         # stories=parsed_stories,
         stories=stories,
-        images=_images,
+        images=images,  # 서비스에서 스토리지로 스트리밍 저장
         voice_id=voice_id,
         level=level,
         is_default=is_default,
@@ -266,6 +298,9 @@ async def create_book_with_images(
     },
 )
 async def list_books(
+    response: Response,
+    cursor: Optional[str] = Query(None, description="다음 페이지 커서 (이전 응답의 X-Next-Cursor 헤더)"),
+    limit: int = Query(100, ge=1, le=100, description="페이지 크기"),
     current_user: User = Depends(get_current_user),
     service: BookOrchestratorService = Depends(get_book_service_readonly),
     storage_service: AbstractStorageService = Depends(get_storage_service),
@@ -276,25 +311,30 @@ async def list_books(
     현재 로그인한 사용자가 생성한 모든 동화책을 조회합니다.
 
     Args:
+        response: 응답 객체 (다음 페이지 커서 헤더 설정용)
+        cursor: 다음 페이지 커서 (None이면 첫 페이지)
+        limit: 페이지 크기
         current_user: 인증된 사용자 정보 (JWT에서 추출)
         service: BookOrchestratorService (의존성 주입)
         storage_service: Storage Service (URL 변환용)
 
     Returns:
         List[BookSummaryResponse]: 동화책 목록 (페이지 정보 제외)
-            - 생성 시간 역순으로 정렬
+            - 생성 시간 순으로 정렬
             - 각 동화책의 기본 정보 포함 (id, title, status, created_at)
             - 페이지 정보는 상세 조회 API에서 확인 가능
+            - 다음 페이지가 있으면 X-Next-Cursor 헤더에 커서 포함
 
     Raises:
+        HTTPException 400: 잘못된 커서
         HTTPException 401: 인증 실패
     """
-    books = await service.get_books_summary(current_user.id)
+    rows, next_cursor = await service.get_books_summary(current_user.id, limit=limit, cursor=cursor)
+    if next_cursor:
+        response.headers["X-Next-Cursor"] = next_cursor
 
-    # ✅ ORM → DTO 변환 + URL 변환 (페이지 정보 제외)
-    return [
-        BookSummaryResponse.from_orm_with_urls(book, storage_service) for book in books
-    ]
+    # ✅ 조회 행 → DTO 변환 + URL 변환 (페이지 정보 제외)
+    return [BookSummaryResponse.from_row(row, storage_service) for row in rows]
 
 
 @router.get(
@@ -303,6 +343,7 @@ async def list_books(
     summary="동화책 상세 조회",
     responses={
         200: {"description": "조회 성공"},
+        304: {"description": "Not Modified (If-None-Match와 ETag 일치)"},
         401: {"description": "인증 실패 (비공개 책 접근 시)"},
         403: {"description": "권한 없음 (다른 사용자의 비공개 책)"},
         404: {"description": "동화책을 찾을 수 없음"},
@@ -310,9 +351,11 @@ async def list_books(
 )
 async def get_book(
     book_id: UUID,
+    request: Request,
     current_user: Optional[User] = Depends(get_optional_user_object),
     service: BookOrchestratorService = Depends(get_book_service_readonly),
     storage_service: AbstractStorageService = Depends(get_storage_service),
+    response_cache: BookResponseCache = Depends(get_book_response_cache),
 ):
     """
     동화책 상세 조회
@@ -320,12 +363,95 @@ async def get_book(
     특정 동화책의 전체 정보를 조회합니다.
     - 공유된 책(is_shared=True)은 누구나 조회 가능
     - 비공개 책은 소유자만 조회 가능
+    - ETag 제공: If-None-Match가 일치하면 304 (본문 없음)
+    - 생성이 끝난 공유 책은 직렬화된 응답을 캐시에서 제공 (페이지 조회/직렬화 없음)
     """
     user_id = current_user.id if current_user else None
+
+    # 권한 확인 후 캐시 제공 (공유 해제 / 삭제된 책의 캐시 응답 방지, 페이지 트리 없이 책 행만 조회)
+    await service.get_book_progress(book_id, user_id)
+    cached = await response_cache.get(book_id)
+    if cached:
+        return etag_response(request, cached.body, cached.etag, SHARED_BOOK_CACHE_CONTROL)
+
+    # 조회 시작 전 세대 (조회 중 무효화되면 저장하지 않음)
+    generation = await response_cache.generation(book_id)
     book = await service.get_book(book_id, user_id)
 
-    # ✅ ORM → DTO 변환 + URL 변환 (ORM 객체 직접 수정하지 않음)
-    return BookResponse.from_orm_with_urls(book, storage_service)
+    # ✅ 조회 프로젝션 → DTO 변환 + URL 변환 (ORM 엔티티 없음)
+    body = BookResponse.from_projection(book, storage_service).model_dump_json().encode()
+
+    if book["is_shared"] and book["status"] == BookStatus.COMPLETED:
+        entry = await response_cache.put(book_id, body, generation)
+        return etag_response(request, entry.body, entry.etag, SHARED_BOOK_CACHE_CONTROL)
+    return etag_response(request, body, compute_etag(body))
+
+
+@router.get(
+    "/books/{book_id}/events",
+    summary="동화책 생성 진행 이벤트 스트림 (SSE)",
+    responses={
+        200: {"description": "text/event-stream (snapshot → stage/page/status 이벤트)"},
+        401: {"description": "인증 실패 (비공개 책 접근 시)"},
+        403: {"description": "권한 없음 (다른 사용자의 비공개 책)"},
+        404: {"description": "동화책을 찾을 수 없음"},
+    },
+)
+async def stream_book_progress(
+    book_id: UUID,
+    request: Request,
+    current_user: Optional[User] = Depends(get_optional_user_object),
+    service: BookOrchestratorService = Depends(get_book_service_readonly),
+):
+    """
+    동화책 생성 진행 이벤트 스트림
+
+    상세 조회를 반복 호출(polling)하는 대신 연결 하나로 진행 상황을 받습니다.
+    - snapshot: 현재 상태 + 이미 완료된 페이지 이벤트
+    - stage: 단계 완료 (story, image, tts, video)
+    - page: 페이지별 완료/실패 (image N, video N, audio N)
+    - status: 생성 완료/실패 (이후 스트림 종료)
+
+    권한 규칙은 상세 조회와 같습니다.
+    """
+    user_id = current_user.id if current_user else None
+
+    # 스냅샷 조회 전에 구독 (그 사이 발행된 종료 이벤트 유실 방지), Redis 장애 시 스냅샷만 전송
+    notifier = get_progress_notifier()
+    subscription = None
+    try:
+        subscription = await notifier.subscribe(book_id)
+    except Exception as e:
+        logger.warning(f"Book progress subscription unavailable: book_id={book_id}: {e}")
+
+    try:
+        progress = await service.get_book_progress(book_id, user_id)
+    except BaseException:
+        if subscription is not None:
+            await subscription.close()
+        raise
+
+    pages = []
+    if subscription is not None:
+        try:
+            pages = await notifier.get_page_events(book_id)
+        except Exception as e:
+            logger.warning(f"Book progress page events unavailable: book_id={book_id}: {e}")
+
+    snapshot = {
+        "book_id": str(book_id),
+        "status": progress["status"],
+        "stage": progress["pipeline_stage"],
+        "progress": progress["progress_percentage"],
+        "error": progress["error_message"],
+        "pages": pages,
+    }
+
+    return StreamingResponse(
+        stream_book_events(snapshot, subscription, request.is_disconnected),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
 
 
 @router.patch(
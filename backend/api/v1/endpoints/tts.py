@@ -26,6 +26,7 @@ from backend.features.tts.schemas import (
     VoiceResponse,
     CreateVoiceCloneRequest,
     WordTTSResponse,
+    WordPrewarmProgressResponse,
 )
 from backend.features.tts.models import VoiceVisibility
 from backend.features.tts.exceptions import (
@@ -33,7 +34,9 @@ from backend.features.tts.exceptions import (
     WordInvalidException,
     BookVoiceNotConfiguredException,
 )
+from backend.features.tts.word_prewarm import WordPrewarmJobs, get_word_prewarm_jobs
 from backend.features.storybook.exceptions import StorybookNotFoundException
+from backend.features.storybook.repository import BookRepository
 from fastapi import UploadFile, File
 
 logger = logging.getLogger(__name__)
@@ -403,3 +406,72 @@ async def generate_word_tts(
             status_code=500,
             detail=f"TTS 생성 중 오류가 발생했습니다: {str(e)}"
         )
+
+
+async def _check_prewarm_access(db: AsyncSession, book_id: UUID, user: User) -> None:
+    """단어 사전 생성 접근 권한 확인 (공유된 책 또는 소유자)"""
+    book = await BookRepository(db).get(book_id)
+    if not book:
+        raise HTTPException(status_code=404, detail=f"Book을 찾을 수 없습니다: {book_id}")
+    if not book.is_shared and book.user_id != user.id:
+        raise HTTPException(status_code=403, detail="이 Book에 접근할 권한이 없습니다")
+    if not book.voice_id:
+        raise HTTPException(status_code=404, detail=f"이 Book에는 음성이 설정되지 않았습니다: {book_id}")
+
+
+@router.post(
+    "/books/{book_id}/words/prewarm",
+    response_model=WordPrewarmProgressResponse,
+    status_code=status.HTTP_202_ACCEPTED,
+    summary="Book 전체 단어 TTS 사전 생성",
+    responses={
+        202: {"description": "작업 등록 (이미 실행 중이면 현재 진행 상황)"},
+        403: {"description": "접근 권한 없음"},
+        404: {"description": "Book을 찾을 수 없거나 voice_id가 설정되지 않음"},
+    },
+)
+async def prewarm_book_words(
+    book_id: UUID,
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db_readonly),
+    jobs: WordPrewarmJobs = Depends(get_word_prewarm_jobs),
+):
+    """
+    Book 전체 대사의 단어 오디오 사전 생성 작업 등록
+
+    모든 대사 번역을 단어로 나누어 아직 저장되지 않은 단어만 백그라운드에서 생성합니다.
+    진행 상황은 GET /tts/books/{book_id}/words/prewarm 으로 조회합니다.
+    """
+    await _check_prewarm_access(db, book_id, current_user)
+    progress = await jobs.enqueue(book_id)
+    return WordPrewarmProgressResponse(**progress)
+
+
+@router.get(
+    "/books/{book_id}/words/prewarm",
+    response_model=WordPrewarmProgressResponse,
+    status_code=status.HTTP_200_OK,
+    summary="Book 단어 TTS 사전 생성 진행 상황",
+    responses={
+        200: {"description": "진행 상황"},
+        403: {"description": "접근 권한 없음"},
+        404: {"description": "Book을 찾을 수 없거나 작업 기록 없음"},
+    },
+)
+async def get_book_words_prewarm(
+    book_id: UUID,
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db_readonly),
+    jobs: WordPrewarmJobs = Depends(get_word_prewarm_jobs),
+):
+    """
+    Book 단어 사전 생성 진행 상황 조회 (등록과 같은 접근 권한: 공유된 책 또는 소유자)
+
+    Returns:
+        WordPrewarmProgressResponse: status(queued | running | completed | failed)와 단어 수
+    """
+    await _check_prewarm_access(db, book_id, current_user)
+    progress = await jobs.get_progress(book_id)
+    if progress is None:
+        raise HTTPException(status_code=404, detail=f"단어 사전 생성 기록이 없습니다: {book_id}")
+    return WordPrewarmProgressResponse(**progress)
@@ -2,7 +2,10 @@ from fastapi import APIRouter, Depends, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from backend.core.database.session import get_db_write
+from backend.core.dependencies import get_cache_service
+from backend.core.cache.service import CacheService
 from backend.core.auth.dependencies import get_current_user_object as get_current_user
+from backend.core.auth.principal import UserPrincipalCache
 from backend.core.auth.providers.credentials import CredentialsAuthProvider
 from backend.features.auth.models import User
 from backend.features.auth.repository import UserRepository
@@ -15,6 +18,7 @@ router = APIRouter()
 
 def get_user_service(
     db: AsyncSession = Depends(get_db_write),
+    cache_service: CacheService = Depends(get_cache_service),
 ) -> UserService:
     """UserService 의존성 주입"""
     user_repo = UserRepository(db)
@@ -23,6 +27,7 @@ def get_user_service(
         user_repo=user_repo,
         credentials_provider=credentials_provider,
         db_session=db,
+        principal_cache=UserPrincipalCache(cache_service),
     )
 
 
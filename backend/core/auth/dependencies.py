@@ -5,15 +5,17 @@ FastAPI Depends용 인증 의존성
 
 import hashlib
 import logging
+import uuid
 from typing import Optional
-from fastapi import Depends, HTTPException, status
+from fastapi import Depends, HTTPException, Request, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
-from sqlalchemy.ext.asyncio import AsyncSession
 
-from ..database.session import get_db_readonly
+from ..database.session import AsyncSessionLocalReadOnly
 from ..dependencies import get_cache_service
 from ..cache.service import CacheService
 from .jwt_manager import JWTManager
+from .principal import UserPrincipalCache
+from .revocation import get_access_token_revocations
 from ..exceptions import AuthenticationException, ErrorCode
 
 logger = logging.getLogger(__name__)
@@ -24,7 +26,6 @@ security = HTTPBearer()
 
 async def get_current_user(
     credentials: HTTPAuthorizationCredentials = Depends(security),
-    db: AsyncSession = Depends(get_db_readonly),
     cache_service: CacheService = Depends(get_cache_service),
 ) -> dict:
     """
@@ -32,8 +33,7 @@ async def get_current_user(
 
     Args:
         credentials: HTTP Authorization Bearer 토큰
-        db: 데이터베이스 세션
-        cache_service: Redis 캐시 서비스
+        cache_service: Redis 캐시 서비스 (폐기 목록에 있는 토큰만 조회)
 
     Returns:
         dict: 사용자 정보 (user_id, email 등)
@@ -54,9 +54,13 @@ async def get_current_user(
         )
 
     # 2. 블랙리스트 확인 (로그아웃된 토큰)
+    # 프로세스 메모리 폐기 목록에 있을 때만 Redis 확인 (대부분의 요청은 네트워크 I/O 없음)
     token_hash = hashlib.sha256(token.encode()).hexdigest()[:16]
     blacklist_key = f"blacklist:access:{token_hash}"
-    is_blacklisted = await cache_service.get(blacklist_key)
+    is_blacklisted = (
+        get_access_token_revocations().might_be_revoked(token_hash)
+        and await cache_service.get(blacklist_key)
+    )
 
     if is_blacklisted:
         logger.warning(
@@ -76,7 +80,7 @@ async def get_current_user(
             message="Invalid token payload"
         )
 
-    logger.info(
+    logger.debug(
         "✅ [AUTH] Access token validated",
         extra={"user_id": user_id}
     )
@@ -112,41 +116,72 @@ async def get_current_active_user(
 
     return current_user
 
+async def _resolve_user(
+    request: Request,
+    user_id: uuid.UUID,
+    cache_service: CacheService,
+):
+    """
+    user_id → User 객체 (요청 내 재사용 → 사용자 캐시 → DB)
+
+    캐시 히트 시 DB 세션을 열지 않습니다. 없는 사용자면 None.
+    """
+    principal = getattr(request.state, "principal", None)
+    if principal is not None and principal.id == user_id:
+        return principal
+
+    principals = UserPrincipalCache(cache_service)
+    user = await principals.get(user_id)
+    if user is None:
+        from backend.features.auth.repository import UserRepository
+
+        async with AsyncSessionLocalReadOnly() as session:
+            user = await UserRepository(session).get(user_id)
+        if user is None:
+            return None
+        await principals.put(user)
+
+    request.state.principal = user
+    return user
+
+
 async def get_current_user_object(
+    request: Request,
     current_user: dict = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db_readonly),
+    cache_service: CacheService = Depends(get_cache_service),
 ):
     """
     현재 인증된 사용자 객체(DB 모델) 반환
+
+    같은 요청의 여러 의존성은 한 번 조회한 객체를 재사용하고,
+    요청 간에는 사용자 캐시(L1 + Redis)를 사용합니다.
     """
-    from backend.features.auth.repository import UserRepository
-    import uuid
-    
-    user_repo = UserRepository(db)
     try:
         user_id = uuid.UUID(current_user["user_id"])
-        user = await user_repo.get(user_id)
-        if user is None:
-             raise AuthenticationException(
-                 error_code=ErrorCode.AUTH_INVALID_CREDENTIALS,
-                 message="User not found"
-             )
-        return user
     except ValueError:
         raise AuthenticationException(
             error_code=ErrorCode.AUTH_TOKEN_INVALID,
             message="Invalid user ID format"
         )
 
+    user = await _resolve_user(request, user_id, cache_service)
+    if user is None:
+        raise AuthenticationException(
+            error_code=ErrorCode.AUTH_INVALID_CREDENTIALS,
+            message="User not found"
+        )
+    return user
+
 
 async def get_optional_user_object(
+    request: Request,
     credentials: Optional[HTTPAuthorizationCredentials] = Depends(HTTPBearer(auto_error=False)),
-    db: AsyncSession = Depends(get_db_readonly),
+    cache_service: CacheService = Depends(get_cache_service),
 ):
     """
     선택적 사용자 객체 반환 (인증되지 않은 경우 None)
     
-    공개 파일 접근 시 사용
+    공개 파일 접근 시 사용 (책 1권 열람 시 미디어 요청마다 호출되므로 사용자 캐시 사용)
     """
     if credentials is None:
         return None
@@ -161,16 +196,11 @@ async def get_optional_user_object(
             return None
         
         # 사용자 객체 조회
-        from backend.features.auth.repository import UserRepository
-        import uuid
-        
-        user_repo = UserRepository(db)
         try:
             user_uuid = uuid.UUID(user_id)
-            user = await user_repo.get(user_uuid)
-            return user
         except ValueError:
             return None
+        return await _resolve_user(request, user_uuid, cache_service)
     except Exception:
         # 인증 실패(만료, 위조 등) 시 None 반환 (공개 파일 접근 허용)
         # TokenExpiredException, InvalidTokenException 등 모든 예외 무시
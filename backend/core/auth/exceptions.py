@@ -3,7 +3,9 @@ Core Authentication Exceptions
 핵심 인증 관련 예외
 """
 
-from ..exceptions import AuthenticationException, ErrorCode
+from fastapi import status
+
+from ..exceptions import AppException, AuthenticationException, ErrorCode
 
 
 class TokenExpiredException(AuthenticationException):
@@ -24,3 +26,15 @@ class InvalidTokenException(AuthenticationException):
             error_code=ErrorCode.AUTH_TOKEN_INVALID,
             message="유효하지 않은 토큰입니다",
         )
+
+
+class PasswordHashingBusyException(AppException):
+    """비밀번호 해싱 대기열 초과 (503)"""
+
+    def __init__(self, pending: int):
+        super().__init__(
+            error_code=ErrorCode.SYS_SERVICE_BUSY,
+            message="로그인 요청이 많아 처리할 수 없습니다. 잠시 후 다시 시도해주세요",
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            details={"pending": pending},
+        )
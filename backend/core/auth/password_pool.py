@@ -0,0 +1,121 @@
+"""
+Password Hash Pool
+비밀번호 해싱 / 검증 전용 스레드 풀 (대기열 상한 + 백프레셔)
+
+- Argon2 해싱은 호출당 수백 ms의 CPU 작업이므로 이벤트 루프가 아닌 이 풀에서 실행
+  (argon2-cffi는 해싱 중 GIL을 해제하므로 스레드 풀로 병렬 실행 가능)
+- 실행 중 + 대기 중 작업이 max_pending 이상이면 즉시 PasswordHashingBusyException (503)
+  (로그인 폭주 시 대기열이 무한히 쌓여 모든 요청이 타임아웃되는 것을 방지)
+- 대기 수는 스레드 작업이 실제로 끝날 때 감소 (요청이 취소되어도 이미 실행 중인 해싱은 슬롯 유지)
+"""
+
+import asyncio
+import functools
+import logging
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Dict, Optional, TypeVar
+
+from ..config import settings
+from .exceptions import PasswordHashingBusyException
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+class PasswordHashPool:
+    """
+    대기열 상한이 있는 비밀번호 해싱 스레드 풀
+
+    Example:
+        pool = get_password_hash_pool()
+        hashed = await pool.run(pwd_context.hash, password)
+    """
+
+    def __init__(self, max_workers: Optional[int] = None, max_pending: Optional[int] = None):
+        """
+        Args:
+            max_workers: 스레드 수 (기본값: settings.password_hash_workers)
+            max_pending: 실행 중 + 대기 중 작업 상한 (기본값: settings.password_hash_max_pending)
+        """
+        self.max_workers = max_workers or settings.password_hash_workers
+        self.max_pending = max_pending or settings.password_hash_max_pending
+        self._executor = ThreadPoolExecutor(
+            max_workers=self.max_workers,
+            thread_name_prefix="password-hash",
+        )
+        self._lock = threading.Lock()  # 대기 수는 worker 스레드의 완료 콜백에서도 갱신
+        self._pending = 0
+        self.completed = 0
+        self.rejected = 0
+
+    @property
+    def pending(self) -> int:
+        """실행 중 + 대기 중 작업 수"""
+        return self._pending
+
+    async def run(self, func: Callable[..., T], *args: Any) -> T:
+        """
+        풀에서 동기 함수 실행
+
+        Raises:
+            PasswordHashingBusyException: 대기열 상한 초과
+        """
+        with self._lock:
+            pending = self._pending
+            if pending < self.max_pending:
+                self._pending += 1
+        if pending >= self.max_pending:
+            self.rejected += 1
+            logger.warning(f"Password hashing pool saturated: pending={pending}")
+            raise PasswordHashingBusyException(pending=pending)
+
+        try:
+            future = self._executor.submit(functools.partial(func, *args))
+        except BaseException:
+            self._release(None)
+            raise
+        future.add_done_callback(self._release)
+        # 대기 중 취소되면 실행 전 작업은 함께 취소, 이미 실행 중이면 끝날 때까지 슬롯 유지
+        return await asyncio.wrap_future(future)
+
+    def _release(self, future: Optional[Future]) -> None:
+        """작업 종료 콜백 (worker 스레드 또는 취소한 스레드에서 호출)"""
+        with self._lock:
+            self._pending -= 1
+            if future is not None and not future.cancelled():
+                self.completed += 1
+
+    def get_stats(self) -> Dict[str, int]:
+        """풀 상태 (모니터링용)"""
+        return {
+            "workers": self.max_workers,
+            "max_pending": self.max_pending,
+            "pending": self._pending,
+            "completed": self.completed,
+            "rejected": self.rejected,
+        }
+
+    def shutdown(self, wait: bool = True) -> None:
+        self._executor.shutdown(wait=wait, cancel_futures=True)
+
+
+# 전역 PasswordHashPool 인스턴스 (lazy)
+_password_hash_pool: Optional[PasswordHashPool] = None
+
+
+def get_password_hash_pool() -> PasswordHashPool:
+    """PasswordHashPool 싱글톤 반환"""
+    global _password_hash_pool
+    if _password_hash_pool is None:
+        _password_hash_pool = PasswordHashPool()
+    return _password_hash_pool
+
+
+def shutdown_password_hash_pool(wait: bool = True) -> None:
+    """비밀번호 해싱 스레드 풀 종료 (lifespan 종료 시 호출)"""
+    global _password_hash_pool
+    if _password_hash_pool is not None:
+        _password_hash_pool.shutdown(wait=wait)
+        _password_hash_pool = None
@@ -0,0 +1,105 @@
+"""
+User Principal Cache
+인증된 사용자(User) 조회 캐시 (요청 내 재사용 + 프로세스 메모리 / Redis)
+
+- 요청 내: 처음 조회한 User를 request.state.principal에 보관 (여러 의존성이 같은 객체 재사용)
+- 요청 간: CacheService auth:principal:{user_id} (L1 프로세스 메모리 + L2 Redis, 짧은 TTL)
+- 무효화: 회원 정보 수정 / 탈퇴 시 invalidate() → Redis 삭제 + CACHE_INVALIDATED로 모든 프로세스 L1 제거
+- 비밀번호 해시는 캐시에 저장하지 않음 (캐시에서 복원한 User의 password_hash는 None)
+"""
+
+import logging
+import uuid
+from datetime import datetime
+from typing import TYPE_CHECKING, Any, Dict, Optional, Union
+
+from ..cache.service import CacheService
+from ..config import settings
+
+if TYPE_CHECKING:
+    from backend.features.auth.models import User
+
+logger = logging.getLogger(__name__)
+
+PRINCIPAL_KEY_PREFIX = "auth:principal:"
+
+UserId = Union[uuid.UUID, str]
+
+
+def _principal_key(user_id: UserId) -> str:
+    return f"{PRINCIPAL_KEY_PREFIX}{user_id}"
+
+
+def _to_cache(user: "User") -> Dict[str, Any]:
+    """User → JSON 직렬화 가능한 dict (password_hash 제외)"""
+    return {
+        "id": str(user.id),
+        "email": user.email,
+        "oauth_provider": user.oauth_provider,
+        "oauth_id": user.oauth_id,
+        "is_active": user.is_active,
+        "created_at": user.created_at.isoformat() if user.created_at else None,
+        "updated_at": user.updated_at.isoformat() if user.updated_at else None,
+    }
+
+
+def _from_cache(data: Dict[str, Any]) -> "User":
+    """캐시 dict → User (세션에 연결되지 않은 객체)"""
+    from backend.features.auth.models import User
+
+    return User(
+        id=uuid.UUID(data["id"]),
+        email=data["email"],
+        password_hash=None,
+        oauth_provider=data.get("oauth_provider"),
+        oauth_id=data.get("oauth_id"),
+        is_active=data.get("is_active", True),
+        created_at=datetime.fromisoformat(data["created_at"]) if data.get("created_at") else None,
+        updated_at=datetime.fromisoformat(data["updated_at"]) if data.get("updated_at") else None,
+    )
+
+
+class UserPrincipalCache:
+    """
+    사용자 조회 캐시
+
+    Example:
+        principals = UserPrincipalCache(cache_service)
+        user = await principals.get(user_id)
+        if user is None:
+            user = await user_repo.get(user_id)
+            await principals.put(user)
+    """
+
+    def __init__(self, cache_service: CacheService):
+        """
+        Args:
+            cache_service: L1 + Redis 캐시 서비스
+        """
+        self.cache_service = cache_service
+
+    async def get(self, user_id: UserId) -> Optional["User"]:
+        """
+        캐시된 User 조회
+
+        Returns:
+            Optional[User]: 캐시 히트 시 User (없거나 손상된 항목이면 None)
+        """
+        data = await self.cache_service.get(_principal_key(user_id))
+        if not isinstance(data, dict):
+            return None
+        try:
+            return _from_cache(data)
+        except (KeyError, TypeError, ValueError) as e:
+            logger.warning(f"Invalid principal cache entry: user={user_id}: {e}")
+            return None
+
+    async def put(self, user: "User") -> None:
+        """User 캐시 저장"""
+        await self.cache_service.set(
+            _principal_key(user.id), _to_cache(user), ttl=settings.auth_principal_cache_ttl
+        )
+
+    async def invalidate(self, user_id: UserId) -> None:
+        """User 캐시 제거 (모든 프로세스)"""
+        await self.cache_service.delete(_principal_key(user_id))
@@ -3,8 +3,13 @@ Credentials Authentication Provider
 이메일/비밀번호 인증 (Argon2 전용)
 """
 
+from typing import Optional, Tuple
+
 from passlib.context import CryptContext
 
+from ...config import settings
+from ..password_pool import get_password_hash_pool
+
 
 class CredentialsAuthProvider:
     """
@@ -12,13 +17,14 @@ class CredentialsAuthProvider:
 
     - Argon2id: 비밀번호 해싱 (OWASP 권장, Python 3.12 호환)
     - 보안 표준: Argon2 (2015 Password Hashing Competition 우승)
+    - 비동기 메서드는 전용 스레드 풀에서 실행 (이벤트 루프 차단 방지)
     """
 
-    # Argon2 전용 컨텍스트
+    # Argon2 전용 컨텍스트 (비용 파라미터가 바뀌면 기존 해시는 needs_update → 로그인 시 재해싱)
     pwd_context = CryptContext(
-        schemes=["argon2"],         # Argon2 단일 알고리즘
-        argon2__rounds=4,           # 시간 비용 (약 0.5초)
-        argon2__memory_cost=65536,  # 메모리 비용 (64MB)
+        schemes=["argon2"],                                   # Argon2 단일 알고리즘
+        argon2__rounds=settings.password_hash_time_cost,      # 시간 비용 (기본 4, 약 0.5초)
+        argon2__memory_cost=settings.password_hash_memory_cost,  # 메모리 비용 (기본 64MB)
     )
 
     @staticmethod
@@ -49,3 +55,40 @@ class CredentialsAuthProvider:
         return CredentialsAuthProvider.pwd_context.verify(
             plain_password, hashed_password
         )
+
+    @staticmethod
+    async def hash_password_async(password: str) -> str:
+        """
+        비밀번호 해싱 (전용 스레드 풀)
+
+        Raises:
+            PasswordHashingBusyException: 해싱 대기열 초과
+        """
+        return await get_password_hash_pool().run(
+            CredentialsAuthProvider.pwd_context.hash, password
+        )
+
+    @staticmethod
+    async def verify_and_update_async(
+        plain_password: str, hashed_password: str
+    ) -> Tuple[bool, Optional[str]]:
+        """
+        비밀번호 검증 + 재해싱 (전용 스레드 풀)
+
+        저장된 해시의 비용 파라미터가 현재 설정과 다르면 검증 성공 시 새 해시를 함께 반환합니다.
+
+        Args:
+            plain_password: 평문 비밀번호
+            hashed_password: 저장된 Argon2 해시
+
+        Returns:
+            Tuple[bool, Optional[str]]: (검증 결과, 새 해시 - 재해싱이 필요 없으면 None)
+
+        Raises:
+            PasswordHashingBusyException: 해싱 대기열 초과
+        """
+        return await get_password_hash_pool().run(
+            CredentialsAuthProvider.pwd_context.verify_and_update,
+            plain_password,
+            hashed_password,
+        )
@@ -0,0 +1,164 @@
+"""
+Google JWKS Cache
+Google ID Token 서명 키 (JWKS) 비동기 캐시
+
+- 키 세트는 응답의 Cache-Control max-age 동안 메모리에 보관 (max-age가 없으면 기본 TTL)
+- 만료 refresh_ahead초 전부터는 백그라운드에서 갱신 (요청은 기존 키로 즉시 검증)
+- 처음 보는 kid(키 교체 직후)는 즉시 갱신 (min_refresh_interval로 갱신 폭주 방지)
+- 갱신은 동시에 1번만 실행 (대기 중인 요청은 그 결과를 공유)
+- 갱신 실패 시 기존 키를 계속 사용하고 min_refresh_interval 후 재시도
+"""
+
+import asyncio
+import logging
+import re
+import time
+from typing import Dict, Optional
+
+import httpx
+from jose import jwk
+from jose.backends.base import Key
+
+from ...config import settings
+
+logger = logging.getLogger(__name__)
+
+_MAX_AGE_PATTERN = re.compile(r"max-age=(\d+)")
+
+# 로그인 요청이 기다리는 다운로드이므로 AI 호출용 http_timeout보다 짧게
+_FETCH_TIMEOUT = 10.0
+
+
+def _cache_lifetime(headers: httpx.Headers) -> int:
+    """Cache-Control max-age (Age 헤더만큼 차감, 없으면 기본 TTL)"""
+    match = _MAX_AGE_PATTERN.search(headers.get("cache-control", ""))
+    if match is None:
+        return settings.google_jwks_default_ttl
+
+    try:
+        age = int(headers.get("age", 0))
+    except ValueError:
+        age = 0
+    return max(int(match.group(1)) - age, 0)
+
+
+class GoogleJWKSCache:
+    """
+    Google 서명 키 캐시
+
+    Example:
+        key = await get_google_jwks_cache().get_key(kid)
+        claims = jwt.decode(token, key, algorithms=["RS256"], audience=client_id)
+    """
+
+    def __init__(self, certs_url: Optional[str] = None, client: Optional[httpx.AsyncClient] = None):
+        """
+        Args:
+            certs_url: JWKS URL (기본값: settings.google_oauth_certs_url)
+            client: HTTP 클라이언트 (None이면 lazy 생성, close()에서 종료)
+        """
+        self.certs_url = certs_url or settings.google_oauth_certs_url
+        self._client = client
+        self._owns_client = client is None
+        self._keys: Dict[str, Key] = {}
+        self._expires_at = 0.0
+        self._last_fetch = float("-inf")
+        self._generation = 0
+        self._refresh_lock = asyncio.Lock()
+        self._refresh_task: Optional[asyncio.Task] = None
+        self.fetches = 0
+
+    def _get_client(self) -> httpx.AsyncClient:
+        """HTTP 클라이언트 (lazy initialization, Keep-Alive 재사용)"""
+        if self._client is None:
+            self._client = httpx.AsyncClient(timeout=_FETCH_TIMEOUT)
+        return self._client
+
+    async def get_key(self, kid: str) -> Optional[Key]:
+        """
+        kid에 해당하는 공개키 조회
+
+        Args:
+            kid: ID Token 헤더의 key ID
+
+        Returns:
+            Optional[Key]: 검증용 공개키 (키 세트를 가져올 수 없거나 없는 kid면 None)
+        """
+        now = time.monotonic()
+        if not self._keys or now >= self._expires_at:
+            await self.refresh()
+        elif now >= self._expires_at - settings.google_jwks_refresh_ahead:
+            self._schedule_refresh()
+
+        key = self._keys.get(kid)
+        if key is None and time.monotonic() - self._last_fetch >= settings.google_jwks_min_refresh_interval:
+            # Google 키 교체 직후: 새 kid로 서명된 토큰
+            await self.refresh()
+            key = self._keys.get(kid)
+        return key
+
+    async def refresh(self) -> None:
+        """키 세트 갱신 (이미 갱신 중이면 그 결과를 기다림)"""
+        generation = self._generation
+        async with self._refresh_lock:
+            if self._generation != generation:
+                return
+            await self._fetch()
+
+    def _schedule_refresh(self) -> None:
+        """백그라운드 갱신 (이미 실행 중이면 무시)"""
+        if self._refresh_task is None or self._refresh_task.done():
+            self._refresh_task = asyncio.create_task(self.refresh())
+
+    async def _fetch(self) -> None:
+        """JWKS 다운로드 + 공개키 구성"""
+        self._last_fetch = time.monotonic()
+        self.fetches += 1
+        try:
+            response = await self._get_client().get(self.certs_url)
+            response.raise_for_status()
+            keys = {
+                key_data["kid"]: jwk.construct(key_data, key_data.get("alg", "RS256"))
+                for key_data in response.json()["keys"]
+            }
+        except Exception as e:
+            logger.warning(f"Google JWKS fetch failed: {e}")
+            if self._keys:
+                # 기존 키로 계속 검증, 잠시 후 재시도
+                self._expires_at = time.monotonic() + settings.google_jwks_min_refresh_interval
+            return
+        finally:
+            self._generation += 1
+
+        self._keys = keys
+        self._expires_at = time.monotonic() + _cache_lifetime(response.headers)
+        logger.info(f"Google JWKS refreshed: {len(keys)} keys")
+
+    async def close(self) -> None:
+        """백그라운드 갱신 취소 및 HTTP 클라이언트 종료"""
+        if self._refresh_task is not None and not self._refresh_task.done():
+            self._refresh_task.cancel()
+            await asyncio.gather(self._refresh_task, return_exceptions=True)
+        if self._owns_client and self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+
+# 전역 GoogleJWKSCache 인스턴스 (lazy)
+_google_jwks_cache: Optional[GoogleJWKSCache] = None
+
+
+def get_google_jwks_cache() -> GoogleJWKSCache:
+    """GoogleJWKSCache 싱글톤 반환"""
+    global _google_jwks_cache
+    if _google_jwks_cache is None:
+        _google_jwks_cache = GoogleJWKSCache()
+    return _google_jwks_cache
+
+
+async def close_google_jwks_cache() -> None:
+    """GoogleJWKSCache 종료 (lifespan 종료 시 호출)"""
+    global _google_jwks_cache
+    if _google_jwks_cache is not None:
+        await _google_jwks_cache.close()
+        _google_jwks_cache = None
@@ -4,10 +4,12 @@ Google OAuth 2.0 인증
 """
 
 from typing import Optional, Dict, Any
-from google.auth.transport import requests
-from google.oauth2 import id_token
+from jose import JWTError, jwt
 
 from ...config import settings
+from .google_jwks import get_google_jwks_cache
+
+GOOGLE_ISSUERS = ("accounts.google.com", "https://accounts.google.com")
 
 
 class GoogleOAuthProvider:
@@ -15,6 +17,7 @@ class GoogleOAuthProvider:
     Google OAuth 2.0 인증 제공자
 
     Google ID Token 검증 및 사용자 정보 추출
+    (서명 키는 GoogleJWKSCache에 캐시, 서명 검증은 로컬에서 수행 → 요청마다 네트워크 호출 없음)
     """
 
     @staticmethod
@@ -38,17 +41,22 @@ class GoogleOAuthProvider:
             raise ValueError("GOOGLE_OAUTH_CLIENT_ID is not configured")
 
         try:
-            # Google ID Token 검증
-            idinfo = id_token.verify_oauth2_token(
+            # 서명 키 조회 (캐시, 키 교체 시에만 다운로드)
+            kid = jwt.get_unverified_header(token).get("kid")
+            key = await get_google_jwks_cache().get_key(kid) if kid else None
+            if key is None:
+                return None
+
+            # 서명 / 만료 / audience / 발급자 검증
+            idinfo = jwt.decode(
                 token,
-                requests.Request(),
-                settings.google_oauth_client_id,
+                key,
+                algorithms=["RS256"],
+                audience=settings.google_oauth_client_id,
+                issuer=GOOGLE_ISSUERS,
+                options={"verify_at_hash": False},
             )
 
-            # 발급자 검증
-            if idinfo["iss"] not in ["accounts.google.com", "https://accounts.google.com"]:
-                return None
-
             # 사용자 정보 반환
             return {
                 "sub": idinfo["sub"],  # Google User ID
@@ -57,6 +65,6 @@ class GoogleOAuthProvider:
                 "picture": idinfo.get("picture", ""),
             }
 
-        except ValueError:
+        except (JWTError, KeyError):
             # 토큰 검증 실패
             return None
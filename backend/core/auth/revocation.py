@@ -0,0 +1,200 @@
+"""
+Access Token Revocation Filter
+로그아웃된 access token의 프로세스 메모리 목록 (요청마다 Redis 조회 없이 블랙리스트 판정)
+
+- 목록: token_hash → 토큰 exp (만료 시각이 지나면 자동 제외)
+- 동기화: 로그아웃 시 Redis Sorted Set(auth:revoked_access)에 기록 + ACCESS_TOKEN_REVOKED 브로드캐스트
+  (모든 프로세스가 수신, 누락 대비로 auth_revocation_sync_interval마다 Sorted Set 전체 재로딩)
+- 판정: 목록에 없으면 폐기되지 않은 토큰 (네트워크 I/O 없음)
+  목록에 있거나 아직 로딩 전이면 Redis 블랙리스트(blacklist:access:*)로 최종 확인
+"""
+
+import asyncio
+import logging
+import time
+from typing import Dict, Optional
+
+import redis.asyncio as aioredis
+from jose import JWTError, jwt
+
+from ..config import settings
+from ..events.bus import EventBus
+from ..events.types import Event, EventType
+
+logger = logging.getLogger(__name__)
+
+REVOKED_ACCESS_KEY = "auth:revoked_access"
+
+
+def token_expiry(token: str) -> float:
+    """access token exp (읽을 수 없으면 지금부터 access token 최대 수명)"""
+    try:
+        exp = jwt.get_unverified_claims(token).get("exp")
+    except JWTError:
+        exp = None
+    if exp is None:
+        return time.time() + settings.jwt_access_token_expire_minutes * 60
+    return float(exp)
+
+
+class AccessTokenRevocations:
+    """
+    폐기된 access token 목록
+
+    Example:
+        if revocations.might_be_revoked(token_hash):
+            is_blacklisted = await cache_service.get(f"blacklist:access:{token_hash}")
+    """
+
+    def __init__(self, redis_url: Optional[str] = None, event_bus: Optional[EventBus] = None):
+        """
+        Args:
+            redis_url: Redis URL (기본값: settings.redis_url)
+            event_bus: 폐기 이벤트 발행 / 수신용 Event Bus
+        """
+        self.redis_url = redis_url or settings.redis_url
+        self.event_bus = event_bus
+        self._redis: Optional[aioredis.Redis] = None
+        self._revoked: Dict[str, float] = {}
+        self._loaded = False
+        self._sync_task: Optional[asyncio.Task] = None
+        self._handlers_registered = False
+
+    def _get_redis(self) -> aioredis.Redis:
+        """Redis 클라이언트 (lazy initialization)"""
+        if self._redis is None:
+            self._redis = aioredis.from_url(self.redis_url, decode_responses=True)
+        return self._redis
+
+    def __len__(self) -> int:
+        return len(self._revoked)
+
+    @property
+    def loaded(self) -> bool:
+        """Redis에서 목록을 한 번 이상 읽었는지 여부"""
+        return self._loaded
+
+    def might_be_revoked(self, token_hash: str) -> bool:
+        """
+        폐기 가능성 판정 (False면 Redis 확인 불필요)
+
+        Args:
+            token_hash: access token SHA-256 앞 16자리
+
+        Returns:
+            bool: 목록에 있거나, 목록을 아직 읽지 못했거나, 필터가 꺼져 있으면 True
+        """
+        if not settings.auth_revocation_filter_enabled or not self._loaded:
+            return True
+
+        exp = self._revoked.get(token_hash)
+        if exp is None:
+            return False
+        if exp <= time.time():
+            del self._revoked[token_hash]
+            return False
+        return True
+
+    async def register(self, event_bus: EventBus) -> None:
+        """ACCESS_TOKEN_REVOKED 구독 + 초기 로딩 + 주기적 재로딩 시작"""
+        self.event_bus = event_bus
+        if self._handlers_registered:
+            return
+        await event_bus.subscribe(EventType.ACCESS_TOKEN_REVOKED, self._handle_revoked)
+        self._handlers_registered = True
+
+        await self.load()
+        self._sync_task = asyncio.create_task(self._sync_periodically())
+
+    async def revoke(self, token_hash: str, exp: float) -> None:
+        """
+        access token 폐기 등록 (로그아웃)
+
+        Args:
+            token_hash: access token SHA-256 앞 16자리
+            exp: 토큰 만료 시각 (epoch 초)
+        """
+        self._add(token_hash, exp)
+
+        try:
+            async with self._get_redis().pipeline(transaction=True) as pipe:
+                pipe.zadd(REVOKED_ACCESS_KEY, {token_hash: exp})
+                pipe.zremrangebyscore(REVOKED_ACCESS_KEY, "-inf", time.time())
+                pipe.expire(REVOKED_ACCESS_KEY, settings.jwt_access_token_expire_minutes * 60)
+                await pipe.execute()
+        except Exception as e:
+            logger.warning(f"Revoked access token save error: {e}")
+
+        if self.event_bus is not None:
+            try:
+                await self.event_bus.publish(
+                    EventType.ACCESS_TOKEN_REVOKED, {"token_hash": token_hash, "exp": exp}
+                )
+            except Exception as e:
+                # 다른 프로세스는 주기적 재로딩으로 반영
+                logger.warning(f"Access token revocation publish error: {e}")
+
+    async def load(self) -> None:
+        """Redis Sorted Set에서 만료되지 않은 폐기 목록 전체 로딩 (실패 시 기존 목록 유지)"""
+        try:
+            entries = await self._get_redis().zrangebyscore(
+                REVOKED_ACCESS_KEY, time.time(), "+inf", withscores=True
+            )
+        except Exception as e:
+            logger.warning(f"Revoked access token load error: {e}")
+            return
+
+        revoked = {token_hash: float(exp) for token_hash, exp in entries}
+        # 로딩 중 이벤트로 추가된 항목 보존
+        for token_hash, exp in self._revoked.items():
+            revoked.setdefault(token_hash, exp)
+        now = time.time()
+        self._revoked = {token_hash: exp for token_hash, exp in revoked.items() if exp > now}
+        self._loaded = True
+
+    async def _sync_periodically(self) -> None:
+        """이벤트 누락 대비 주기적 재로딩"""
+        while True:
+            await asyncio.sleep(settings.auth_revocation_sync_interval)
+            await self.load()
+
+    async def _handle_revoked(self, event: Event) -> None:
+        """ACCESS_TOKEN_REVOKED 처리 (다른 프로세스의 로그아웃)"""
+        token_hash = event.payload.get("token_hash")
+        exp = event.payload.get("exp")
+        if token_hash and exp is not None:
+            self._add(token_hash, float(exp))
+
+    def _add(self, token_hash: str, exp: float) -> None:
+        if exp > time.time():
+            self._revoked[token_hash] = exp
+
+    async def close(self) -> None:
+        """재로딩 Task 취소 및 Redis 연결 종료"""
+        if self._sync_task is not None:
+            self._sync_task.cancel()
+            await asyncio.gather(self._sync_task, return_exceptions=True)
+            self._sync_task = None
+        if self._redis is not None:
+            await self._redis.close()
+            self._redis = None
+
+
+# 전역 AccessTokenRevocations 인스턴스 (lazy)
+_access_token_revocations: Optional[AccessTokenRevocations] = None
+
+
+def get_access_token_revocations() -> AccessTokenRevocations:
+    """AccessTokenRevocations 싱글톤 반환"""
+    global _access_token_revocations
+    if _access_token_revocations is None:
+        _access_token_revocations = AccessTokenRevocations()
+    return _access_token_revocations
+
+
+async def close_access_token_revocations() -> None:
+    """AccessTokenRevocations 종료 (lifespan 종료 시 호출)"""
+    global _access_token_revocations
+    if _access_token_revocations is not None:
+        await _access_token_revocations.close()
+        _access_token_revocations = None
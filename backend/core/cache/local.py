@@ -0,0 +1,142 @@
+"""
+Local Cache Tier
+CacheService 앞단의 프로세스 메모리 L1 캐시 (LRU + 네임스페이스별 TTL / 음성 캐싱)
+
+- 정책이 있는 네임스페이스(키 prefix)만 L1에 저장 (락 / refresh token 등은 항상 Redis)
+- 값은 JSON 문자열로 보관하여 조회마다 새 객체를 반환 (Redis 티어와 같은 의미, 호출자 변경 격리)
+- 음성 캐싱: Redis에 없는 키도 negative_ttl 동안 기억 (예: 블랙리스트에 없는 access token)
+- 다른 프로세스의 변경은 CACHE_INVALIDATED 이벤트로 제거 (CacheService에서 처리)
+"""
+
+import json
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Dict, Optional, Tuple
+
+from ..config import settings
+
+
+@dataclass(frozen=True)
+class CachePolicy:
+    """네임스페이스별 L1 정책"""
+
+    ttl: float  # 값이 있는 항목 최대 TTL (초, Redis TTL보다 길지 않게 제한됨)
+    negative_ttl: float = 0.0  # Redis에 없는 키를 기억하는 시간 (0이면 음성 캐싱 안 함)
+
+
+# 키 prefix → L1 정책 (가장 긴 prefix 우선)
+DEFAULT_POLICIES: Dict[str, CachePolicy] = {
+    # 요청마다 조회되는 access token 블랙리스트 (로그아웃 시 모든 프로세스에 무효화 이벤트 전달)
+    "blacklist:access:": CachePolicy(ttl=300.0, negative_ttl=5.0),
+    # 인증된 사용자 조회 (회원 정보 수정 / 탈퇴 시 무효화 이벤트 전달)
+    "auth:principal:": CachePolicy(ttl=30.0),
+    # @cache_result 음성 목록 / 단어 TTS 응답
+    "tts:voices:": CachePolicy(ttl=60.0),
+    "tts:word:": CachePolicy(ttl=10.0),
+}
+
+_MISSING = object()
+
+
+@dataclass
+class _Entry:
+    raw: Optional[str]  # JSON 문자열 (None이면 음성 항목)
+    expires_at: float
+
+
+class LocalCache:
+    """
+    프로세스 메모리 L1 캐시 (항목 수 제한 LRU)
+
+    Example:
+        found, value = local.get(key)
+        if not found:
+            value = await redis_get(key)
+            local.put(key, value)
+    """
+
+    def __init__(
+        self,
+        max_entries: Optional[int] = None,
+        policies: Optional[Dict[str, CachePolicy]] = None,
+    ):
+        """
+        Args:
+            max_entries: 최대 항목 수 (기본값: settings.cache_l1_max_entries)
+            policies: 키 prefix → 정책 (기본값: DEFAULT_POLICIES)
+        """
+        self.max_entries = max_entries or settings.cache_l1_max_entries
+        self.policies = dict(DEFAULT_POLICIES if policies is None else policies)
+        # 긴 prefix부터 매칭
+        self._prefixes = sorted(self.policies, key=len, reverse=True)
+        self._entries: "OrderedDict[str, _Entry]" = OrderedDict()
+        self.evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def policy_for(self, key: str) -> Optional[CachePolicy]:
+        """키에 적용되는 정책 (없으면 L1 미사용)"""
+        for prefix in self._prefixes:
+            if key.startswith(prefix):
+                return self.policies[prefix]
+        return None
+
+    def get(self, key: str) -> Tuple[bool, Any]:
+        """
+        조회
+
+        Returns:
+            Tuple[bool, Any]: (L1 히트 여부, 값 - 음성 항목이면 None)
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            return False, None
+        if entry.expires_at <= time.monotonic():
+            del self._entries[key]
+            return False, None
+
+        self._entries.move_to_end(key)
+        return True, None if entry.raw is None else json.loads(entry.raw)
+
+    def put(self, key: str, value: Any, ttl: Optional[float] = None) -> None:
+        """
+        저장 (value가 None이면 음성 항목, 정책이 없는 키는 무시)
+
+        Args:
+            key: 캐시 키
+            value: 값 (JSON 직렬화 가능)
+            ttl: Redis TTL (초, 정책 TTL보다 짧으면 이 값 사용)
+        """
+        policy = self.policy_for(key)
+        if policy is None:
+            return
+
+        if value is None:
+            lifetime = policy.negative_ttl
+            raw = None
+        else:
+            lifetime = policy.ttl if ttl is None else min(policy.ttl, ttl)
+            try:
+                raw = json.dumps(value)
+            except (TypeError, ValueError):
+                self._entries.pop(key, None)
+                return
+
+        if lifetime <= 0:
+            self._entries.pop(key, None)
+            return
+
+        self._entries[key] = _Entry(raw=raw, expires_at=time.monotonic() + lifetime)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def delete(self, key: str) -> bool:
+        """삭제 (항목이 있었으면 True)"""
+        return self._entries.pop(key, _MISSING) is not _MISSING
+
+    def clear(self) -> None:
+        self._entries.clear()
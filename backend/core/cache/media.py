@@ -0,0 +1,322 @@
+"""
+Media Cache
+미디어 파일 전용 2단계 캐시 (프로세스 메모리 LRU + Redis raw bytes)
+
+- JSON/base64 직렬화 없이 bytes를 그대로 저장 (aiocache CacheService와 별도)
+- 메모리 티어는 전체 바이트 수로 제한 (LRU 제거)
+- ETag/Content-Type 메타데이터를 본문과 분리 조회 가능 (304 응답 시 본문 불필요)
+"""
+
+import logging
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Dict, Optional
+
+import redis.asyncio as aioredis
+
+from ..config import settings
+from .metrics import media_cache_metrics
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class CachedMedia:
+    """캐시된 미디어 항목"""
+
+    data: bytes
+    etag: str
+    content_type: Optional[str] = None
+    expires_at: float = 0.0
+
+    @property
+    def size(self) -> int:
+        return len(self.data)
+
+
+class MemoryLRUTier:
+    """
+    프로세스 메모리 LRU 티어 (전체 바이트 수 제한)
+
+    Args:
+        max_bytes: 전체 최대 바이트 수
+        entry_max_bytes: 항목당 최대 바이트 수 (초과 항목은 저장하지 않음)
+    """
+
+    def __init__(self, max_bytes: int, entry_max_bytes: int):
+        self.max_bytes = max_bytes
+        self.entry_max_bytes = min(entry_max_bytes, max_bytes)
+        self._entries: "OrderedDict[str, CachedMedia]" = OrderedDict()
+        self._total_bytes = 0
+
+    @property
+    def total_bytes(self) -> int:
+        return self._total_bytes
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: str) -> Optional[CachedMedia]:
+        """조회 (만료 항목은 제거, 히트 시 최근 사용으로 이동)"""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+
+        if entry.expires_at and entry.expires_at <= time.monotonic():
+            self._remove(key)
+            return None
+
+        self._entries.move_to_end(key)
+        return entry
+
+    def put(self, key: str, entry: CachedMedia) -> bool:
+        """
+        저장 (용량 초과 시 가장 오래 사용되지 않은 항목부터 제거)
+
+        Returns:
+            bool: 저장 여부 (항목 크기 제한 초과 시 False)
+        """
+        if entry.size > self.entry_max_bytes:
+            self._remove(key)
+            return False
+
+        self._remove(key)
+        self._entries[key] = entry
+        self._total_bytes += entry.size
+
+        evicted = 0
+        while self._total_bytes > self.max_bytes and self._entries:
+            oldest_key = next(iter(self._entries))
+            self._remove(oldest_key)
+            evicted += 1
+
+        if evicted:
+            media_cache_metrics.record_eviction(evicted)
+        self._report_usage()
+        return True
+
+    def delete(self, key: str) -> None:
+        self._remove(key)
+        self._report_usage()
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._total_bytes = 0
+        self._report_usage()
+
+    def _remove(self, key: str) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._total_bytes -= entry.size
+
+    def _report_usage(self) -> None:
+        media_cache_metrics.set_memory_usage(self._total_bytes, len(self._entries))
+
+
+class MediaCache:
+    """
+    미디어 2단계 캐시
+
+    - L1: 프로세스 메모리 LRU (media_cache_memory_max_bytes, 항목당 media_cache_memory_entry_max_bytes)
+    - L2: Redis Hash (body/etag/content_type 필드, raw bytes)
+    - 항목당 최대 크기(file_cache_max_size)를 넘는 파일은 캐싱하지 않음
+    - Redis 오류는 캐시 미스로 처리 (스토리지에서 다시 읽음)
+
+    Example:
+        cached = await media_cache.get(path)
+        if cached is None:
+            data = await storage.get(path)
+            await media_cache.set(path, data, etag=etag, content_type="image/webp")
+    """
+
+    KEY_PREFIX = "media:"
+
+    def __init__(
+        self,
+        redis_url: Optional[str] = None,
+        memory_max_bytes: Optional[int] = None,
+        memory_entry_max_bytes: Optional[int] = None,
+        entry_max_bytes: Optional[int] = None,
+        ttl: Optional[int] = None,
+    ):
+        """
+        Args:
+            redis_url: Redis URL (기본값: settings.redis_url)
+            memory_max_bytes: 메모리 티어 전체 최대 바이트 수
+            memory_entry_max_bytes: 메모리 티어 항목당 최대 바이트 수
+            entry_max_bytes: 캐싱 가능한 항목당 최대 바이트 수 (Redis 포함)
+            ttl: 기본 TTL (초)
+        """
+        self.redis_url = redis_url or settings.redis_url
+        self.entry_max_bytes = entry_max_bytes or settings.file_cache_max_size
+        self.ttl = ttl or settings.media_cache_ttl
+        self.memory = MemoryLRUTier(
+            max_bytes=memory_max_bytes or settings.media_cache_memory_max_bytes,
+            entry_max_bytes=memory_entry_max_bytes or settings.media_cache_memory_entry_max_bytes,
+        )
+        self._redis: Optional[aioredis.Redis] = None
+
+    def _get_redis(self) -> aioredis.Redis:
+        """Redis 클라이언트 (lazy initialization, bytes 그대로 사용)"""
+        if self._redis is None:
+            self._redis = aioredis.from_url(self.redis_url, decode_responses=False)
+        return self._redis
+
+    def _redis_key(self, key: str) -> str:
+        return f"{self.KEY_PREFIX}{key}"
+
+    async def get(self, key: str) -> Optional[CachedMedia]:
+        """
+        미디어 조회 (L1 → L2, L2 히트 시 L1에 승격)
+
+        Args:
+            key: 캐시 키 (파일 경로)
+
+        Returns:
+            Optional[CachedMedia]: 캐시된 항목 또는 None
+        """
+        entry = self.memory.get(key)
+        if entry is not None:
+            media_cache_metrics.record_memory_hit(entry.size)
+            return entry
+
+        try:
+            redis_key = self._redis_key(key)
+            async with self._get_redis().pipeline(transaction=False) as pipe:
+                pipe.hmget(redis_key, "body", "etag", "content_type")
+                pipe.pttl(redis_key)
+                (body, etag, content_type), pttl = await pipe.execute()
+        except Exception as e:
+            media_cache_metrics.record_error()
+            logger.warning(f"Media cache get error: {key}: {e}")
+            return None
+
+        if body is None or etag is None:
+            media_cache_metrics.record_miss()
+            return None
+
+        ttl_seconds = pttl / 1000 if pttl and pttl > 0 else self.ttl
+        entry = CachedMedia(
+            data=body,
+            etag=etag.decode(),
+            content_type=content_type.decode() if content_type else None,
+            expires_at=time.monotonic() + ttl_seconds,
+        )
+        self.memory.put(key, entry)
+        media_cache_metrics.record_redis_hit(entry.size)
+        return entry
+
+    async def get_etag(self, key: str) -> Optional[str]:
+        """
+        ETag만 조회 (본문 전송 없음, 304 응답용)
+
+        Args:
+            key: 캐시 키
+
+        Returns:
+            Optional[str]: ETag 또는 None
+        """
+        entry = self.memory.get(key)
+        if entry is not None:
+            return entry.etag
+
+        try:
+            etag = await self._get_redis().hget(self._redis_key(key), "etag")
+        except Exception as e:
+            media_cache_metrics.record_error()
+            logger.warning(f"Media cache get_etag error: {key}: {e}")
+            return None
+
+        return etag.decode() if etag else None
+
+    async def set(
+        self,
+        key: str,
+        data: bytes,
+        etag: str,
+        content_type: Optional[str] = None,
+        ttl: Optional[int] = None,
+    ) -> bool:
+        """
+        미디어 저장 (L1 + L2)
+
+        Args:
+            key: 캐시 키
+            data: 파일 데이터
+            etag: ETag (따옴표 제외)
+            content_type: MIME 타입
+            ttl: TTL (초, 기본값: settings.media_cache_ttl)
+
+        Returns:
+            bool: 저장 여부 (크기 제한 초과 또는 Redis 오류 시 False)
+        """
+        if len(data) > self.entry_max_bytes:
+            media_cache_metrics.record_rejected()
+            logger.debug(f"Media cache skip (too large: {len(data)} bytes): {key}")
+            return False
+
+        ttl = ttl or self.ttl
+        self.memory.put(
+            key,
+            CachedMedia(
+                data=data,
+                etag=etag,
+                content_type=content_type,
+                expires_at=time.monotonic() + ttl,
+            ),
+        )
+
+        mapping: Dict[str, bytes] = {"body": data, "etag": etag.encode()}
+        if content_type:
+            mapping["content_type"] = content_type.encode()
+
+        try:
+            redis_key = self._redis_key(key)
+            async with self._get_redis().pipeline(transaction=True) as pipe:
+                pipe.delete(redis_key)
+                pipe.hset(redis_key, mapping=mapping)
+                pipe.expire(redis_key, ttl)
+                await pipe.execute()
+        except Exception as e:
+            media_cache_metrics.record_error()
+            logger.warning(f"Media cache set error: {key}: {e}")
+            return False
+
+        media_cache_metrics.record_set()
+        return True
+
+    async def delete(self, key: str) -> None:
+        """미디어 캐시 무효화 (L1 + L2)"""
+        self.memory.delete(key)
+        try:
+            await self._get_redis().delete(self._redis_key(key))
+        except Exception as e:
+            media_cache_metrics.record_error()
+            logger.warning(f"Media cache delete error: {key}: {e}")
+
+    async def close(self) -> None:
+        """Redis 연결 종료"""
+        if self._redis is not None:
+            await self._redis.close()
+            self._redis = None
+
+
+# 전역 MediaCache 인스턴스 (lazy)
+_media_cache: Optional[MediaCache] = None
+
+
+def get_media_cache() -> MediaCache:
+    """MediaCache 싱글톤 반환"""
+    global _media_cache
+    if _media_cache is None:
+        _media_cache = MediaCache()
+    return _media_cache
+
+
+async def close_media_cache() -> None:
+    """MediaCache 종료 (lifespan 종료 시 호출)"""
+    global _media_cache
+    if _media_cache is not None:
+        await _media_cache.close()
+        _media_cache = None
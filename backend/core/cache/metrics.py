@@ -10,12 +10,15 @@ import threading
 
 
 class CacheMetrics:
-    """캐시 메트릭 수집"""
+    """캐시 메트릭 수집 (hits = L1 히트 + L2(Redis) 히트, misses = L2 미스)"""
     
     def __init__(self):
         self._lock = threading.Lock()
         self.hits = 0
         self.misses = 0
+        self.l1_hits = 0
+        self.l1_misses = 0
+        self.l1_invalidations = 0
         self.set_operations = 0
         self.delete_operations = 0
         self.total_get_time = 0.0
@@ -24,12 +27,24 @@ class CacheMetrics:
         self.errors = 0
         self._key_stats = defaultdict(lambda: {"hits": 0, "misses": 0})
     
-    def record_hit(self, key: str, duration: float):
-        """캐시 히트 기록"""
+    def record_hit(self, key: str, duration: float, tier: str = "l2"):
+        """캐시 히트 기록 (tier: l1 | l2)"""
         with self._lock:
             self.hits += 1
+            if tier == "l1":
+                self.l1_hits += 1
             self.total_get_time += duration
             self._key_stats[key]["hits"] += 1
+
+    def record_l1_miss(self, key: str):
+        """L1 미스 기록 (L2 조회로 이어짐)"""
+        with self._lock:
+            self.l1_misses += 1
+
+    def record_l1_invalidation(self, count: int = 1):
+        """다른 프로세스의 무효화 이벤트로 제거한 L1 항목 기록"""
+        with self._lock:
+            self.l1_invalidations += count
     
     def record_miss(self, key: str, duration: float):
         """캐시 미스 기록"""
@@ -61,6 +76,19 @@ class CacheMetrics:
         total = self.hits + self.misses
         return self.hits / total if total > 0 else 0.0
     
+    @property
+    def l1_hit_rate(self) -> float:
+        """L1 히트율 (L1 정책이 있는 키 기준)"""
+        total = self.l1_hits + self.l1_misses
+        return self.l1_hits / total if total > 0 else 0.0
+
+    @property
+    def l2_hit_rate(self) -> float:
+        """L2(Redis) 히트율 (L1을 거치지 않았거나 L1 미스인 조회 기준)"""
+        l2_hits = self.hits - self.l1_hits
+        total = l2_hits + self.misses
+        return l2_hits / total if total > 0 else 0.0
+
     @property
     def avg_get_time(self) -> float:
         """평균 조회 시간 (초)"""
@@ -84,6 +112,12 @@ class CacheMetrics:
                 "hits": self.hits,
                 "misses": self.misses,
                 "hit_rate": self.hit_rate,
+                "l1_hits": self.l1_hits,
+                "l1_misses": self.l1_misses,
+                "l1_hit_rate": self.l1_hit_rate,
+                "l1_invalidations": self.l1_invalidations,
+                "l2_hits": self.hits - self.l1_hits,
+                "l2_hit_rate": self.l2_hit_rate,
                 "set_operations": self.set_operations,
                 "delete_operations": self.delete_operations,
                 "errors": self.errors,
@@ -110,6 +144,9 @@ class CacheMetrics:
         with self._lock:
             self.hits = 0
             self.misses = 0
+            self.l1_hits = 0
+            self.l1_misses = 0
+            self.l1_invalidations = 0
             self.set_operations = 0
             self.delete_operations = 0
             self.total_get_time = 0.0
@@ -119,6 +156,100 @@ class CacheMetrics:
             self._key_stats.clear()
 
 
+
+class MediaCacheMetrics:
+    """미디어 캐시 (메모리 LRU + Redis) 메트릭 수집"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.memory_hits = 0
+        self.redis_hits = 0
+        self.misses = 0
+        self.sets = 0
+        self.evictions = 0
+        self.rejected = 0
+        self.errors = 0
+        self.bytes_served = 0
+        self.memory_bytes = 0
+        self.memory_entries = 0
+
+    def record_memory_hit(self, size: int):
+        """메모리 티어 히트 기록"""
+        with self._lock:
+            self.memory_hits += 1
+            self.bytes_served += size
+
+    def record_redis_hit(self, size: int):
+        """Redis 티어 히트 기록"""
+        with self._lock:
+            self.redis_hits += 1
+            self.bytes_served += size
+
+    def record_miss(self):
+        """캐시 미스 기록"""
+        with self._lock:
+            self.misses += 1
+
+    def record_set(self):
+        """캐시 저장 기록"""
+        with self._lock:
+            self.sets += 1
+
+    def record_eviction(self, count: int = 1):
+        """메모리 티어 LRU 제거 기록"""
+        with self._lock:
+            self.evictions += count
+
+    def record_rejected(self):
+        """크기 제한 초과로 캐싱하지 않은 항목 기록"""
+        with self._lock:
+            self.rejected += 1
+
+    def record_error(self):
+        """캐시 오류 기록"""
+        with self._lock:
+            self.errors += 1
+
+    def set_memory_usage(self, total_bytes: int, entries: int):
+        """메모리 티어 사용량 갱신"""
+        with self._lock:
+            self.memory_bytes = total_bytes
+            self.memory_entries = entries
+
+    def get_stats(self) -> Dict:
+        """전체 통계 반환"""
+        with self._lock:
+            hits = self.memory_hits + self.redis_hits
+            total = hits + self.misses
+            return {
+                "memory_hits": self.memory_hits,
+                "redis_hits": self.redis_hits,
+                "misses": self.misses,
+                "hit_rate": hits / total if total > 0 else 0.0,
+                "memory_hit_rate": self.memory_hits / total if total > 0 else 0.0,
+                "sets": self.sets,
+                "evictions": self.evictions,
+                "rejected": self.rejected,
+                "errors": self.errors,
+                "bytes_served": self.bytes_served,
+                "memory_bytes": self.memory_bytes,
+                "memory_entries": self.memory_entries,
+            }
+
+    def reset(self):
+        """통계 초기화 (메모리 사용량 게이지는 유지)"""
+        with self._lock:
+            self.memory_hits = 0
+            self.redis_hits = 0
+            self.misses = 0
+            self.sets = 0
+            self.evictions = 0
+            self.rejected = 0
+            self.errors = 0
+            self.bytes_served = 0
+
+
 # 전역 메트릭 인스턴스
 cache_metrics = CacheMetrics()
+media_cache_metrics = MediaCacheMetrics()
 
@@ -1,27 +1,45 @@
 """
 Cache Service
 aiocache 기반 캐시 서비스 (이벤트 기반 무효화)
+
+- L1: 프로세스 메모리 LRU (LocalCache, 정책이 있는 네임스페이스만 / 음성 캐싱 포함)
+- L2: Redis (aiocache)
+- L1에 저장되는 키를 변경 / 삭제하면 CACHE_INVALIDATED 브로드캐스트 이벤트로 다른 프로세스의 L1도 제거
 """
 
+import json
 import logging
 import time
-from typing import Optional, Any, Callable
+from typing import Optional, Any, Callable, List
 from functools import wraps
 from aiocache import caches
+from ..config import settings
 from ..events.bus import EventBus
 from ..events.types import Event, EventType
+from .local import LocalCache
 from .metrics import cache_metrics
 
 logger = logging.getLogger(__name__)
 
 
+def _decode(result: Any) -> Any:
+    """aiocache의 JsonSerializer가 문자열로 반환하는 경우 처리"""
+    if isinstance(result, str):
+        try:
+            return json.loads(result)
+        except (json.JSONDecodeError, TypeError):
+            pass  # JSON이 아니면 그대로 반환
+    return result
+
+
 class CacheService:
-    """aiocache 기반 캐시 서비스 (이벤트 기반 무효화)"""
+    """aiocache 기반 캐시 서비스 (L1 프로세스 메모리 + L2 Redis, 이벤트 기반 무효화)"""
     
-    def __init__(self, event_bus: EventBus):
+    def __init__(self, event_bus: EventBus, local: Optional[LocalCache] = None):
         self.event_bus = event_bus
         self._cache = None
         self._handlers_registered = False
+        self.local = local if local is not None else (LocalCache() if settings.cache_l1_enabled else None)
     
     def _get_cache(self):
         """캐시 인스턴스 가져오기 (lazy initialization)"""
@@ -38,51 +56,48 @@ class CacheService:
             await self.event_bus.subscribe(EventType.VOICE_CREATED, self._handle_voice_created)
             await self.event_bus.subscribe(EventType.VOICE_UPDATED, self._handle_voice_updated)
             await self.event_bus.subscribe(EventType.VOICE_DELETED, self._handle_voice_deleted)
+            await self.event_bus.subscribe(EventType.CACHE_INVALIDATED, self._handle_cache_invalidated)
             self._handlers_registered = True
             logger.info("Event handlers registered successfully")
         except Exception as e:
             logger.error(f"Failed to register event handlers: {e}", exc_info=True)
     
     async def get(self, key: str) -> Optional[Any]:
-        """캐시 조회"""
+        """캐시 조회 (L1 → L2)"""
         # 이벤트 핸들러 등록 (최초 1회)
-        await self._setup_event_handlers()
+        if not self._handlers_registered:
+            await self._setup_event_handlers()
         
         start = time.time()
+        local = self._local_for(key)
+        if local is not None:
+            found, value = local.get(key)
+            if found:
+                cache_metrics.record_hit(key, time.time() - start, tier="l1")
+                return value
+            cache_metrics.record_l1_miss(key)
+
         try:
             cache = self._get_cache()
-            result = await cache.get(key)
+            result = _decode(await cache.get(key))
             duration = time.time() - start
             
-            # aiocache의 JsonSerializer가 문자열로 반환하는 경우 처리
-            if isinstance(result, str):
-                try:
-                    import json
-                    result = json.loads(result)
-                except (json.JSONDecodeError, TypeError):
-                    pass  # JSON이 아니면 그대로 반환
-            
             # 메트릭 기록
             if result is not None:
                 cache_metrics.record_hit(key, duration)
-                logger.info(
-                    f"Cache hit: {key}",
-                    extra={
-                        "cache_key": key,
-                        "duration_ms": duration * 1000,
-                        "hit": True,
-                    }
-                )
             else:
                 cache_metrics.record_miss(key, duration)
-                logger.info(
-                    f"Cache miss: {key}",
-                    extra={
-                        "cache_key": key,
-                        "duration_ms": duration * 1000,
-                        "hit": False,
-                    }
-                )
+            logger.debug(
+                f"Cache {'hit' if result is not None else 'miss'}: {key}",
+                extra={
+                    "cache_key": key,
+                    "duration_ms": duration * 1000,
+                    "hit": result is not None,
+                }
+            )
+
+            if local is not None:
+                local.put(key, result)
             
             return result
         except Exception as e:
@@ -111,7 +126,8 @@ class CacheService:
             bool: 성공 시 True, nx=True이고 키가 이미 존재하면 False
         """
         # 이벤트 핸들러 등록 (최초 1회)
-        await self._setup_event_handlers()
+        if not self._handlers_registered:
+            await self._setup_event_handlers()
 
         start = time.time()
         try:
@@ -128,7 +144,7 @@ class CacheService:
 
                     if result:
                         cache_metrics.record_set(key, duration)
-                        logger.info(
+                        logger.debug(
                             f"Cache set (NX): {key}",
                             extra={
                                 "cache_key": key,
@@ -137,9 +153,10 @@ class CacheService:
                                 "nx": True,
                             }
                         )
+                        await self._invalidate_local(key)
                         return True
                     else:
-                        logger.info(
+                        logger.debug(
                             f"Cache set (NX) failed - key already exists: {key}",
                             extra={
                                 "cache_key": key,
@@ -153,13 +170,14 @@ class CacheService:
                     # Redis 클라이언트에 접근할 수 없으면 일반 set 사용
                     logger.warning("Redis client not available, falling back to regular set")
                     await cache.set(key, value, ttl=ttl)
+                    await self._invalidate_local(key)
                     return True
             else:
                 # 일반 SET
                 await cache.set(key, value, ttl=ttl)
                 duration = time.time() - start
                 cache_metrics.record_set(key, duration)
-                logger.info(
+                logger.debug(
                     f"Cache set: {key}",
                     extra={
                         "cache_key": key,
@@ -167,6 +185,11 @@ class CacheService:
                         "duration_ms": duration * 1000,
                     }
                 )
+                local = self._local_for(key)
+                if local is not None:
+                    # 다른 프로세스의 L1(음성 항목 포함)을 먼저 제거한 뒤 로컬 L1 갱신
+                    await self._invalidate_local(key)
+                    local.put(key, _decode(value), ttl=ttl)
                 return True
         except Exception as e:
             cache_metrics.record_error(key)
@@ -181,14 +204,14 @@ class CacheService:
             return False
     
     async def delete(self, key: str) -> None:
-        """캐시 삭제"""
+        """캐시 삭제 (L1 + L2, 다른 프로세스 L1 무효화)"""
         start = time.time()
         try:
             cache = self._get_cache()
             await cache.delete(key)
             duration = time.time() - start
             cache_metrics.record_delete(key, duration)
-            logger.info(
+            logger.debug(
                 f"Cache deleted: {key}",
                 extra={
                     "cache_key": key,
@@ -205,6 +228,34 @@ class CacheService:
                 },
                 exc_info=True
             )
+        await self._invalidate_local(key)
+
+    def _local_for(self, key: str) -> Optional[LocalCache]:
+        """키에 L1 정책이 있으면 LocalCache 반환"""
+        if self.local is not None and self.local.policy_for(key) is not None:
+            return self.local
+        return None
+
+    async def _invalidate_local(self, *keys: str) -> None:
+        """로컬 L1 제거 후 다른 프로세스에 CACHE_INVALIDATED 발행 (L1 정책이 있는 키만)"""
+        targets: List[str] = [key for key in keys if self._local_for(key) is not None]
+        if not targets:
+            return
+
+        for key in targets:
+            self.local.delete(key)
+        try:
+            await self.event_bus.publish(EventType.CACHE_INVALIDATED, {"keys": targets})
+        except Exception as e:
+            logger.warning(f"Failed to publish cache invalidation: {targets}: {e}")
+
+    async def _handle_cache_invalidated(self, event: Event) -> None:
+        """CACHE_INVALIDATED 이벤트 처리 (L1만 제거, L2는 발행한 프로세스가 이미 처리)"""
+        if self.local is None:
+            return
+        removed = sum(1 for key in event.payload.get("keys", []) if self.local.delete(key))
+        if removed:
+            cache_metrics.record_l1_invalidation(removed)
     
     # 이벤트 핸들러들
     async def _handle_voice_created(self, event: Event) -> None:
@@ -4,7 +4,7 @@ Core Configuration Module
 """
 
 import json
-from typing import List, Optional
+from typing import Dict, List, Optional
 from pydantic import Field, field_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
@@ -20,6 +20,36 @@ class Settings(BaseSettings):
     debug: bool = Field(default=False, env="DEBUG")
     log_level: str = Field(default="INFO", env="LOG_LEVEL")
     log_json_format: bool = Field(default=False, env="LOG_JSON_FORMAT")
+    log_async_enabled: bool = Field(
+        default=True,
+        env="LOG_ASYNC_ENABLED",
+        description="Hand log records to a background writer thread instead of writing stdout on the caller thread",
+    )
+    log_queue_size: int = Field(
+        default=10000,
+        env="LOG_QUEUE_SIZE",
+        description="Max records waiting for the writer thread; further records are dropped and counted",
+    )
+    log_batch_size: int = Field(
+        default=256,
+        env="LOG_BATCH_SIZE",
+        description="Max records the writer formats and writes per flush",
+    )
+    log_flush_interval: float = Field(
+        default=0.1,
+        env="LOG_FLUSH_INTERVAL",
+        description="Max seconds a record waits in the writer before its batch is flushed",
+    )
+    log_rate_limits: Dict[str, float] = Field(
+        default={"backend.infrastructure.ai": 10.0, "backend.core.cache": 20.0},
+        env="LOG_RATE_LIMITS",
+        description="Per-logger (prefix) max INFO/DEBUG records per second (JSON); WARNING and above always pass",
+    )
+    log_sample_rates: Dict[str, float] = Field(
+        default={"httpx": 0.1},
+        env="LOG_SAMPLE_RATES",
+        description="Per-logger (prefix) fraction of INFO/DEBUG records kept (JSON); WARNING and above always pass",
+    )
 
     # ==================== Sentry ====================
     sentry_dsn: Optional[str] = Field(default=None, env="SENTRY_DSN")
@@ -67,6 +97,44 @@ class Settings(BaseSettings):
         default=7, env="JWT_REFRESH_TOKEN_EXPIRE_DAYS"
     )
 
+    auth_revocation_filter_enabled: bool = Field(
+        default=True,
+        env="AUTH_REVOCATION_FILTER_ENABLED",
+        description="Check revoked access tokens against a per-process set; Redis is only queried on a hit",
+    )
+    auth_revocation_sync_interval: int = Field(
+        default=60,
+        env="AUTH_REVOCATION_SYNC_INTERVAL",
+        description="Seconds between full reloads of the revoked access-token set from Redis (missed-event safety net)",
+    )
+    auth_principal_cache_ttl: int = Field(
+        default=120,
+        env="AUTH_PRINCIPAL_CACHE_TTL",
+        description="Redis TTL (seconds) for the resolved User cached per user id (in-process tier is capped at 30s)",
+    )
+
+    # ==================== Password Hashing ====================
+    password_hash_time_cost: int = Field(
+        default=4,
+        env="PASSWORD_HASH_TIME_COST",
+        description="Argon2 time cost; hashes with a different cost are rehashed on the next login",
+    )
+    password_hash_memory_cost: int = Field(
+        default=65536,
+        env="PASSWORD_HASH_MEMORY_COST",
+        description="Argon2 memory cost (KiB); hashes with a different cost are rehashed on the next login",
+    )
+    password_hash_workers: int = Field(
+        default=2,
+        env="PASSWORD_HASH_WORKERS",
+        description="Threads in the dedicated password-hashing executor (Argon2 never runs on the event loop)",
+    )
+    password_hash_max_pending: int = Field(
+        default=32,
+        env="PASSWORD_HASH_MAX_PENDING",
+        description="Max queued + running hash operations per process before requests are rejected with 503",
+    )
+
     # ==================== Google OAuth ====================
     google_oauth_client_id: Optional[str] = Field(
         default=None, env="GOOGLE_OAUTH_CLIENT_ID"
@@ -78,6 +146,26 @@ class Settings(BaseSettings):
         default="http://localhost:8000/auth/google/callback",
         env="GOOGLE_OAUTH_REDIRECT_URI",
     )
+    google_oauth_certs_url: str = Field(
+        default="https://www.googleapis.com/oauth2/v3/certs",
+        env="GOOGLE_OAUTH_CERTS_URL",
+        description="Google ID token signing keys (JWKS)",
+    )
+    google_jwks_default_ttl: int = Field(
+        default=3600,
+        env="GOOGLE_JWKS_DEFAULT_TTL",
+        description="JWKS cache lifetime (seconds) when the response has no Cache-Control max-age",
+    )
+    google_jwks_refresh_ahead: int = Field(
+        default=300,
+        env="GOOGLE_JWKS_REFRESH_AHEAD",
+        description="Refresh JWKS in the background this many seconds before the cached set expires",
+    )
+    google_jwks_min_refresh_interval: int = Field(
+        default=30,
+        env="GOOGLE_JWKS_MIN_REFRESH_INTERVAL",
+        description="Minimum seconds between forced JWKS refreshes triggered by unknown key IDs",
+    )
 
     # ==================== AI Providers ====================
     # Story Generation
@@ -101,6 +189,43 @@ class Settings(BaseSettings):
         default=None, env="ELEVENLABS_PRONUNCIATION_VERSION_ID"
     )
 
+    # Word Audio Store (책 간 공유 단어 발음 오디오)
+    tts_word_store_prefix: str = Field(
+        default="shared/words",
+        env="TTS_WORD_STORE_PREFIX",
+        description="전역 단어 오디오 저장 경로 prefix ({prefix}/{voice_id}/{hash[:2]}/{hash}.mp3)",
+    )
+    tts_word_index_ttl: int = Field(
+        default=2592000,
+        env="TTS_WORD_INDEX_TTL",
+        description="Book별 단어 인덱스 TTL (초, 기본 30일 - 만료 후 전역 인덱스에서 재연결)",
+    )
+    tts_word_prewarm_concurrency: int = Field(
+        default=4,
+        env="TTS_WORD_PREWARM_CONCURRENCY",
+        description="단어 오디오 사전 생성 시 동시 TTS 요청 수",
+    )
+    tts_word_prewarm_on_finalize: bool = Field(
+        default=True,
+        env="TTS_WORD_PREWARM_ON_FINALIZE",
+        description="동화책 생성 완료 시 책 전체 단어 오디오 사전 생성 작업 등록",
+    )
+    tts_word_prewarm_job_ttl: int = Field(
+        default=86400,
+        env="TTS_WORD_PREWARM_JOB_TTL",
+        description="책 단어 사전 생성 진행 상황 보관 TTL (초)",
+    )
+    tts_word_prewarm_stale_seconds: int = Field(
+        default=120,
+        env="TTS_WORD_PREWARM_STALE_SECONDS",
+        description="실행 중 heartbeat가 이 시간 동안 없으면 작업이 중단된 것으로 보고 재등록 허용 (중복 실행 방지 락 TTL, 초)",
+    )
+    tts_word_single_flight_timeout: float = Field(
+        default=30.0,
+        env="TTS_WORD_SINGLE_FLIGHT_TIMEOUT",
+        description="같은 단어 생성 대기 최대 시간 (초, 다른 프로세스의 생성 락 TTL 겸용)",
+    )
+
     # Image Generation
     ai_image_provider: str = Field(default="runware", env="AI_IMAGE_PROVIDER")
 
@@ -131,6 +256,80 @@ class Settings(BaseSettings):
     storage_provider: str = Field(default="local", env="STORAGE_PROVIDER")
     storage_base_path: str = Field(default="/app/data", env="STORAGE_BASE_PATH")
     storage_base_url: str = Field(default="/api/v1/files", env="STORAGE_BASE_URL")
+    storage_stream_chunk_size: int = Field(
+        default=64 * 1024,
+        env="STORAGE_STREAM_CHUNK_SIZE",
+        description="Chunk size (bytes) for streaming file reads",
+    )
+    file_cache_max_size: int = Field(
+        default=2 * 1024 * 1024,
+        env="FILE_CACHE_MAX_SIZE",
+        description="Largest public file (bytes) served from the media cache; larger files are streamed",
+    )
+    media_cache_memory_max_bytes: int = Field(
+        default=64 * 1024 * 1024,
+        env="MEDIA_CACHE_MEMORY_MAX_BYTES",
+        description="Total bytes kept in the in-process media cache tier (LRU)",
+    )
+    media_cache_memory_entry_max_bytes: int = Field(
+        default=512 * 1024,
+        env="MEDIA_CACHE_MEMORY_ENTRY_MAX_BYTES",
+        description="Largest single file (bytes) kept in the in-process tier; larger ones live only in Redis",
+    )
+    media_cache_ttl: int = Field(
+        default=86400,
+        env="MEDIA_CACHE_TTL",
+        description="Media cache TTL (seconds) for both tiers",
+    )
+
+    # S3/R2 Object Storage I/O
+    storage_io_max_workers: int = Field(
+        default=16,
+        env="STORAGE_IO_MAX_WORKERS",
+        description="Threads in the dedicated object-storage executor (boto3 calls never run on the event loop)",
+    )
+    storage_max_pool_connections: int = Field(
+        default=32,
+        env="STORAGE_MAX_POOL_CONNECTIONS",
+        description="boto3 HTTP connection pool size per S3/R2 client",
+    )
+    storage_multipart_threshold: int = Field(
+        default=8 * 1024 * 1024,
+        env="STORAGE_MULTIPART_THRESHOLD",
+        description="Uploads larger than this (bytes) use multipart upload",
+    )
+    storage_multipart_part_size: int = Field(
+        default=8 * 1024 * 1024,
+        env="STORAGE_MULTIPART_PART_SIZE",
+        description="Multipart part size (bytes, S3 minimum 5 MiB)",
+    )
+    storage_multipart_concurrency: int = Field(
+        default=4,
+        env="STORAGE_MULTIPART_CONCURRENCY",
+        description="Parts uploaded concurrently per multipart upload",
+    )
+
+    # CDN → Storage Transfer (생성된 이미지/비디오 저장)
+    storage_transfer_concurrency: int = Field(
+        default=4,
+        env="STORAGE_TRANSFER_CONCURRENCY",
+        description="Parallel CDN-to-storage transfers per task",
+    )
+    storage_transfer_budget_bytes: int = Field(
+        default=256 * 1024 * 1024,
+        env="STORAGE_TRANSFER_BUDGET_BYTES",
+        description="Per-process budget (bytes) of in-flight CDN-to-storage transfers",
+    )
+    storage_transfer_default_reservation: int = Field(
+        default=16 * 1024 * 1024,
+        env="STORAGE_TRANSFER_DEFAULT_RESERVATION",
+        description="Budget reserved (bytes) for a transfer whose Content-Length is unknown",
+    )
+    storage_transfer_max_retries: int = Field(
+        default=2,
+        env="STORAGE_TRANSFER_MAX_RETRIES",
+        description="Attempts per item for CDN-to-storage transfers",
+    )
 
     # AWS S3 (if STORAGE_PROVIDER=s3)
     aws_access_key_id: Optional[str] = Field(default=None, env="AWS_ACCESS_KEY_ID")
@@ -155,6 +354,14 @@ class Settings(BaseSettings):
     cloudflare_signing_key: Optional[str] = Field(default=None, env="CLOUDFLARE_SIGNING_KEY")
     cloudflare_url_expiration: int = Field(default=3600, env="CLOUDFLARE_URL_EXPIRATION")
 
+    # Signed URL 시간 버킷 (R2/S3)
+    signed_url_bucket_seconds: int = Field(
+        default=900, env="SIGNED_URL_BUCKET_SECONDS"
+    )  # 만료 시각을 이 간격 경계로 올림 → 같은 버킷 안에서는 같은 URL (0이면 비활성화)
+    signed_url_cache_size: int = Field(
+        default=4096, env="SIGNED_URL_CACHE_SIZE"
+    )  # 프로세스 메모리 서명 URL LRU 최대 항목 수
+
 
     # ==================== Redis Cache & Event Bus ====================
     redis_host: str = Field(default="redis", env="REDIS_HOST")
@@ -165,6 +372,17 @@ class Settings(BaseSettings):
         """Redis 연결 URL"""
         return f"redis://{self.redis_host}:{self.redis_port}"
 
+    cache_l1_enabled: bool = Field(
+        default=True,
+        env="CACHE_L1_ENABLED",
+        description="CacheService 앞단 프로세스 메모리 L1 캐시 사용 (정책이 있는 네임스페이스만)",
+    )
+    cache_l1_max_entries: int = Field(
+        default=10000,
+        env="CACHE_L1_MAX_ENTRIES",
+        description="L1 캐시 최대 항목 수 (LRU)",
+    )
+
     # ==================== CORS ====================
     cors_origins_str: str = Field(default="http://localhost:5173", env="CORS_ORIGINS")
 
@@ -194,6 +412,11 @@ class Settings(BaseSettings):
     # ==================== Business Logic ====================
     max_books_per_user: int = Field(default=3, env="MAX_BOOKS_PER_USER")
     max_pages_per_book: int = Field(default=5, env="MAX_PAGES_PER_BOOK")
+    max_upload_image_bytes: int = Field(
+        default=10 * 1024 * 1024,
+        env="MAX_UPLOAD_IMAGE_BYTES",
+        description="Largest accepted source image (bytes) per page upload",
+    )
     max_voice_clones_per_user: int = Field(default=1, env="MAX_VOICE_CLONES_PER_USER")
     max_dialogues_per_page: int = Field(
         default=4, env="MAX_DIALOGUES_PER_PAGE"
@@ -245,12 +468,143 @@ class Settings(BaseSettings):
     http_timeout: float = Field(default=60.0, env="HTTP_TIMEOUT")
     http_read_timeout: float = Field(default=300.0, env="HTTP_READ_TIMEOUT")
     http_max_connections: int = Field(default=10, env="HTTP_MAX_CONNECTIONS")
+    http_pool_max_connections: Dict[str, int] = Field(
+        default={"runware": 20, "kling": 10, "google_ai": 10, "cdn": 20, "elevenlabs": 5},
+        env="HTTP_POOL_MAX_CONNECTIONS",
+        description="Per-provider connection pool size (JSON); others use http_max_connections",
+    )
+    http_keepalive_expiry: float = Field(
+        default=30.0,
+        env="HTTP_KEEPALIVE_EXPIRY",
+        description="Seconds an idle pooled connection is kept alive",
+    )
+    http2_enabled: bool = Field(
+        default=True,
+        env="HTTP2_ENABLED",
+        description="Negotiate HTTP/2 with AI providers when the h2 package is installed",
+    )
 
     # ==================== Resource Limits ====================
     video_generation_limit: int = Field(
         default=20,
         env="VIDEO_GENERATION_LIMIT",
-        description="Maximum concurrent video generation requests (server-wide)",
+        description="Maximum concurrent video generation requests across all processes (default for *:video policies)",
+    )
+    rate_limit_distributed: bool = Field(
+        default=True,
+        env="RATE_LIMIT_DISTRIBUTED",
+        description="Share provider rate limits across processes via Redis (false: per-process limits only)",
+    )
+    rate_limit_policies: Dict[str, Dict[str, float]] = Field(
+        default={
+            "runware:image": {"rate": 10, "burst": 20, "concurrency": 20},
+            "runware:video": {"rate": 2, "burst": 5},
+            "kling:video": {"rate": 1, "burst": 3, "concurrency": 10},
+            "elevenlabs:tts": {"rate": 5, "burst": 5, "concurrency": 5, "reserved": 2, "latency_target": 20},
+        },
+        env="RATE_LIMIT_POLICIES",
+        description=(
+            "Per provider:operation limits (JSON): rate (req/s, 0=unlimited), burst, concurrency, "
+            "reserved (slots kept for interactive calls), lease_ttl (s), latency_target (s)"
+        ),
+    )
+    rate_limit_min_factor: float = Field(
+        default=0.1,
+        env="RATE_LIMIT_MIN_FACTOR",
+        description="Lowest fraction of a policy the adaptive limiter may shrink to after 429s/latency spikes",
+    )
+    rate_limit_recovery_step: float = Field(
+        default=0.05,
+        env="RATE_LIMIT_RECOVERY_STEP",
+        description="Fraction of a policy restored per successful call after a reduction",
+    )
+    rate_limit_cooldown_seconds: float = Field(
+        default=5.0,
+        env="RATE_LIMIT_COOLDOWN_SECONDS",
+        description="Minimum time between allowance reductions (and before recovery starts)",
+    )
+
+    # ==================== DAG Worker ====================
+    dag_embedded_worker: bool = Field(
+        default=True,
+        env="DAG_EMBEDDED_WORKER",
+        description="Run a DAG worker inside the API process (disable when running dedicated workers)",
+    )
+    dag_worker_concurrency: int = Field(
+        default=10,
+        env="DAG_WORKER_CONCURRENCY",
+        description="Maximum concurrent DAG nodes per worker process",
+    )
+    dag_lease_seconds: int = Field(
+        default=60,
+        env="DAG_LEASE_SECONDS",
+        description="DAG node lease TTL; stale nodes are reclaimed after twice this value (seconds)",
+    )
+    dag_retention_seconds: int = Field(
+        default=86400,
+        env="DAG_RETENTION_SECONDS",
+        description="How long finished DAG state is kept in Redis (seconds)",
+    )
+
+    # ==================== Book Progress Events ====================
+    book_progress_heartbeat_seconds: float = Field(
+        default=15.0,
+        env="BOOK_PROGRESS_HEARTBEAT_SECONDS",
+        description="Keep-alive interval for the book progress SSE stream (seconds)",
+    )
+    book_progress_retention_seconds: int = Field(
+        default=86400,
+        env="BOOK_PROGRESS_RETENTION_SECONDS",
+        description="How long per-page progress events are kept for late subscribers (seconds)",
+    )
+
+    # ==================== Shared Book Response Cache ====================
+    book_response_cache_enabled: bool = Field(
+        default=True,
+        env="BOOK_RESPONSE_CACHE_ENABLED",
+        description="Cache serialized detail responses of completed shared books (Redis + in-process tier)",
+    )
+    book_response_cache_ttl: int = Field(
+        default=3600,
+        env="BOOK_RESPONSE_CACHE_TTL",
+        description="Upper bound for cached book responses; entries also expire when the signed URL bucket rolls over (seconds)",
+    )
+    book_response_cache_local_ttl: float = Field(
+        default=5.0,
+        env="BOOK_RESPONSE_CACHE_LOCAL_TTL",
+        description="In-process tier TTL; bounds staleness in processes that did not receive the invalidation event (seconds)",
+    )
+    book_response_cache_local_max_entries: int = Field(
+        default=256,
+        env="BOOK_RESPONSE_CACHE_LOCAL_MAX_ENTRIES",
+        description="Maximum number of book responses kept in the in-process tier",
+    )
+
+    # ==================== TTS Worker ====================
+    tts_embedded_worker: bool = Field(
+        default=True,
+        env="TTS_EMBEDDED_WORKER",
+        description="Run a TTS worker inside the API process (disable when running dedicated workers)",
+    )
+    tts_worker_concurrency: int = Field(
+        default=3,
+        env="TTS_WORKER_CONCURRENCY",
+        description="Maximum concurrent TTS jobs per worker process (ElevenLabs pool slots minus word TTS headroom)",
+    )
+    tts_worker_visibility_timeout: int = Field(
+        default=120,
+        env="TTS_WORKER_VISIBILITY_TIMEOUT",
+        description="Unacknowledged TTS messages idle longer than this are reclaimed by another worker (seconds)",
+    )
+    tts_worker_max_deliveries: int = Field(
+        default=5,
+        env="TTS_WORKER_MAX_DELIVERIES",
+        description="Delivery attempts before a TTS message is moved to the dead-letter stream",
+    )
+    tts_worker_metrics_interval: int = Field(
+        default=10,
+        env="TTS_WORKER_METRICS_INTERVAL",
+        description="How often each TTS worker publishes its metrics snapshot to Redis (seconds)",
     )
 
     # ==================== Task Retry Configuration ====================
@@ -274,7 +628,7 @@ class Settings(BaseSettings):
     task_image_poll_interval: int = Field(
         default=5,
         env="TASK_IMAGE_POLL_INTERVAL",
-        description="Polling interval for async image generation status check (seconds)",
+        description="Maximum polling interval for async image generation status check (seconds)",
     )
     task_image_max_wait_time: int = Field(
         default=300,
@@ -282,6 +636,35 @@ class Settings(BaseSettings):
         description="Maximum wait time for async image generation (seconds)",
     )
 
+    # Video generation async polling settings
+    task_video_max_wait_time: int = Field(
+        default=600,
+        env="TASK_VIDEO_MAX_WAIT_TIME",
+        description="Maximum wait time for async video generation (seconds)",
+    )
+
+    # Shared status poller settings (image/video)
+    task_video_poll_interval: int = Field(
+        default=10,
+        env="TASK_VIDEO_POLL_INTERVAL",
+        description="Maximum polling interval for async video generation status check (seconds)",
+    )
+    task_poll_min_interval: float = Field(
+        default=1.0,
+        env="TASK_POLL_MIN_INTERVAL",
+        description="Polling interval for freshly submitted tasks (seconds)",
+    )
+    task_poll_backoff_factor: float = Field(
+        default=0.1,
+        env="TASK_POLL_BACKOFF_FACTOR",
+        description="Polling interval as a fraction of how long a task has been pending",
+    )
+    task_poll_batch_size: int = Field(
+        default=50,
+        env="TASK_POLL_BATCH_SIZE",
+        description="Maximum task UUIDs per status request",
+    )
+
     task_retry_delay: float = Field(
         default=2.0,
         env="TASK_RETRY_DELAY",
@@ -7,6 +7,7 @@ from typing import Optional
 from fastapi import Depends
 from sqlalchemy.ext.asyncio import AsyncSession
 from backend.core.config import settings
+from backend.infrastructure.storage.base import AbstractStorageService
 from backend.infrastructure.storage.local import LocalStorageService
 from backend.infrastructure.storage.s3 import S3StorageService
 from backend.infrastructure.storage.r2 import R2StorageService
@@ -46,19 +47,26 @@ def get_cache_service(
     return _cache_service
 
 
+_object_storage_service: Optional[AbstractStorageService] = None
+
+
 def get_storage_service():
     """
     스토리지 서비스 의존성
 
     설정에 따라 LocalStorageService 또는 S3StorageService 반환
+    S3/R2는 boto3 클라이언트 연결 풀을 재사용하도록 프로세스당 1개만 생성합니다.
 
     Returns:
         AbstractStorageService: 스토리지 서비스 인스턴스
     """
-    if settings.storage_provider == "s3":
-        return S3StorageService()
-    elif settings.storage_provider == "r2":
-        return R2StorageService()
+    global _object_storage_service
+    if settings.storage_provider in ("s3", "r2"):
+        if _object_storage_service is None:
+            _object_storage_service = (
+                S3StorageService() if settings.storage_provider == "s3" else R2StorageService()
+            )
+        return _object_storage_service
     return LocalStorageService()
 
 
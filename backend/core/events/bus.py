@@ -4,7 +4,7 @@ Event Bus Interface
 """
 
 from abc import ABC, abstractmethod
-from typing import Callable, Awaitable
+from typing import Awaitable, Callable, List
 from .types import Event, EventType
 
 
@@ -15,6 +15,13 @@ class EventBus(ABC):
     async def publish(self, event_type: EventType, payload: dict) -> None:
         """이벤트 발행"""
         pass
+
+    async def publish_many(self, event_type: EventType, payloads: List[dict]) -> None:
+        """
+        이벤트 일괄 발행 (기본 구현: 순차 publish, 구현체에서 파이프라인으로 재정의)
+        """
+        for payload in payloads:
+            await self.publish(event_type, payload)
     
     @abstractmethod
     async def subscribe(
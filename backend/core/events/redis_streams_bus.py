@@ -11,7 +11,7 @@ from typing import Dict, List, Callable, Awaitable, Optional
 import redis.asyncio as aioredis
 import redis
 from .bus import EventBus
-from .types import Event, EventType
+from .types import BROADCAST_EVENT_TYPES, Event, EventType
 from ..config import settings
 
 logger = logging.getLogger(__name__)
@@ -20,13 +20,20 @@ logger = logging.getLogger(__name__)
 class RedisStreamsEventBus(EventBus):
     """Redis Streams 기반 이벤트 버스"""
     
-    def __init__(self, redis_url: str = None, consumer_group: str = "cache-service"):
+    def __init__(
+        self,
+        redis_url: str = None,
+        consumer_group: str = "cache-service",
+        stream_prefix: str = "events",
+    ):
         self.redis_url = redis_url or settings.redis_url
         self.consumer_group = consumer_group
+        self.stream_prefix = stream_prefix
         self.redis: Optional[aioredis.Redis] = None
         self.handlers: Dict[EventType, List[Callable]] = {}
         self._running = False
         self._task: Optional[asyncio.Task] = None
+        self._broadcast_task: Optional[asyncio.Task] = None
     
     async def connect(self):
         """Redis 연결"""
@@ -38,7 +45,7 @@ class RedisStreamsEventBus(EventBus):
         
         # Consumer Groups 생성 (이미 있으면 무시)
         for event_type in EventType:
-            stream_name = f"events:{event_type.value}"
+            stream_name = f"{self.stream_prefix}:{event_type.value}"
             try:
                 await self.redis.xgroup_create(
                     stream_name,
@@ -58,7 +65,7 @@ class RedisStreamsEventBus(EventBus):
             await self.connect()
         
         event = Event.create(event_type, payload, source="tts-service")
-        stream_name = f"events:{event_type.value}"
+        stream_name = f"{self.stream_prefix}:{event_type.value}"
         
         try:
             await self.redis.xadd(
@@ -73,6 +80,33 @@ class RedisStreamsEventBus(EventBus):
         except Exception as e:
             logger.error(f"Failed to publish event: {e}", exc_info=True)
             raise
+
+    async def publish_many(self, event_type: EventType, payloads: List[dict]) -> None:
+        """이벤트 일괄 발행 (모든 XADD를 하나의 파이프라인으로 전송 - 1 round-trip)"""
+        if not payloads:
+            return
+        if not self.redis:
+            await self.connect()
+
+        stream_name = f"{self.stream_prefix}:{event_type.value}"
+
+        try:
+            async with self.redis.pipeline(transaction=False) as pipe:
+                for payload in payloads:
+                    event = Event.create(event_type, payload, source="tts-service")
+                    pipe.xadd(
+                        stream_name,
+                        {
+                            "event": event.model_dump_json(),
+                            "type": event_type.value
+                        },
+                        maxlen=10000
+                    )
+                await pipe.execute()
+            logger.info(f"Events published: {event_type.value} x{len(payloads)}")
+        except Exception as e:
+            logger.error(f"Failed to publish events: {e}", exc_info=True)
+            raise
     
     async def subscribe(
         self,
@@ -91,10 +125,11 @@ class RedisStreamsEventBus(EventBus):
         
         while self._running:
             try:
-                # 모든 이벤트 스트림에서 읽기
+                # 모든 이벤트 스트림에서 읽기 (브로드캐스트 이벤트는 _listen_broadcast에서 수신)
                 streams = {
-                    f"events:{et.value}": ">"
+                    f"{self.stream_prefix}:{et.value}": ">"
                     for et in self.handlers.keys()
+                    if et not in BROADCAST_EVENT_TYPES
                 }
                 
                 if not streams:
@@ -119,13 +154,7 @@ class RedisStreamsEventBus(EventBus):
                             event_type = EventType(data["type"])
                             
                             # 모든 핸들러 실행
-                            if event_type in self.handlers:
-                                for handler in self.handlers[event_type]:
-                                    try:
-                                        await handler(event)
-                                        logger.debug(f"Handler executed for {event_type.value}")
-                                    except Exception as e:
-                                        logger.error(f"Handler error: {e}", exc_info=True)
+                            await self._dispatch(event_type, event)
                             
                             # ACK 처리
                             await self.redis.xack(
@@ -147,6 +176,53 @@ class RedisStreamsEventBus(EventBus):
         
         logger.info(f"Event listener stopped: {consumer_name}")
     
+    async def _dispatch(self, event_type: EventType, event: Event) -> None:
+        """이벤트 타입의 모든 핸들러 실행 (핸들러 오류는 로그만 남김)"""
+        for handler in self.handlers.get(event_type, []):
+            try:
+                await handler(event)
+                logger.debug(f"Handler executed for {event_type.value}")
+            except Exception as e:
+                logger.error(f"Handler error: {e}", exc_info=True)
+
+    async def _listen_broadcast(self):
+        """
+        브로드캐스트 이벤트 수신 루프 (Consumer Group 없이 XREAD)
+
+        모든 프로세스가 같은 메시지를 받습니다. 시작 이후 발행된 메시지만 처리하며 ACK하지 않습니다.
+        """
+        last_ids: Dict[str, str] = {}
+
+        while self._running:
+            try:
+                for event_type in BROADCAST_EVENT_TYPES:
+                    stream_name = f"{self.stream_prefix}:{event_type.value}"
+                    if event_type in self.handlers and stream_name not in last_ids:
+                        # 구독 시점의 마지막 메시지 이후부터 수신
+                        latest = await self.redis.xrevrange(stream_name, count=1)
+                        last_ids[stream_name] = latest[0][0] if latest else "0-0"
+
+                if not last_ids:
+                    await asyncio.sleep(1)
+                    continue
+
+                messages = await self.redis.xread(last_ids, count=100, block=1000)
+
+                for stream_name, msgs in messages:
+                    for msg_id, data in msgs:
+                        last_ids[stream_name] = msg_id
+                        try:
+                            event = Event(**json.loads(data["event"]))
+                            await self._dispatch(EventType(data["type"]), event)
+                        except Exception as e:
+                            logger.error(f"Broadcast event processing error: {e}", exc_info=True)
+
+            except asyncio.TimeoutError:
+                continue
+            except Exception as e:
+                logger.error(f"Broadcast listening error: {e}", exc_info=True)
+                await asyncio.sleep(1)
+
     async def start(self, consumer_name: str = None) -> None:
         """이벤트 버스 시작"""
         if not self.redis:
@@ -158,6 +234,7 @@ class RedisStreamsEventBus(EventBus):
         
         self._running = True
         self._task = asyncio.create_task(self._listen(consumer_name))
+        self._broadcast_task = asyncio.create_task(self._listen_broadcast())
         logger.info(f"Event bus started (consumer: {consumer_name})")
     
     async def stop(self) -> None:
@@ -165,12 +242,13 @@ class RedisStreamsEventBus(EventBus):
         logger.info("Stopping event bus...")
         self._running = False
         
-        if self._task:
-            self._task.cancel()
-            try:
-                await self._task
-            except asyncio.CancelledError:
-                pass
+        for task in (self._task, self._broadcast_task):
+            if task:
+                task.cancel()
+                try:
+                    await task
+                except asyncio.CancelledError:
+                    pass
         
         if self.redis:
             await self.redis.close()
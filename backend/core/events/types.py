@@ -16,6 +16,19 @@ class EventType(str, Enum):
     VOICE_UPDATED = "voice.updated"
     VOICE_DELETED = "voice.deleted"
     TTS_CREATION = "tts.creation"
+    BOOK_UPDATED = "book.updated"
+    WORD_AUDIO_PREWARM = "tts.word_prewarm"
+    CACHE_INVALIDATED = "cache.invalidated"
+    ACCESS_TOKEN_REVOKED = "auth.access_token_revoked"
+
+
+# 모든 프로세스에 전달되는 이벤트 (Consumer Group 없이 XREAD로 수신)
+# 프로세스 메모리 캐시 무효화처럼 한 곳에서만 처리하면 안 되는 이벤트에 사용
+BROADCAST_EVENT_TYPES = frozenset({
+    EventType.BOOK_UPDATED,
+    EventType.CACHE_INVALIDATED,
+    EventType.ACCESS_TOKEN_REVOKED,
+})
 
 
 class Event(BaseModel):
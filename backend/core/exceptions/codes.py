@@ -94,6 +94,9 @@ class ErrorCode(str, Enum):
     BIZ_BOOK_INVALID_LEVEL = "BIZ_110"
     """잘못된 레벨입니다"""
 
+    BIZ_BOOK_IMAGE_TOO_LARGE = "BIZ_111"
+    """업로드 이미지 크기가 너무 큽니다"""
+
     BIZ_TTS_GENERATION_FAILED = "BIZ_201"
     """음성 생성에 실패했습니다"""
 
@@ -124,3 +127,6 @@ class ErrorCode(str, Enum):
 
     SYS_EXTERNAL_SERVICE_ERROR = "SYS_003"
     """외부 서비스 연동 중 오류가 발생했습니다"""
+
+    SYS_SERVICE_BUSY = "SYS_004"
+    """요청이 많아 처리할 수 없습니다. 잠시 후 다시 시도해주세요"""
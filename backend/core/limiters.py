@@ -1,66 +1,428 @@
 """
-Resource Limiters - Global Semaphores for Rate Limiting
-서버 전체 리소스 사용량 제어 (동시성 제한)
+Resource Limiters - Distributed Rate Limiting
+서버 전체(모든 프로세스) 외부 API 호출량 제어
+
+Provider/작업(예: "runware:image", "elevenlabs:tts")별로
+- 토큰 버킷 (초당 요청 수)
+- 동시 실행 Lease (동시 요청 수)
+를 Redis에서 공유하므로 API/Worker 프로세스 수와 관계없이 실제 부하가 정책을 넘지 않습니다.
+
+429 응답이나 지연 급증을 감지하면 허용량을 줄이고(AIMD), 정상 응답이 이어지면 다시 늘립니다.
+Redis를 사용할 수 없으면 프로세스 로컬 동시성 제한으로 대체합니다.
 """
 
 import asyncio
-from typing import Optional
+import random
+import threading
+import time
+import uuid
+from collections import defaultdict
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from enum import Enum
+from typing import AsyncIterator, Dict, Optional
+
+import redis.asyncio as aioredis
+
 from .config import settings
+from .logging import get_logger
 
+logger = get_logger(__name__)
+
+_KEY_PREFIX = "ratelimit"
+# Redis 장애 시 재연결을 시도하기 전까지 로컬 제한만 사용하는 시간 (초)
+_REDIS_RETRY_AFTER = 30.0
+# 동시 실행 슬롯이 가득 찼을 때 재시도 간격 (초)
+_POLL_INTERVAL = 0.1
+
+# 토큰 버킷 + 동시 실행 Lease 획득 (원자적)
+# KEYS: [state hash, lease zset]
+# ARGV: rate, burst, concurrency, reserved, is_batch, lease_id, lease_ttl_ms
+# Returns: {acquired(0|1), wait_ms, factor}
+_ACQUIRE_SCRIPT = """
+local t = redis.call('TIME')
+local now = tonumber(t[1]) * 1000 + math.floor(tonumber(t[2]) / 1000)
+local rate = tonumber(ARGV[1])
+local burst = tonumber(ARGV[2])
+local concurrency = tonumber(ARGV[3])
+local reserved = tonumber(ARGV[4])
+local is_batch = tonumber(ARGV[5])
+local ttl = tonumber(ARGV[7])
+
+local state = redis.call('HMGET', KEYS[1], 'tokens', 'ts', 'factor')
+local factor = tonumber(state[3]) or 1.0
+
+redis.call('ZREMRANGEBYSCORE', KEYS[2], '-inf', now)
+local slots = math.max(1, math.floor(concurrency * factor))
+if is_batch == 1 then
+  slots = math.max(1, slots - reserved)
+end
+if redis.call('ZCARD', KEYS[2]) >= slots then
+  return {0, 0, tostring(factor)}
+end
+
+if rate > 0 then
+  local capacity = math.max(1, burst * factor)
+  local tokens = tonumber(state[1]) or capacity
+  local ts = tonumber(state[2]) or now
+  tokens = math.min(capacity, tokens + (now - ts) / 1000 * rate * factor)
+  if tokens < 1 then
+    redis.call('HSET', KEYS[1], 'tokens', tokens, 'ts', now)
+    return {0, math.ceil((1 - tokens) * 1000 / (rate * factor)), tostring(factor)}
+  end
+  redis.call('HSET', KEYS[1], 'tokens', tokens - 1, 'ts', now)
+end
+
+redis.call('ZADD', KEYS[2], now + ttl, ARGV[6])
+redis.call('PEXPIRE', KEYS[2], ttl * 2)
+redis.call('PEXPIRE', KEYS[1], 86400000)
+return {1, 0, tostring(factor)}
+"""
+
+# 허용량 조정 (AIMD)
+# KEYS: [state hash]
+# ARGV: mode(throttle|slow|ok), min_factor, recovery_step, cooldown_ms
+# Returns: factor
+_ADAPT_SCRIPT = """
+local t = redis.call('TIME')
+local now = tonumber(t[1]) * 1000 + math.floor(tonumber(t[2]) / 1000)
+local mode = ARGV[1]
+local state = redis.call('HMGET', KEYS[1], 'factor', 'cut_ts')
+local factor = tonumber(state[1]) or 1.0
+local cut_ts = tonumber(state[2]) or 0
+
+-- 여러 프로세스가 같은 429를 동시에 보고해도 쿨다운 동안은 1회만 감소
+if now - cut_ts < tonumber(ARGV[4]) then
+  return tostring(factor)
+end
+
+if mode == 'ok' then
+  factor = math.min(1.0, factor + tonumber(ARGV[3]))
+else
+  local mult = 0.5
+  if mode == 'slow' then
+    mult = 0.8
+  end
+  factor = math.max(tonumber(ARGV[2]), factor * mult)
+  redis.call('HSET', KEYS[1], 'cut_ts', now)
+end
+redis.call('HSET', KEYS[1], 'factor', factor)
+redis.call('PEXPIRE', KEYS[1], 86400000)
+return tostring(factor)
+"""
 
-class ResourceLimiters:
-    """
-    글로벌 리소스 제한자 (싱글톤 패턴)
 
-    서버 전체에서 공유되는 세마포어를 관리하여 외부 API 호출량 제어
+class Priority(str, Enum):
+    """호출 우선순위 (INTERACTIVE는 reserved 슬롯까지 사용 가능)"""
+
+    INTERACTIVE = "interactive"
+    BATCH = "batch"
+
+
+@dataclass(frozen=True)
+class LimitPolicy:
+    """
+    Provider/작업별 제한 정책
 
     Attributes:
-        video_generation: 비디오 생성 API 동시 호출 제한
-        (향후 확장: image_generation, tts_generation 등)
+        rate: 초당 허용 요청 수 (0이면 제한 없음)
+        burst: 토큰 버킷 최대 크기
+        concurrency: 최대 동시 요청 수
+        reserved: BATCH 요청이 사용할 수 없는(INTERACTIVE 전용) 동시 슬롯 수
+        lease_ttl: 동시 실행 Lease TTL (초, 프로세스가 죽으면 이 시간 후 회수)
+        latency_target: 이보다 오래 걸린 요청은 지연 급증으로 보고 허용량 감소 (초, 0이면 사용 안 함)
     """
 
-    _instance: Optional['ResourceLimiters'] = None
+    rate: float = 0.0
+    burst: float = 1.0
+    concurrency: int = 10
+    reserved: int = 0
+    lease_ttl: int = 120
+    latency_target: float = 0.0
+
+    def slots(self, factor: float, priority: Priority) -> int:
+        """현재 factor에서 우선순위별 사용 가능한 동시 슬롯 수"""
+        slots = max(1, int(self.concurrency * factor))
+        if priority == Priority.BATCH:
+            slots = max(1, slots - self.reserved)
+        return slots
+
+
+def is_throttle_error(error: BaseException) -> bool:
+    """Provider 예외가 429 (Rate Limit)인지 판별"""
+    status = getattr(error, "status_code", None)
+    response = getattr(error, "response", None)
+    if status is None and response is not None:
+        status = getattr(response, "status_code", None)
+    if status == 429:
+        return True
+    message = str(error).lower()
+    return "429" in message or "rate limit" in message or "too many requests" in message
+
 
-    def __new__(cls):
-        """싱글톤 패턴 구현"""
-        if cls._instance is None:
-            cls._instance = super().__new__(cls)
-            cls._instance._initialized = False
-        return cls._instance
+@dataclass
+class _Lease:
+    name: str
+    lease_id: str
+    factor: float
+    local: bool
+
+
+class _LocalGate:
+    """Redis를 사용할 수 없을 때의 프로세스 로컬 동시성 제한"""
 
     def __init__(self):
-        """세마포어 초기화 (최초 1회만)"""
-        if self._initialized:
-            return
+        self.active = 0
+        self.condition = asyncio.Condition()
+
+    async def acquire(self, slots: int) -> None:
+        async with self.condition:
+            await self.condition.wait_for(lambda: self.active < slots)
+            self.active += 1
 
-        # Video Generation Semaphore
-        self.video_generation = asyncio.Semaphore(
-            settings.video_generation_limit
+    async def release(self) -> None:
+        async with self.condition:
+            self.active -= 1
+            self.condition.notify_all()
+
+
+class RateLimiter:
+    """
+    분산 Rate Limiter
+
+    Example:
+        limiter = get_limiters()
+        async with limiter.limit("runware", "video"):
+            result = await video_provider.generate_video(...)
+
+        # 실시간 요청은 INTERACTIVE로 reserved 슬롯 사용
+        async with limiter.limit("elevenlabs", "tts", Priority.INTERACTIVE):
+            ...
+    """
+
+    def __init__(self, redis_url: Optional[str] = None, distributed: Optional[bool] = None):
+        """
+        Args:
+            redis_url: Redis 연결 URL (None일 경우 settings에서 가져옴)
+            distributed: Redis 공유 제한 사용 여부 (기본값: settings.rate_limit_distributed)
+        """
+        self.redis_url = redis_url or settings.redis_url
+        self.distributed = settings.rate_limit_distributed if distributed is None else distributed
+        self.redis: Optional[aioredis.Redis] = None
+        self._acquire_script = None
+        self._adapt_script = None
+        self._redis_down_until = 0.0
+
+        self._local_gates: Dict[str, _LocalGate] = {}
+        self._local_factors: Dict[str, float] = {}
+
+        self._lock = threading.Lock()
+        self._stats = defaultdict(
+            lambda: {"acquired": 0, "throttled": 0, "slow": 0, "fallback": 0, "total_wait_time": 0.0, "factor": 1.0}
         )
 
-        self._initialized = True
+    def policy(self, provider: str, operation: str) -> LimitPolicy:
+        """
+        Provider/작업 정책 조회 (settings.rate_limit_policies)
+
+        정책이 없는 작업은 동시 요청 수만 HTTP 풀 크기로 제한합니다.
+        비디오 작업의 동시 요청 수 기본값은 settings.video_generation_limit입니다.
+        """
+        config = dict(settings.rate_limit_policies.get(f"{provider}:{operation}", {}))
+        if "concurrency" not in config:
+            config["concurrency"] = (
+                settings.video_generation_limit
+                if operation == "video"
+                else settings.http_pool_max_connections.get(provider, settings.http_max_connections)
+            )
+        for field in ("concurrency", "reserved", "lease_ttl"):
+            if field in config:
+                config[field] = int(config[field])
+        return LimitPolicy(**config)
+
+    @asynccontextmanager
+    async def limit(
+        self,
+        provider: str,
+        operation: str,
+        priority: Priority = Priority.BATCH,
+    ) -> AsyncIterator[None]:
+        """
+        토큰 + 동시 실행 슬롯을 확보한 상태로 블록 실행
+
+        블록에서 429 예외가 발생하면 허용량을 줄이고,
+        latency_target보다 오래 걸리면 지연 급증으로 보고 줄입니다.
+        """
+        name = f"{provider}:{operation}"
+        policy = self.policy(provider, operation)
+
+        wait_started = time.monotonic()
+        lease = await self._acquire(name, policy, priority)
+        started = time.monotonic()
+        self._record(name, "acquired", wait=started - wait_started, factor=lease.factor)
+
+        try:
+            yield
+        except BaseException as e:
+            if isinstance(e, Exception) and is_throttle_error(e):
+                self._record(name, "throttled")
+                logger.warning(f"Rate limited by provider: {name}, reducing allowance")
+                await self._adapt(lease, "throttle")
+            raise
+        else:
+            elapsed = time.monotonic() - started
+            if policy.latency_target and elapsed > policy.latency_target:
+                self._record(name, "slow")
+                await self._adapt(lease, "slow")
+            elif lease.factor < 1.0:
+                await self._adapt(lease, "ok")
+        finally:
+            await self._release(lease)
+
+    async def _acquire(self, name: str, policy: LimitPolicy, priority: Priority) -> _Lease:
+        """Redis 공유 슬롯 확보 (Redis 장애 시 로컬 슬롯)"""
+        lease_id = uuid.uuid4().hex
+        is_batch = 1 if priority == Priority.BATCH else 0
+
+        while self._use_redis():
+            try:
+                await self._connect()
+                acquired, wait_ms, factor = await self._acquire_script(
+                    keys=[f"{_KEY_PREFIX}:{name}", f"{_KEY_PREFIX}:{name}:leases"],
+                    args=[
+                        policy.rate,
+                        policy.burst,
+                        policy.concurrency,
+                        policy.reserved,
+                        is_batch,
+                        lease_id,
+                        policy.lease_ttl * 1000,
+                    ],
+                )
+            except (aioredis.RedisError, OSError) as e:
+                self._mark_redis_down(e)
+                break
 
-    def reset(self):
-        """테스트용: 세마포어 재초기화"""
-        self.video_generation = asyncio.Semaphore(
-            settings.video_generation_limit
+            if int(acquired):
+                return _Lease(name, lease_id, float(factor), local=False)
+
+            # 토큰 부족이면 다음 토큰까지, 슬롯 부족이면 짧게 대기 (동시 깨어남 방지용 jitter)
+            delay = int(wait_ms) / 1000 if int(wait_ms) else _POLL_INTERVAL
+            await asyncio.sleep(delay * (1 + random.random() * 0.2))
+
+        self._record(name, "fallback")
+        factor = self._local_factors.get(name, 1.0)
+        gate = self._local_gates.setdefault(name, _LocalGate())
+        await gate.acquire(policy.slots(factor, priority))
+        return _Lease(name, lease_id, factor, local=True)
+
+    async def _release(self, lease: _Lease) -> None:
+        if lease.local:
+            await self._local_gates[lease.name].release()
+            return
+        try:
+            await self.redis.zrem(f"{_KEY_PREFIX}:{lease.name}:leases", lease.lease_id)
+        except (aioredis.RedisError, OSError) as e:
+            # 해제 실패 시 Lease TTL 이후 자동 회수
+            logger.warning(f"Failed to release rate limit lease {lease.name}: {e}")
+
+    async def _adapt(self, lease: _Lease, mode: str) -> None:
+        """허용량 조정 (throttle: ×0.5, slow: ×0.8, ok: +recovery_step)"""
+        if not lease.local and self._use_redis():
+            try:
+                factor = await self._adapt_script(
+                    keys=[f"{_KEY_PREFIX}:{lease.name}"],
+                    args=[
+                        mode,
+                        settings.rate_limit_min_factor,
+                        settings.rate_limit_recovery_step,
+                        int(settings.rate_limit_cooldown_seconds * 1000),
+                    ],
+                )
+                self._record(lease.name, factor=float(factor))
+                return
+            except (aioredis.RedisError, OSError) as e:
+                self._mark_redis_down(e)
+
+        factor = self._local_factors.get(lease.name, 1.0)
+        if mode == "ok":
+            factor = min(1.0, factor + settings.rate_limit_recovery_step)
+        else:
+            factor = max(settings.rate_limit_min_factor, factor * (0.5 if mode == "throttle" else 0.8))
+        self._local_factors[lease.name] = factor
+        self._record(lease.name, factor=factor)
+
+    def _use_redis(self) -> bool:
+        return self.distributed and time.monotonic() >= self._redis_down_until
+
+    def _mark_redis_down(self, error: BaseException) -> None:
+        logger.warning(
+            f"Rate limiter Redis unavailable, using per-process limits for {_REDIS_RETRY_AFTER:.0f}s: {error}"
         )
+        self._redis_down_until = time.monotonic() + _REDIS_RETRY_AFTER
+
+    async def _connect(self) -> None:
+        if self.redis is not None:
+            return
+        self.redis = aioredis.from_url(
+            self.redis_url,
+            encoding="utf-8",
+            decode_responses=True,
+        )
+        self._acquire_script = self.redis.register_script(_ACQUIRE_SCRIPT)
+        self._adapt_script = self.redis.register_script(_ADAPT_SCRIPT)
+
+    def _record(self, name: str, counter: Optional[str] = None, wait: float = 0.0, factor: Optional[float] = None):
+        with self._lock:
+            stats = self._stats[name]
+            if counter:
+                stats[counter] += 1
+            stats["total_wait_time"] += wait
+            if factor is not None:
+                stats["factor"] = factor
+
+    def get_stats(self) -> Dict[str, Dict]:
+        """
+        Provider/작업별 통계 (이 프로세스 기준)
+
+        Returns:
+            dict: 이름별 acquired / throttled / slow / fallback / avg_wait_time_ms / factor
+        """
+        with self._lock:
+            return {
+                name: {
+                    "acquired": stats["acquired"],
+                    "throttled": stats["throttled"],
+                    "slow": stats["slow"],
+                    "fallback": stats["fallback"],
+                    "avg_wait_time_ms": round(stats["total_wait_time"] / stats["acquired"] * 1000, 2)
+                    if stats["acquired"] else 0.0,
+                    "factor": round(stats["factor"], 3),
+                }
+                for name, stats in self._stats.items()
+            }
+
+    async def close(self) -> None:
+        """Redis 연결 종료"""
+        if self.redis:
+            await self.redis.close()
+            self.redis = None
 
 
 # 글로벌 싱글톤 인스턴스
-_limiters = ResourceLimiters()
+_limiters = RateLimiter()
 
 
-def get_limiters() -> ResourceLimiters:
+def get_limiters() -> RateLimiter:
     """
-    글로벌 리소스 제한자 반환
+    글로벌 Rate Limiter 반환
 
     Returns:
-        ResourceLimiters: 서버 전체 세마포어 관리 객체
+        RateLimiter: Provider/작업별 분산 제한 관리 객체
 
     Example:
         limiters = get_limiters()
-        async with limiters.video_generation:
+        async with limiters.limit(settings.ai_video_provider, "video"):
             result = await video_provider.generate_video(...)
     """
     return _limiters
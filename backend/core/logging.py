@@ -1,23 +1,250 @@
 """
 Core Logging Configuration
 structlog 기반의 구조화된 로깅 설정
+
+- 비동기 출력 (log_async_enabled): 호출 스레드(이벤트 루프)는 레코드를 큐에 넣기만 하고,
+  백그라운드 writer 스레드가 포맷 / 출력을 배치로 처리 (배치당 write + flush 1회)
+- 큐가 가득 차면 호출자를 막지 않고 버린 뒤 개수를 기록 (다음 배치에 경고 한 줄 출력)
+- 로거별 속도 제한 / 샘플링 (log_rate_limits / log_sample_rates): INFO 이하 대량 로그만 대상,
+  WARNING 이상은 항상 출력
 """
 
+import copy
 import logging
+import logging.handlers
+import queue
+import random
 import sys
-from typing import Any, Dict
+import threading
+import time
+from typing import Any, Dict, List, Optional, TextIO
 
 import structlog
 from asgi_correlation_id import correlation_id
 
 from backend.core.config import settings
 
+# 레코드에 보관하는 호출 시점의 structlog contextvars (writer 스레드에서 병합)
+_CONTEXT_ATTR = "_log_context"
+
+
+def merge_captured_contextvars(logger: Any, method_name: str, event_dict: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    호출 스레드에서 캡처한 contextvars 병합
 
-def configure_logging() -> None:
+    writer 스레드에는 요청 컨텍스트가 없으므로 AsyncLogHandler가 레코드에 담아 둔 값을 사용합니다.
+    (ExtraAdder가 레코드 속성으로 추가한 항목을 꺼내어 펼침)
+    """
+    captured = event_dict.pop(_CONTEXT_ATTR, None)
+    if captured:
+        for key, value in captured.items():
+            event_dict.setdefault(key, value)
+    return event_dict
+
+
+class LogRateFilter(logging.Filter):
+    """
+    로거별 속도 제한 / 샘플링 필터 (INFO 이하 레코드만 대상)
+
+    - 규칙은 로거 이름 prefix로 매칭 (가장 긴 prefix 우선, "a.b"는 "a.b"와 "a.b.*"에 적용)
+    - 속도 제한: 초당 N개 (토큰 버킷, 최대 1초 분량 burst)
+      제한 후 처음 통과하는 레코드에 suppressed=버린 개수 속성 추가
+    - 샘플링: 비율만큼만 통과
+    """
+
+    def __init__(
+        self,
+        rate_limits: Optional[Dict[str, float]] = None,
+        sample_rates: Optional[Dict[str, float]] = None,
+    ):
+        """
+        Args:
+            rate_limits: 로거 prefix → 초당 최대 레코드 수 (기본값: settings.log_rate_limits)
+            sample_rates: 로거 prefix → 통과 비율 0~1 (기본값: settings.log_sample_rates)
+        """
+        super().__init__()
+        self.rate_limits = dict(settings.log_rate_limits if rate_limits is None else rate_limits)
+        self.sample_rates = dict(settings.log_sample_rates if sample_rates is None else sample_rates)
+        self._lock = threading.Lock()
+        self._buckets: Dict[str, List[float]] = {}  # prefix → [tokens, last_refill]
+        self._suppressed: Dict[str, int] = {}
+        self._rules: Dict[str, tuple] = {}  # 로거 이름 → (rate_prefix, sample_prefix) 매칭 캐시
+
+    @staticmethod
+    def _match(name: str, prefixes) -> Optional[str]:
+        best = None
+        for prefix in prefixes:
+            if (name == prefix or name.startswith(prefix + ".")) and (best is None or len(prefix) > len(best)):
+                best = prefix
+        return best
+
+    def _rules_for(self, name: str) -> tuple:
+        rules = self._rules.get(name)
+        if rules is None:
+            rules = (self._match(name, self.rate_limits), self._match(name, self.sample_rates))
+            self._rules[name] = rules
+        return rules
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.levelno > logging.INFO:
+            return True
+
+        rate_prefix, sample_prefix = self._rules_for(record.name)
+
+        if sample_prefix is not None and random.random() >= self.sample_rates[sample_prefix]:
+            return False
+
+        if rate_prefix is None:
+            return True
+
+        rate = self.rate_limits[rate_prefix]
+        now = time.monotonic()
+        with self._lock:
+            bucket = self._buckets.get(rate_prefix)
+            if bucket is None:
+                bucket = self._buckets[rate_prefix] = [rate, now]
+            bucket[0] = min(rate, bucket[0] + (now - bucket[1]) * rate)
+            bucket[1] = now
+
+            if bucket[0] < 1.0:
+                self._suppressed[rate_prefix] = self._suppressed.get(rate_prefix, 0) + 1
+                return False
+
+            bucket[0] -= 1.0
+            suppressed = self._suppressed.pop(rate_prefix, 0)
+
+        if suppressed:
+            record.suppressed = suppressed
+        return True
+
+
+class AsyncLogHandler(logging.handlers.QueueHandler):
+    """
+    큐 + 백그라운드 writer 스레드 로그 핸들러
+
+    호출 스레드에서는 메시지 문자열화와 contextvars 캡처만 수행하고,
+    포맷(structlog 렌더링)과 stream 쓰기는 writer 스레드가 배치로 처리합니다.
+    """
+
+    def __init__(
+        self,
+        stream: Optional[TextIO] = None,
+        queue_size: Optional[int] = None,
+        batch_size: Optional[int] = None,
+        flush_interval: Optional[float] = None,
+    ):
+        """
+        Args:
+            stream: 출력 stream (기본값: 출력 시점의 sys.stdout)
+            queue_size: 대기 레코드 상한 (기본값: settings.log_queue_size)
+            batch_size: 배치당 최대 레코드 수 (기본값: settings.log_batch_size)
+            flush_interval: 배치 최대 대기 시간 초 (기본값: settings.log_flush_interval)
+        """
+        super().__init__(queue.Queue(maxsize=queue_size or settings.log_queue_size))
+        self.stream = stream
+        self.batch_size = batch_size or settings.log_batch_size
+        self.flush_interval = settings.log_flush_interval if flush_interval is None else flush_interval
+        self.dropped = 0
+        self._reported_dropped = 0
+        self._writer = threading.Thread(target=self._run, name="log-writer", daemon=True)
+        self._writer.start()
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        """
+        호출 시점 값 고정 (인자 문자열화 + 예외 traceback 렌더링 + contextvars 캡처, 나머지 포맷은 writer에서)
+
+        traceback은 호출 스레드에서 렌더링합니다. (exc_info=True는 호출 스레드의 예외를 가리키고,
+        Python 3.11 traceback 렌더링의 ast.parse는 다른 스레드의 컴파일과 겹치면 SystemError 발생)
+        같은 레코드를 받는 다른 핸들러를 위해 QueueHandler.prepare처럼 복사본을 수정합니다.
+        """
+        record = copy.copy(record)
+        if isinstance(record.msg, dict):  # structlog 레코드는 event dict 그대로 전달
+            if record.msg.get("exc_info"):
+                record.msg = structlog.processors.format_exc_info(None, record.levelname, dict(record.msg))
+        else:
+            record.msg = record.getMessage()
+            record.args = None
+            if record.exc_info:
+                record.exception = structlog.processors.format_exc_info(
+                    None, record.levelname, {"exc_info": record.exc_info}
+                )["exception"]  # ExtraAdder가 event dict에 추가
+                record.exc_info = None
+                record.exc_text = None
+        context = structlog.contextvars.get_contextvars()
+        if context:
+            setattr(record, _CONTEXT_ATTR, context)
+        return record
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        """큐에 추가 (가득 차면 버리고 개수만 기록 - 호출자를 막지 않음)"""
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+    def _run(self) -> None:
+        """writer 스레드: 첫 레코드 이후 flush_interval 또는 batch_size까지 모아서 한 번에 출력"""
+        while True:
+            record = self.queue.get()
+            if record is None:
+                return
+
+            batch = [record]
+            deadline = time.monotonic() + self.flush_interval
+            stopping = False
+            while len(batch) < self.batch_size:
+                remaining = deadline - time.monotonic()
+                try:
+                    record = self.queue.get(timeout=remaining) if remaining > 0 else self.queue.get_nowait()
+                except queue.Empty:
+                    break
+                if record is None:
+                    stopping = True
+                    break
+                batch.append(record)
+
+            self._write(batch)
+            if stopping:
+                return
+
+    def _write(self, batch: List[logging.LogRecord]) -> None:
+        lines = []
+        for record in batch:
+            try:
+                lines.append(self.format(record))
+            except Exception:
+                self.handleError(record)
+
+        dropped = self.dropped
+        if dropped != self._reported_dropped:
+            lines.append(f"[logging] {dropped - self._reported_dropped} log records dropped (queue full)")
+            self._reported_dropped = dropped
+
+        if not lines:
+            return
+        stream = self.stream or sys.stdout  # sys.stdout 교체(캡처 등) 반영
+        try:
+            stream.write("\n".join(lines) + "\n")
+            stream.flush()
+        except Exception:
+            self.handleError(batch[-1])
+
+    def close(self) -> None:
+        """남은 레코드 출력 후 writer 종료 (logging.shutdown에서도 호출)"""
+        if self._writer.is_alive():
+            self.queue.put(None)
+            self._writer.join(timeout=5.0)
+        super().close()
+
+
+def configure_logging(stream: Optional[TextIO] = None) -> None:
     """
     structlog 및 표준 로깅 설정
+
+    Args:
+        stream: 출력 stream (기본값: sys.stdout)
     """
-    
+
     # 공통 프로세서 (structlog & standard logging)
     shared_processors = [
         structlog.contextvars.merge_contextvars,
@@ -25,6 +252,7 @@ def configure_logging() -> None:
         structlog.stdlib.add_log_level,
         structlog.stdlib.PositionalArgumentsFormatter(),
         structlog.stdlib.ExtraAdder(), # extra 인자 표시
+        merge_captured_contextvars,    # 비동기 출력 시 호출 스레드의 contextvars
         structlog.processors.TimeStamper(fmt="%Y-%m-%d %H:%M:%S", utc=False),
         structlog.processors.StackInfoRenderer(),
     ]
@@ -34,7 +262,7 @@ def configure_logging() -> None:
         renderer = structlog.processors.JSONRenderer()
     else:
         renderer = structlog.dev.ConsoleRenderer(
-            colors=True, 
+            colors=True,
             pad_event=20,     # 메시지 패딩 (정렬)
         )
 
@@ -59,10 +287,17 @@ def configure_logging() -> None:
 
     # 3. 루트 로거 설정
     root_logger = logging.getLogger()
+    for existing in root_logger.handlers:
+        if isinstance(existing, AsyncLogHandler):
+            existing.close()  # 재설정 시 이전 writer 스레드 종료
     root_logger.handlers = [] # 기존 핸들러 제거
-    
-    handler = logging.StreamHandler(sys.stdout)
+
+    if settings.log_async_enabled:
+        handler = AsyncLogHandler(stream=stream)
+    else:
+        handler = logging.StreamHandler(stream or sys.stdout)
     handler.setFormatter(formatter)
+    handler.addFilter(LogRateFilter())
     root_logger.addHandler(handler)
     root_logger.setLevel(settings.log_level.upper())
 
@@ -13,6 +13,7 @@ from sqlalchemy import select, and_, or_
 from backend.features.storybook.models import Book
 from backend.features.storybook.repository import BookRepository
 from backend.core.database.session import get_db
+from backend.core.config import settings
 
 logger = logging.getLogger(__name__)
 
@@ -88,6 +89,10 @@ class FileAccessService:
         # 공통 책 파일: shared/books/ 경로는 모든 사용자 접근 가능
         if file_path.startswith('shared/books/'):
             return True
+
+        # 전역 단어 오디오: 단어 + voice_id의 content hash 경로로 책 / 사용자 정보가 없음 (R2 CDN과 동일하게 공개)
+        if file_path.startswith(settings.tts_word_store_prefix.strip('/') + '/'):
+            return True
         
         # 파일 경로에서 책 ID 추출
         book_id = self._extract_book_id_from_path(file_path)
@@ -2,12 +2,12 @@
 File Cache Service
 파일 캐싱 서비스
 
-공개 파일을 Redis에 캐싱하여 성능을 최적화합니다.
+공개 파일을 미디어 캐시(메모리 LRU + Redis raw bytes)에 캐싱하여 성능을 최적화합니다.
 """
 import hashlib
 import logging
 from typing import Optional
-from backend.core.cache.service import CacheService
+from backend.core.cache.media import CachedMedia, MediaCache, get_media_cache
 
 logger = logging.getLogger(__name__)
 
@@ -15,100 +15,88 @@ logger = logging.getLogger(__name__)
 class FileCacheService:
     """
     파일 캐싱 서비스
-    
-    공개 파일만 Redis에 캐싱합니다 (보안 고려).
+
+    공개 파일만 캐싱합니다 (보안 고려).
+    본문과 ETag를 함께 저장하고, 스토리지 stat() ETag와 일치할 때만 캐시된 본문을 사용합니다.
     """
-    
-    def __init__(self, cache_service: CacheService):
-        self.cache_service = cache_service
-    
+
+    def __init__(self, media_cache: Optional[MediaCache] = None):
+        self.media_cache = media_cache or get_media_cache()
+
     def _get_cache_key(self, file_path: str) -> str:
         """
         캐시 키 생성
-        
+
         Args:
             file_path: 파일 경로
-        
+
         Returns:
             str: 캐시 키
         """
         return f"file:{file_path}"
-    
-    async def get_file(self, file_path: str) -> Optional[bytes]:
+
+    async def get_file(self, file_path: str) -> Optional[CachedMedia]:
         """
         캐시에서 파일 조회
-        
+
         Args:
             file_path: 파일 경로
-        
+
         Returns:
-            Optional[bytes]: 캐시된 파일 데이터 또는 None
+            Optional[CachedMedia]: 캐시된 파일 (data, etag, content_type) 또는 None
         """
-        cache_key = self._get_cache_key(file_path)
-        cached_data = await self.cache_service.get(cache_key)
-        
-        if cached_data:
-            # bytes로 변환 (aiocache가 문자열로 반환할 수 있음)
-            if isinstance(cached_data, str):
-                try:
-                    import base64
-                    cached_data = base64.b64decode(cached_data)
-                except Exception:
-                    logger.warning(f"Failed to decode cached file: {file_path}")
-                    return None
-            elif isinstance(cached_data, bytes):
-                return cached_data
-            else:
-                logger.warning(f"Unexpected cache data type: {type(cached_data)}")
-                return None
-        
-        return None
-    
+        return await self.media_cache.get(self._get_cache_key(file_path))
+
     async def cache_file(
         self,
         file_path: str,
         file_data: bytes,
+        etag: Optional[str] = None,
+        content_type: Optional[str] = None,
         ttl: int = 86400,  # 24시간
-    ) -> None:
+    ) -> bool:
         """
         파일 캐싱
-        
+
         Args:
             file_path: 파일 경로
             file_data: 파일 데이터
+            etag: ETag (None이면 본문 MD5)
+            content_type: MIME 타입
             ttl: 캐시 유지 시간 (초)
+
+        Returns:
+            bool: 캐싱 여부 (크기 제한 초과 시 False)
         """
-        cache_key = self._get_cache_key(file_path)
-        
-        # bytes를 base64로 인코딩하여 저장 (aiocache 호환성)
-        try:
-            import base64
-            encoded_data = base64.b64encode(file_data).decode('utf-8')
-            await self.cache_service.set(cache_key, encoded_data, ttl=ttl)
+        cached = await self.media_cache.set(
+            self._get_cache_key(file_path),
+            file_data,
+            etag=etag or self.get_etag(file_data),
+            content_type=content_type,
+            ttl=ttl,
+        )
+        if cached:
             logger.debug(f"File cached: {file_path} (TTL: {ttl}s)")
-        except Exception as e:
-            logger.error(f"Failed to cache file {file_path}: {e}", exc_info=True)
-    
+        return cached
+
     async def invalidate_file(self, file_path: str) -> None:
         """
         파일 캐시 무효화
-        
+
         Args:
             file_path: 파일 경로
         """
-        cache_key = self._get_cache_key(file_path)
-        await self.cache_service.delete(cache_key)
+        await self.media_cache.delete(self._get_cache_key(file_path))
         logger.debug(f"File cache invalidated: {file_path}")
-    
+
     def get_etag(self, file_data: bytes) -> str:
         """
         파일 데이터의 ETag 생성
-        
+
         Args:
             file_data: 파일 데이터
-        
+
         Returns:
             str: ETag (MD5 해시)
         """
         return hashlib.md5(file_data).hexdigest()
-
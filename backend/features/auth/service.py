@@ -12,6 +12,7 @@ from ...core.auth.jwt_manager import JWTManager
 
 logger = logging.getLogger(__name__)
 from ...core.auth.providers.credentials import CredentialsAuthProvider
+from ...core.auth.revocation import get_access_token_revocations, token_expiry
 from ...core.auth.providers.google_oauth import GoogleOAuthProvider
 from ...core.cache.service import CacheService
 from ...core.config import settings
@@ -75,7 +76,7 @@ class AuthService:
             raise EmailAlreadyExistsException(email)
 
         # 비밀번호 해싱
-        password_hash = self.credentials_provider.hash_password(password)
+        password_hash = await self.credentials_provider.hash_password_async(password)
 
         # 사용자 생성
         user = User(
@@ -109,6 +110,15 @@ class AuthService:
 
         return user, access_token, refresh_token
 
+    async def _rehash_password(self, user: User, new_hash: str) -> None:
+        """
+        로그인 성공 시 현재 비용 파라미터로 만든 해시로 교체
+        """
+        user.password_hash = new_hash
+        await self.user_repo.save(user)
+        await self.db.commit()
+        logger.info("🔁 [LOGIN] Password rehashed with current cost", extra={"user_id": str(user.id)})
+
     async def login(self, email: str, password: str) -> Tuple[User, str, str]:
         """
         로그인
@@ -129,12 +139,18 @@ class AuthService:
         if user.password_hash is None:
             raise OAuthUserOnlyException("social")
 
-        # 비밀번호 검증
-        verify_result = self.credentials_provider.verify_password(password, user.password_hash)
+        # 비밀번호 검증 (비용 파라미터가 바뀐 해시는 새 해시 함께 반환)
+        verify_result, new_hash = await self.credentials_provider.verify_and_update_async(
+            password, user.password_hash
+        )
 
         if not verify_result:
             raise InvalidCredentialsException()
 
+        # 재해싱 (현재 비용 파라미터로 투명하게 업그레이드)
+        if new_hash is not None:
+            await self._rehash_password(user, new_hash)
+
         # JWT 토큰 생성
         access_token = self.jwt_manager.create_access_token(
             data={"sub": str(user.id), "email": user.email}
@@ -298,11 +314,15 @@ class AuthService:
         logger.info(f"🗑️ [REDIS] Refresh token removed from whitelist", extra={"user_id": user_id})
 
         # 2. Access Token 블랙리스트 추가 (남은 만료 시간만큼 TTL)
-        access_blacklist_key = f"blacklist:access:{self._hash_token(access_token)}"
+        access_token_hash = self._hash_token(access_token)
+        access_blacklist_key = f"blacklist:access:{access_token_hash}"
         access_ttl = settings.jwt_access_token_expire_minutes * 60
         await self.cache_service.set(access_blacklist_key, "1", ttl=access_ttl)
         logger.info(f"🚫 [REDIS] Access token blacklisted", extra={"ttl": access_ttl})
 
+        # 모든 프로세스의 폐기 목록에 등록 (토큰 exp까지 유지)
+        await get_access_token_revocations().revoke(access_token_hash, token_expiry(access_token))
+
         # 3. Refresh Token 블랙리스트 추가
         refresh_blacklist_key = f"blacklist:refresh:{self._hash_token(refresh_token)}"
         refresh_ttl = settings.jwt_refresh_token_expire_days * 24 * 3600
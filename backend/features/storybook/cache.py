@@ -0,0 +1,314 @@
+"""
+Shared Book Response Cache
+공유 책 상세 응답 캐시 (직렬화된 JSON bytes: Redis + 프로세스 메모리 티어)
+
+공유(is_shared)되고 생성이 끝난 책의 GET /storybook/books/{id} 응답 본문을 ETag와 함께 저장합니다.
+캐시 히트 시 페이지 트리 조회/직렬화 없이 응답(200/304)합니다. (권한 확인은 엔드포인트에서 책 행만 조회)
+
+무효화:
+- 공유 상태 변경 / 삭제 / 파이프라인 완료 시 invalidate() → 책별 세대(generation) 증가 + Redis 키 삭제
+  + BOOK_UPDATED 이벤트 발행
+- 저장은 조회 시작 전에 읽은 세대가 그대로일 때만 수행 (무효화 전에 시작한 요청이 이전 응답을 다시 쓰지 않음)
+- BOOK_UPDATED는 브로드캐스트 이벤트라 모든 프로세스가 메모리 티어 항목을 제거
+- 이벤트 유실(Redis 재연결 등)에 대비해 메모리 티어는 짧은 TTL(book_response_cache_local_ttl)로 유지
+
+응답 본문의 서명 URL은 시간 버킷(signed_url_bucket_seconds) 단위로 바뀌므로
+캐시 항목도 버킷이 끝나면 만료됩니다.
+"""
+
+import hashlib
+import time
+import uuid
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Optional, Union
+
+import redis.asyncio as aioredis
+
+from backend.core.config import settings
+from backend.core.events.bus import EventBus
+from backend.core.events.types import Event, EventType
+from backend.core.logging import get_logger
+
+logger = get_logger(__name__)
+
+CACHE_KEY_PREFIX = "book_response"
+
+
+# 세대가 그대로일 때만 저장 (KEYS: 응답 키, 세대 키 / ARGV: 세대, body, etag, TTL ms)
+_PUT_IF_GENERATION = """
+if (redis.call('GET', KEYS[2]) or '0') ~= ARGV[1] then
+    return 0
+end
+redis.call('HSET', KEYS[1], 'body', ARGV[2], 'etag', ARGV[3], 'gen', ARGV[1])
+redis.call('PEXPIRE', KEYS[1], ARGV[4])
+return 1
+"""
+
+
+def _cache_key(book_id: Union[str, uuid.UUID]) -> str:
+    return f"{CACHE_KEY_PREFIX}:{book_id}"
+
+
+def _generation_key(book_id: Union[str, uuid.UUID]) -> str:
+    return f"{CACHE_KEY_PREFIX}:{book_id}:gen"
+
+
+def compute_etag(body: bytes) -> str:
+    """응답 본문 ETag (따옴표 포함)"""
+    return f'"{hashlib.sha256(body).hexdigest()[:32]}"'
+
+
+def _ttl_until_bucket_end(now: float) -> float:
+    """현재 서명 URL 버킷이 끝날 때까지 남은 시간 (버킷 비활성화 시 최대 TTL)"""
+    bucket = settings.signed_url_bucket_seconds
+    if bucket <= 0:
+        return settings.book_response_cache_ttl
+    return min(settings.book_response_cache_ttl, bucket - (now % bucket))
+
+
+@dataclass
+class CachedBookResponse:
+    """캐시된 책 응답"""
+
+    body: bytes
+    etag: str
+    expires_at: float = 0.0  # time.monotonic() 기준 (메모리 티어)
+    generation: int = 0
+
+
+class BookResponseCache:
+    """
+    공유 책 상세 응답 캐시
+
+    Redis/이벤트 오류는 로그만 남기고 캐시 미스로 처리합니다 (응답은 DB 경로로 계속 제공).
+    """
+
+    def __init__(self, redis_url: str = None, event_bus: Optional[EventBus] = None):
+        """
+        Args:
+            redis_url: Redis 연결 URL (None일 경우 settings에서 가져옴)
+            event_bus: 무효화 이벤트 발행/구독용 Event Bus (None이면 이벤트 없이 Redis만 삭제)
+        """
+        self.redis_url = redis_url or settings.redis_url
+        self.redis: Optional[aioredis.Redis] = None
+        self.event_bus = event_bus
+        self._local: "OrderedDict[str, CachedBookResponse]" = OrderedDict()
+        # 무효화로 알게 된 최신 세대 (이보다 이전 세대 항목은 메모리 티어에 두지 않음)
+        self._local_generations: "OrderedDict[str, int]" = OrderedDict()
+        self._handlers_registered = False
+        self.hits = 0
+        self.misses = 0
+
+    async def connect(self):
+        """Redis 연결 (본문은 bytes 그대로 저장하므로 decode하지 않음)"""
+        if self.redis:
+            return
+
+        self.redis = aioredis.from_url(self.redis_url, decode_responses=False)
+
+    async def close(self):
+        """Redis 연결 종료"""
+        if self.redis:
+            await self.redis.close()
+            self.redis = None
+
+    async def register(self, event_bus: EventBus) -> None:
+        """BOOK_UPDATED 이벤트 구독 (메모리 티어 무효화)"""
+        self.event_bus = event_bus
+        if self._handlers_registered:
+            return
+        await event_bus.subscribe(EventType.BOOK_UPDATED, self._handle_book_updated)
+        self._handlers_registered = True
+
+    async def get(self, book_id: Union[str, uuid.UUID]) -> Optional[CachedBookResponse]:
+        """
+        캐시 조회 (메모리 티어 → Redis)
+
+        Returns:
+            Optional[CachedBookResponse]: 캐시된 응답 또는 None
+        """
+        if not settings.book_response_cache_enabled:
+            return None
+
+        key = _cache_key(book_id)
+        entry = self._local_get(key)
+        if entry is not None:
+            self.hits += 1
+            return entry
+
+        try:
+            await self.connect()
+            async with self.redis.pipeline(transaction=True) as pipe:
+                pipe.hmget(key, "body", "etag", "gen")
+                pipe.get(_generation_key(book_id))
+                pipe.pttl(key)
+                (body, etag, entry_generation), generation, ttl_ms = await pipe.execute()
+        except Exception as e:
+            logger.warning(f"Book response cache get failed: book_id={book_id}: {e}")
+            self.misses += 1
+            return None
+
+        # 무효화 이전 세대로 저장된 항목은 미스 (무효화와 경합한 저장)
+        if body is None or etag is None or (entry_generation or b"0") != (generation or b"0"):
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        entry = CachedBookResponse(body=body, etag=etag.decode(), generation=int(entry_generation or 0))
+        self._local_put(key, entry, ttl_ms / 1000 if ttl_ms and ttl_ms > 0 else None)
+        return entry
+
+    async def generation(self, book_id: Union[str, uuid.UUID]) -> Optional[int]:
+        """
+        현재 무효화 세대 조회 (책 조회 시작 전에 읽어서 put()에 전달)
+
+        Returns:
+            Optional[int]: 세대 (Redis 오류 시 None → 저장하지 않음)
+        """
+        if not settings.book_response_cache_enabled:
+            return None
+
+        try:
+            await self.connect()
+            return int(await self.redis.get(_generation_key(book_id)) or 0)
+        except Exception as e:
+            logger.warning(f"Book response cache generation get failed: book_id={book_id}: {e}")
+            return None
+
+    async def put(
+        self, book_id: Union[str, uuid.UUID], body: bytes, generation: Optional[int]
+    ) -> CachedBookResponse:
+        """
+        응답 본문 저장 (만료: 서명 URL 버킷 종료 시각)
+
+        조회 시작 후 무효화되었으면(세대 변경) 저장하지 않습니다.
+
+        Args:
+            book_id: Book ID
+            body: 직렬화된 응답 본문
+            generation: 책 조회 시작 전에 generation()으로 읽은 세대 (None이면 저장하지 않음)
+
+        Returns:
+            CachedBookResponse: 응답 항목 (ETag 포함, 저장 여부와 무관)
+        """
+        entry = CachedBookResponse(body=body, etag=compute_etag(body), generation=generation or 0)
+        if not settings.book_response_cache_enabled or generation is None:
+            return entry
+
+        ttl = _ttl_until_bucket_end(time.time())
+        key = _cache_key(book_id)
+
+        try:
+            await self.connect()
+            stored = await self.redis.eval(
+                _PUT_IF_GENERATION,
+                2,
+                key,
+                _generation_key(book_id),
+                str(generation),
+                body,
+                entry.etag,
+                max(int(ttl * 1000), 1),
+            )
+        except Exception as e:
+            logger.warning(f"Book response cache put failed: book_id={book_id}: {e}")
+            return entry
+
+        if stored:
+            self._local_put(key, entry, ttl)
+        else:
+            logger.debug(f"Book response cache put skipped (invalidated): book_id={book_id}")
+        return entry
+
+    async def invalidate(self, book_id: Union[str, uuid.UUID]) -> None:
+        """
+        책 응답 무효화 (세대 증가 + 메모리 티어 / Redis 삭제, 다른 프로세스에 BOOK_UPDATED 발행)
+        """
+        key = _cache_key(book_id)
+        self._local.pop(key, None)
+        payload = {"book_id": str(book_id)}
+
+        try:
+            await self.connect()
+            async with self.redis.pipeline(transaction=True) as pipe:
+                pipe.incr(_generation_key(book_id))
+                # 이전 세대로 저장된 항목보다 오래 유지 (만료 후에는 세대 0부터 다시 시작)
+                pipe.expire(_generation_key(book_id), settings.book_response_cache_ttl * 2)
+                pipe.delete(key)
+                generation, _, _ = await pipe.execute()
+            payload["generation"] = int(generation)
+            self._observe_generation(key, int(generation))
+        except Exception as e:
+            logger.warning(f"Book response cache delete failed: book_id={book_id}: {e}")
+
+        if self.event_bus:
+            try:
+                await self.event_bus.publish(EventType.BOOK_UPDATED, payload)
+            except Exception as e:
+                logger.warning(f"Failed to publish book updated event: book_id={book_id}: {e}")
+
+    async def _handle_book_updated(self, event: Event) -> None:
+        """BOOK_UPDATED 이벤트 처리 (메모리 티어 제거)"""
+        book_id = event.payload.get("book_id")
+        if not book_id:
+            logger.warning(f"Book updated event missing book_id: {event.event_id}")
+            return
+        key = _cache_key(book_id)
+        self._local.pop(key, None)
+        if event.payload.get("generation") is not None:
+            self._observe_generation(key, int(event.payload["generation"]))
+
+    def _observe_generation(self, key: str, generation: int) -> None:
+        """무효화 세대 기록 (이전 세대 항목이 메모리 티어에 다시 들어오지 않도록)"""
+        if generation > self._local_generations.get(key, 0):
+            self._local_generations[key] = generation
+        self._local_generations.move_to_end(key)
+        while len(self._local_generations) > settings.book_response_cache_local_max_entries:
+            self._local_generations.popitem(last=False)
+        entry = self._local.get(key)
+        if entry is not None and entry.generation < generation:
+            self._local.pop(key, None)
+
+    def _local_get(self, key: str) -> Optional[CachedBookResponse]:
+        entry = self._local.get(key)
+        if entry is None:
+            return None
+        if entry.expires_at <= time.monotonic():
+            self._local.pop(key, None)
+            return None
+        self._local.move_to_end(key)
+        return entry
+
+    def _local_put(self, key: str, entry: CachedBookResponse, ttl: Optional[float]) -> None:
+        local_ttl = settings.book_response_cache_local_ttl
+        if local_ttl <= 0:
+            return
+        if entry.generation < self._local_generations.get(key, 0):
+            return  # 저장 중에 무효화됨
+        if ttl is not None:
+            local_ttl = min(local_ttl, ttl)
+        self._local[key] = CachedBookResponse(
+            body=entry.body,
+            etag=entry.etag,
+            expires_at=time.monotonic() + local_ttl,
+            generation=entry.generation,
+        )
+        self._local.move_to_end(key)
+        while len(self._local) > settings.book_response_cache_local_max_entries:
+            self._local.popitem(last=False)
+
+    def get_stats(self) -> dict:
+        """캐시 통계"""
+        return {"hits": self.hits, "misses": self.misses, "local_entries": len(self._local)}
+
+
+_book_response_cache: Optional[BookResponseCache] = None
+
+
+def get_book_response_cache() -> BookResponseCache:
+    """프로세스 공유 BookResponseCache 반환"""
+    global _book_response_cache
+    if _book_response_cache is None:
+        _book_response_cache = BookResponseCache()
+    return _book_response_cache
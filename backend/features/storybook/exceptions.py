@@ -56,6 +56,17 @@ class ImageUploadFailedException(BusinessLogicException):
         )
 
 
+class ImageTooLargeException(ValidationException):
+    """업로드 이미지 크기 초과"""
+
+    def __init__(self, filename: str, max_bytes: int):
+        super().__init__(
+            error_code=ErrorCode.BIZ_BOOK_IMAGE_TOO_LARGE,
+            message=f"이미지 크기는 {max_bytes // (1024 * 1024)}MB 이하여야 합니다",
+            details={"filename": filename, "max_bytes": max_bytes},
+        )
+
+
 class StoriesImagesMismatchException(ValidationException):
     """스토리와 이미지 개수 불일치"""
 
@@ -131,3 +142,14 @@ class InvalidLevelException(ValidationException):
                 "max_level": max_level,
             },
         )
+
+
+class InvalidBookCursorException(ValidationException):
+    """잘못된 목록 페이지 커서"""
+
+    def __init__(self, cursor: str):
+        super().__init__(
+            error_code=ErrorCode.VAL_INVALID_FORMAT,
+            message="잘못된 페이지 커서입니다",
+            details={"cursor": cursor},
+        )
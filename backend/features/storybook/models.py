@@ -20,6 +20,11 @@ class Book(Base):
     """
     __tablename__ = "books"
 
+    __table_args__ = (
+        # 목록 keyset 페이지네이션: 사용자별 (created_at, id) 순서
+        Index('idx_book_user_created', 'user_id', 'created_at', 'id'),
+    )
+
     id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True),
         primary_key=True,
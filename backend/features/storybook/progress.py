@@ -0,0 +1,221 @@
+"""
+Book Progress Events
+동화책 생성 진행 이벤트 발행/구독 (Redis Pub/Sub)
+
+파이프라인 Task와 TTS Worker가 단계/페이지 완료 시 이벤트를 발행하고,
+SSE 엔드포인트(/storybook/books/{id}/events)가 구독하여 클라이언트에 전달합니다.
+
+이벤트 종류:
+- stage:  {"type": "stage", "stage": "image", "progress": 60}
+- page:   {"type": "page", "stage": "image|video|audio", "page": 3, "status": "completed|failed"}
+          (audio는 "dialogue": 대사 순번 포함)
+- status: {"type": "status", "status": "completed|failed", "error": ...} (종료 이벤트)
+
+페이지 이벤트는 Hash에도 보관하여 늦게 연결한 클라이언트가 이미 끝난 페이지를 받을 수 있습니다.
+"""
+
+import asyncio
+import json
+import time
+import uuid
+from typing import Any, AsyncIterator, Callable, Awaitable, Dict, List, Optional, Union
+
+import redis.asyncio as aioredis
+
+from backend.core.config import settings
+from backend.core.logging import get_logger
+from .models import BookStatus
+
+logger = get_logger(__name__)
+
+STAGE_EVENT = "stage"
+PAGE_EVENT = "page"
+STATUS_EVENT = "status"
+
+_TERMINAL_STATUSES = {BookStatus.COMPLETED, BookStatus.FAILED}
+
+
+def _channel(book_id: Union[str, uuid.UUID]) -> str:
+    return f"book_progress:{book_id}"
+
+
+def _pages_key(book_id: Union[str, uuid.UUID]) -> str:
+    return f"book_progress:{book_id}:pages"
+
+
+class ProgressSubscription:
+    """단일 Book 진행 이벤트 구독 (전용 Pub/Sub 연결)"""
+
+    def __init__(self, pubsub: aioredis.client.PubSub, channel: str):
+        self.pubsub = pubsub
+        self.channel = channel
+
+    async def get(self, timeout: float) -> Optional[Dict[str, Any]]:
+        """
+        다음 이벤트 대기
+
+        Args:
+            timeout: 최대 대기 시간 (초)
+
+        Returns:
+            Optional[dict]: 이벤트 (timeout 동안 없으면 None)
+        """
+        deadline = time.monotonic() + timeout
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return None
+            message = await self.pubsub.get_message(ignore_subscribe_messages=True, timeout=remaining)
+            if message and message.get("type") == "message":
+                return json.loads(message["data"])
+
+    async def close(self) -> None:
+        try:
+            await self.pubsub.unsubscribe(self.channel)
+        finally:
+            await self.pubsub.aclose()
+
+
+class BookProgressNotifier:
+    """
+    Book 진행 이벤트 발행/구독
+
+    발행 실패는 로그만 남기고 무시합니다 (파이프라인 진행에 영향 없음).
+    """
+
+    def __init__(self, redis_url: str = None):
+        """
+        Args:
+            redis_url: Redis 연결 URL (None일 경우 settings에서 가져옴)
+        """
+        self.redis_url = redis_url or settings.redis_url
+        self.redis: Optional[aioredis.Redis] = None
+
+    async def connect(self):
+        """Redis 연결"""
+        if self.redis:
+            return
+
+        self.redis = aioredis.from_url(
+            self.redis_url,
+            encoding="utf-8",
+            decode_responses=True,
+        )
+
+    async def close(self):
+        """Redis 연결 종료"""
+        if self.redis:
+            await self.redis.close()
+            self.redis = None
+
+    async def publish(self, book_id: Union[str, uuid.UUID], event_type: str, **fields: Any) -> None:
+        """
+        진행 이벤트 발행
+
+        Args:
+            book_id: Book ID
+            event_type: stage | page | status
+            **fields: 이벤트 필드
+        """
+        event = {"book_id": str(book_id), "type": event_type, **fields, "timestamp": time.time()}
+        payload = json.dumps(event, default=str)
+
+        try:
+            await self.connect()
+            async with self.redis.pipeline(transaction=False) as pipe:
+                pipe.publish(_channel(book_id), payload)
+                if event_type == PAGE_EVENT:
+                    field = f"{fields.get('stage')}:{fields.get('page')}"
+                    if "dialogue" in fields:
+                        field += f":{fields['dialogue']}"
+                    pipe.hset(_pages_key(book_id), field, payload)
+                    pipe.expire(_pages_key(book_id), settings.book_progress_retention_seconds)
+                await pipe.execute()
+        except Exception as e:
+            logger.warning(f"Failed to publish book progress event: book_id={book_id}, {event_type}: {e}")
+
+    async def get_page_events(self, book_id: Union[str, uuid.UUID]) -> List[Dict[str, Any]]:
+        """보관된 페이지 이벤트 조회 (발생 순서)"""
+        await self.connect()
+        raw = await self.redis.hgetall(_pages_key(book_id))
+        events = [json.loads(value) for value in raw.values()]
+        return sorted(events, key=lambda event: event.get("timestamp", 0))
+
+    async def subscribe(self, book_id: Union[str, uuid.UUID]) -> ProgressSubscription:
+        """
+        Book 진행 이벤트 구독 시작
+
+        스냅샷 조회 전에 구독해야 그 사이에 발행된 이벤트를 놓치지 않습니다.
+        """
+        await self.connect()
+        pubsub = self.redis.pubsub()
+        await pubsub.subscribe(_channel(book_id))
+        return ProgressSubscription(pubsub, _channel(book_id))
+
+
+_notifier: Optional[BookProgressNotifier] = None
+
+
+def get_progress_notifier() -> BookProgressNotifier:
+    """프로세스 공유 BookProgressNotifier 반환"""
+    global _notifier
+    if _notifier is None:
+        _notifier = BookProgressNotifier()
+    return _notifier
+
+
+async def publish_book_event(book_id: Union[str, uuid.UUID], event_type: str, **fields: Any) -> None:
+    """진행 이벤트 발행 (파이프라인 Task/Worker용 단축 함수)"""
+    await get_progress_notifier().publish(book_id, event_type, **fields)
+
+
+def format_sse(event: Dict[str, Any], event_name: Optional[str] = None) -> str:
+    """SSE 메시지 포맷"""
+    data = json.dumps(event, default=str, ensure_ascii=False)
+    return f"event: {event_name or event.get('type', 'message')}\ndata: {data}\n\n"
+
+
+async def stream_book_events(
+    snapshot: Dict[str, Any],
+    subscription: Optional[ProgressSubscription],
+    is_disconnected: Callable[[], Awaitable[bool]],
+    heartbeat: Optional[float] = None,
+) -> AsyncIterator[str]:
+    """
+    SSE 스트림 생성
+
+    첫 메시지로 현재 상태(snapshot)를 보내고, 이후 Pub/Sub 이벤트를 전달합니다.
+    종료 이벤트(status)를 받거나 이미 완료/실패한 책이면 스트림을 닫습니다.
+
+    Args:
+        snapshot: 현재 진행 상황 (status, pipeline_stage, progress_percentage, pages 등)
+        subscription: 진행 이벤트 구독 (None이면 스냅샷만 전송)
+        is_disconnected: 클라이언트 연결 종료 확인 함수
+        heartbeat: keep-alive 주석 전송 간격 (초, 기본값: settings.book_progress_heartbeat_seconds)
+    """
+    heartbeat = heartbeat or settings.book_progress_heartbeat_seconds
+
+    try:
+        yield f"retry: {int(settings.book_progress_heartbeat_seconds * 1000)}\n\n"
+        yield format_sse(snapshot, "snapshot")
+
+        if subscription is None or snapshot.get("status") in _TERMINAL_STATUSES:
+            return
+
+        while not await is_disconnected():
+            event = await subscription.get(timeout=heartbeat)
+            if event is None:
+                yield ": keepalive\n\n"
+                continue
+
+            yield format_sse(event)
+            if event.get("type") == STATUS_EVENT:
+                return
+    except asyncio.CancelledError:
+        raise
+    finally:
+        if subscription is not None:
+            try:
+                await subscription.close()
+            except Exception as e:
+                logger.warning(f"Failed to close book progress subscription: {e}")
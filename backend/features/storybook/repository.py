@@ -5,8 +5,10 @@ Book Repository
 
 import uuid
 from datetime import datetime
-from typing import Optional, List
-from sqlalchemy import select, or_, func
+from typing import Optional, List, Tuple
+from sqlalchemy import select, insert, or_, func, literal_column, tuple_
+from sqlalchemy.dialects.postgresql import JSON, aggregate_order_by
+from sqlalchemy.engine import RowMapping
 from sqlalchemy.orm import selectinload
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -14,6 +16,112 @@ from .models import Book, Page, Dialogue, DialogueTranslation, DialogueAudio
 from backend.domain.repositories.base import AbstractRepository
 
 
+# ==================== Read Projections ====================
+
+# 목록 응답(BookSummaryResponse)에 필요한 컬럼
+_SUMMARY_COLUMNS = (
+    Book.id,
+    Book.user_id,
+    Book.title,
+    Book.cover_image,
+    Book.status,
+    Book.created_at,
+    Book.pipeline_stage,
+    Book.progress_percentage,
+    Book.error_message,
+    Book.retry_count,
+    Book.is_shared,
+)
+
+# 상세 응답(BookResponse)에 필요한 Book 컬럼
+_DETAIL_COLUMNS = _SUMMARY_COLUMNS + (Book.task_metadata,)
+
+
+def _json_array(element, *order_by):
+    """json_agg(element ORDER BY ...) (행이 없으면 빈 배열)"""
+    return func.coalesce(
+        func.json_agg(aggregate_order_by(element, *order_by)),
+        literal_column("'[]'::json"),
+        type_=JSON,
+    )
+
+
+def _json_object(**fields):
+    """json_build_object('key', value, ...) (키는 리터럴: asyncpg가 바인드 파라미터 타입을 추론하지 못함)"""
+    args = []
+    for key, value in fields.items():
+        args.extend((literal_column(f"'{key}'"), value))
+    return func.json_build_object(*args)
+
+
+def _pages_json():
+    """Book의 페이지 트리 (페이지 → 대사 → 번역/오디오) JSON 상관 서브쿼리"""
+    translations = (
+        select(
+            _json_array(
+                _json_object(
+                    language_code=DialogueTranslation.language_code,
+                    text=DialogueTranslation.text,
+                    is_primary=DialogueTranslation.is_primary,
+                ),
+                DialogueTranslation.is_primary.desc(),
+                DialogueTranslation.language_code,
+            )
+        )
+        .where(DialogueTranslation.dialogue_id == Dialogue.id)
+        .scalar_subquery()
+    )
+    audios = (
+        select(
+            _json_array(
+                _json_object(
+                    language_code=DialogueAudio.language_code,
+                    voice_id=DialogueAudio.voice_id,
+                    audio_url=DialogueAudio.audio_url,
+                    duration=DialogueAudio.duration,
+                ),
+                DialogueAudio.language_code,
+                DialogueAudio.voice_id,
+            )
+        )
+        .where(DialogueAudio.dialogue_id == Dialogue.id)
+        .scalar_subquery()
+    )
+    dialogues = (
+        select(
+            _json_array(
+                _json_object(
+                    id=Dialogue.id,
+                    sequence=Dialogue.sequence,
+                    speaker=Dialogue.speaker,
+                    translations=translations,
+                    audios=audios,
+                ),
+                Dialogue.sequence,
+            )
+        )
+        .where(Dialogue.page_id == Page.id)
+        .scalar_subquery()
+    )
+    return (
+        select(
+            _json_array(
+                _json_object(
+                    id=Page.id,
+                    sequence=Page.sequence,
+                    image_url=Page.image_url,
+                    image_prompt=Page.image_prompt,
+                    video_prompt=Page.video_prompt,
+                    dialogues=dialogues,
+                ),
+                Page.sequence,
+            )
+        )
+        .where(Page.book_id == Book.id)
+        .scalar_subquery()
+    )
+
+
 class BookRepository(AbstractRepository[Book]):
     """
     동화책 Repository
@@ -125,41 +233,85 @@ class BookRepository(AbstractRepository[Book]):
         return result.scalar() or 0
 
     async def get_user_books_summary(
-        self, user_id: uuid.UUID, skip: int = 0, limit: int = 100
-    ) -> List[Book]:
+        self,
+        user_id: uuid.UUID,
+        limit: int = 100,
+        after: Optional[Tuple[datetime, uuid.UUID]] = None,
+    ) -> List[RowMapping]:
         """
         사용자의 동화책 목록 조회 (목록용, 페이지 정보 제외)
 
-        ✅ Readonly 보장: 세션에서 분리하여 반환 (DB 수정 방지)
+        ✅ 목록에 필요한 컬럼만 조회 (ORM 엔티티/세션 분리 비용 없음)
+        ✅ Keyset 페이지네이션: (created_at, id) 기준 다음 페이지 조회 (OFFSET 스캔 없음)
 
         Args:
             user_id: 사용자 UUID
-            skip: 건너뛸 개수
             limit: 가져올 개수
+            after: 이전 페이지 마지막 항목의 (created_at, id) (None이면 첫 페이지)
 
         Returns:
-            List[Book]: 동화책 목록 (페이지 정보 미포함)
+            List[RowMapping]: 동화책 목록 행 (BookSummaryResponse 필드 + user_id)
         """
-        from sqlalchemy import inspect
-
         query = (
-            select(Book)
+            select(*_SUMMARY_COLUMNS)
             .where(or_(Book.user_id == user_id, Book.is_default == True))
             .where(Book.is_deleted == False)  # 삭제된 책 제외
-            .order_by(Book.created_at.asc())
-            .offset(skip)
-            .limit(limit)
         )
+        if after is not None:
+            query = query.where(tuple_(Book.created_at, Book.id) > tuple_(*after))
+
+        query = query.order_by(Book.created_at.asc(), Book.id.asc()).limit(limit)
         result = await self.session.execute(query)
-        books = list(result.scalars().all())
+        return list(result.mappings().all())
 
-        # ✅ 모든 책을 세션에서 분리 (읽기 전용 보장)
-        # 페이지 정보 없으므로 Book만 분리 (_detach_book_from_session은 pages 접근하여 사용 불가)
-        for book in books:
-            if inspect(book).session is not None:
-                self.session.expunge(book)
+    async def get_book_detail(self, book_id: uuid.UUID) -> Optional[dict]:
+        """
+        동화책 상세 조회 (읽기 전용 프로젝션)
 
-        return books
+        페이지 → 대사 → 번역/오디오 트리를 DB에서 JSON으로 집계하여 쿼리 1회로 조회합니다.
+        ORM 엔티티를 만들지 않으므로 세션 분리(_detach_book_from_session)가 필요 없습니다.
+        파이프라인 Task처럼 엔티티가 필요한 곳은 get_with_pages를 사용합니다.
+
+        Args:
+            book_id: 동화책 UUID
+
+        Returns:
+            Optional[dict]: Book 컬럼 + "pages" (중첩 dict 목록) 또는 None
+        """
+        query = select(
+            *_DETAIL_COLUMNS, _pages_json().label("pages")
+        ).where(Book.id == book_id)
+        result = await self.session.execute(query)
+        row = result.mappings().one_or_none()
+        return dict(row) if row else None
+
+    async def get_dialogue_texts(
+        self, book_id: uuid.UUID, language_code: Optional[str] = None
+    ) -> List[str]:
+        """
+        동화책의 대사 번역 텍스트 조회 (단어 오디오 사전 생성용)
+
+        Args:
+            book_id: 동화책 UUID
+            language_code: 언어 코드 (None이면 원본 언어(is_primary) 번역, Book 음성으로 읽는 텍스트)
+
+        Returns:
+            List[str]: 페이지 → 대사 순서의 번역 텍스트
+        """
+        language_filter = (
+            DialogueTranslation.language_code == language_code
+            if language_code is not None
+            else DialogueTranslation.is_primary.is_(True)
+        )
+        query = (
+            select(DialogueTranslation.text)
+            .join(Dialogue, Dialogue.id == DialogueTranslation.dialogue_id)
+            .join(Page, Page.id == Dialogue.page_id)
+            .where(Page.book_id == book_id, language_filter)
+            .order_by(Page.sequence, Dialogue.sequence)
+        )
+        result = await self.session.scalars(query)
+        return list(result.all())
 
     async def add_page(self, book_id: uuid.UUID, page_data: dict) -> Page:
         """
@@ -270,6 +422,39 @@ class BookRepository(AbstractRepository[Book]):
         await self.session.refresh(audio)
         return audio
 
+    async def add_dialogue_audios(self, audios: List[dict]) -> List[DialogueAudio]:
+        """
+        대사 오디오 일괄 추가 (단일 multi-row INSERT ... RETURNING)
+
+        Args:
+            audios: 오디오 데이터 목록
+                [{"dialogue_id": ..., "language_code": "en", "voice_id": "...",
+                  "audio_url": "...", "status": "PENDING"}, ...]
+
+        Returns:
+            List[DialogueAudio]: 생성된 오디오 (입력 순서 유지)
+        """
+        if not audios:
+            return []
+
+        now = datetime.utcnow()
+        rows = [
+            {
+                "id": uuid.uuid4(),
+                "duration": None,
+                "status": "PENDING",
+                "created_at": now,
+                "updated_at": now,
+                **audio,
+            }
+            for audio in audios
+        ]
+        result = await self.session.scalars(
+            insert(DialogueAudio).returning(DialogueAudio, sort_by_parameter_order=True),
+            rows,
+        )
+        return list(result.all())
+
     # ==================== Progress Tracking Methods ====================
 
     async def update_progress(
@@ -323,6 +508,9 @@ class BookRepository(AbstractRepository[Book]):
         Returns:
             Optional[dict]: 진행 상황 정보
                 {
+                    "book_id": UUID,
+                    "user_id": UUID,
+                    "is_shared": bool,
                     "status": "creating|completed|failed",
                     "pipeline_stage": "story|images|tts|video|completed",
                     "progress_percentage": 0-100,
@@ -339,6 +527,9 @@ class BookRepository(AbstractRepository[Book]):
             return None
 
         return {
+            "book_id": book.id,
+            "user_id": book.user_id,
+            "is_shared": book.is_shared,
             "status": book.status,
             "pipeline_stage": book.pipeline_stage,
             "progress_percentage": book.progress_percentage,
@@ -1,8 +1,10 @@
+import base64
 from pydantic import BaseModel, Field, field_validator, create_model
-from typing import List, Optional, TYPE_CHECKING, Annotated, Type
+from typing import Any, List, Mapping, Optional, TYPE_CHECKING, Annotated, Tuple, Type
 from uuid import UUID
 from datetime import datetime
 from backend.core.config import settings
+from backend.features.storybook.exceptions import InvalidBookCursorException
 
 if TYPE_CHECKING:
     from backend.features.storybook.models import Book, Page, Dialogue, DialogueTranslation, DialogueAudio
@@ -116,6 +118,16 @@ class DialogueAudioResponse(BaseModel):
             duration=audio.duration
         )
 
+    @classmethod
+    def from_projection(cls, audio: Mapping[str, Any], storage_service: "AbstractStorageService", is_shared: bool = False) -> "DialogueAudioResponse":
+        """조회 프로젝션(dict) → DTO 변환 + URL 변환"""
+        return cls(
+            language_code=audio["language_code"],
+            voice_id=audio["voice_id"],
+            audio_url=storage_service.get_url(audio["audio_url"], is_shared=is_shared) if audio["audio_url"] else "",
+            duration=audio["duration"]
+        )
+
 class DialogueResponse(BaseModel):
     """대화문 응답 (다국어 지원)"""
     id: UUID = Field(..., description="대화문 고유 ID")
@@ -177,6 +189,20 @@ class DialogueResponse(BaseModel):
             ]
         )
 
+    @classmethod
+    def from_projection(cls, dialogue: Mapping[str, Any], storage_service: "AbstractStorageService", is_shared: bool = False) -> "DialogueResponse":
+        """조회 프로젝션(dict) → DTO 변환 + URL 변환"""
+        return cls(
+            id=dialogue["id"],
+            sequence=dialogue["sequence"],
+            speaker=dialogue["speaker"],
+            translations=[DialogueTranslationResponse(**t) for t in dialogue["translations"]],
+            audios=[
+                DialogueAudioResponse.from_projection(a, storage_service, is_shared)
+                for a in dialogue["audios"]
+            ]
+        )
+
 class PageResponse(BaseModel):
     id: UUID = Field(..., description="페이지 고유 ID")
     sequence: int = Field(..., description="페이지 순서", example=1)
@@ -221,6 +247,42 @@ class PageResponse(BaseModel):
             ]
         )
 
+    @classmethod
+    def from_projection(cls, page: Mapping[str, Any], storage_service: "AbstractStorageService", is_shared: bool = False) -> "PageResponse":
+        """조회 프로젝션(dict) → DTO 변환 + URL 변환"""
+        return cls(
+            id=page["id"],
+            sequence=page["sequence"],
+            image_url=storage_service.get_url(page["image_url"], is_shared=is_shared) if page["image_url"] else None,
+            image_prompt=page["image_prompt"],
+            video_prompt=page["video_prompt"],
+            dialogues=[
+                DialogueResponse.from_projection(d, storage_service, is_shared)
+                for d in page["dialogues"]
+            ]
+        )
+
+def encode_book_cursor(created_at: datetime, book_id: UUID) -> str:
+    """목록 keyset 커서 생성 (마지막 항목의 created_at, id)"""
+    raw = f"{created_at.isoformat()}|{book_id}"
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_book_cursor(cursor: str) -> Tuple[datetime, UUID]:
+    """
+    목록 keyset 커서 해석
+
+    Raises:
+        InvalidBookCursorException: 형식이 잘못된 커서
+    """
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)).decode()
+        created_at, book_id = raw.split("|", 1)
+        return datetime.fromisoformat(created_at), UUID(book_id)
+    except ValueError:
+        raise InvalidBookCursorException(cursor)
+
+
 class BookSummaryResponse(BaseModel):
     """책 목록용 간소화 응답 (페이지 정보 제외)"""
     id: UUID = Field(..., description="동화책 고유 ID")
@@ -254,6 +316,22 @@ class BookSummaryResponse(BaseModel):
         )
 
 
+    @classmethod
+    def from_row(cls, row: Mapping[str, Any], storage_service: "AbstractStorageService") -> "BookSummaryResponse":
+        """목록 조회 행(BookRepository.get_user_books_summary) → DTO 변환 + URL 변환"""
+        return cls(
+            id=row["id"],
+            title=row["title"],
+            cover_image=storage_service.get_url(row["cover_image"], is_shared=row["is_shared"]) if row["cover_image"] else None,
+            status=row["status"],
+            created_at=row["created_at"],
+            pipeline_stage=row["pipeline_stage"],
+            progress_percentage=row["progress_percentage"],
+            error_message=row["error_message"],
+            retry_count=row["retry_count"],
+            is_shared=row["is_shared"],
+        )
+
 class BookResponse(BaseModel):
     id: UUID = Field(..., description="동화책 고유 ID")
     title: str = Field(..., description="동화책 제목", example="우주를 탐험하는 용감한 고양이")
@@ -334,6 +412,37 @@ class BookResponse(BaseModel):
             is_shared=book.is_shared,
         )
 
+    @classmethod
+    def from_projection(cls, book: Mapping[str, Any], storage_service: "AbstractStorageService") -> "BookResponse":
+        """
+        조회 프로젝션(BookRepository.get_book_detail) → DTO 변환 + URL 변환
+
+        Args:
+            book: Book 컬럼 + 중첩 pages dict
+            storage_service: Storage Service (URL 변환용)
+
+        Returns:
+            BookResponse: URL이 변환된 DTO 객체
+        """
+        is_shared = book["is_shared"]
+        return cls(
+            id=book["id"],
+            title=book["title"],
+            cover_image=storage_service.get_url(book["cover_image"], is_shared=is_shared) if book["cover_image"] else None,
+            status=book["status"],
+            created_at=book["created_at"],
+            pages=[
+                PageResponse.from_projection(page, storage_service, is_shared=is_shared)
+                for page in book["pages"]
+            ],
+            pipeline_stage=book["pipeline_stage"],
+            task_metadata=book["task_metadata"],
+            progress_percentage=book["progress_percentage"],
+            error_message=book["error_message"],
+            retry_count=book["retry_count"],
+            is_shared=is_shared,
+        )
+
 class BookListResponse(BaseModel):
     books: List[BookResponse]
 
@@ -1,10 +1,15 @@
 import uuid
 import asyncio
 import logging
-from typing import List, Optional, Dict, Any
+import mimetypes
+from typing import AsyncIterator, List, Optional, Dict, Any, Tuple
+from fastapi import UploadFile
+from sqlalchemy.engine import RowMapping
 from sqlalchemy.ext.asyncio import AsyncSession
 from .models import Book, Page, Dialogue, DialogueTranslation, DialogueAudio, BookStatus
+from .cache import get_book_response_cache
 from .repository import BookRepository
+from .schemas import decode_book_cursor, encode_book_cursor
 from backend.core.utils.trace import log_process
 from backend.infrastructure.ai.factory import AIProviderFactory
 from backend.infrastructure.storage.base import AbstractStorageService
@@ -16,6 +21,7 @@ from .exceptions import (
     StorybookUnauthorizedException,
     StorybookCreationFailedException,
     ImageUploadFailedException,
+    ImageTooLargeException,
     StoriesImagesMismatchException,
     AIGenerationFailedException,
     InvalidPageCountException,
@@ -76,7 +82,7 @@ class BookOrchestratorService:
         self,
         user_id: uuid.UUID,
         stories: List[str],
-        images: List[bytes],
+        images: List[UploadFile],
         voice_id: str,
         level: int,
         is_default: bool,
@@ -107,6 +113,7 @@ class BookOrchestratorService:
         Raises:
             BookQuotaExceededException: 할당량 초과
             InvalidPageCountException: 페이지 수 범위 초과
+            ImageTooLargeException: 원본 이미지 크기 초과
         """
 
         # 1. 할당량 검사
@@ -153,6 +160,13 @@ class BookOrchestratorService:
                 },
             )
 
+        # 3-2. 원본 이미지를 스토리지에 스트리밍 저장 (DAG에는 키만 전달)
+        try:
+            image_keys = await self._store_source_images(book, images)
+        except Exception:
+            await self.db_session.rollback()
+            raise
+
         await self.db_session.commit()
 
         # Refresh to reload attributes after commit
@@ -164,7 +178,7 @@ class BookOrchestratorService:
             book_id=book.id,
             stories=stories,
             tts_producer=self.tts_producer,
-            images=images,
+            image_keys=image_keys,
             voice_id=voice_id,
             level=level,
             target_language=target_language,
@@ -176,27 +190,96 @@ class BookOrchestratorService:
 
         return await self.book_repo.get_with_pages(book.id)
 
+    async def _store_source_images(
+        self, book: Book, images: List[UploadFile]
+    ) -> List[str]:
+        """
+        업로드된 원본 이미지를 스토리지에 청크 단위로 저장
+
+        API 프로세스 메모리에 이미지 전체를 올리지 않으며, 크기 제한을 넘으면 저장을 중단합니다.
+        하나라도 실패하면 이미 저장한 원본을 삭제합니다.
+
+        Args:
+            book: 생성 중인 Book
+            images: 페이지 순서대로 업로드된 이미지
+
+        Returns:
+            List[str]: 페이지별 원본 이미지 스토리지 키
+
+        Raises:
+            ImageTooLargeException: 이미지 크기 제한 초과
+            ImageUploadFailedException: 스토리지 저장 실패
+        """
+        stored: List[str] = []
+        try:
+            for page_idx, image in enumerate(images):
+                content_type = image.content_type or "application/octet-stream"
+                extension = mimetypes.guess_extension(content_type) or ""
+                key = f"{book.base_path}/originals/page_{page_idx + 1}{extension}"
+
+                stored.append(
+                    await self.storage_service.save_stream(
+                        _read_upload_chunks(image, settings.max_upload_image_bytes),
+                        key,
+                        content_type=content_type,
+                    )
+                )
+        except Exception as e:
+            for key in stored:
+                try:
+                    await self.storage_service.delete(key)
+                except Exception as cleanup_error:
+                    logger.warning(
+                        f"[BookService] Failed to clean up source image {key}: {cleanup_error}"
+                    )
+            if isinstance(e, ImageTooLargeException):
+                raise
+            raise ImageUploadFailedException(
+                filename=images[len(stored)].filename, reason=str(e)
+            ) from e
+
+        return stored
+
     async def get_books(self, user_id: uuid.UUID) -> List[Book]:
         """사용자의 책 목록 조회"""
         return await self.book_repo.get_user_books(user_id)
 
-    async def get_books_summary(self, user_id: uuid.UUID) -> List[Book]:
-        """사용자의 책 목록 조회 (목록용, 페이지 제외)"""
-        return await self.book_repo.get_user_books_summary(user_id)
+    async def get_books_summary(
+        self, user_id: uuid.UUID, limit: int = 100, cursor: Optional[str] = None
+    ) -> Tuple[List[RowMapping], Optional[str]]:
+        """
+        사용자의 책 목록 조회 (목록용, 페이지 제외)
+
+        Args:
+            user_id: 사용자 UUID
+            limit: 페이지 크기
+            cursor: 이전 응답의 다음 페이지 커서 (None이면 첫 페이지)
 
-    async def get_book(self, book_id: uuid.UUID, user_id: uuid.UUID = None) -> Book:
-        """책 상세 조회"""
-        book = await self.book_repo.get_with_pages(book_id)
+        Returns:
+            Tuple[List[RowMapping], Optional[str]]: (목록 행, 다음 페이지 커서 - 마지막 페이지면 None)
+        """
+        after = decode_book_cursor(cursor) if cursor else None
+        rows = await self.book_repo.get_user_books_summary(user_id, limit=limit, after=after)
+
+        next_cursor = None
+        if len(rows) == limit:
+            last = rows[-1]
+            next_cursor = encode_book_cursor(last["created_at"], last["id"])
+        return rows, next_cursor
+
+    async def get_book(self, book_id: uuid.UUID, user_id: uuid.UUID = None) -> dict:
+        """책 상세 조회 (읽기 전용 프로젝션, BookResponse.from_projection으로 변환)"""
+        book = await self.book_repo.get_book_detail(book_id)
         if not book:
             raise StorybookNotFoundException(storybook_id=str(book_id))
 
         # 권한 체크
         # 1. 공유된 책은 무조건 접근 허용
-        if book.is_shared:
+        if book["is_shared"]:
             return book
 
         # 2. 비공개 책: 로그인 필요 & 소유자 확인
-        if not user_id or book.user_id != user_id:
+        if not user_id or book["user_id"] != user_id:
             raise StorybookUnauthorizedException(
                 storybook_id=str(book_id),
                 user_id=str(user_id) if user_id else "anonymous",
@@ -204,6 +287,24 @@ class BookOrchestratorService:
 
         return book
 
+    async def get_book_progress(self, book_id: uuid.UUID, user_id: uuid.UUID = None) -> dict:
+        """
+        책 생성 진행 상황 조회 (페이지 트리를 로드하지 않음)
+
+        권한 규칙은 get_book과 같습니다.
+        """
+        progress = await self.book_repo.get_progress(book_id)
+        if not progress:
+            raise StorybookNotFoundException(storybook_id=str(book_id))
+
+        if not progress["is_shared"] and (not user_id or progress["user_id"] != user_id):
+            raise StorybookUnauthorizedException(
+                storybook_id=str(book_id),
+                user_id=str(user_id) if user_id else "anonymous",
+            )
+
+        return progress
+
     async def update_book_sharing(
         self, book_id: uuid.UUID, is_shared: bool, user_id: uuid.UUID
     ) -> Book:
@@ -233,6 +334,8 @@ class BookOrchestratorService:
         book.is_shared = is_shared
         self.db_session.add(book)
         await self.db_session.commit()
+        # 비공개 전환 시 캐시된 공유 응답이 더 이상 제공되지 않도록 무효화
+        await get_book_response_cache().invalidate(book_id)
 
         # Reload with pages for response schema
         return await self.book_repo.get_with_pages(book_id)
@@ -256,4 +359,18 @@ class BookOrchestratorService:
         result = await self.book_repo.soft_delete(book_id)
         if result:
             await self.db_session.commit()
+            await get_book_response_cache().invalidate(book_id)
         return result
+
+
+async def _read_upload_chunks(upload: UploadFile, max_bytes: int) -> AsyncIterator[bytes]:
+    """업로드 파일을 청크 단위로 읽기 (max_bytes 초과 시 ImageTooLargeException)"""
+    total = 0
+    while True:
+        chunk = await upload.read(settings.storage_stream_chunk_size)
+        if not chunk:
+            return
+        total += len(chunk)
+        if total > max_bytes:
+            raise ImageTooLargeException(filename=upload.filename, max_bytes=max_bytes)
+        yield chunk
@@ -6,8 +6,7 @@ Storybook Task Definitions
 import json
 import logging
 import uuid
-from typing import List
-import httpx
+from typing import Any, Dict, List
 from backend.core.database.session import AsyncSessionLocal
 from backend.core.dependencies import (
     get_storage_service,
@@ -17,6 +16,7 @@ from backend.core.dependencies import (
 )
 from backend.infrastructure.storage.base import AbstractStorageService
 from backend.infrastructure.ai.factory import AIProviderFactory
+from backend.infrastructure.ai.poller import get_task_poller
 from backend.infrastructure.ai.base import StoryResponse
 from backend.features.storybook.repository import BookRepository
 from backend.features.storybook.models import BookStatus
@@ -32,10 +32,18 @@ from backend.features.storybook.prompts.generate_tts_expression_prompt import (
 from backend.features.storybook.prompts.generate_image_prompt import GenerateImagePrompt
 from backend.features.storybook.prompts.generate_video_prompt import GenerateVideoPrompt
 from backend.features.storybook.validators import ValidatorFactory
+from backend.features.storybook.cache import get_book_response_cache
+from backend.features.storybook.progress import (
+    PAGE_EVENT,
+    STAGE_EVENT,
+    STATUS_EVENT,
+    publish_book_event,
+)
 from backend.core.config import settings
 from backend.core.limiters import get_limiters
 from backend.features.tts.exceptions import BookVoiceNotConfiguredException
 from backend.features.tts.producer import TTSProducer
+from backend.features.tts.word_prewarm import get_word_prewarm_jobs
 
 # from backend.features.storybook.dependencies import get_tts_producer
 
@@ -43,6 +51,7 @@ from backend.features.tts.producer import TTSProducer
 from .schemas import TaskResult, TaskContext, TaskStatus
 from .store import TaskStore
 from .retry import retry_with_config, BatchRetryTracker, calculate_retry_delay
+from .transfer import TransferItem, transfer_all
 
 # test
 import asyncio
@@ -86,6 +95,28 @@ async def _mark_book_failed(book_id: str, stage: str, error: str) -> None:
     except Exception as e:
         logger.error(f"[Story Task] Failed to update error in DB: {e}")
 
+    await publish_book_event(
+        book_id, STATUS_EVENT, status=BookStatus.FAILED, error=f"{stage}: {error}"
+    )
+
+
+def _page_saved_publisher(book_id: str, stage: str):
+    """공통: 페이지 저장 완료 이벤트 발행 콜백 (transfer_all on_saved)"""
+
+    async def on_saved(idx: int, path: str) -> None:
+        await publish_book_event(book_id, PAGE_EVENT, stage=stage, page=idx + 1, status="completed")
+
+    return on_saved
+
+
+async def _publish_failed_pages(
+    book_id: str, stage: str, total_pages: int, stored: Dict[int, Any]
+) -> None:
+    """공통: 저장되지 않은 페이지 실패 이벤트 발행"""
+    for idx in range(total_pages):
+        if idx not in stored:
+            await publish_book_event(book_id, PAGE_EVENT, stage=stage, page=idx + 1, status="failed")
+
 
 async def _shorten_title(
     story_provider,
@@ -427,6 +458,7 @@ async def _save_story_to_db(
 
             await session.commit()
             logger.info(f"[Story Task] Completed for book_id={book_id}")
+            await publish_book_event(book_id, STAGE_EVENT, stage="story", progress=30)
 
             return TaskResult(
                 status=TaskStatus.COMPLETED,
@@ -540,7 +572,7 @@ async def generate_story_task(
 
 async def generate_image_task(
     book_id: str,
-    images: List[bytes],
+    image_keys: List[str],
     context: TaskContext,
 ) -> TaskResult:
     """
@@ -554,7 +586,7 @@ async def generate_image_task(
         Phase 2: Generate prompts from dialogues
         Phase 3: MAIN RETRY LOOP
             Phase 3a: Submit async requests (get task_uuids)
-            Phase 3b: Polling loop (check_image_status)
+            Phase 3b: Shared batched polling (TaskStatusPoller)
             Phase 3c: Handle timeouts + Save to Redis
         Phase 4: Evaluate results (all/partial/failed)
         Phase 5: Download images from CDN → Save to S3
@@ -563,14 +595,14 @@ async def generate_image_task(
 
     Args:
         book_id: Book UUID (string)
-        images: 모든 페이지의 원본 이미지 바이트 리스트
+        image_keys: 모든 페이지의 원본 이미지 스토리지 키 리스트 (요청 직전에 로드)
         context: Task 실행 컨텍스트
 
     Returns:
         TaskResult: 성공 시 모든 페이지의 image_urls 반환
     """
     logger.info(
-        f"[Image Task] [Book: {book_id}] Starting async batch processing, {len(images)} images"
+        f"[Image Task] [Book: {book_id}] Starting async batch processing, {len(image_keys)} images"
     )
     # return ""
 
@@ -584,13 +616,13 @@ async def generate_image_task(
     # 디버깅: Redis에서 가져온 데이터 확인
     logger.info(
         f"[Image Task] [Book: {book_id}] Redis story_data exists: {story_data is not None}, "
-        f"dialogues count: {len(dialogues)}, images count: {len(images)}"
+        f"dialogues count: {len(dialogues)}, images count: {len(image_keys)}"
     )
 
     # === Phase 1: Initialize Trackers ===
     logger.info(f"[Image Task] [Book: {book_id}] Phase 1: Initializing trackers")
     max_retries = settings.task_image_max_retries
-    tracker = BatchRetryTracker(total_items=len(images), max_retries=max_retries)
+    tracker = BatchRetryTracker(total_items=len(image_keys), max_retries=max_retries)
 
     # Redis cache recovery (for restart scenarios)
     image_cache_key = f"images_cache:{book_id}"
@@ -610,6 +642,7 @@ async def generate_image_task(
     ]
     ai_factory = get_ai_factory()
     image_provider = ai_factory.get_image_provider()
+    limiters = get_limiters()
 
     # === Phase 3: Async Request + Polling Loop ===
     while not tracker.is_all_completed():
@@ -628,12 +661,15 @@ async def generate_image_task(
             f"[Image Task] [Book: {book_id}] Phase 3a: Submitting async requests"
         )
 
-        tasks = [
-            image_provider.generate_image_from_image(
-                image_data=images[idx], prompt=prompts[idx]
-            )
-            for idx in pending_indices
-        ]
+        async def submit(idx: int) -> dict:
+            # 원본은 제출 직전에만 로드 (DAG 인자에는 키만 보관)
+            image_data = await storage_service.get(image_keys[idx])
+            async with limiters.limit(settings.ai_image_provider, "image"):
+                return await image_provider.generate_image_from_image(
+                    image_data=image_data, prompt=prompts[idx]
+                )
+
+        tasks = [submit(idx) for idx in pending_indices]
 
         # return_exceptions=True로 개별 실패 허용
         task_uuid_results = await asyncio.gather(*tasks, return_exceptions=True)
@@ -670,58 +706,37 @@ async def generate_image_task(
             f"[Image Task] [Book: {book_id}] Phase 3b: Starting polling for {len(pending_to_task_uuid)} tasks"
         )
 
+        # 공유 폴러: 모든 Book의 대기 작업을 묶어서 일괄 조회 (대기 시간에 따라 간격 증가)
         max_wait_time = settings.task_image_max_wait_time  # 300 seconds
-        poll_interval = settings.task_image_poll_interval  # 5 seconds
-        elapsed_time = 0
-
-        while elapsed_time < max_wait_time and pending_to_task_uuid:
-            logger.info(
-                f"[Image Task] [Book: {book_id}] Polling: {len(pending_to_task_uuid)} pending, "
-                f"elapsed={elapsed_time}s/{max_wait_time}s"
-            )
-
-            for idx in list(pending_to_task_uuid.keys()):
-                task_uuid = pending_to_task_uuid[idx]
-
-                try:
-                    status_response = await image_provider.check_image_status(task_uuid)
-                    status = status_response["status"]
-                    progress = status_response.get("progress", 0)
-
-                    if status == "completed":
-                        image_info = {
-                            "imageUUID": status_response.get("image_uuid"),
-                            "imageURL": status_response.get("image_url"),
-                        }
-                        tracker.mark_success(idx, image_info)
-                        del pending_to_task_uuid[idx]
-                        logger.info(
-                            f"[Image Task] [Book: {book_id}] Page {idx} ✅ completed: "
-                            f"imageURL={image_info['imageURL'][:50] if image_info['imageURL'] else 'None'}..."
-                        )
-
-                    elif status == "failed":
-                        error_msg = status_response.get("error", "Unknown error")
-                        tracker.mark_failure(idx, error_msg)
-                        del pending_to_task_uuid[idx]
-                        logger.error(
-                            f"[Image Task] [Book: {book_id}] Page {idx} ❌ failed: {error_msg}"
-                        )
-
-                    else:
-                        # processing/pending 상태
-                        logger.info(
-                            f"[Image Task] [Book: {book_id}] Page {idx} ⏳ {status} (progress={progress}%)"
-                        )
+        poller = get_task_poller(image_provider, "image")
+        status_responses = await poller.wait_many(
+            list(pending_to_task_uuid.values()), timeout=max_wait_time
+        )
 
-                except Exception as e:
-                    logger.error(
-                        f"[Image Task] [Book: {book_id}] Page {idx} ⚠️ status check error: {e}"
-                    )
+        for idx in list(pending_to_task_uuid.keys()):
+            status_response = status_responses.get(pending_to_task_uuid[idx])
+            if status_response is None:
+                continue  # 타임아웃 → 아래에서 처리
+
+            if status_response["status"] == "completed":
+                image_info = {
+                    "imageUUID": status_response.get("image_uuid"),
+                    "imageURL": status_response.get("image_url"),
+                }
+                tracker.mark_success(idx, image_info)
+                del pending_to_task_uuid[idx]
+                logger.info(
+                    f"[Image Task] [Book: {book_id}] Page {idx} ✅ completed: "
+                    f"imageURL={image_info['imageURL'][:50] if image_info['imageURL'] else 'None'}..."
+                )
 
-            if pending_to_task_uuid:
-                await asyncio.sleep(poll_interval)
-                elapsed_time += poll_interval
+            else:
+                error_msg = status_response.get("error", "Unknown error")
+                tracker.mark_failure(idx, error_msg)
+                del pending_to_task_uuid[idx]
+                logger.error(
+                    f"[Image Task] [Book: {book_id}] Page {idx} ❌ failed: {error_msg}"
+                )
 
         # Handle timed-out tasks
         for idx in list(pending_to_task_uuid.keys()):
@@ -777,45 +792,39 @@ async def generate_image_task(
         base_path = book.base_path
 
     # Storage tracker (separate from generation tracker)
-    storage_tracker = BatchRetryTracker(total_items=tracker.total_items, max_retries=2)
+    storage_tracker = BatchRetryTracker(
+        total_items=tracker.total_items,
+        max_retries=settings.storage_transfer_max_retries,
+    )
 
     # Pre-mark failed generation items as storage failed
     for idx in tracker.get_failed_indices():
         storage_tracker.mark_failure(idx, "Generation failed - skipping storage")
 
-    # Download and store image
-    async def download_and_store_image(idx: int, image_info: dict) -> str:
-        """Download from Runware CDN and save to permanent storage"""
-        image_url = image_info.get("imageURL")
-
-        # Download with timeout
-        timeout = httpx.Timeout(settings.http_timeout, read=settings.http_read_timeout)
-        async with httpx.AsyncClient(timeout=timeout) as client:
-            response = await client.get(image_url)
-            response.raise_for_status()
-            image_bytes = response.content
-
-        # Save to storage
-        file_name = f"{base_path}/images/page_{idx + 1}.webp"
-        await storage_service.save(image_bytes, file_name, content_type="image/webp")
-
-        logger.info(
-            f"[Image Task] [Book: {book_id}] Page {idx + 1}: "
-            f"Saved to {file_name} ({len(image_bytes)} bytes)"
+    # Stream CDN → storage in parallel (bounded concurrency + byte budget, per-item retry)
+    transfer_items = [
+        TransferItem(
+            idx=idx,
+            url=image_info.get("imageURL"),
+            path=f"{base_path}/images/page_{idx + 1}.webp",
+            content_type="image/webp",
         )
+        for idx, image_info in tracker.completed.items()
+    ]
+    await transfer_all(
+        transfer_items,
+        storage_service,
+        storage_tracker,
+        log_prefix=f"[Image Task] [Book: {book_id}]",
+        on_saved=_page_saved_publisher(book_id, "image"),
+    )
+    await _publish_failed_pages(book_id, "image", storage_tracker.total_items, storage_tracker.completed)
 
-        return file_name
-
-    # Process images sequentially for memory management
-    for idx, image_info in tracker.completed.items():
-        try:
-            storage_path = await download_and_store_image(idx, image_info)
-            storage_tracker.mark_success(idx, storage_path)
-        except Exception as e:
-            storage_tracker.mark_failure(idx, str(e))
-            logger.error(
-                f"[Image Task] [Book: {book_id}] Page {idx + 1} storage failed: {e}"
-            )
+    for idx in sorted(set(tracker.completed) - set(storage_tracker.completed)):
+        logger.error(
+            f"[Image Task] [Book: {book_id}] Page {idx + 1} storage failed: "
+            f"{storage_tracker.last_errors.get(idx)}"
+        )
 
     logger.info(
         f"[Image Task] [Book: {book_id}] Phase 5 completed: "
@@ -873,6 +882,7 @@ async def generate_image_task(
                 f"[Image Task] [Book: {book_id}] Updated {len(storage_tracker.completed)} "
                 f"page images, cover={cover_path is not None}"
             )
+            await publish_book_event(book_id, STAGE_EVENT, stage="image", progress=60)
 
         except Exception as e:
             logger.error(
@@ -898,7 +908,7 @@ async def generate_image_task(
             # None 유지하여 순서 보존 (Video Task에서 인덱스 매칭 필요)
             "images": image_infos,
             "storage_paths": storage_paths,
-            "page_count": len(images),
+            "page_count": len(image_keys),
             "failed_pages": tracker.get_failed_indices(),
             "storage_failed_pages": storage_tracker.get_failed_indices(),
         },
@@ -915,7 +925,7 @@ async def generate_image_task(
         result={
             "image_infos": image_infos,
             "storage_paths": storage_paths,
-            "page_count": len(images),
+            "page_count": len(image_keys),
             "completed_count": len(tracker.completed),
             "failed_count": len(tracker.get_failed_indices()),
             "storage_completed_count": len(storage_tracker.completed),
@@ -969,14 +979,14 @@ async def generate_tts_task(
             )
 
             # === Phase 2: Build Task List ===
-            tasks_to_generate = []
-            tasks_to_enqueue = []
+            audio_rows = []
+            audio_texts = []
 
             # Redis에서 감정 포함 대화 텍스트 가져오기
             dialogues_with_emotion = (
                 story_data.get("dialogues", []) if story_data else []
             )
-            logger.info(f"[TTS Task] dialogues_with_emotion: {dialogues_with_emotion}")
+            logger.debug(f"[TTS Task] dialogues_with_emotion: {dialogues_with_emotion}")
             logger.info(
                 f"[TTS Task] [Book: {book_id}] Loaded {len(dialogues_with_emotion)} pages with emotion from Redis"
             )
@@ -1007,7 +1017,7 @@ async def generate_tts_task(
                         emotion_text = dialogues_with_emotion[page_idx][dialogue_idx]
                         if not emotion_text or not emotion_text.strip():
                             raise ValueError("Empty emotion text")
-                        logger.info(
+                        logger.debug(
                             f"[TTS Task] [Book: {book_id}] Using emotion text for page {page_idx + 1}, dialogue {dialogue_idx + 1}"
                         )
                     except (IndexError, TypeError, ValueError) as e:
@@ -1019,35 +1029,31 @@ async def generate_tts_task(
                     # file_name = f"users/{book.user_id}/audios/standalone/{uuid.uuid4()}.mp3"
                     audio_uuid = uuid.uuid4()
                     file_name = f"{book.base_path}/{audio_uuid}.mp3"
-                    logger.info(
-                        f"[TTS Task] [Book: {book_id}] Audio path: {file_name} (is_default: {book.is_default})"
-                    )
-                    audio = await repo.add_dialogue_audio(
-                        dialogue_id=dialogue.id,
-                        language_code=primary_translation.language_code,
-                        voice_id=book.voice_id,
-                        audio_url=file_name,
-                        status="PENDING",
-                    )
-                    if not audio:
-                        logger.error(
-                            f"[TTS Task] Failed to create DialogueAudio record for dialogue {dialogue.id}, skipping"
-                        )
-                        continue
-                    logger.info(
-                        f"[TTS Task] [Book: {book_id}] Enqueuing TTS for dialogue {dialogue.id}, audio_id={audio.id}"
-                    )
-                    logger.info(
-                        f"[TTS Task] [Book: {book_id}] Text (with emotion): {emotion_text}"
+                    logger.debug(
+                        f"[TTS Task] [Book: {book_id}] Dialogue {dialogue.id}: audio path {file_name}, "
+                        f"text (with emotion): {emotion_text}"
                     )
-                    tasks_to_enqueue.append(
+                    audio_rows.append(
                         {
-                            "audio_id": audio.id,
-                            "text": emotion_text,
                             "dialogue_id": dialogue.id,
+                            "language_code": primary_translation.language_code,
+                            "voice_id": book.voice_id,
+                            "audio_url": file_name,
+                            "status": "PENDING",
                         }
                     )
-                    tasks_to_generate.append(audio.id)
+                    audio_texts.append(emotion_text)
+
+            # DialogueAudio 일괄 생성 (단일 INSERT ... RETURNING)
+            audios = await repo.add_dialogue_audios(audio_rows)
+            tasks_to_enqueue = [
+                (audio.id, text) for audio, text in zip(audios, audio_texts)
+            ]
+            tasks_to_generate = [audio.id for audio in audios]
+            logger.info(
+                f"[TTS Task] [Book: {book_id}] Created {len(audios)} DialogueAudio records "
+                f"(is_default: {book.is_default})"
+            )
 
             await repo.update(
                 book_uuid,
@@ -1062,12 +1068,10 @@ async def generate_tts_task(
             logger.info(
                 f"[TTS Task] Enqueuing {len(tasks_to_enqueue)} tasks to Redis..."
             )
-            for task in tasks_to_enqueue:
-                await tts_producer.enqueue_tts_task(
-                    dialogue_audio_id=task["audio_id"],
-                    text=task["text"],
-                )
-                logger.debug(f"[TTS Task] Enqueued audio_id={task['audio_id']}")
+            # 모든 XADD를 하나의 파이프라인으로 전송
+            await tts_producer.enqueue_many(tasks_to_enqueue)
+            # 대사별 오디오 완료 이벤트는 TTS Worker가 발행
+            await publish_book_event(book_id, STAGE_EVENT, stage="tts", progress=70)
             return TaskResult(
                 status=TaskStatus.COMPLETED,
                 result={
@@ -1091,6 +1095,9 @@ async def generate_tts_task(
             except Exception as db_error:
                 logger.error(f"[TTS Task] Failed to update error in DB: {db_error}")
 
+            await publish_book_event(
+                book_id, STATUS_EVENT, status=BookStatus.FAILED, error=f"TTS generation failed: {str(e)}"
+            )
             return TaskResult(status=TaskStatus.FAILED, error=str(e))
 
         except Exception as e:
@@ -1109,6 +1116,9 @@ async def generate_tts_task(
             except Exception as db_error:
                 logger.error(f"[TTS Task] Failed to update error in DB: {db_error}")
 
+            await publish_book_event(
+                book_id, STATUS_EVENT, status=BookStatus.FAILED, error=f"TTS generation failed: {str(e)}"
+            )
             return TaskResult(status=TaskStatus.FAILED, error=str(e))
 
 
@@ -1207,9 +1217,9 @@ async def generate_video_task(
             prompt = prompts[idx]
 
             async def generate_with_limit(uuid=img_uuid, p=prompt, page_idx=idx):
-                async with limiters.video_generation:
+                async with limiters.limit(settings.ai_video_provider, "video"):
                     logger.info(
-                        f"[Video Task] [Book: {book_id}] Page {page_idx}: Acquiring semaphore for image {uuid[:8]}..."
+                        f"[Video Task] [Book: {book_id}] Page {page_idx}: Acquired rate limit slot for image {uuid[:8]}..."
                     )
                     return await video_provider.generate_video(
                         image_uuid=uuid, prompt=p
@@ -1236,43 +1246,31 @@ async def generate_video_task(
             logger.warning(f"[Video Task] [Book: {book_id}] All video requests failed")
             break
 
-        # === Phase 3: 폴링 루프 (타임아웃 10분) ===
-        max_wait_time = 600
-        poll_interval = 10
-        elapsed_time = 0
-
-        while elapsed_time < max_wait_time and pending_to_task_uuid:
-            for idx in list(pending_to_task_uuid.keys()):
-                task_uuid = pending_to_task_uuid[idx]
-
-                try:
-                    status_response = await video_provider.check_video_status(task_uuid)
-                    status = status_response["status"]
-
-                    if status == "completed":
-                        video_url = status_response["video_url"]
-                        tracker.mark_success(idx, video_url)
-                        del pending_to_task_uuid[idx]
-                        logger.info(
-                            f"[Video Task] [Book: {book_id}] Page {idx} completed"
-                        )
+        # === Phase 3: 폴링 (공유 폴러, 타임아웃 10분) ===
+        max_wait_time = settings.task_video_max_wait_time  # 600 seconds
+        poller = get_task_poller(video_provider, "video")
+        status_responses = await poller.wait_many(
+            list(pending_to_task_uuid.values()), timeout=max_wait_time
+        )
 
-                    elif status == "failed":
-                        error_msg = status_response.get("error", "Unknown error")
-                        tracker.mark_failure(idx, error_msg)
-                        del pending_to_task_uuid[idx]
-                        logger.error(
-                            f"[Video Task] [Book: {book_id}] Page {idx} failed: {error_msg}"
-                        )
+        for idx in list(pending_to_task_uuid.keys()):
+            status_response = status_responses.get(pending_to_task_uuid[idx])
+            if status_response is None:
+                continue  # 타임아웃 → 아래에서 처리
 
-                except Exception as e:
-                    logger.error(
-                        f"[Video Task] [Book: {book_id}] Status check failed for page {idx}: {e}"
-                    )
+            if status_response["status"] == "completed":
+                video_url = status_response["video_url"]
+                tracker.mark_success(idx, video_url)
+                del pending_to_task_uuid[idx]
+                logger.info(f"[Video Task] [Book: {book_id}] Page {idx} completed")
 
-            if pending_to_task_uuid:
-                await asyncio.sleep(poll_interval)
-                elapsed_time += poll_interval
+            else:
+                error_msg = status_response.get("error", "Unknown error")
+                tracker.mark_failure(idx, error_msg)
+                del pending_to_task_uuid[idx]
+                logger.error(
+                    f"[Video Task] [Book: {book_id}] Page {idx} failed: {error_msg}"
+                )
 
         # 타임아웃된 작업 처리
         for idx in pending_to_task_uuid.keys():
@@ -1298,18 +1296,15 @@ async def generate_video_task(
 
     # === Phase 4: 결과 평가 ===
     if tracker.is_all_completed():
-        status = TaskStatus.COMPLETED
         logger.info(
             f"[Video Task] [Book: {book_id}] All {tracker.total_items} videos completed"
         )
     elif tracker.is_partial_failure():
-        status = TaskStatus.FAILED  # 부분 실패는 실패로 처리
         logger.error(
             f"[Video Task] [Book: {book_id}] Partial failure: "
             f"{len(tracker.completed)}/{tracker.total_items} videos"
         )
     else:
-        status = TaskStatus.FAILED
         logger.error(f"[Video Task] [Book: {book_id}] All videos failed")
 
     # === Phase 5: Get Book object for base_path ===
@@ -1320,32 +1315,46 @@ async def generate_video_task(
         if not book:
             raise ValueError(f"Book {book_id} not found")
 
-    # === Phase 6: HTTP Download + S3 Upload (세션 밖에서 실행) ===
+    # === Phase 6: CDN → Storage 스트리밍 전송 (세션 밖에서 병렬 실행) ===
     storage_service = get_storage_service()
-    s3_video_urls = []
+    storage_tracker = BatchRetryTracker(
+        total_items=total_pages,
+        max_retries=settings.storage_transfer_max_retries,
+    )
 
-    for page_idx in range(len(image_uuids)):
-        if page_idx in tracker.completed:
-            # 성공한 비디오: 다운로드 + S3 업로드
-            video_url = tracker.completed[page_idx]
-            video_bytes = await video_provider.download_video(video_url)
-            video_size = len(video_bytes)
+    transfer_items = [
+        TransferItem(
+            idx=page_idx,
+            url=tracker.completed[page_idx],
+            path=f"{book.base_path}/videos/page_{page_idx + 1}.mp4",
+            content_type="video/mp4",
+        )
+        for page_idx in range(len(image_uuids))
+        if page_idx in tracker.completed
+    ]
+    await transfer_all(
+        transfer_items,
+        storage_service,
+        storage_tracker,
+        client_name=getattr(video_provider, "download_client", "cdn"),
+        log_prefix=f"[Video Task] [Book: {book_id}]",
+        on_saved=_page_saved_publisher(book_id, "video"),
+    )
+    await _publish_failed_pages(book_id, "video", total_pages, storage_tracker.completed)
 
-            file_name = f"{book.base_path}/videos/page_{page_idx + 1}.mp4"
-            logger.info(
-                f"[Video Task] [Book: {book_id}] Page {page_idx + 1}: Uploading to {file_name}"
-            )
-            storage_url = await storage_service.save(
-                video_bytes, file_name, content_type="video/mp4"
-            )
-            logger.info(
-                f"[Video Task] [Book: {book_id}] Page {page_idx + 1}: Uploaded to {storage_url} (size: {video_size} bytes)"
-            )
-            s3_video_urls.append(file_name)
+    # 실패한 비디오: None (순서 유지)
+    s3_video_urls = []
+    for page_idx in range(len(image_uuids)):
+        if page_idx in storage_tracker.completed:
+            s3_video_urls.append(storage_tracker.completed[page_idx])
         else:
-            # 실패한 비디오: None 추가 (순서 유지)
+            reason = (
+                storage_tracker.last_errors.get(page_idx, "upload failed")
+                if page_idx in tracker.completed
+                else "generation failed"
+            )
             logger.warning(
-                f"[Video Task] [Book: {book_id}] Page {page_idx + 1}: Video failed, skipping"
+                f"[Video Task] [Book: {book_id}] Page {page_idx + 1}: Video not stored ({reason}), skipping"
             )
             s3_video_urls.append(None)
 
@@ -1388,6 +1397,7 @@ async def generate_video_task(
                 raise ValueError(f"Book {book_id} not found for update")
 
             await session.commit()
+            await publish_book_event(book_id, STAGE_EVENT, stage="video", progress=80)
 
             # 결과 반환
             if tracker.is_all_completed():
@@ -1515,6 +1525,18 @@ async def finalize_book_task(
             logger.info(
                 f"[Finalize Task] [Book: {book_id}] Updated book status to {final_status}"
             )
+            await publish_book_event(book_id, STATUS_EVENT, status=final_status, progress=100)
+            # 재생성 등으로 캐시된 공유 책 응답이 있으면 무효화
+            await get_book_response_cache().invalidate(book_id)
+
+            # 읽기 모드 첫 탭부터 저장된 단어 오디오를 쓰도록 책 전체 단어 사전 생성 등록
+            if final_status == BookStatus.COMPLETED and settings.tts_word_prewarm_on_finalize:
+                try:
+                    await get_word_prewarm_jobs().enqueue(book_id)
+                except Exception as prewarm_error:
+                    logger.warning(
+                        f"[Finalize Task] [Book: {book_id}] Word prewarm enqueue failed: {prewarm_error}"
+                    )
 
         except Exception as e:
             logger.error(
@@ -1538,6 +1560,9 @@ async def finalize_book_task(
                     f"[Finalize Task] Failed to update error in DB: {db_error}"
                 )
 
+            await publish_book_event(
+                book_id, STATUS_EVENT, status=BookStatus.FAILED, error=f"Finalization failed: {str(e)}"
+            )
             return TaskResult(status=TaskStatus.FAILED, error=str(e))
 
     # === Phase 3: Redis Cleanup - 세션 밖에서 실행 (비동기, 에러 무시) ===
@@ -0,0 +1,410 @@
+"""
+Durable DAG Store
+Redis 기반 영속 DAG 저장소 (노드/의존성/상태를 Redis에 보관하여 재시작 후 재개)
+"""
+
+import base64
+import json
+import logging
+import time
+import uuid
+from typing import Any, Callable, Awaitable, Dict, List, Optional
+import redis.asyncio as aioredis
+
+from backend.core.config import settings
+from backend.features.tts.producer import TTSProducer
+
+from .schemas import TaskResult, TaskContext, TaskStatus
+from .runner import TaskRunner, TaskNode
+from .core import (
+    generate_story_task,
+    generate_image_task,
+    generate_tts_task,
+    generate_video_task,
+    finalize_book_task,
+)
+
+logger = logging.getLogger(__name__)
+
+# Ready 노드 큐 (Redis Stream) 및 Consumer Group
+DAG_READY_STREAM = "dag:ready"
+DAG_WORKER_GROUP = "dag_workers"
+
+# 진행 중인 DAG execution_id 집합 (재시작 시 복구 대상)
+DAG_ACTIVE_SET = "dag:active"
+
+# Worker 프로세스에서 실행 가능한 Task 함수 (이름 → 함수)
+# ⚠️ DAG 노드는 함수 객체 대신 이름으로 저장되므로 여기 등록된 함수만 사용 가능
+TASK_REGISTRY: Dict[str, Callable[..., Awaitable[TaskResult]]] = {
+    func.__name__: func
+    for func in (
+        generate_story_task,
+        generate_image_task,
+        generate_tts_task,
+        generate_video_task,
+        finalize_book_task,
+    )
+}
+
+# 프로세스 로컬 객체 참조 이름 (직렬화 불가 → Worker 측 리소스로 주입)
+TTS_PRODUCER_REF = "tts_producer"
+
+
+# ============================================================
+# Argument Encoding
+# ============================================================
+
+
+def encode_task_arg(value: Any) -> Any:
+    """
+    Task 인자를 JSON 직렬화 가능한 형태로 변환
+
+    - bytes → base64
+    - TaskContext → dict
+    - TTSProducer → Worker 리소스 참조 (프로세스마다 새로 주입)
+    - UUID → str
+
+    Args:
+        value: Task 인자
+
+    Returns:
+        Any: JSON 직렬화 가능한 값
+    """
+    if isinstance(value, bytes):
+        return {"__type__": "bytes", "data": base64.b64encode(value).decode("ascii")}
+    if isinstance(value, TaskContext):
+        return {"__type__": "context", "data": value.model_dump()}
+    if isinstance(value, TTSProducer):
+        return {"__type__": "ref", "name": TTS_PRODUCER_REF}
+    if isinstance(value, uuid.UUID):
+        return str(value)
+    if isinstance(value, (list, tuple)):
+        return [encode_task_arg(v) for v in value]
+    if isinstance(value, dict):
+        return {k: encode_task_arg(v) for k, v in value.items()}
+    return value
+
+
+def decode_task_arg(value: Any, resources: Optional[Dict[str, Any]] = None) -> Any:
+    """
+    encode_task_arg의 역변환
+
+    Args:
+        value: 인코딩된 값
+        resources: Worker 리소스 (참조 이름 → 객체)
+
+    Returns:
+        Any: 원래 Task 인자
+
+    Raises:
+        KeyError: Worker에 등록되지 않은 리소스 참조
+    """
+    if isinstance(value, list):
+        return [decode_task_arg(v, resources) for v in value]
+    if isinstance(value, dict):
+        kind = value.get("__type__")
+        if kind == "bytes":
+            return base64.b64decode(value["data"])
+        if kind == "context":
+            return TaskContext(**value["data"])
+        if kind == "ref":
+            return (resources or {})[value["name"]]
+        return {k: decode_task_arg(v, resources) for k, v in value.items()}
+    return value
+
+
+def serialize_node(node: TaskNode) -> str:
+    """TaskNode → JSON (func는 레지스트리 이름으로 저장)"""
+    func_name = node.func.__name__
+    if TASK_REGISTRY.get(func_name) is not node.func:
+        raise ValueError(f"Task function '{func_name}' is not registered in TASK_REGISTRY")
+
+    return json.dumps(
+        {
+            "task_id": node.task_id,
+            "name": node.name,
+            "func": func_name,
+            "args": encode_task_arg(list(node.args)),
+            "kwargs": encode_task_arg(node.kwargs),
+            "depends_on": node.depends_on,
+        },
+        ensure_ascii=False,
+    )
+
+
+def deserialize_node(raw: str, resources: Optional[Dict[str, Any]] = None) -> TaskNode:
+    """JSON → TaskNode (레지스트리에서 func 복원)"""
+    data = json.loads(raw)
+    return TaskNode(
+        task_id=data["task_id"],
+        name=data["name"],
+        func=TASK_REGISTRY[data["func"]],
+        args=tuple(decode_task_arg(data["args"], resources)),
+        kwargs=decode_task_arg(data["kwargs"], resources),
+        depends_on=data["depends_on"],
+    )
+
+
+# ============================================================
+# DAG Store
+# ============================================================
+
+
+class DAGStore:
+    """
+    Redis 기반 DAG 상태 저장소
+
+    Key Patterns:
+    - dag:{execution_id}:meta → Hash (book_id, created_at)
+    - dag:{execution_id}:nodes → Hash (task_id → 노드 JSON)
+    - dag:{execution_id}:state → Hash (task_id → TaskStatus)
+    - dag:{execution_id}:enqueued → Hash (task_id → 1, 중복 enqueue 방지)
+    - dag:{execution_id}:lease:{task_id} → 실행 중인 Worker (TTL)
+    - dag:active → Set (진행 중인 execution_id)
+    - dag:ready → Stream (실행 가능한 노드 큐)
+    """
+
+    def __init__(self, redis_url: str = None):
+        """
+        Args:
+            redis_url: Redis 연결 URL (None일 경우 settings에서 가져옴)
+        """
+        self.redis_url = redis_url or settings.redis_url
+        self.redis: Optional[aioredis.Redis] = None
+
+    async def connect(self):
+        """Redis 연결"""
+        if self.redis:
+            return
+
+        self.redis = aioredis.from_url(
+            self.redis_url,
+            encoding="utf-8",
+            decode_responses=True,
+            max_connections=50,
+        )
+
+    async def close(self):
+        """Redis 연결 종료"""
+        if self.redis:
+            await self.redis.close()
+            self.redis = None
+
+    @staticmethod
+    def _key(execution_id: str, suffix: str) -> str:
+        return f"dag:{execution_id}:{suffix}"
+
+    async def save_dag(
+        self, execution_id: str, book_id: str, nodes: List[TaskNode]
+    ) -> None:
+        """
+        DAG 전체(노드, 의존성, 초기 상태)를 원자적으로 저장
+
+        Args:
+            execution_id: DAG 실행 ID
+            book_id: Book UUID (string)
+            nodes: DAG 노드 리스트
+        """
+        await self.connect()
+
+        async with self.redis.pipeline(transaction=True) as pipe:
+            pipe.hset(
+                self._key(execution_id, "meta"),
+                mapping={"book_id": book_id, "created_at": str(int(time.time()))},
+            )
+            pipe.hset(
+                self._key(execution_id, "nodes"),
+                mapping={node.task_id: serialize_node(node) for node in nodes},
+            )
+            pipe.hset(
+                self._key(execution_id, "state"),
+                mapping={node.task_id: TaskStatus.PENDING.value for node in nodes},
+            )
+            pipe.sadd(DAG_ACTIVE_SET, execution_id)
+            await pipe.execute()
+
+    async def enqueue(self, execution_id: str, task_id: str, force: bool = False) -> bool:
+        """
+        실행 가능한 노드를 Ready Stream에 추가
+
+        Args:
+            execution_id: DAG 실행 ID
+            task_id: Task ID
+            force: True면 중복 방지 마커를 무시 (재시작 복구용)
+
+        Returns:
+            bool: 실제로 enqueue 되었는지 여부
+        """
+        await self.connect()
+
+        if not force:
+            first = await self.redis.hsetnx(
+                self._key(execution_id, "enqueued"), task_id, 1
+            )
+            if not first:
+                return False
+
+        await self.redis.xadd(
+            DAG_READY_STREAM,
+            {"execution_id": execution_id, "task_id": task_id},
+        )
+        return True
+
+    async def get_meta(self, execution_id: str) -> Dict[str, str]:
+        """DAG 메타데이터 조회"""
+        await self.connect()
+        return await self.redis.hgetall(self._key(execution_id, "meta"))
+
+    async def get_node(
+        self, execution_id: str, task_id: str, resources: Optional[Dict[str, Any]] = None
+    ) -> Optional[TaskNode]:
+        """노드 조회 (없으면 None)"""
+        await self.connect()
+        raw = await self.redis.hget(self._key(execution_id, "nodes"), task_id)
+        return deserialize_node(raw, resources) if raw else None
+
+    async def get_dependencies(self, execution_id: str) -> Dict[str, List[str]]:
+        """
+        의존성 그래프 조회 (args는 디코딩하지 않음)
+
+        Returns:
+            Dict[str, List[str]]: task_id → depends_on
+        """
+        await self.connect()
+        raw_nodes = await self.redis.hgetall(self._key(execution_id, "nodes"))
+        return {
+            task_id: json.loads(raw)["depends_on"] for task_id, raw in raw_nodes.items()
+        }
+
+    async def get_states(self, execution_id: str) -> Dict[str, str]:
+        """전체 노드 상태 조회"""
+        await self.connect()
+        return await self.redis.hgetall(self._key(execution_id, "state"))
+
+    async def set_state(self, execution_id: str, task_id: str, status: TaskStatus) -> None:
+        """노드 상태 업데이트"""
+        await self.connect()
+        await self.redis.hset(self._key(execution_id, "state"), task_id, status.value)
+
+    async def acquire_lease(
+        self, execution_id: str, task_id: str, owner: str, ttl: int
+    ) -> bool:
+        """노드 실행권 획득 (다른 Worker가 실행 중이면 False)"""
+        await self.connect()
+        return bool(
+            await self.redis.set(
+                self._key(execution_id, f"lease:{task_id}"), owner, nx=True, ex=ttl
+            )
+        )
+
+    async def refresh_lease(self, execution_id: str, task_id: str, ttl: int) -> None:
+        """실행권 TTL 연장 (Heartbeat)"""
+        await self.connect()
+        await self.redis.expire(self._key(execution_id, f"lease:{task_id}"), ttl)
+
+    async def release_lease(self, execution_id: str, task_id: str) -> None:
+        """실행권 반환"""
+        await self.connect()
+        await self.redis.delete(self._key(execution_id, f"lease:{task_id}"))
+
+    async def has_lease(self, execution_id: str, task_id: str) -> bool:
+        """실행권 보유 Worker 존재 여부"""
+        await self.connect()
+        return await self.redis.exists(self._key(execution_id, f"lease:{task_id}")) > 0
+
+    async def get_active_executions(self) -> List[str]:
+        """진행 중인 DAG 목록"""
+        await self.connect()
+        return list(await self.redis.smembers(DAG_ACTIVE_SET))
+
+    async def complete_dag(self, execution_id: str, retention: int) -> None:
+        """
+        DAG 종료 처리 (active 집합에서 제거 + 상태 키 만료 설정)
+
+        Args:
+            execution_id: DAG 실행 ID
+            retention: 종료 후 상태 보존 시간 (초)
+        """
+        await self.connect()
+
+        async with self.redis.pipeline(transaction=True) as pipe:
+            pipe.srem(DAG_ACTIVE_SET, execution_id)
+            for suffix in ("meta", "nodes", "state", "enqueued"):
+                pipe.expire(self._key(execution_id, suffix), retention)
+            await pipe.execute()
+
+
+# API 프로세스 공유 DAGStore (책마다 Redis 연결 풀을 새로 만들지 않도록)
+_dag_store: Optional[DAGStore] = None
+
+
+def get_dag_store() -> DAGStore:
+    """DAGStore 싱글톤 반환"""
+    global _dag_store
+    if _dag_store is None:
+        _dag_store = DAGStore()
+    return _dag_store
+
+
+async def close_dag_store() -> None:
+    """DAGStore 종료 (lifespan 종료 시 호출)"""
+    global _dag_store
+    if _dag_store is not None:
+        await _dag_store.close()
+        _dag_store = None
+
+
+# ============================================================
+# Durable Runner
+# ============================================================
+
+
+class DurableTaskRunner(TaskRunner):
+    """
+    Redis 영속 DAG Runner
+
+    TaskRunner와 동일하게 submit_task로 DAG를 구성하지만,
+    실행은 API 프로세스가 아닌 DAGWorker 프로세스가 담당합니다.
+
+    Features:
+    - 노드/의존성/상태를 Redis에 저장 (재배포/재시작에도 유실 없음)
+    - 의존성 없는 루트 노드만 Ready Stream에 enqueue
+    - 후속 노드는 Worker가 의존성 완료 시점에 enqueue
+
+    Example:
+        runner = DurableTaskRunner()
+        t1 = await runner.submit_task("story", generate_story_task, args=(...))
+        t2 = await runner.submit_task("image", generate_image_task, depends_on=[t1])
+        await runner.schedule(execution_id, book_id, [t1, t2])
+    """
+
+    def __init__(self, dag_store: Optional[DAGStore] = None):
+        """
+        Args:
+            dag_store: DAG 저장소 (기본값: 프로세스 공유 DAGStore)
+        """
+        super().__init__()
+        self.dag_store = dag_store or get_dag_store()
+
+    async def schedule(
+        self, execution_id: str, book_id: str, task_ids: List[str]
+    ) -> None:
+        """
+        DAG를 Redis에 저장하고 루트 노드를 enqueue
+
+        Args:
+            execution_id: DAG 실행 ID
+            book_id: Book UUID (string)
+            task_ids: DAG에 포함할 Task ID 리스트
+        """
+        nodes = [self.tasks[task_id] for task_id in task_ids]
+        await self.dag_store.save_dag(execution_id, book_id, nodes)
+
+        for node in nodes:
+            if not node.depends_on:
+                await self.dag_store.enqueue(execution_id, node.task_id)
+
+        logger.info(
+            f"[DurableTaskRunner] DAG scheduled: execution_id={execution_id}, "
+            f"book_id={book_id}, nodes={len(nodes)}"
+        )
@@ -22,10 +22,6 @@ from .core import (
 
 logger = logging.getLogger(__name__)
 
-# Global Semaphore for Production Safety
-# 동시 실행 제어 (리소스 폭주 방지)
-GLOBAL_TASK_LIMIT = asyncio.Semaphore(10)  # 동시 AI 호출 10개 제한
-
 
 @dataclass
 class TaskNode:
@@ -166,10 +162,10 @@ class TaskRunner:
             # 1. Wait for dependencies
             dependency_results = await self._wait_for_dependencies(task_id)
 
-            # 2. Execute task function with semaphore (prevent resource explosion)
+            # 2. Execute task function
             # Option B: 의존성은 실행 순서만 보장, 데이터는 Redis 공유
-            async with GLOBAL_TASK_LIMIT:
-                result = await task.func(*task.args, **task.kwargs)
+            # (외부 AI 호출량은 Task 내부에서 core.limiters로 제어)
+            result = await task.func(*task.args, **task.kwargs)
 
             # 3. Store result in Redis
             await self.task_store.set_task_result(task_id, result, ttl=3600)
@@ -285,14 +281,14 @@ async def create_storybook_dag(
     user_id: uuid.UUID,
     book_id: uuid.UUID,
     stories: List[str],
-    images: List[bytes],
+    image_keys: List[str],
     tts_producer: TTSProducer,
     voice_id: str,
     level: int,
     target_language: str = "en",
 ) -> Dict[str, Any]:
     """
-    동화책 생성 DAG 생성 및 실행
+    동화책 생성 DAG 생성 및 스케줄링 (Redis 영속 DAG, DAGWorker가 실행)
 
     DAG 구조:
         [Story]
@@ -326,7 +322,9 @@ async def create_storybook_dag(
                 "finalize_task": str,
             }
     """
-    runner = TaskRunner()
+    from .durable import DurableTaskRunner
+
+    runner = DurableTaskRunner()
 
     # Task Context
     execution_id = str(uuid.uuid4())
@@ -355,7 +353,7 @@ async def create_storybook_dag(
     t_image = await runner.submit_task(
         name="generate_image_batch",
         func=generate_image_task,
-        args=(str(book_id), images, context),
+        args=(str(book_id), image_keys, context),  # 원본 이미지는 스토리지 키로만 전달
         depends_on=[t_story],  # 실행 순서만 보장, dialogues는 Redis 조회
     )
 
@@ -383,39 +381,11 @@ async def create_storybook_dag(
         depends_on=[t_story, t_image, t_tts, t_video],
     )
 
-    # DAG 실행 (백그라운드)
+    # DAG 저장 (Redis) + 루트 노드 enqueue
+    # 실제 실행은 DAGWorker 프로세스가 담당 (API 재시작/배포에도 유실 없음)
     all_task_ids = [t_story, t_image, t_tts, t_video, t_finalize]
+    await runner.schedule(execution_id, str(book_id), all_task_ids)
 
-    # 백그라운드 실행 + 실패 시 상태 업데이트
-    async def _run_dag():
-        from backend.core.database.session import AsyncSessionLocal
-        from backend.features.storybook.repository import BookRepository
-        from backend.features.storybook.models import BookStatus
-
-        results = await runner.execute_dag(all_task_ids)
-
-        # 실패한 task가 있으면 Book 상태 업데이트
-        failed = [
-            runner.tasks[tid].name
-            for tid, r in results.items()
-            if r.status == TaskStatus.FAILED
-        ]
-        if failed:
-            logger.error(f"[TaskRunner] Failed tasks: {failed}")
-            async with AsyncSessionLocal() as session:
-                repo = BookRepository(session)
-                book = await repo.get(book_id)
-                if book and book.status == BookStatus.CREATING:
-                    await repo.update(
-                        book_id,
-                        status=BookStatus.FAILED,
-                        pipeline_stage="failed",
-                        error_message=f"Tasks failed: {', '.join(failed)}",
-                    )
-                    await session.commit()
-                    logger.error(f"[TaskRunner] Failed tasks: {failed}")
-
-    asyncio.create_task(_run_dag(), name=f"storybook_dag_{book_id}")
     return {
         "execution_id": execution_id,
         "story_task": t_story,
@@ -0,0 +1,184 @@
+"""
+CDN → Storage Transfer
+생성된 이미지/비디오를 Provider CDN에서 스토리지로 스트리밍 전송 (동시성 제한 + 프로세스 바이트 예산 + 항목별 재시도)
+"""
+
+import asyncio
+import logging
+import weakref
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from typing import AsyncIterator, Awaitable, Callable, List, Optional
+
+from backend.core.config import settings
+from backend.infrastructure.ai.factory import AIProviderFactory
+from backend.infrastructure.storage.base import AbstractStorageService
+from .retry import BatchRetryTracker, calculate_retry_delay
+
+logger = logging.getLogger(__name__)
+
+
+class ByteBudget:
+    """
+    진행 중인 전송의 총 바이트 수 제한
+
+    전송 시작 전에 예상 크기만큼 예약하고, 예산이 부족하면 다른 전송이 끝날 때까지 대기합니다.
+    예산보다 큰 항목은 예산 전체를 예약합니다 (단독 실행).
+
+    Args:
+        capacity: 전체 예산 (bytes)
+    """
+
+    def __init__(self, capacity: int):
+        self.capacity = capacity
+        self.available = capacity
+        self._condition = asyncio.Condition()
+
+    @asynccontextmanager
+    async def reserve(self, nbytes: int) -> AsyncIterator[int]:
+        """
+        예산 예약 컨텍스트
+
+        Args:
+            nbytes: 예약할 바이트 수
+
+        Yields:
+            int: 실제 예약된 바이트 수
+        """
+        amount = max(1, min(nbytes, self.capacity))
+
+        async with self._condition:
+            await self._condition.wait_for(lambda: self.available >= amount)
+            self.available -= amount
+
+        try:
+            yield amount
+        finally:
+            async with self._condition:
+                self.available += amount
+                self._condition.notify_all()
+
+    @property
+    def in_use(self) -> int:
+        return self.capacity - self.available
+
+
+# 이벤트 루프별 예산 (asyncio.Condition은 생성된 루프에 묶임)
+_budgets: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, ByteBudget]" = weakref.WeakKeyDictionary()
+
+
+def get_transfer_budget() -> ByteBudget:
+    """현재 이벤트 루프의 전송 바이트 예산 (프로세스 단위 설정값)"""
+    loop = asyncio.get_running_loop()
+    budget = _budgets.get(loop)
+    if budget is None:
+        budget = ByteBudget(settings.storage_transfer_budget_bytes)
+        _budgets[loop] = budget
+    return budget
+
+
+@dataclass
+class TransferItem:
+    """전송 항목"""
+
+    idx: int
+    url: str
+    path: str
+    content_type: str
+
+
+async def transfer_to_storage(
+    item: TransferItem,
+    storage_service: AbstractStorageService,
+    budget: Optional[ByteBudget] = None,
+    client_name: str = "cdn",
+) -> int:
+    """
+    CDN 응답 본문을 메모리에 모으지 않고 스토리지로 스트리밍 저장
+
+    Args:
+        item: 전송 항목
+        storage_service: 스토리지 서비스
+        budget: 바이트 예산 (기본값: 프로세스 예산)
+        client_name: 공유 HTTP 클라이언트 이름 (Provider별 연결 풀)
+
+    Returns:
+        int: 전송한 바이트 수
+    """
+    budget = budget or get_transfer_budget()
+    transferred = 0
+
+    async with AIProviderFactory.http_clients.client(client_name) as client:
+        async with client.stream("GET", item.url) as response:
+            response.raise_for_status()
+            expected = int(response.headers.get("Content-Length") or 0)
+            # 압축 응답은 디코딩 후 크기가 달라지므로 길이 검증 제외
+            verify_length = expected > 0 and not response.headers.get("Content-Encoding")
+
+            async with budget.reserve(expected or settings.storage_transfer_default_reservation):
+
+                async def chunks() -> AsyncIterator[bytes]:
+                    nonlocal transferred
+                    async for chunk in response.aiter_bytes(settings.storage_stream_chunk_size):
+                        transferred += len(chunk)
+                        yield chunk
+
+                await storage_service.save_stream(chunks(), item.path, content_type=item.content_type)
+
+    if verify_length and transferred != expected:
+        raise IOError(f"Incomplete transfer: {transferred}/{expected} bytes from {item.url}")
+
+    return transferred
+
+
+async def transfer_all(
+    items: List[TransferItem],
+    storage_service: AbstractStorageService,
+    tracker: BatchRetryTracker,
+    concurrency: Optional[int] = None,
+    client_name: str = "cdn",
+    log_prefix: str = "[Transfer]",
+    on_saved: Optional[Callable[[int, str], Awaitable[None]]] = None,
+) -> None:
+    """
+    여러 항목을 동시에 전송 (항목별 재시도, 결과는 tracker에 기록)
+
+    - 동시 전송 수: concurrency (기본값: settings.storage_transfer_concurrency)
+    - 메모리: 프로세스 바이트 예산 + 스토리지 스트리밍 업로드로 제한
+    - 실패한 항목은 다른 항목을 기다리지 않고 tracker.max_retries까지 개별 재시도
+
+    Args:
+        items: 전송 항목 목록
+        storage_service: 스토리지 서비스
+        tracker: 재시도 추적기 (성공 시 저장 경로 기록)
+        concurrency: 동시 전송 수
+        client_name: 공유 HTTP 클라이언트 이름
+        log_prefix: 로그 접두사
+        on_saved: 항목 저장 완료 시 호출 (idx, path) - 페이지별 진행 이벤트 발행용
+    """
+    semaphore = asyncio.Semaphore(max(1, concurrency or settings.storage_transfer_concurrency))
+    budget = get_transfer_budget()
+
+    async def run(item: TransferItem) -> None:
+        attempt = 0
+        while item.idx not in tracker.completed and tracker.retry_counts[item.idx] < tracker.max_retries:
+            attempt += 1
+            try:
+                async with semaphore:
+                    size = await transfer_to_storage(item, storage_service, budget, client_name)
+            except Exception as e:
+                tracker.mark_failure(item.idx, str(e))
+                logger.warning(
+                    f"{log_prefix} Page {item.idx + 1}: transfer failed "
+                    f"(attempt {tracker.retry_counts[item.idx]}/{tracker.max_retries}): {e}"
+                )
+                if tracker.retry_counts[item.idx] < tracker.max_retries:
+                    await asyncio.sleep(await calculate_retry_delay(attempt))
+                continue
+
+            tracker.mark_success(item.idx, item.path)
+            logger.info(f"{log_prefix} Page {item.idx + 1}: Saved to {item.path} ({size} bytes)")
+            if on_saved is not None:
+                await on_saved(item.idx, item.path)
+
+    await asyncio.gather(*(run(item) for item in items))
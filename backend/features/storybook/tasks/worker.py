@@ -0,0 +1,455 @@
+"""
+DAG Worker
+Redis Streams에서 실행 가능한 DAG 노드를 가져와 실행하는 워커 프로세스
+"""
+
+import asyncio
+import uuid
+from typing import Any, Dict, List, Optional, Set
+import redis.asyncio as aioredis
+
+from backend.core.config import settings
+from backend.core.logging import configure_logging, get_logger
+
+from backend.features.storybook.progress import STATUS_EVENT, publish_book_event
+
+from .schemas import TaskResult, TaskStatus
+from .store import TaskStore
+from .durable import DAGStore, DAG_READY_STREAM, DAG_WORKER_GROUP, TTS_PRODUCER_REF
+
+logger = get_logger(__name__)
+
+# 종료 상태 (더 이상 실행되지 않는 노드)
+_TERMINAL_STATES = {TaskStatus.COMPLETED.value, TaskStatus.FAILED.value}
+
+
+class NodeLeaseHeld(Exception):
+    """다른 Worker가 Lease를 보유한 채 실행 중인 노드 (메시지를 ACK하지 않고 남겨둠)"""
+
+
+class DAGWorker:
+    """
+    Storybook DAG Worker (Consumer)
+
+    - dag:ready Stream에서 노드를 가져와 실행 (Consumer Group: dag_workers)
+    - 노드 완료 시 의존성이 모두 충족된 후속 노드를 enqueue
+    - Lease + Heartbeat로 중복 실행 방지
+    - 죽은 Worker가 남긴 메시지는 XAUTOCLAIM으로 회수하여 재실행
+    - 시작 시 진행 중이던 DAG를 마지막 완료 노드부터 재개
+
+    여러 프로세스로 수평 확장 가능 (API 프로세스와 독립 실행)
+    """
+
+    def __init__(
+        self,
+        resources: Optional[Dict[str, Any]] = None,
+        concurrency: Optional[int] = None,
+        dag_store: Optional[DAGStore] = None,
+        task_store: Optional[TaskStore] = None,
+    ):
+        """
+        Args:
+            resources: Task 인자로 주입할 프로세스 로컬 객체 (예: {"tts_producer": producer})
+            concurrency: 동시 실행 노드 수 (기본값: settings.dag_worker_concurrency)
+            dag_store: DAG 저장소 (테스트용 주입)
+            task_store: Task 결과 저장소 (테스트용 주입)
+        """
+        self.redis_url = settings.redis_url
+        self.consumer_name = f"dag-worker-{str(uuid.uuid4())[:8]}"
+        self.resources = resources or {}
+        self.dag_store = dag_store or DAGStore()
+        self.task_store = task_store or TaskStore()
+
+        self.lease_seconds = settings.dag_lease_seconds
+        self.semaphore = asyncio.Semaphore(concurrency or settings.dag_worker_concurrency)
+        self.active_tasks: Set[asyncio.Task] = set()
+        self.running = False
+        self.redis: Optional[aioredis.Redis] = None
+
+    async def start(self):
+        """워커 시작"""
+        logger.info(f"Starting DAG Worker: {self.consumer_name} (Redis: {self.redis_url})")
+
+        self.redis = aioredis.from_url(self.redis_url, decode_responses=True)
+
+        try:
+            await self.redis.xgroup_create(
+                DAG_READY_STREAM, DAG_WORKER_GROUP, id="0", mkstream=True
+            )
+            logger.info(f"Consumer group created: {DAG_WORKER_GROUP}")
+        except aioredis.ResponseError as e:
+            if "BUSYGROUP" not in str(e):
+                raise
+
+        self.running = True
+
+        # 재시작 복구: 진행 중이던 DAG의 ready 노드 재등록
+        try:
+            await self.recover()
+        except Exception as e:
+            logger.error(f"DAG recovery failed: {e}", exc_info=True)
+
+        reclaim_task = asyncio.create_task(self._reclaim_loop())
+
+        try:
+            while self.running:
+                await self.semaphore.acquire()
+
+                try:
+                    messages = await self.redis.xreadgroup(
+                        DAG_WORKER_GROUP,
+                        self.consumer_name,
+                        {DAG_READY_STREAM: ">"},
+                        count=1,
+                        block=1000,
+                    )
+
+                    if not messages:
+                        self.semaphore.release()
+                        continue
+
+                    for _stream, msgs in messages:
+                        for msg_id, data in msgs:
+                            self._spawn(msg_id, data)
+
+                except Exception as e:
+                    logger.error(f"Error in DAG worker loop: {e}", exc_info=True)
+                    self.semaphore.release()
+                    await asyncio.sleep(1)
+
+        except asyncio.CancelledError:
+            logger.info("DAG Worker cancelled")
+        finally:
+            reclaim_task.cancel()
+            await asyncio.gather(reclaim_task, return_exceptions=True)
+            await self.shutdown()
+
+    def _spawn(self, msg_id: str, data: Dict[str, str]) -> None:
+        """메시지 처리 태스크 생성 (세마포어 슬롯은 이미 확보된 상태)"""
+        task = asyncio.create_task(self.process_message_wrapper(msg_id, data))
+        self.active_tasks.add(task)
+        task.add_done_callback(self.active_tasks.discard)
+
+    async def _reclaim_loop(self):
+        """
+        죽은 Worker의 미처리 메시지 회수 (XAUTOCLAIM)
+
+        Lease TTL의 2배 이상 ACK되지 않은 메시지를 가져와 재실행합니다.
+        아직 Lease가 살아 있는 노드(실행 중)는 ACK하지 않고 남겨두므로,
+        Lease 보유 Worker가 이후 죽더라도 다음 회수 주기에 다시 실행됩니다.
+        """
+        min_idle_ms = self.lease_seconds * 2 * 1000
+
+        while self.running:
+            await asyncio.sleep(self.lease_seconds)
+            try:
+                result = await self.redis.xautoclaim(
+                    DAG_READY_STREAM,
+                    DAG_WORKER_GROUP,
+                    self.consumer_name,
+                    min_idle_time=min_idle_ms,
+                    count=10,
+                )
+                claimed = result[1] if result else []
+                for msg_id, data in claimed:
+                    if not data:
+                        continue
+                    logger.warning(f"Reclaimed stale DAG message: {msg_id}", extra={"data": data})
+                    await self.semaphore.acquire()
+                    self._spawn(msg_id, data)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Failed to reclaim DAG messages: {e}", exc_info=True)
+
+    async def process_message_wrapper(self, msg_id: str, data: Dict[str, str]):
+        """메시지 처리 래퍼 (세마포어 반환 보장)"""
+        try:
+            await self.process_message(msg_id, data)
+        finally:
+            self.semaphore.release()
+
+    async def process_message(self, msg_id: str, data: Dict[str, str]):
+        """
+        메시지 처리 후 ACK
+
+        실패 시 / 다른 Worker가 실행 중(Lease 보유)일 때는 ACK 하지 않음 → XAUTOCLAIM 대상으로 남김
+        (Lease 보유 Worker가 정상 완료하면 자신의 ACK로 같은 메시지가 PEL에서 제거됨)
+        """
+        execution_id = data.get("execution_id")
+        task_id = data.get("task_id")
+
+        if not execution_id or not task_id:
+            logger.error(f"Invalid DAG message (missing execution_id/task_id): {data}")
+            await self.redis.xack(DAG_READY_STREAM, DAG_WORKER_GROUP, msg_id)
+            return
+
+        try:
+            await self.run_node(execution_id, task_id)
+            await self.redis.xack(DAG_READY_STREAM, DAG_WORKER_GROUP, msg_id)
+        except NodeLeaseHeld:
+            logger.info(f"[DAGWorker] Node still leased, leaving message pending: {msg_id}")
+        except asyncio.CancelledError:
+            # 종료 중: ACK 하지 않음 → 다른 Worker가 회수
+            raise
+        except Exception as e:
+            logger.error(f"Failed to process DAG message {msg_id}: {e}", exc_info=True)
+
+    async def run_node(self, execution_id: str, task_id: str) -> Optional[TaskResult]:
+        """
+        단일 DAG 노드 실행
+
+        Args:
+            execution_id: DAG 실행 ID
+            task_id: Task ID
+
+        Returns:
+            Optional[TaskResult]: 실행 결과 (실행하지 않은 경우 None)
+
+        Raises:
+            NodeLeaseHeld: 다른 Worker가 Lease를 보유한 채 실행 중인 경우
+        """
+        states = await self.dag_store.get_states(execution_id)
+        state = states.get(task_id)
+
+        if state is None:
+            logger.warning(f"[DAGWorker] Unknown node: execution={execution_id}, task={task_id}")
+            return None
+
+        if state == TaskStatus.COMPLETED.value:
+            # 완료 직후 크래시한 경우 후속 노드 enqueue가 누락되었을 수 있음 (멱등)
+            await self._advance(execution_id, task_id)
+            return None
+
+        if state == TaskStatus.FAILED.value:
+            return None
+
+        if not await self.dag_store.acquire_lease(
+            execution_id, task_id, self.consumer_name, self.lease_seconds
+        ):
+            raise NodeLeaseHeld(f"{execution_id}:{task_id}")
+
+        # 중복 메시지 (recover 재등록 / XAUTOCLAIM 재전달): 조회 이후 다른 Worker가 완료하고
+        # Lease를 해제했을 수 있으므로 Lease 획득 후 상태를 다시 확인
+        state = (await self.dag_store.get_states(execution_id)).get(task_id)
+        if state in (TaskStatus.COMPLETED.value, TaskStatus.FAILED.value):
+            await self.dag_store.release_lease(execution_id, task_id)
+            return None
+
+        heartbeat = asyncio.create_task(self._heartbeat(execution_id, task_id))
+        try:
+            node = await self.dag_store.get_node(execution_id, task_id, self.resources)
+            await self.dag_store.set_state(execution_id, task_id, TaskStatus.IN_PROGRESS)
+
+            try:
+                result = await node.func(*node.args, **node.kwargs)
+            except asyncio.CancelledError:
+                # 종료 중: 다음 Worker가 처음부터 재실행 (images_cache/videos_cache로 부분 복구)
+                await self.dag_store.set_state(execution_id, task_id, TaskStatus.PENDING)
+                raise
+            except Exception as e:
+                logger.error(
+                    f"[DAGWorker] Task exception: {node.name} (id={task_id[:8]}...), error={e}",
+                    exc_info=True,
+                )
+                result = TaskResult(status=TaskStatus.FAILED, error=str(e))
+
+            await self.task_store.set_task_result(task_id, result, ttl=3600)
+
+            if result.status == TaskStatus.COMPLETED:
+                await self.dag_store.set_state(execution_id, task_id, TaskStatus.COMPLETED)
+                logger.info(f"[DAGWorker] Task completed: {node.name} (id={task_id[:8]}...)")
+                await self._advance(execution_id, task_id)
+            else:
+                await self.dag_store.set_state(execution_id, task_id, TaskStatus.FAILED)
+                logger.error(
+                    f"[DAGWorker] Task failed: {node.name} (id={task_id[:8]}...), error={result.error}"
+                )
+                await self._fail_downstream(execution_id, task_id, node.name, result.error)
+
+            return result
+
+        finally:
+            heartbeat.cancel()
+            await asyncio.gather(heartbeat, return_exceptions=True)
+            await self.dag_store.release_lease(execution_id, task_id)
+
+    async def _heartbeat(self, execution_id: str, task_id: str):
+        """실행 중 Lease TTL 연장"""
+        interval = max(1, self.lease_seconds // 3)
+        while True:
+            await asyncio.sleep(interval)
+            await self.dag_store.refresh_lease(execution_id, task_id, self.lease_seconds)
+
+    async def _advance(self, execution_id: str, task_id: str):
+        """완료된 노드의 후속 노드 중 의존성이 모두 충족된 노드를 enqueue"""
+        dependencies = await self.dag_store.get_dependencies(execution_id)
+        states = await self.dag_store.get_states(execution_id)
+
+        for candidate, depends_on in dependencies.items():
+            if task_id not in depends_on:
+                continue
+            if states.get(candidate) != TaskStatus.PENDING.value:
+                continue
+            if all(states.get(dep) == TaskStatus.COMPLETED.value for dep in depends_on):
+                await self.dag_store.enqueue(execution_id, candidate)
+
+        await self._maybe_finish(execution_id, states)
+
+    async def _fail_downstream(
+        self, execution_id: str, task_id: str, task_name: str, error: Optional[str]
+    ):
+        """실패한 노드에 (간접적으로) 의존하는 모든 노드를 실패 처리"""
+        dependencies = await self.dag_store.get_dependencies(execution_id)
+
+        failed = {task_id}
+        changed = True
+        while changed:
+            changed = False
+            for candidate, depends_on in dependencies.items():
+                if candidate not in failed and failed.intersection(depends_on):
+                    failed.add(candidate)
+                    changed = True
+
+        for candidate in failed - {task_id}:
+            await self.dag_store.set_state(execution_id, candidate, TaskStatus.FAILED)
+            await self.task_store.set_task_result(
+                candidate,
+                TaskResult(
+                    status=TaskStatus.FAILED,
+                    error=f"Dependency task '{task_name}' failed: {error}",
+                ),
+                ttl=3600,
+            )
+
+        await self._maybe_finish(execution_id)
+
+    async def _maybe_finish(self, execution_id: str, states: Optional[Dict[str, str]] = None):
+        """모든 노드가 종료 상태면 DAG 종료 처리 (실패 노드가 있으면 Book 실패 처리)"""
+        states = states if states is not None else await self.dag_store.get_states(execution_id)
+        if not states or not all(s in _TERMINAL_STATES for s in states.values()):
+            return
+
+        failed = [tid for tid, s in states.items() if s == TaskStatus.FAILED.value]
+        if failed:
+            meta = await self.dag_store.get_meta(execution_id)
+            await self._mark_book_failed(execution_id, meta.get("book_id"), failed)
+
+        await self.dag_store.complete_dag(execution_id, settings.dag_retention_seconds)
+        logger.info(
+            f"[DAGWorker] DAG finished: execution_id={execution_id}, failed_nodes={len(failed)}"
+        )
+
+    async def _mark_book_failed(
+        self, execution_id: str, book_id: Optional[str], failed_task_ids: List[str]
+    ):
+        """실패한 Task가 있으면 Book 상태 업데이트 (생성 중인 경우에만)"""
+        from backend.core.database.session import AsyncSessionLocal
+        from backend.features.storybook.repository import BookRepository
+        from backend.features.storybook.models import BookStatus
+
+        if not book_id:
+            return
+
+        names = []
+        for tid in failed_task_ids:
+            node = await self.dag_store.get_node(execution_id, tid, self.resources)
+            names.append(node.name if node else tid)
+
+        logger.error(f"[DAGWorker] Failed tasks: {names}")
+        async with AsyncSessionLocal() as session:
+            repo = BookRepository(session)
+            book = await repo.get(uuid.UUID(book_id))
+            if book and book.status == BookStatus.CREATING:
+                await repo.update(
+                    uuid.UUID(book_id),
+                    status=BookStatus.FAILED,
+                    pipeline_stage="failed",
+                    error_message=f"Tasks failed: {', '.join(names)}",
+                )
+                await session.commit()
+                await publish_book_event(
+                    book_id, STATUS_EVENT, status=BookStatus.FAILED, error=f"Tasks failed: {', '.join(names)}"
+                )
+
+    async def recover(self) -> int:
+        """
+        재시작 복구: 진행 중인 DAG에서 실행 가능한 노드를 다시 enqueue
+
+        - 완료된 노드는 건너뜀 (마지막 완료 노드부터 재개)
+        - Lease가 없는 IN_PROGRESS 노드는 Worker가 죽은 것으로 보고 PENDING으로 되돌림
+
+        Returns:
+            int: 재등록된 노드 수
+        """
+        requeued = 0
+
+        for execution_id in await self.dag_store.get_active_executions():
+            dependencies = await self.dag_store.get_dependencies(execution_id)
+            states = await self.dag_store.get_states(execution_id)
+
+            if not states:
+                continue
+
+            for task_id, depends_on in dependencies.items():
+                state = states.get(task_id)
+                if state in _TERMINAL_STATES:
+                    continue
+                if not all(states.get(dep) == TaskStatus.COMPLETED.value for dep in depends_on):
+                    continue
+                if await self.dag_store.has_lease(execution_id, task_id):
+                    continue
+
+                if state == TaskStatus.IN_PROGRESS.value:
+                    await self.dag_store.set_state(execution_id, task_id, TaskStatus.PENDING)
+
+                await self.dag_store.enqueue(execution_id, task_id, force=True)
+                requeued += 1
+
+            await self._maybe_finish(execution_id, states)
+
+        if requeued:
+            logger.info(f"[DAGWorker] Recovered {requeued} ready nodes")
+        return requeued
+
+    async def shutdown(self):
+        """종료 처리"""
+        logger.info("Shutting down DAG worker...")
+        self.running = False
+
+        if self.active_tasks:
+            for task in self.active_tasks:
+                task.cancel()
+            await asyncio.gather(*self.active_tasks, return_exceptions=True)
+
+        if self.redis:
+            await self.redis.close()
+            self.redis = None
+        await self.dag_store.close()
+        await self.task_store.close()
+
+
+async def _run_standalone():
+    """독립 프로세스 실행 (TTS Producer 등 Worker 리소스 구성)"""
+    from backend.core.events.redis_streams_bus import RedisStreamsEventBus
+    from backend.features.storybook.cache import get_book_response_cache
+    from backend.features.tts.producer import TTSProducer
+    from backend.features.tts.word_prewarm import get_word_prewarm_jobs
+
+    event_bus = RedisStreamsEventBus(redis_url=settings.redis_url)
+    # 완료된 책의 응답 캐시 무효화 / 단어 사전 생성 이벤트 발행용 (구독은 API 프로세스)
+    get_book_response_cache().event_bus = event_bus
+    get_word_prewarm_jobs().event_bus = event_bus
+    worker = DAGWorker(resources={TTS_PRODUCER_REF: TTSProducer(event_bus=event_bus)})
+    try:
+        await worker.start()
+    finally:
+        await event_bus.stop()
+
+
+if __name__ == "__main__":
+    configure_logging()
+    try:
+        asyncio.run(_run_standalone())
+    except KeyboardInterrupt:
+        logger.info("KeyboardInterrupt received")
@@ -93,7 +93,7 @@ class WordInvalidException(ValidationException):
 
     def __init__(self, word: str, reason: str):
         super().__init__(
-            error_code=ErrorCode.VALIDATION_FAILED,
+            error_code=ErrorCode.VAL_INVALID_INPUT,
             message=f"유효하지 않은 단어입니다: {reason}",
             details={"word": word, "reason": reason},
         )
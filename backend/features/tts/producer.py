@@ -1,6 +1,6 @@
 import uuid
 import logging
-from typing import Dict, Any
+from typing import Dict, Any, List, Tuple
 
 from backend.core.events.bus import EventBus
 from backend.core.events.types import EventType
@@ -35,3 +35,22 @@ class TTSProducer:
         except Exception as e:
             logger.error(f"Failed to enqueue TTS task: {e}")
             raise
+
+    async def enqueue_many(self, tasks: List[Tuple[uuid.UUID, str]]) -> None:
+        """
+        TTS 생성 작업 일괄 큐 등록 (단일 Redis round-trip)
+
+        Args:
+            tasks: (dialogue_audio_id, text) 목록
+        """
+        payloads = [
+            {"uuid": str(dialogue_audio_id), "text": text}
+            for dialogue_audio_id, text in tasks
+        ]
+
+        try:
+            await self.event_bus.publish_many(EventType.TTS_CREATION, payloads)
+            logger.info(f"TTS Tasks Enqueued: {len(payloads)}")
+        except Exception as e:
+            logger.error(f"Failed to enqueue TTS tasks: {e}")
+            raise
@@ -132,3 +132,15 @@ class WordTTSResponse(BaseModel):
                 "voice_id": "SDF3xZmtvClcRUCSmgGW"
             }
         }
+
+
+class WordPrewarmProgressResponse(BaseModel):
+    """책 단어 오디오 사전 생성 진행 상황 응답 스키마"""
+    book_id: UUID = Field(..., description="Book ID")
+    status: str = Field(..., description="queued | running | completed | failed", example="running")
+    requested: int = Field(0, description="책에서 추출한 단어 수", example=120)
+    existing: int = Field(0, description="이미 저장되어 있던 단어 수", example=95)
+    generated: int = Field(0, description="새로 생성한 단어 수", example=20)
+    failed: int = Field(0, description="생성 실패 단어 수", example=0)
+    error: Optional[str] = Field(None, description="작업 실패 사유")
+    updated_at: Optional[datetime] = Field(None, description="마지막 갱신 시각")
@@ -2,10 +2,8 @@ import uuid
 import logging
 import time
 import asyncio
-from typing import List, Dict, Any, Optional
+from typing import Awaitable, Callable, List, Dict, Any, Optional, Tuple
 from sqlalchemy.ext.asyncio import AsyncSession
-from pathlib import Path
-from contextlib import asynccontextmanager
 
 from .models import Audio, Voice, VoiceVisibility, VoiceStatus
 from .repository import AudioRepository, VoiceRepository
@@ -16,6 +14,19 @@ from backend.core.cache.service import cache_result, invalidate_cache
 from backend.core.events.bus import EventBus
 from backend.core.events.types import EventType
 from backend.core.tasks.voice_queue import VoiceSyncQueue
+from backend.core.config import settings
+from backend.core.limiters import Priority, get_limiters
+from .word_store import (
+    COMMON_VOCABULARY,
+    WordAudioEntry,
+    WordAudioIndex,
+    WordAudioKey,
+    build_word_audio_key,
+    extract_words,
+    get_word_audio_index,
+    normalize_word,
+)
+from .single_flight import WordAudioSingleFlight, get_word_audio_single_flight
 from .exceptions import (
     TTSGenerationFailedException,
     TTSUploadFailedException,
@@ -48,6 +59,8 @@ class TTSService:
         db_session: AsyncSession,
         cache_service,  # CacheService (순환 참조 방지)
         event_bus: EventBus,  # EventBus
+        word_index: Optional[WordAudioIndex] = None,
+        single_flight: Optional[WordAudioSingleFlight] = None,
     ):
         self.audio_repo = audio_repo
         self.voice_repo = voice_repo
@@ -57,142 +70,381 @@ class TTSService:
         self.cache_service = cache_service  # 데코레이터에서 사용
         self.event_bus = event_bus
         self.voice_queue = VoiceSyncQueue()  # Redis 작업 큐
+        self.word_index = word_index or get_word_audio_index()  # 공유 단어 오디오 인덱스
+        self.single_flight = single_flight or get_word_audio_single_flight()  # 단어 생성 요청 병합
 
-    @asynccontextmanager
-    async def redis_lock(self, lock_key: str, timeout: int = 30):
+    def _build_word_key(self, tts_provider, word: str, voice_id: Optional[str]) -> WordAudioKey:
         """
-        Redis 분산 락 컨텍스트 매니저
+        단어 오디오 콘텐츠 주소 키 생성 (Provider가 실제 적용할 모델 / 발음 사전 기준)
 
         Args:
-            lock_key: 락 키
-            timeout: 타임아웃 (초)
+            tts_provider: TTS Provider
+            word: 단어
+            voice_id: 음성 ID (None이면 기본 음성)
 
-        Yields:
-            bool: 락 획득 성공 여부
+        Returns:
+            WordAudioKey: 전역 저장소 키
         """
-        lock_acquired = False
-        lock_value = str(uuid.uuid4())
+        normalized = normalize_word(word)
+        profile = tts_provider.get_synthesis_profile(normalized)
+        return build_word_audio_key(
+            normalized,
+            voice_id=voice_id or settings.tts_default_voice_id,
+            model_id=profile["model_id"],
+            pronunciation_version=profile["pronunciation_version"],
+        )
 
+    def _get_word_tts_provider(self):
+        """단어 TTS용 Provider (초기화 실패는 TTSGenerationFailedException으로 변환)"""
         try:
-            # 락 획득 시도 (최대 30초 대기, 0.1초 간격으로 재시도)
-            max_wait = timeout
-            wait_interval = 0.1
-            elapsed = 0
-
-            while elapsed < max_wait:
-                # SET NX (Not eXists) - 키가 없을 때만 설정
-                lock_acquired = await self.cache_service.set(
-                    lock_key,
-                    lock_value,
-                    ttl=timeout,
-                    nx=True  # Only set if not exists
-                )
+            return self.ai_factory.get_tts_provider()
+        except TTSAPIKeyNotConfiguredException:
+            raise
+        except Exception as e:
+            raise TTSGenerationFailedException(
+                reason=f"TTS Provider 초기화 실패: {str(e)}"
+            )
+
+    async def _ensure_word_audio(
+        self,
+        tts_provider,
+        key: WordAudioKey,
+        book_id: Optional[uuid.UUID] = None,
+        priority: Priority = Priority.INTERACTIVE,
+    ) -> Optional[bytes]:
+        """
+        전역 저장소에 단어 오디오가 없으면 생성 (book_id가 있으면 Book별 인덱스에 연결)
 
-                if lock_acquired:
-                    logger.info(f"Redis lock acquired: {lock_key}")
-                    break
+        생성은 content hash 단위 Single-Flight로 병합되므로, 여러 책에서 같은 단어/음성을
+        동시에 요청해도 TTS는 한 번만 호출됩니다. 같은 프로세스의 대기 요청은 생성된 오디오를
+        그대로 공유하고, 다른 프로세스의 대기 요청은 완료 알림 후 None을 받습니다.
 
-                # 락을 얻지 못하면 대기
-                await asyncio.sleep(wait_interval)
-                elapsed += wait_interval
+        Args:
+            tts_provider: TTS Provider
+            key: 단어 오디오 키
+            book_id: 연결할 Book ID (선택)
+            priority: TTS Rate Limit 우선순위 (사전 생성은 BATCH)
+
+        Returns:
+            Optional[bytes]: 새로 생성한 오디오 데이터 (이미 저장되어 있거나 다른 프로세스가 생성했으면 None)
 
-            if not lock_acquired:
-                logger.warning(f"Failed to acquire Redis lock: {lock_key} (timeout: {timeout}s)")
-                raise TTSGenerationFailedException(
-                    reason=f"다른 요청이 처리 중입니다. 잠시 후 다시 시도해주세요. (lock timeout)"
+        Raises:
+            TTSGenerationFailedException: TTS 생성 실패
+            TTSUploadFailedException: 파일 저장 실패
+        """
+        if await self.word_index.lookup(key.content_hash):
+            if book_id is not None:
+                await self.word_index.register(key, book_id=book_id)
+            return None
+
+        async def is_stored() -> bool:
+            return bool(await self.word_index.lookup(key.content_hash))
+
+        async def produce() -> Optional[bytes]:
+            # 다시 확인 (락 획득 전에 다른 프로세스가 생성했을 수 있음)
+            if await is_stored():
+                return None
+            audio = await self._synthesize_word_audio(tts_provider, key, priority)
+            await self.word_index.register(key)
+            return audio
+
+        audio_bytes = await self.single_flight.run(key.content_hash, is_stored, produce)
+
+        if book_id is not None:
+            await self.word_index.register(key, book_id=book_id)
+        return audio_bytes
+
+    async def _synthesize_word_audio(
+        self,
+        tts_provider,
+        key: WordAudioKey,
+        priority: Priority = Priority.INTERACTIVE,
+    ) -> Optional[bytes]:
+        """
+        단어 TTS 생성 후 전역 경로에 저장
+
+        Args:
+            tts_provider: TTS Provider
+            key: 단어 오디오 키
+            priority: TTS Rate Limit 우선순위
+
+        Returns:
+            Optional[bytes]: 생성된 오디오 데이터 (인덱스 유실로 파일만 남아있던 경우 None)
+        """
+        # 인덱스 유실 대비 (생성 경로에서만 스토리지 확인)
+        try:
+            if await self.storage_service.exists(key.storage_path):
+                logger.info(f"Word audio already stored, re-indexing: {key.storage_path}")
+                return None
+        except Exception:
+            pass
+
+        audio = bytearray()
+        tts_error: Optional[Exception] = None
+
+        async def chunks():
+            # Provider 스트림을 스토리지로 바로 전달 (반환용 사본만 유지)
+            nonlocal tts_error
+            try:
+                async for chunk in tts_provider.text_to_speech_stream(
+                    text=key.word,
+                    voice_id=key.voice_id,
+                    model_id=key.model_id,
+                ):
+                    audio.extend(chunk)
+                    yield chunk
+            except Exception as e:
+                tts_error = e
+                raise
+
+        try:
+            async with get_limiters().limit(settings.ai_tts_provider, "tts", priority):
+                await self.storage_service.save_stream(
+                    chunks(),
+                    key.storage_path,
+                    content_type="audio/mpeg"
+                )
+        except Exception as e:
+            if tts_error is None:
+                raise TTSUploadFailedException(
+                    filename=key.storage_path,
+                    reason=str(e)
                 )
+            if isinstance(tts_error, (TTSAPIKeyNotConfiguredException, TTSAPIAuthenticationFailedException)):
+                raise tts_error
+            raise TTSGenerationFailedException(
+                reason=f"Word TTS 생성 실패: {str(tts_error)}"
+            )
 
-            yield lock_acquired
+        audio_bytes = bytes(audio)
 
-        finally:
-            # 락 해제 (본인이 획득한 락만 해제)
-            if lock_acquired:
-                try:
-                    current_value = await self.cache_service.get(lock_key)
-                    if current_value == lock_value:
-                        await self.cache_service.delete(lock_key)
-                        logger.info(f"Redis lock released: {lock_key}")
-                except Exception as e:
-                    logger.error(f"Failed to release Redis lock: {lock_key}, error: {e}")
+        logger.info(
+            f"Generated word audio: word={key.word}, voice_id={key.voice_id}, "
+            f"model={key.model_id}, path={key.storage_path}"
+        )
+        return audio_bytes
+
+    async def get_or_create_word_audio(
+        self,
+        word: str,
+        voice_id: Optional[str] = None,
+        book_id: Optional[uuid.UUID] = None,
+        load: bool = False,
+    ) -> Tuple[WordAudioEntry, Optional[bytes]]:
+        """
+        단어 오디오 조회 또는 생성 (책 간 공유 전역 저장소)
+
+        Args:
+            word: 단어
+            voice_id: 음성 ID (None이면 기본 음성)
+            book_id: Book ID (있으면 Book별 인덱스 조회 / 연결)
+            load: True면 이미 저장된 오디오도 읽어서 반환
+
+        Returns:
+            Tuple[WordAudioEntry, Optional[bytes]]: (저장 위치, 오디오 데이터)
+                - 오디오 데이터는 새로 생성했거나 load=True인 경우에만 반환
+
+        Raises:
+            WordTooLongException / WordInvalidException: 유효하지 않은 단어
+            TTSGenerationFailedException: TTS 생성 실패
+            TTSUploadFailedException: 파일 저장 실패
+        """
+        self._validate_word(word)
+
+        entry = await self.word_index.resolve(book_id, word) if book_id else None
+        audio_bytes = None
+
+        if entry is None:
+            tts_provider = self._get_word_tts_provider()
+            key = self._build_word_key(tts_provider, word, voice_id)
+            audio_bytes = await self._ensure_word_audio(tts_provider, key, book_id=book_id)
+            entry = WordAudioEntry(path=key.storage_path, voice_id=key.voice_id)
+
+        if audio_bytes is None and load:
+            audio_bytes = await self.storage_service.get(entry.path)
+
+        return entry, audio_bytes
 
     async def generate_and_save_word_audio(
         self,
         word: str,
         file_path: str,
         voice_id: Optional[str] = None,
+        book_id: Optional[uuid.UUID] = None,
     ) -> bytes:
         """
-        단어 오디오를 즉시 생성하고 저장 (Redis lock으로 중복 방지)
+        단어 오디오를 즉시 생성하고 저장 (Single-Flight로 중복 생성 방지)
 
-        Redis 분산 락을 사용하여 동시에 같은 단어에 대한 여러 요청이 오더라도
-        첫 번째 요청만 TTS를 생성하고, 나머지는 대기 후 완성된 파일을 반환합니다.
+        오디오는 Book 경로가 아닌 전역 단어 저장소에 한 번만 저장되고,
+        Book별 경로(file_path)는 인덱스를 통해 전역 오디오로 연결됩니다.
 
         Args:
             word: 생성할 단어
-            file_path: 저장할 경로
+            file_path: 요청된 Book별 경로 (로그용)
             voice_id: 음성 ID
+            book_id: Book ID (있으면 Book별 인덱스에 연결)
 
         Returns:
-            bytes: 생성된 오디오 데이터
+            bytes: 오디오 데이터
 
         Raises:
             TTSGenerationFailedException: TTS 생성 실패
             TTSUploadFailedException: 파일 저장 실패
         """
-        # 중복 생성 방지 (Redis lock)
-        lock_key = f"tts:generating:{file_path}"
+        entry, audio_bytes = await self.get_or_create_word_audio(
+            word=word,
+            voice_id=voice_id,
+            book_id=book_id,
+            load=True,
+        )
 
-        async with self.redis_lock(lock_key, timeout=30):
-            # 다시 확인 (lock 대기 중 다른 요청이 생성했을 수 있음)
-            try:
-                if await self.storage_service.exists(file_path):
-                    logger.info(f"File already generated by another request: {file_path}")
-                    return await self.storage_service.get(file_path)
-            except Exception:
-                pass
+        logger.info(f"Word audio ready: {file_path} -> {entry.path}, word={word}, voice_id={entry.voice_id}")
 
-            # 단어 유효성 검증
-            self._validate_word(word)
+        return audio_bytes
 
-            # TTS Provider 가져오기
-            try:
-                tts_provider = self.ai_factory.get_tts_provider()
-            except TTSAPIKeyNotConfiguredException:
-                raise
-            except Exception as e:
-                raise TTSGenerationFailedException(
-                    reason=f"TTS Provider 초기화 실패: {str(e)}"
-                )
+    async def prewarm_word_audio(
+        self,
+        voice_id: Optional[str] = None,
+        words: Optional[List[str]] = None,
+        concurrency: Optional[int] = None,
+    ) -> Dict[str, int]:
+        """
+        음성별 자주 쓰는 단어 오디오 사전 생성
+
+        전역 인덱스를 HMGET 1회로 확인하고, 없는 단어만 동시성 제한 하에 생성합니다.
+
+        Args:
+            voice_id: 음성 ID (None이면 기본 음성)
+            words: 단어 목록 (None이면 COMMON_VOCABULARY)
+            concurrency: 동시 TTS 요청 수 (기본값: settings.tts_word_prewarm_concurrency)
 
-            # TTS 생성
+        Returns:
+            Dict[str, int]: requested / existing / generated / failed
+        """
+        tts_provider = self._get_word_tts_provider()
+
+        keys: Dict[str, WordAudioKey] = {}
+        for word in words if words is not None else COMMON_VOCABULARY:
             try:
-                audio_bytes = await tts_provider.text_to_speech(
-                    text=word,
-                    voice_id=voice_id,
-                )
-            except (TTSAPIKeyNotConfiguredException, TTSAPIAuthenticationFailedException):
-                raise
-            except Exception as e:
-                raise TTSGenerationFailedException(
-                    reason=f"Word TTS 생성 실패: {str(e)}"
-                )
+                self._validate_word(word)
+            except (WordTooLongException, WordInvalidException):
+                logger.warning(f"Skipping invalid prewarm word: {word!r}")
+                continue
+            key = self._build_word_key(tts_provider, word, voice_id)
+            keys[key.content_hash] = key
+
+        summary = await self._warm_word_keys(tts_provider, list(keys.values()), concurrency)
+        logger.info(f"Word audio prewarm done: voice_id={voice_id or settings.tts_default_voice_id}, {summary}")
+        return summary
+
+    async def prewarm_book_word_audio(
+        self,
+        book_id: uuid.UUID,
+        concurrency: Optional[int] = None,
+        on_progress: Optional[Callable[[Dict[str, int]], Awaitable[None]]] = None,
+    ) -> Dict[str, int]:
+        """
+        Book 전체 대사의 단어 오디오 사전 생성 (읽기 모드 첫 탭부터 저장된 오디오 사용)
 
-            # 스토리지 저장
+        원본 언어(is_primary) 대사 텍스트를 단어로 나누고, 전역 저장소에 없는 단어만
+        Rate Limiter(BATCH 우선순위) 하에 동시 생성합니다. 이미 있는 단어도 Book별 인덱스에 연결합니다.
+
+        Args:
+            book_id: Book ID
+            concurrency: 동시 TTS 요청 수 (기본값: settings.tts_word_prewarm_concurrency)
+            on_progress: 진행 콜백 (단어 1개 처리마다 현재 summary 전달)
+
+        Returns:
+            Dict[str, int]: requested / existing / generated / failed
+
+        Raises:
+            StorybookNotFoundException: Book이 존재하지 않음
+            BookVoiceNotConfiguredException: Book에 voice_id가 설정되지 않음
+        """
+        from backend.features.storybook.repository import BookRepository
+        book_repo = BookRepository(self.db_session)
+        book = await book_repo.get(book_id)
+
+        if not book:
+            raise StorybookNotFoundException(storybook_id=str(book_id))
+
+        if not book.voice_id:
+            raise BookVoiceNotConfiguredException(book_id=str(book_id))
+
+        texts = await book_repo.get_dialogue_texts(book_id)
+        tts_provider = self._get_word_tts_provider()
+
+        keys: Dict[str, WordAudioKey] = {}
+        for word in extract_words(texts):
             try:
-                await self.storage_service.save(
-                    audio_bytes,
-                    file_path,
-                    content_type="audio/mpeg"
-                )
-            except Exception as e:
-                raise TTSUploadFailedException(
-                    filename=file_path,
-                    reason=str(e)
-                )
+                self._validate_word(word)
+            except (WordTooLongException, WordInvalidException):
+                continue
+            key = self._build_word_key(tts_provider, word, book.voice_id)
+            keys[key.content_hash] = key
+
+        summary = await self._warm_word_keys(
+            tts_provider, list(keys.values()), concurrency, book_id=book_id, on_progress=on_progress
+        )
+        logger.info(f"Book word audio prewarm done: book={book_id}, voice_id={book.voice_id}, {summary}")
+        return summary
+
+    async def _warm_word_keys(
+        self,
+        tts_provider,
+        keys: List[WordAudioKey],
+        concurrency: Optional[int] = None,
+        book_id: Optional[uuid.UUID] = None,
+        on_progress: Optional[Callable[[Dict[str, int]], Awaitable[None]]] = None,
+    ) -> Dict[str, int]:
+        """
+        전역 인덱스를 HMGET 1회로 확인하고, 없는 키만 동시성 제한 하에 생성
+
+        Args:
+            tts_provider: TTS Provider
+            keys: 단어 오디오 키 목록 (중복 없음)
+            concurrency: 동시 TTS 요청 수 (기본값: settings.tts_word_prewarm_concurrency)
+            book_id: 연결할 Book ID (있으면 기존 / 생성 단어 모두 Book별 인덱스에 연결)
+            on_progress: 진행 콜백
 
-            logger.info(f"Generated and saved word audio on-demand: {file_path}, word={word}, voice_id={voice_id}")
+        Returns:
+            Dict[str, int]: requested / existing / generated / failed
+        """
+        stored = await self.word_index.lookup_many([key.content_hash for key in keys])
+        missing = [key for key in keys if not stored.get(key.content_hash)]
+
+        summary = {
+            "requested": len(keys),
+            "existing": len(keys) - len(missing),
+            "generated": 0,
+            "failed": 0,
+        }
 
-            return audio_bytes
+        if book_id is not None and summary["existing"]:
+            existing = [key for key in keys if stored.get(key.content_hash)]
+            await self.word_index.register_many(existing, book_id=book_id)
+
+        if on_progress:
+            await on_progress(dict(summary))
+
+        semaphore = asyncio.Semaphore(concurrency or settings.tts_word_prewarm_concurrency)
+
+        async def warm(key: WordAudioKey) -> None:
+            async with semaphore:
+                try:
+                    audio = await self._ensure_word_audio(
+                        tts_provider, key, book_id=book_id, priority=Priority.BATCH
+                    )
+                    # None: 그 사이 다른 요청 / 프로세스가 생성했거나 파일이 이미 있었음
+                    summary["generated" if audio is not None else "existing"] += 1
+                except Exception as e:
+                    logger.warning(f"Word audio prewarm failed: word={key.word}, voice_id={key.voice_id}: {e}")
+                    summary["failed"] += 1
+            if on_progress:
+                await on_progress(dict(summary))
+
+        await asyncio.gather(*(warm(key) for key in missing))
+        return summary
 
     @log_process(step="Generate Speech", desc="TTS 음성 생성 및 업로드")
     async def generate_speech(
@@ -222,11 +474,12 @@ class TTSService:
 
         # 1. TTS 생성
         try:
-            audio_bytes = await tts_provider.text_to_speech(
-                text=text,
-                voice_id=voice_id,
-                model_id=model_id
-            )
+            async with get_limiters().limit(settings.ai_tts_provider, "tts", Priority.INTERACTIVE):
+                audio_bytes = await tts_provider.text_to_speech(
+                    text=text,
+                    voice_id=voice_id,
+                    model_id=model_id
+                )
         except (TTSAPIKeyNotConfiguredException, TTSAPIAuthenticationFailedException):
             # API 키 관련 예외는 그대로 전파
             raise
@@ -459,111 +712,92 @@ class TTSService:
         """
         # 1. 단어 유효성 검증
         self._validate_word(word)
-        
-        # 2. Book 조회 및 voice_id 가져오기
+
+        # 2. Book별 인덱스 확인 (Redis 조회 1회, DB / 스토리지 조회 없음)
+        entry = await self.word_index.resolve(book_id, word)
+        if entry is not None:
+            logger.info(f"Word TTS 캐시 사용: book={book_id}, word={word}")
+            return self._word_tts_result(word, entry, cached=True)
+
+        # 3. Book 조회 및 voice_id 가져오기
         from backend.features.storybook.repository import BookRepository
         book_repo = BookRepository(self.db_session)
         book = await book_repo.get(book_id)
-        
+
         if not book:
             raise StorybookNotFoundException(storybook_id=str(book_id))
-        
+
         if not book.voice_id:
             raise BookVoiceNotConfiguredException(book_id=str(book_id))
-        
+
         voice_id = book.voice_id
-        
-        # 3. 파일 경로 설정 (Book의 base_path 사용)
-        file_path = Path(f"{book.base_path}/words/{word}.mp3")
-        
-        # 4. 캐시 확인 (파일 존재 여부)
+
+        # 4. 기존 Book 경로에 생성된 파일이 있으면 인덱스에 연결 (이전 저장 방식 호환)
+        legacy_path = f"{book.base_path}/words/{word}.mp3"
         try:
-            # 스토리지에서 파일 존재 여부 확인
-            file_exists = await self.storage_service.exists(str(file_path))
+            legacy_exists = await self.storage_service.exists(legacy_path)
         except Exception:
-            file_exists = False
-        
-        # 캐시된 파일이 있으면 바로 반환
-        if file_exists:
-            # storage_service.get_url()을 사용하여 URL 생성
-            # Local: /api/v1/files/... 상대 경로
-            # S3: Pre-signed URL
-            audio_url = self.storage_service.get_url(str(file_path))
-            
-            logger.info(f"Word TTS 캐시 사용: book={book_id}, word={word}")
-            return {
-                "success": True,
-                "word": word,
-                "file_path": f"/{file_path}",
-                "audio_url": audio_url,
-                "cached": True,
-                "duration_ms": None,
-                "voice_id": voice_id,
-            }
-        
-        # 5. TTS 생성
+            legacy_exists = False
+
+        if legacy_exists:
+            entry = WordAudioEntry(path=legacy_path, voice_id=voice_id)
+            await self.word_index.link(book_id, word, entry)
+            logger.info(f"Word TTS 캐시 사용 (기존 경로): book={book_id}, word={word}")
+            return self._word_tts_result(word, entry, cached=True)
+
+        # 5. 전역 저장소 조회 / TTS 생성 (다른 책에서 생성된 오디오 재사용)
         start_time = time.time()
-        
-        try:
-            tts_provider = self.ai_factory.get_tts_provider()
-        except TTSAPIKeyNotConfiguredException:
-            raise
-        except Exception as e:
-            raise TTSGenerationFailedException(
-                reason=f"TTS Provider 초기화 실패: {str(e)}"
-            )
 
-        try:
-            # Provider가 자동으로 모델 선택 및 발음 사전 적용
-            audio_bytes = await tts_provider.text_to_speech(
-                text=word,
-                voice_id=voice_id,
-            )
-        except (TTSAPIKeyNotConfiguredException, TTSAPIAuthenticationFailedException):
-            raise
-        except Exception as e:
-            raise TTSGenerationFailedException(
-                reason=f"Word TTS 생성 실패: {str(e)}"
-            )
-        
-        # 6. 파일 저장
-        try:
-            audio_path = await self.storage_service.save(
-                audio_bytes,
-                str(file_path),
-                content_type="audio/mpeg"
-            )
-            # ✅ 경로만 저장됨
-            # Local: "shared/books/{id}/words/word.mp3"
-            # S3: "shared/books/{id}/words/word.mp3"
-            
-            # ✅ API 응답용 URL 생성
-            audio_url = self.storage_service.get_url(audio_path)
-            # Local: "/api/v1/files/shared/books/{id}/words/word.mp3"
-            # S3: "https://bucket.s3.amazonaws.com/.../word.mp3?Signature=..."
-        except Exception as e:
-            raise TTSUploadFailedException(
-                filename=str(file_path),
-                reason=str(e)
-            )
-        
+        entry, audio_bytes = await self.get_or_create_word_audio(
+            word=word,
+            voice_id=voice_id,
+            book_id=book_id,
+        )
+
+        if audio_bytes is None:
+            logger.info(f"Word TTS 공유 오디오 사용: book={book_id}, word={word}, path={entry.path}")
+            return self._word_tts_result(word, entry, cached=True)
+
         duration_ms = int((time.time() - start_time) * 1000)
-        
+
         logger.info(
             f"Word TTS 생성 완료: book={book_id}, word={word}, "
             f"voice_id={voice_id}, duration={duration_ms}ms"
         )
-        
+
+        return self._word_tts_result(word, entry, cached=False, duration_ms=duration_ms)
+
+    def _word_tts_result(
+        self,
+        word: str,
+        entry: WordAudioEntry,
+        cached: bool,
+        duration_ms: Optional[int] = None,
+    ) -> Dict[str, Any]:
+        """
+        단어 TTS 응답 생성
+
+        Args:
+            word: 요청 단어
+            entry: 오디오 저장 위치
+            cached: 기존 오디오 사용 여부
+            duration_ms: 생성 소요 시간 (새로 생성한 경우)
+
+        Returns:
+            Dict[str, Any]: generate_word_tts 응답
+        """
+        # Local: /api/v1/files/... 상대 경로
+        # S3/R2: Pre-signed URL / CDN URL
         return {
             "success": True,
             "word": word,
-            "file_path": f"/{file_path}",
-            "audio_url": audio_url,
-            "cached": False,
+            "file_path": f"/{entry.path}",
+            "audio_url": self.storage_service.get_url(entry.path),
+            "cached": cached,
             "duration_ms": duration_ms,
-            "voice_id": voice_id,
+            "voice_id": entry.voice_id,
         }
-    
+
     def _validate_word(self, word: str) -> None:
         """
         단어 유효성 검증
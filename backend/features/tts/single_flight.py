@@ -0,0 +1,228 @@
+"""
+Word Audio Single-Flight
+같은 단어 오디오(content hash)에 대한 동시 생성 요청 병합
+
+- 프로세스 내부: 진행 중인 생성 Future를 공유 (후속 요청은 Redis 조회 없이 같은 결과를 받음)
+- 프로세스 간: Redis SET NX 락을 잡은 1곳만 생성하고, 나머지는 완료 채널(Pub/Sub)을 구독해 대기
+  (100ms 간격 락 재시도 / 스토리지 재조회 폴링 없음)
+
+채널: tts:done:{content_hash} → "done" | "failed"
+"""
+
+import asyncio
+import logging
+import time
+import uuid
+from typing import Awaitable, Callable, Dict, Optional
+
+import redis.asyncio as aioredis
+
+from backend.core.config import settings
+from .exceptions import TTSGenerationFailedException
+
+logger = logging.getLogger(__name__)
+
+LOCK_KEY_PREFIX = "tts:generating:"
+DONE_CHANNEL_PREFIX = "tts:done:"
+
+DONE = "done"
+FAILED = "failed"
+
+# 본인이 잡은 락만 해제 (GET + DEL 원자 실행)
+_RELEASE_SCRIPT = """
+if redis.call("get", KEYS[1]) == ARGV[1] then
+    return redis.call("del", KEYS[1])
+end
+return 0
+"""
+
+
+class WordAudioSingleFlight:
+    """
+    단어 오디오 생성 Single-Flight
+
+    run()의 반환값은 생성한 프로세스 안에서만 공유됩니다. 다른 프로세스가 생성을 끝낸 경우
+    None을 반환하므로, 호출자는 필요할 때 저장소에서 읽습니다.
+
+    Redis 오류 시 프로세스 간 병합 없이 직접 생성합니다 (프로세스 내부 병합은 유지).
+
+    Example:
+        audio = await single_flight.run(key.content_hash, is_stored, synthesize)
+    """
+
+    def __init__(self, redis_url: Optional[str] = None, timeout: Optional[float] = None):
+        """
+        Args:
+            redis_url: Redis URL (기본값: settings.redis_url)
+            timeout: 최대 대기 시간 / 생성 락 TTL (초, 기본값: settings.tts_word_single_flight_timeout)
+        """
+        self.redis_url = redis_url or settings.redis_url
+        self.timeout = timeout or settings.tts_word_single_flight_timeout
+        self._redis: Optional[aioredis.Redis] = None
+        self._inflight: Dict[str, asyncio.Future] = {}
+
+    def _get_redis(self) -> aioredis.Redis:
+        """Redis 클라이언트 (lazy initialization)"""
+        if self._redis is None:
+            self._redis = aioredis.from_url(self.redis_url, decode_responses=True)
+        return self._redis
+
+    async def run(
+        self,
+        content_hash: str,
+        is_done: Callable[[], Awaitable[bool]],
+        produce: Callable[[], Awaitable[Optional[bytes]]],
+    ) -> Optional[bytes]:
+        """
+        content hash 단위로 생성을 1회만 실행
+
+        Args:
+            content_hash: 단어 오디오 키
+            is_done: 다른 프로세스가 이미 생성했는지 확인 (완료 채널 구독 직후 호출)
+            produce: 생성 함수 (락을 잡은 경우에만 호출, 인덱스 등록까지 끝낸 뒤 반환)
+
+        Returns:
+            Optional[bytes]: 이 프로세스에서 생성한 오디오 (다른 프로세스가 생성했으면 None)
+
+        Raises:
+            TTSGenerationFailedException: 대기 시간 초과
+            (produce에서 발생한 예외는 같은 프로세스의 대기 요청에도 그대로 전달)
+        """
+        inflight = self._inflight.get(content_hash)
+        if inflight is not None:
+            # 다른 요청의 취소가 공유 Future로 전파되지 않도록 shield
+            return await asyncio.shield(inflight)
+
+        future = asyncio.get_running_loop().create_future()
+        # 대기 요청이 없을 때 "exception was never retrieved" 경고 방지
+        future.add_done_callback(lambda f: f.cancelled() or f.exception())
+        self._inflight[content_hash] = future
+
+        try:
+            result = await self._run_exclusive(content_hash, is_done, produce)
+        except asyncio.CancelledError:
+            future.set_exception(TTSGenerationFailedException(reason="단어 오디오 생성이 취소되었습니다"))
+            raise
+        except Exception as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            self._inflight.pop(content_hash, None)
+
+    async def _run_exclusive(
+        self,
+        content_hash: str,
+        is_done: Callable[[], Awaitable[bool]],
+        produce: Callable[[], Awaitable[Optional[bytes]]],
+    ) -> Optional[bytes]:
+        """프로세스 간 병합 (락 획득 시 생성, 아니면 완료 알림 대기)"""
+        lock_key = f"{LOCK_KEY_PREFIX}{content_hash}"
+        deadline = time.monotonic() + self.timeout
+
+        while True:
+            token = uuid.uuid4().hex
+            try:
+                acquired = await self._get_redis().set(lock_key, token, nx=True, px=int(self.timeout * 1000))
+            except Exception as e:
+                logger.warning(f"Word audio lock unavailable, generating without coordination: {e}")
+                return await produce()
+
+            if acquired:
+                return await self._produce_and_notify(content_hash, lock_key, token, produce)
+
+            outcome = await self._wait_for_done(content_hash, is_done, deadline - time.monotonic())
+            if outcome == DONE:
+                return None
+
+            if time.monotonic() >= deadline:
+                logger.warning(f"Word audio single-flight timeout: {content_hash} ({self.timeout}s)")
+                raise TTSGenerationFailedException(
+                    reason="다른 요청이 처리 중입니다. 잠시 후 다시 시도해주세요. (lock timeout)"
+                )
+            # 생성 실패 알림: 락이 풀렸으므로 직접 생성 시도
+
+    async def _produce_and_notify(
+        self,
+        content_hash: str,
+        lock_key: str,
+        token: str,
+        produce: Callable[[], Awaitable[Optional[bytes]]],
+    ) -> Optional[bytes]:
+        """생성 후 완료 채널에 결과 발행, 락 해제"""
+        outcome = FAILED
+        try:
+            result = await produce()
+            outcome = DONE
+            return result
+        finally:
+            try:
+                redis = self._get_redis()
+                await redis.eval(_RELEASE_SCRIPT, 1, lock_key, token)
+                await redis.publish(f"{DONE_CHANNEL_PREFIX}{content_hash}", outcome)
+            except Exception as e:
+                logger.error(f"Failed to release word audio lock: {lock_key}, error: {e}")
+
+    async def _wait_for_done(
+        self,
+        content_hash: str,
+        is_done: Callable[[], Awaitable[bool]],
+        timeout: float,
+    ) -> Optional[str]:
+        """
+        완료 채널 대기
+
+        구독 후 is_done()을 확인하므로 락 조회와 구독 사이에 끝난 생성도 놓치지 않습니다.
+
+        Returns:
+            Optional[str]: DONE | FAILED (timeout이면 None)
+        """
+        channel = f"{DONE_CHANNEL_PREFIX}{content_hash}"
+        pubsub = self._get_redis().pubsub()
+        try:
+            await pubsub.subscribe(channel)
+            if await is_done():
+                return DONE
+
+            deadline = time.monotonic() + timeout
+            while True:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return None
+                message = await pubsub.get_message(ignore_subscribe_messages=True, timeout=remaining)
+                if message and message.get("type") == "message":
+                    return message["data"]
+        finally:
+            try:
+                await pubsub.unsubscribe(channel)
+                await pubsub.aclose()
+            except Exception as e:
+                logger.warning(f"Failed to close word audio subscription: {channel}: {e}")
+
+    async def close(self) -> None:
+        """Redis 연결 종료"""
+        if self._redis is not None:
+            await self._redis.close()
+            self._redis = None
+
+
+# 전역 WordAudioSingleFlight 인스턴스 (lazy, 프로세스 내부 병합을 위해 TTSService 간 공유)
+_single_flight: Optional[WordAudioSingleFlight] = None
+
+
+def get_word_audio_single_flight() -> WordAudioSingleFlight:
+    """WordAudioSingleFlight 싱글톤 반환"""
+    global _single_flight
+    if _single_flight is None:
+        _single_flight = WordAudioSingleFlight()
+    return _single_flight
+
+
+async def close_word_audio_single_flight() -> None:
+    """WordAudioSingleFlight 종료 (lifespan 종료 시 호출)"""
+    global _single_flight
+    if _single_flight is not None:
+        await _single_flight.close()
+        _single_flight = None
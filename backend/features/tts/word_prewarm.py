@@ -0,0 +1,274 @@
+"""
+Book Word Audio Prewarm Jobs
+책 전체 단어 오디오 사전 생성 작업 (등록 / 실행 / 진행 상황)
+
+- 등록: 파이프라인 완료(finalize_book_task) 또는 API 요청 시 WORD_AUDIO_PREWARM 이벤트 발행
+- 실행: 이벤트를 받은 API 프로세스 1곳이 백그라운드 Task로 실행
+  (이벤트 수신 루프를 막지 않음, 책별 Redis 락으로 중복 실행 방지)
+- 진행 상황: tts:word_prewarm:{book_id} Hash (status / requested / existing / generated / failed)
+- 실행 중에는 heartbeat로 updated_at / 락 TTL 갱신 (tts_word_prewarm_stale_seconds)
+  실행 프로세스가 죽거나 이벤트가 처리되지 않아 heartbeat가 끊기면 재등록 가능
+"""
+
+import asyncio
+import logging
+import time
+import uuid
+from datetime import datetime
+from typing import Any, Dict, Optional, Set, Union
+
+import redis.asyncio as aioredis
+
+from backend.core.config import settings
+from backend.core.events.bus import EventBus
+from backend.core.events.types import Event, EventType
+
+logger = logging.getLogger(__name__)
+
+BookId = Union[uuid.UUID, str]
+
+PREWARM_KEY_PREFIX = "tts:word_prewarm:"
+
+STATUS_QUEUED = "queued"
+STATUS_RUNNING = "running"
+STATUS_COMPLETED = "completed"
+STATUS_FAILED = "failed"
+
+_COUNT_FIELDS = ("requested", "existing", "generated", "failed")
+
+
+def _progress_key(book_id: BookId) -> str:
+    return f"{PREWARM_KEY_PREFIX}{book_id}"
+
+
+def _lock_key(book_id: BookId) -> str:
+    return f"{PREWARM_KEY_PREFIX}{book_id}:lock"
+
+
+class WordPrewarmJobs:
+    """
+    책 단어 오디오 사전 생성 작업 관리
+
+    진행 상황 저장 실패는 로그만 남기고 무시합니다 (작업은 계속 진행).
+    """
+
+    def __init__(self, redis_url: Optional[str] = None, event_bus: Optional[EventBus] = None):
+        """
+        Args:
+            redis_url: Redis URL (기본값: settings.redis_url)
+            event_bus: 작업 등록 / 수신용 Event Bus (None이면 등록 불가)
+        """
+        self.redis_url = redis_url or settings.redis_url
+        self.event_bus = event_bus
+        self._redis: Optional[aioredis.Redis] = None
+        self._tasks: Set[asyncio.Task] = set()
+        self._handlers_registered = False
+
+    def _get_redis(self) -> aioredis.Redis:
+        """Redis 클라이언트 (lazy initialization)"""
+        if self._redis is None:
+            self._redis = aioredis.from_url(self.redis_url, decode_responses=True)
+        return self._redis
+
+    async def register(self, event_bus: EventBus) -> None:
+        """WORD_AUDIO_PREWARM 이벤트 구독 (작업 실행 프로세스)"""
+        self.event_bus = event_bus
+        if self._handlers_registered:
+            return
+        await event_bus.subscribe(EventType.WORD_AUDIO_PREWARM, self._handle_prewarm)
+        self._handlers_registered = True
+
+    async def enqueue(self, book_id: BookId) -> Dict[str, Any]:
+        """
+        책 단어 사전 생성 작업 등록
+
+        Args:
+            book_id: Book ID
+
+        Returns:
+            Dict[str, Any]: 현재 진행 상황 (이미 실행 중이면 실행 중 상태, heartbeat가 끊긴 작업은 재등록)
+
+        Raises:
+            RuntimeError: Event Bus가 설정되지 않음
+        """
+        if self.event_bus is None:
+            raise RuntimeError("Event bus not configured for word prewarm jobs")
+
+        progress = await self.get_progress(book_id)
+        if progress and progress["status"] in (STATUS_QUEUED, STATUS_RUNNING):
+            if not self._is_stale(progress):
+                return progress
+            logger.warning(
+                f"Book word audio prewarm stalled, re-enqueueing: book={book_id}, "
+                f"status={progress['status']}, updated_at={progress['updated_at']}"
+            )
+
+        await self._save(book_id, status=STATUS_QUEUED, error="", **{field: 0 for field in _COUNT_FIELDS})
+        await self.event_bus.publish(EventType.WORD_AUDIO_PREWARM, {"book_id": str(book_id)})
+        logger.info(f"Book word audio prewarm enqueued: book={book_id}")
+        return await self.get_progress(book_id) or {"book_id": str(book_id), "status": STATUS_QUEUED}
+
+    async def get_progress(self, book_id: BookId) -> Optional[Dict[str, Any]]:
+        """
+        진행 상황 조회
+
+        Returns:
+            Optional[Dict[str, Any]]: 진행 상황 (작업 기록이 없으면 None)
+        """
+        try:
+            raw = await self._get_redis().hgetall(_progress_key(book_id))
+        except Exception as e:
+            logger.warning(f"Word prewarm progress lookup error: book={book_id}: {e}")
+            return None
+
+        if not raw:
+            return None
+
+        progress: Dict[str, Any] = {"book_id": str(book_id), "status": raw.get("status", STATUS_QUEUED)}
+        for field in _COUNT_FIELDS:
+            progress[field] = int(raw.get(field) or 0)
+        progress["error"] = raw.get("error") or None
+        updated_at = raw.get("updated_at")
+        progress["updated_at"] = datetime.utcfromtimestamp(float(updated_at)) if updated_at else None
+        return progress
+
+    @staticmethod
+    def _is_stale(progress: Dict[str, Any]) -> bool:
+        """heartbeat(updated_at)가 tts_word_prewarm_stale_seconds 이상 끊긴 작업인지"""
+        updated_at = progress.get("updated_at")
+        if updated_at is None:
+            return True
+        age = (datetime.utcnow() - updated_at).total_seconds()
+        return age >= settings.tts_word_prewarm_stale_seconds
+
+    async def _handle_prewarm(self, event: Event) -> None:
+        """WORD_AUDIO_PREWARM 이벤트 처리 (백그라운드 Task로 실행 후 즉시 반환)"""
+        book_id = event.payload.get("book_id")
+        if not book_id:
+            logger.warning(f"Word prewarm event missing book_id: {event.event_id}")
+            return
+
+        task = asyncio.create_task(self.run(book_id))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def run(self, book_id: BookId) -> Optional[Dict[str, int]]:
+        """
+        책 단어 사전 생성 실행
+
+        Args:
+            book_id: Book ID
+
+        Returns:
+            Optional[Dict[str, int]]: 결과 summary (다른 프로세스가 실행 중이거나 실패하면 None)
+        """
+        token = uuid.uuid4().hex
+        try:
+            acquired = await self._get_redis().set(
+                _lock_key(book_id), token, nx=True, ex=settings.tts_word_prewarm_stale_seconds
+            )
+        except Exception as e:
+            logger.warning(f"Word prewarm lock unavailable: book={book_id}: {e}")
+            acquired = True
+
+        if not acquired:
+            logger.info(f"Book word audio prewarm already running: book={book_id}")
+            return None
+
+        await self._save(book_id, status=STATUS_RUNNING)
+
+        async def on_progress(summary: Dict[str, int]) -> None:
+            await self._save(book_id, **summary)
+
+        heartbeat = asyncio.create_task(self._heartbeat(book_id))
+        try:
+            summary = await self._prewarm(book_id, on_progress)
+        except Exception as e:
+            logger.error(f"Book word audio prewarm failed: book={book_id}: {e}", exc_info=True)
+            await self._save(book_id, status=STATUS_FAILED, error=str(e))
+            return None
+        finally:
+            heartbeat.cancel()
+            await asyncio.gather(heartbeat, return_exceptions=True)
+            try:
+                redis = self._get_redis()
+                if await redis.get(_lock_key(book_id)) == token:
+                    await redis.delete(_lock_key(book_id))
+            except Exception as e:
+                logger.warning(f"Failed to release word prewarm lock: book={book_id}: {e}")
+
+        await self._save(book_id, status=STATUS_COMPLETED, **summary)
+        return summary
+
+    async def _heartbeat(self, book_id: BookId) -> None:
+        """실행 중 updated_at / 락 TTL 갱신 (진행 이벤트가 뜸한 긴 TTS 생성 중에도 유지)"""
+        interval = settings.tts_word_prewarm_stale_seconds / 3
+        while True:
+            await asyncio.sleep(interval)
+            await self._save(book_id)
+            try:
+                await self._get_redis().expire(_lock_key(book_id), settings.tts_word_prewarm_stale_seconds)
+            except Exception as e:
+                logger.warning(f"Word prewarm lock refresh error: book={book_id}: {e}")
+
+    async def _prewarm(self, book_id: BookId, on_progress) -> Dict[str, int]:
+        """DB 세션 / TTSService를 구성하여 사전 생성"""
+        from backend.core.database.session import AsyncSessionLocal
+        from backend.core.dependencies import get_ai_factory, get_cache_service, get_storage_service
+        from .repository import AudioRepository, VoiceRepository
+        from .service import TTSService
+
+        async with AsyncSessionLocal() as session:
+            service = TTSService(
+                audio_repo=AudioRepository(session),
+                voice_repo=VoiceRepository(session),
+                storage_service=get_storage_service(),
+                ai_factory=get_ai_factory(),
+                db_session=session,
+                cache_service=get_cache_service(self.event_bus),
+                event_bus=self.event_bus,
+            )
+            return await service.prewarm_book_word_audio(
+                uuid.UUID(str(book_id)), on_progress=on_progress
+            )
+
+    async def _save(self, book_id: BookId, **fields: Any) -> None:
+        """진행 상황 저장 (HSET + EXPIRE)"""
+        key = _progress_key(book_id)
+        try:
+            async with self._get_redis().pipeline(transaction=False) as pipe:
+                pipe.hset(key, mapping={**fields, "updated_at": time.time()})
+                pipe.expire(key, settings.tts_word_prewarm_job_ttl)
+                await pipe.execute()
+        except Exception as e:
+            logger.warning(f"Word prewarm progress save error: book={book_id}: {e}")
+
+    async def close(self) -> None:
+        """실행 중인 작업 취소 및 Redis 연결 종료"""
+        for task in list(self._tasks):
+            task.cancel()
+        if self._tasks:
+            await asyncio.gather(*self._tasks, return_exceptions=True)
+        if self._redis is not None:
+            await self._redis.close()
+            self._redis = None
+
+
+# 전역 WordPrewarmJobs 인스턴스 (lazy)
+_word_prewarm_jobs: Optional[WordPrewarmJobs] = None
+
+
+def get_word_prewarm_jobs() -> WordPrewarmJobs:
+    """WordPrewarmJobs 싱글톤 반환"""
+    global _word_prewarm_jobs
+    if _word_prewarm_jobs is None:
+        _word_prewarm_jobs = WordPrewarmJobs()
+    return _word_prewarm_jobs
+
+
+async def close_word_prewarm_jobs() -> None:
+    """WordPrewarmJobs 종료 (lifespan 종료 시 호출)"""
+    global _word_prewarm_jobs
+    if _word_prewarm_jobs is not None:
+        await _word_prewarm_jobs.close()
+        _word_prewarm_jobs = None
@@ -0,0 +1,356 @@
+"""
+Word Audio Store
+책 간 공유되는 콘텐츠 주소 기반 단어 발음 오디오 저장소
+
+- 키: sha256(정규화 단어, voice_id, model_id, 발음 사전 버전)
+- 저장 경로: {tts_word_store_prefix}/{voice_id}/{hash[:2]}/{hash}.mp3 (모든 책이 공유)
+- Redis 인덱스
+  - 전역: tts:word_store (content hash → 저장 경로)
+  - Book별: tts:word_index:{fingerprint}:{book_id} (정규화 단어 → 저장 경로 / voice_id)
+- Book별 인덱스 히트는 Redis HGET 1회 (DB / 스토리지 exists() 조회 없음)
+"""
+
+import hashlib
+import json
+import logging
+import re
+import unicodedata
+import uuid
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional, Union
+
+import redis.asyncio as aioredis
+
+from backend.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+BookId = Union[uuid.UUID, str]
+
+
+# 기본 사전 생성 어휘 (유아 영어 그림책 고빈도 sight words)
+COMMON_VOCABULARY: List[str] = [
+    "a", "and", "away", "big", "blue", "can", "come", "down", "find", "for",
+    "funny", "go", "help", "here", "i", "in", "is", "it", "jump", "little",
+    "look", "make", "me", "my", "not", "one", "play", "red", "run", "said",
+    "see", "the", "three", "to", "two", "up", "we", "where", "yellow", "you",
+]
+
+
+def normalize_word(word: str) -> str:
+    """
+    단어 정규화 (유니코드 NFC, 앞뒤 공백 제거, 연속 공백 축약, 대소문자 통일)
+
+    Args:
+        word: 원본 단어
+
+    Returns:
+        str: 정규화된 단어 (예: " Hello " → "hello")
+    """
+    normalized = unicodedata.normalize("NFC", word)
+    return " ".join(normalized.split()).casefold()
+
+
+# 문자로 이루어진 단어 (it's, ice-cream 같은 아포스트로피 / 하이픈 연결 포함, 숫자 / 특수문자 제외)
+_WORD_PATTERN = re.compile(r"[^\W\d_]+(?:['’\-][^\W\d_]+)*")
+
+
+def extract_words(texts: Iterable[str], max_length: int = 50) -> List[str]:
+    """
+    대사 텍스트에서 단어 추출 (정규화 후 중복 제거, 처음 등장한 순서 유지)
+
+    Args:
+        texts: 대사 텍스트 목록
+        max_length: 최대 단어 길이 (초과 단어는 제외)
+
+    Returns:
+        List[str]: 정규화된 단어 목록 (예: ["the", "cat", "it's"])
+    """
+    words: Dict[str, None] = {}
+    for text in texts:
+        for match in _WORD_PATTERN.finditer(unicodedata.normalize("NFC", text or "")):
+            word = normalize_word(match.group().replace("’", "'"))
+            if len(word) <= max_length:
+                words.setdefault(word)
+    return list(words)
+
+
+@dataclass(frozen=True)
+class WordAudioKey:
+    """전역 단어 오디오 키 (콘텐츠 주소)"""
+
+    word: str
+    voice_id: str
+    model_id: str
+    pronunciation_version: Optional[str]
+    content_hash: str
+
+    @property
+    def storage_path(self) -> str:
+        """전역 저장 경로"""
+        prefix = settings.tts_word_store_prefix.strip("/")
+        return f"{prefix}/{self.voice_id}/{self.content_hash[:2]}/{self.content_hash}.mp3"
+
+
+@dataclass(frozen=True)
+class WordAudioEntry:
+    """Book별 인덱스 항목"""
+
+    path: str
+    voice_id: str
+
+
+def build_word_audio_key(
+    word: str,
+    voice_id: str,
+    model_id: str,
+    pronunciation_version: Optional[str] = None,
+) -> WordAudioKey:
+    """
+    단어 오디오 키 생성
+
+    Args:
+        word: 단어 (내부에서 정규화)
+        voice_id: 음성 ID
+        model_id: 실제 사용될 TTS 모델 ID
+        pronunciation_version: 적용될 발음 사전 버전 (없으면 None)
+
+    Returns:
+        WordAudioKey: 콘텐츠 주소 키
+    """
+    normalized = normalize_word(word)
+    material = "\x1f".join([normalized, voice_id, model_id, pronunciation_version or ""])
+    return WordAudioKey(
+        word=normalized,
+        voice_id=voice_id,
+        model_id=model_id,
+        pronunciation_version=pronunciation_version,
+        content_hash=hashlib.sha256(material.encode("utf-8")).hexdigest(),
+    )
+
+
+def index_fingerprint() -> str:
+    """
+    Book별 인덱스 네임스페이스 (모델 / 발음 사전 설정이 바뀌면 새 네임스페이스 사용)
+
+    Returns:
+        str: 설정 기반 짧은 해시
+    """
+    material = "|".join([
+        settings.tts_default_model_id,
+        settings.pronunciation_dictionary_id or "",
+        settings.pronunciation_version_id or "",
+    ])
+    return hashlib.sha256(material.encode("utf-8")).hexdigest()[:12]
+
+
+class WordAudioIndex:
+    """
+    단어 오디오 Redis 인덱스
+
+    - Redis 오류는 캐시 미스로 처리 (호출자는 전역 저장소 확인 / 생성으로 진행)
+    - 전역 인덱스는 만료 없음, Book별 인덱스는 tts_word_index_ttl 후 만료
+
+    Example:
+        entry = await word_index.resolve(book_id, "hello")
+        if entry is None:
+            key = build_word_audio_key("hello", voice_id, model_id)
+            ...  # 생성 후
+            await word_index.register(key, book_id=book_id)
+    """
+
+    STORE_KEY = "tts:word_store"
+    BOOK_KEY_PREFIX = "tts:word_index:"
+
+    def __init__(
+        self,
+        redis_url: Optional[str] = None,
+        book_ttl: Optional[int] = None,
+    ):
+        """
+        Args:
+            redis_url: Redis URL (기본값: settings.redis_url)
+            book_ttl: Book별 인덱스 TTL (초, 기본값: settings.tts_word_index_ttl)
+        """
+        self.redis_url = redis_url or settings.redis_url
+        self.book_ttl = book_ttl or settings.tts_word_index_ttl
+        self._redis: Optional[aioredis.Redis] = None
+
+    def _get_redis(self) -> aioredis.Redis:
+        """Redis 클라이언트 (lazy initialization)"""
+        if self._redis is None:
+            self._redis = aioredis.from_url(self.redis_url, decode_responses=True)
+        return self._redis
+
+    def _book_key(self, book_id: BookId) -> str:
+        return f"{self.BOOK_KEY_PREFIX}{index_fingerprint()}:{book_id}"
+
+    async def resolve(self, book_id: BookId, word: str) -> Optional[WordAudioEntry]:
+        """
+        Book 단어 → 전역 오디오 조회 (HGET 1회)
+
+        Args:
+            book_id: Book ID
+            word: 단어 (내부에서 정규화)
+
+        Returns:
+            Optional[WordAudioEntry]: 인덱스 항목 또는 None
+        """
+        try:
+            raw = await self._get_redis().hget(self._book_key(book_id), normalize_word(word))
+        except Exception as e:
+            logger.warning(f"Word index resolve error: book={book_id}, word={word}: {e}")
+            return None
+
+        if not raw:
+            return None
+
+        try:
+            data = json.loads(raw)
+            return WordAudioEntry(path=data["path"], voice_id=data["voice_id"])
+        except (ValueError, KeyError, TypeError):
+            logger.warning(f"Corrupted word index entry: book={book_id}, word={word}")
+            return None
+
+    async def lookup(self, content_hash: str) -> Optional[str]:
+        """
+        전역 저장소 조회
+
+        Args:
+            content_hash: 콘텐츠 해시
+
+        Returns:
+            Optional[str]: 저장 경로 또는 None
+        """
+        try:
+            return await self._get_redis().hget(self.STORE_KEY, content_hash)
+        except Exception as e:
+            logger.warning(f"Word store lookup error: {content_hash}: {e}")
+            return None
+
+    async def lookup_many(self, content_hashes: List[str]) -> Dict[str, Optional[str]]:
+        """
+        전역 저장소 일괄 조회 (HMGET 1회)
+
+        Args:
+            content_hashes: 콘텐츠 해시 목록
+
+        Returns:
+            Dict[str, Optional[str]]: 해시 → 저장 경로 (없으면 None)
+        """
+        if not content_hashes:
+            return {}
+
+        try:
+            paths = await self._get_redis().hmget(self.STORE_KEY, content_hashes)
+        except Exception as e:
+            logger.warning(f"Word store lookup_many error ({len(content_hashes)} keys): {e}")
+            paths = [None] * len(content_hashes)
+
+        return dict(zip(content_hashes, paths))
+
+    async def register(self, key: WordAudioKey, book_id: Optional[BookId] = None) -> None:
+        """
+        전역 저장소에 등록 (book_id가 있으면 Book별 인덱스에도 연결)
+
+        Args:
+            key: 단어 오디오 키
+            book_id: Book ID (선택)
+        """
+        await self.register_many([key], book_id=book_id)
+
+    async def register_many(
+        self,
+        keys: Iterable[WordAudioKey],
+        book_id: Optional[BookId] = None,
+    ) -> None:
+        """
+        전역 저장소 일괄 등록 (파이프라인 1회)
+
+        Args:
+            keys: 단어 오디오 키 목록
+            book_id: Book ID (선택, 있으면 Book별 인덱스에도 연결)
+        """
+        keys = list(keys)
+        if not keys:
+            return
+
+        try:
+            async with self._get_redis().pipeline(transaction=False) as pipe:
+                pipe.hset(
+                    self.STORE_KEY,
+                    mapping={key.content_hash: key.storage_path for key in keys},
+                )
+                if book_id is not None:
+                    book_key = self._book_key(book_id)
+                    pipe.hset(
+                        book_key,
+                        mapping={
+                            key.word: json.dumps({"path": key.storage_path, "voice_id": key.voice_id})
+                            for key in keys
+                        },
+                    )
+                    pipe.expire(book_key, self.book_ttl)
+                await pipe.execute()
+        except Exception as e:
+            logger.warning(f"Word store register error ({len(keys)} keys, book={book_id}): {e}")
+
+    async def link(self, book_id: BookId, word: str, entry: WordAudioEntry) -> None:
+        """
+        Book 단어를 기존 오디오에 연결 (전역 저장소 외 경로 포함)
+
+        Args:
+            book_id: Book ID
+            word: 단어 (내부에서 정규화)
+            entry: 연결할 항목
+        """
+        try:
+            book_key = self._book_key(book_id)
+            async with self._get_redis().pipeline(transaction=False) as pipe:
+                pipe.hset(
+                    book_key,
+                    normalize_word(word),
+                    json.dumps({"path": entry.path, "voice_id": entry.voice_id}),
+                )
+                pipe.expire(book_key, self.book_ttl)
+                await pipe.execute()
+        except Exception as e:
+            logger.warning(f"Word index link error: book={book_id}, word={word}: {e}")
+
+    async def unlink_book(self, book_id: BookId) -> None:
+        """
+        Book별 인덱스 삭제 (전역 오디오는 다른 책이 공유하므로 유지)
+
+        Args:
+            book_id: Book ID
+        """
+        try:
+            await self._get_redis().delete(self._book_key(book_id))
+        except Exception as e:
+            logger.warning(f"Word index unlink error: book={book_id}: {e}")
+
+    async def close(self) -> None:
+        """Redis 연결 종료"""
+        if self._redis is not None:
+            await self._redis.close()
+            self._redis = None
+
+
+# 전역 WordAudioIndex 인스턴스 (lazy)
+_word_audio_index: Optional[WordAudioIndex] = None
+
+
+def get_word_audio_index() -> WordAudioIndex:
+    """WordAudioIndex 싱글톤 반환"""
+    global _word_audio_index
+    if _word_audio_index is None:
+        _word_audio_index = WordAudioIndex()
+    return _word_audio_index
+
+
+async def close_word_audio_index() -> None:
+    """WordAudioIndex 종료 (lifespan 종료 시 호출)"""
+    global _word_audio_index
+    if _word_audio_index is not None:
+        await _word_audio_index.close()
+        _word_audio_index = None
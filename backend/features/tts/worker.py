@@ -1,15 +1,19 @@
 import asyncio
 import json
 import logging
+import threading
+import time
 import uuid
-from typing import Set, Optional
+from typing import Any, Dict, List, Optional, Set
 import redis.asyncio as aioredis
-from sqlalchemy import select
+from sqlalchemy import select, update
 
 from backend.core.config import settings
 from backend.core.events.types import EventType
 from backend.core.database.session import AsyncSessionLocal
-from backend.features.storybook.models import DialogueAudio
+from backend.core.limiters import Priority, get_limiters
+from backend.features.storybook.models import Dialogue, DialogueAudio, Page
+from backend.features.storybook.progress import PAGE_EVENT, publish_book_event
 from backend.infrastructure.ai.factory import AIProviderFactory
 from backend.core.logging import configure_logging, get_logger
 from backend.core.dependencies import get_storage_service
@@ -19,24 +23,110 @@ from backend.infrastructure.storage.base import AbstractStorageService
 # logging.basicConfig(level=logging.INFO) # Removed in favor of structlog
 logger = get_logger(__name__)
 
+TTS_STREAM = f"events:{EventType.TTS_CREATION.value}"
+TTS_WORKER_GROUP = "tts_workers"
+# K회 이상 전달되어도 ACK되지 않은 메시지(또는 형식이 잘못된 메시지)를 옮기는 Stream
+TTS_DEAD_LETTER_STREAM = f"{TTS_STREAM}:dead"
+# 워커별 메트릭 스냅샷 키 (API 프로세스에서 모든 워커의 메트릭을 모아 조회)
+TTS_WORKER_METRICS_PREFIX = "tts_workers:metrics:"
+
+
+def _stream_id_ms(msg_id: str) -> Optional[int]:
+    """Stream 메시지 ID(<ms>-<seq>)에서 enqueue 시각(ms) 추출"""
+    try:
+        return int(msg_id.split("-", 1)[0])
+    except (ValueError, AttributeError):
+        return None
+
+
+class TTSWorkerMetrics:
+    """TTS 워커 프로세스 메트릭 수집"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.processed = 0
+        self.failed = 0
+        self.reclaimed = 0
+        self.dead_lettered = 0
+        self.total_processing_time = 0.0
+        self.max_processing_time = 0.0
+        self.total_queue_time = 0.0
+
+    def record_processed(self, processing_time: float, queue_time: float):
+        """처리 완료 기록 (processing: 처리 시간, queue: enqueue → 처리 시작 대기 시간)"""
+        with self._lock:
+            self.processed += 1
+            self.total_processing_time += processing_time
+            self.max_processing_time = max(self.max_processing_time, processing_time)
+            self.total_queue_time += queue_time
+
+    def record_failed(self):
+        """처리 실패 기록 (ACK되지 않아 재전달 대상)"""
+        with self._lock:
+            self.failed += 1
+
+    def record_reclaimed(self, count: int):
+        """XAUTOCLAIM으로 회수한 메시지 수 기록"""
+        with self._lock:
+            self.reclaimed += count
+
+    def record_dead_lettered(self):
+        """Dead-letter Stream 이동 기록"""
+        with self._lock:
+            self.dead_lettered += 1
+
+    def get_stats(self, in_flight: int = 0) -> Dict:
+        """통계 정보 반환"""
+        with self._lock:
+            processed = self.processed
+            return {
+                "in_flight": in_flight,
+                "processed": processed,
+                "failed": self.failed,
+                "reclaimed": self.reclaimed,
+                "dead_lettered": self.dead_lettered,
+                "avg_latency_ms": round(self.total_processing_time / processed * 1000, 2) if processed else 0.0,
+                "max_latency_ms": round(self.max_processing_time * 1000, 2),
+                "avg_queue_time_ms": round(self.total_queue_time / processed * 1000, 2) if processed else 0.0,
+            }
+
+
 class TTSWorker:
     """
     TTS Worker (Consumer)
     Redis Streams에서 작업을 가져와 ElevenLabs TTS를 생성하고 파일로 저장합니다.
-    Semaphore(3)을 사용하여 동시 요청 수를 제한합니다 (총 5개 중 2개는 실시간 Word TTS용으로 확보).
+
+    - Semaphore(tts_worker_concurrency, 기본 3)로 프로세스당 동시 처리 수 제한
+    - ElevenLabs 호출은 core.limiters의 BATCH 우선순위로 전체 프로세스 공유 한도 적용
+      (reserved 슬롯은 실시간 Word TTS용으로 확보)
+    - 빈 슬롯 수만큼 한 번에 XREADGROUP
+    - visibility timeout 동안 ACK되지 않은 메시지는 XAUTOCLAIM으로 회수하여 재처리
+    - tts_worker_max_deliveries회 넘게 전달된 메시지는 Dead-letter Stream으로 이동
+
+    여러 프로세스로 수평 확장 가능 (API 프로세스와 독립 실행)
     """
 
-    def __init__(self, storage_service: Optional[AbstractStorageService] = None):
+    def __init__(
+        self,
+        storage_service: Optional[AbstractStorageService] = None,
+        concurrency: Optional[int] = None,
+    ):
         self.redis_url = settings.redis_url
-        self.stream_name = f"events:{EventType.TTS_CREATION.value}"
-        self.group_name = "tts_workers"
+        self.stream_name = TTS_STREAM
+        self.group_name = TTS_WORKER_GROUP
+        self.dead_letter_stream = TTS_DEAD_LETTER_STREAM
         # Consumer name includes UUID to identify instances
         self.consumer_name = f"worker-{str(uuid.uuid4())[:8]}"
 
-        # Concurrency Control: Max 3 concurrent tasks
-        self.semaphore = asyncio.Semaphore(3)
+        # Concurrency Control
+        self.semaphore = asyncio.Semaphore(concurrency or settings.tts_worker_concurrency)
         self.active_tasks: Set[asyncio.Task] = set()
         self.running = False
+        self.redis: Optional[aioredis.Redis] = None
+
+        self.visibility_timeout = settings.tts_worker_visibility_timeout
+        self.max_deliveries = settings.tts_worker_max_deliveries
+        self.metrics = TTSWorkerMetrics()
 
         self.ai_factory = AIProviderFactory()
 
@@ -48,7 +138,7 @@ class TTSWorker:
         logger.info(f"Starting TTS Worker: {self.consumer_name} (Redis: {self.redis_url})")
         
         # Redis Connection
-        self.redis = await aioredis.from_url(self.redis_url, decode_responses=True)
+        self.redis = aioredis.from_url(self.redis_url, decode_responses=True)
         
         # Ensure Consumer Group Exists
         try:
@@ -60,51 +150,175 @@ class TTSWorker:
             logger.info(f"Consumer group already exists: {self.group_name}")
         
         self.running = True
+        background = [
+            asyncio.create_task(self._reclaim_loop()),
+            asyncio.create_task(self._metrics_loop()),
+        ]
         
         try:
             while self.running:
-                # 1. Acquire Semaphore Slot
-                # 빈 슬롯이 생길 때까지 대기
-                await self.semaphore.acquire()
+                # 1. 빈 슬롯 확보 (최소 1개가 생길 때까지 대기)
+                slots = await self._acquire_slots()
                 
                 try:
-                    # 2. Read from Redis (Blocking for 1s)
-                    # 한 번에 1개씩만 가져와서 태스크로 실행 (세마포어 루프 구조상 1개씩 처리하는게 깔끔함)
+                    # 2. 빈 슬롯 수만큼 한 번에 읽기 (Blocking for 1s)
                     messages = await self.redis.xreadgroup(
                         self.group_name,
                         self.consumer_name,
                         {self.stream_name: ">"},
-                        count=1,
+                        count=slots,
                         block=1000
                     )
                     
-                    if not messages:
-                        # 메시지가 없으면 슬롯 반환하고 다시 대기
-                        self.semaphore.release()
-                        continue
-                    
-                    # 3. Process Messages
-                    for stream, msgs in messages:
+                    # 3. Process Messages (메시지 1개당 슬롯 1개를 넘겨줌)
+                    for stream, msgs in messages or []:
                         for msg_id, data in msgs:
                             logger.info(f"Received message: {msg_id}", extra={"stream": stream, "data": data})
-                            
-                            # Fire and forget (bg task) - Semaphore is held!
-                            task = asyncio.create_task(self.process_message_wrapper(msg_id, data))
-                            self.active_tasks.add(task)
-                            
-                            # Cleanup callback
-                            task.add_done_callback(self.active_tasks.discard)
+                            self._spawn(msg_id, data)
+                            slots -= 1
                             
                 except Exception as e:
                     logger.error(f"Error in main loop: {e}", exc_info=True)
-                    self.semaphore.release()
                     await asyncio.sleep(1)
+                finally:
+                    # 사용하지 않은 슬롯 반환
+                    self._release_slots(slots)
                     
         except asyncio.CancelledError:
             logger.info("Worker cancelled")
         finally:
+            for task in background:
+                task.cancel()
+            await asyncio.gather(*background, return_exceptions=True)
             await self.shutdown()
 
+    async def _acquire_slots(self) -> int:
+        """세마포어 슬롯을 1개 이상 확보 (남은 빈 슬롯은 대기 없이 모두 확보)"""
+        await self.semaphore.acquire()
+        slots = 1
+        while not self.semaphore.locked():
+            await self.semaphore.acquire()
+            slots += 1
+        return slots
+
+    def _release_slots(self, slots: int) -> None:
+        for _ in range(slots):
+            self.semaphore.release()
+
+    def _spawn(self, msg_id: str, data: Dict[str, str]) -> None:
+        """메시지 처리 태스크 생성 (세마포어 슬롯은 이미 확보된 상태)"""
+        task = asyncio.create_task(self.process_message_wrapper(msg_id, data))
+        self.active_tasks.add(task)
+        task.add_done_callback(self.active_tasks.discard)
+
+    async def _reclaim_loop(self):
+        """주기적으로 죽은/멈춘 Worker의 미처리 메시지 회수"""
+        interval = max(1, self.visibility_timeout // 2)
+        while self.running:
+            await asyncio.sleep(interval)
+            try:
+                await self.reclaim()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Failed to reclaim TTS messages: {e}", exc_info=True)
+
+    async def reclaim(self) -> int:
+        """
+        visibility timeout 동안 ACK되지 않은 메시지 회수 (XAUTOCLAIM)
+
+        빈 슬롯 수만큼 가져와 재처리하고, 전달 횟수가 max_deliveries를 넘은 메시지는
+        Dead-letter Stream으로 옮깁니다.
+
+        Returns:
+            int: 재처리를 시작한 메시지 수
+        """
+        slots = await self._acquire_slots()
+        spawned = 0
+        try:
+            result = await self.redis.xautoclaim(
+                self.stream_name,
+                self.group_name,
+                self.consumer_name,
+                min_idle_time=self.visibility_timeout * 1000,
+                count=slots,
+            )
+            claimed = [(msg_id, data) for msg_id, data in (result[1] if result else []) if data]
+            if claimed:
+                self.metrics.record_reclaimed(len(claimed))
+
+            for msg_id, data in claimed:
+                deliveries = await self._delivery_count(msg_id)
+                if deliveries > self.max_deliveries:
+                    await self.dead_letter(msg_id, data, f"exceeded {self.max_deliveries} deliveries")
+                    continue
+
+                logger.warning(
+                    f"Reclaimed stale TTS message: {msg_id} (delivery {deliveries})",
+                    extra={"data": data},
+                )
+                self._spawn(msg_id, data)
+                slots -= 1
+                spawned += 1
+        finally:
+            self._release_slots(slots)
+        return spawned
+
+    async def _delivery_count(self, msg_id: str) -> int:
+        """PEL에 기록된 메시지 전달 횟수 (XAUTOCLAIM 시점에 1 증가)"""
+        pending = await self.redis.xpending_range(
+            self.stream_name, self.group_name, min=msg_id, max=msg_id, count=1
+        )
+        return pending[0]["times_delivered"] if pending else 1
+
+    async def dead_letter(self, msg_id: str, data: Dict[str, str], reason: str):
+        """메시지를 Dead-letter Stream으로 옮기고 ACK (DialogueAudio는 FAILED 처리)"""
+        await self.redis.xadd(
+            self.dead_letter_stream,
+            {
+                **data,
+                "original_id": msg_id,
+                "reason": reason,
+                "consumer": self.consumer_name,
+            },
+        )
+        await self.redis.xack(self.stream_name, self.group_name, msg_id)
+        self.metrics.record_dead_lettered()
+        logger.error(f"TTS message moved to dead-letter stream: {msg_id} ({reason})")
+
+        try:
+            payload = json.loads(data.get("event", "{}")).get("payload", {})
+            if payload.get("uuid"):
+                await self._mark_failed(payload["uuid"])
+        except Exception as e:
+            logger.error(f"Failed to mark dead-lettered DialogueAudio as FAILED: {e}")
+
+    async def _mark_failed(self, dialogue_audio_id_str: str):
+        async with AsyncSessionLocal() as session:
+            await session.execute(
+                update(DialogueAudio)
+                .where(DialogueAudio.id == uuid.UUID(dialogue_audio_id_str))
+                .values(status="FAILED")
+            )
+            await session.commit()
+
+    async def _metrics_loop(self):
+        """워커 메트릭 스냅샷을 Redis에 주기적으로 게시 (collect_tts_metrics에서 집계)"""
+        interval = settings.tts_worker_metrics_interval
+        key = f"{TTS_WORKER_METRICS_PREFIX}{self.consumer_name}"
+        while self.running:
+            try:
+                await self.redis.set(key, json.dumps(self.get_stats()), ex=interval * 3)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning(f"Failed to publish TTS worker metrics: {e}")
+            await asyncio.sleep(interval)
+
+    def get_stats(self) -> Dict:
+        """이 워커 프로세스의 메트릭"""
+        return {"consumer": self.consumer_name, **self.metrics.get_stats(len(self.active_tasks))}
+
     async def process_message_wrapper(self, msg_id, data):
         """메시지 처리 래퍼 (세마포어 반환 보장)"""
         try:
@@ -115,13 +329,17 @@ class TTSWorker:
 
     async def process_message(self, msg_id, data):
         """실제 메시지 처리 로직"""
+        started = time.monotonic()
+        enqueued_ms = _stream_id_ms(msg_id)
+        queue_time = max(0.0, time.time() - enqueued_ms / 1000) if enqueued_ms else 0.0
+
         try:
             # 1. Parse Event
             event_json = data.get("event")
             if not event_json:
                 logger.error(f"Invalid message format (missing 'event'): {data}")
-                # 형식이 잘못된 메시지는 ACK 처리하여 다시 안 받음 (Dead Letter Queue 개념이 없으므로 Log만)
-                await self.redis.xack(self.stream_name, self.group_name, msg_id)
+                # 형식이 잘못된 메시지는 재시도해도 실패하므로 바로 Dead-letter 처리
+                await self.dead_letter(msg_id, data, "missing event")
                 return
 
             event_dict = json.loads(event_json)
@@ -132,7 +350,7 @@ class TTSWorker:
             
             if not uuid_str or not text:
                 logger.error(f"Invalid payload (missing uuid/text): {payload}")
-                await self.redis.xack(self.stream_name, self.group_name, msg_id)
+                await self.dead_letter(msg_id, data, "missing uuid/text")
                 return
 
             # 2. Process Logic
@@ -140,11 +358,16 @@ class TTSWorker:
             
             # 3. ACK
             await self.redis.xack(self.stream_name, self.group_name, msg_id)
+            self.metrics.record_processed(time.monotonic() - started, queue_time)
             logger.info(f"Task successfully processed and ACKed: {msg_id}")
             
+        except asyncio.CancelledError:
+            # 종료 중: ACK 하지 않음 → 다른 Worker가 회수
+            raise
         except Exception as e:
+            self.metrics.record_failed()
             logger.error(f"Failed to process message {msg_id}: {e}", exc_info=True)
-            # 실패 시 ACK 안함 -> 나중에 재처리 (XCLAIM 등 필요하지만 여기선 생략)
+            # 실패 시 ACK 안함 → visibility timeout 이후 XAUTOCLAIM으로 재처리
 
     async def handle_tts_task(self, dialogue_audio_id_str: str, text: str):
         """DB 조회, API 호출, 파일 저장"""
@@ -164,40 +387,32 @@ class TTSWorker:
                 record.status = "PROCESSING"
                 await session.commit()
                 
-                # 2. Call ElevenLabs API
+                # 2~3. ElevenLabs 스트리밍 → StorageService 저장 (청크가 도착하는 대로 전달)
                 provider = self.ai_factory.get_tts_provider()
                 # voice_id가 없으면 Provider 기본값 사용되지만, DB에 저장된 voice_id 사용
                 voice_id = record.voice_id
-                
-                try:
-                    audio_bytes = await provider.text_to_speech(
-                        text=text,
-                        voice_id=voice_id
-                    )
-                except Exception as api_error:
-                    logger.error(f"API Error: {api_error}")
-                    record.status = "FAILED"
-                    await session.commit()
-                    return
 
-                # 3. Save via StorageService (환경 독립적: Local/S3 자동 분기)
                 try:
-                    file_path = await self.storage_service.save(
-                        file_data=audio_bytes,
-                        path=record.audio_url.strip("/"),
-                        content_type="audio/mpeg"
-                    )
-                    logger.info(f"TTS audio saved via StorageService: {file_path}")
-                except Exception as storage_error:
-                    logger.error(f"Storage Error: {storage_error}")
+                    # 전체 프로세스 공유 한도 (실시간 Word TTS용 reserved 슬롯은 사용하지 않음)
+                    async with get_limiters().limit(settings.ai_tts_provider, "tts", Priority.BATCH):
+                        file_path = await self.storage_service.save_stream(
+                            provider.text_to_speech_stream(text=text, voice_id=voice_id),
+                            path=record.audio_url.strip("/"),
+                            content_type="audio/mpeg"
+                        )
+                    logger.info(f"TTS audio streamed to storage: {file_path}")
+                except Exception as tts_error:
+                    logger.error(f"TTS/Storage Error: {tts_error}")
                     record.status = "FAILED"
                     await session.commit()
+                    await self._publish_audio_event(session, record)
                     return
 
                 # 4. Update Status: COMPLETED
                 record.status = "COMPLETED"
                 # Duration은 mp3 파싱 필요하므로 생략 (또는 provider가 반환하면 좋음)
                 await session.commit()
+                await self._publish_audio_event(session, record)
                 
             except Exception as e:
                 logger.error(f"DB/File Error during task: {e}", exc_info=True)
@@ -207,24 +422,97 @@ class TTSWorker:
                 # We do minimal implementation here.
                 raise
 
+    async def _publish_audio_event(self, session, record: DialogueAudio) -> None:
+        """대사 오디오 완료/실패를 Book 진행 이벤트로 발행 (page N, dialogue M)"""
+        try:
+            row = (
+                await session.execute(
+                    select(Page.book_id, Page.sequence, Dialogue.sequence)
+                    .join(Dialogue, Dialogue.page_id == Page.id)
+                    .where(Dialogue.id == record.dialogue_id)
+                )
+            ).first()
+        except Exception as e:
+            logger.warning(f"Failed to resolve page for DialogueAudio {record.id}: {e}")
+            return
+        if not row:
+            return
+
+        book_id, page_sequence, dialogue_sequence = row
+        await publish_book_event(
+            book_id,
+            PAGE_EVENT,
+            stage="audio",
+            page=page_sequence,
+            dialogue=dialogue_sequence,
+            dialogue_audio_id=str(record.id),
+            status=record.status.lower(),
+        )
+
     async def shutdown(self):
         """종료 처리"""
         logger.info("Shutting down worker...")
-        if self.redis:
-            await self.redis.close()
-        
-        # Cancel active tasks
+        self.running = False
+
+        # Cancel active tasks (ACK되지 않은 메시지는 다른 Worker가 회수)
         if self.active_tasks:
             for task in self.active_tasks:
                 task.cancel()
             await asyncio.gather(*self.active_tasks, return_exceptions=True)
 
+        if self.redis:
+            await self.redis.close()
+            self.redis = None
+
+
+async def collect_tts_metrics(redis: aioredis.Redis) -> Dict[str, Any]:
+    """
+    TTS 큐/워커 메트릭 집계 (모든 워커 프로세스 대상)
+
+    Args:
+        redis: Redis 클라이언트 (decode_responses=True)
+
+    Returns:
+        dict: 큐 깊이, 지연(lag), Dead-letter 수, 워커별 in-flight/처리 지연
+    """
+    stream_length = await redis.xlen(TTS_STREAM)
+    dead_letter_length = await redis.xlen(TTS_DEAD_LETTER_STREAM)
+
+    group: Dict[str, Any] = {}
+    try:
+        for info in await redis.xinfo_groups(TTS_STREAM):
+            if info.get("name") == TTS_WORKER_GROUP:
+                group = info
+                break
+    except aioredis.ResponseError:
+        pass
+
+    workers: List[Dict[str, Any]] = []
+    async for key in redis.scan_iter(match=f"{TTS_WORKER_METRICS_PREFIX}*"):
+        snapshot = await redis.get(key)
+        if snapshot:
+            workers.append(json.loads(snapshot))
+
+    pending = group.get("pending", 0)
+    # lag: 아직 어떤 워커에도 전달되지 않은 메시지 수 (Redis 7+)
+    lag = group.get("lag")
+
+    return {
+        "stream_length": stream_length,
+        "pending": pending,
+        "lag": lag,
+        "queue_depth": pending + (lag or 0),
+        "dead_letter_length": dead_letter_length,
+        "in_flight": sum(w.get("in_flight", 0) for w in workers),
+        "workers": workers,
+    }
+
+
 if __name__ == "__main__":
+    # 전용 워커 프로세스 (API에서는 TTS_EMBEDDED_WORKER=false)
+    #   python -m backend.features.tts.worker
     configure_logging() # 로깅 설정 초기화
-    worker = TTSWorker()
-    loop = asyncio.get_event_loop()
     try:
-        loop.run_until_complete(worker.start())
+        asyncio.run(TTSWorker().start())
     except KeyboardInterrupt:
         logger.info("KeyboardInterrupt received")
-        loop.run_until_complete(worker.shutdown())
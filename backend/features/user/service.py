@@ -9,6 +9,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from backend.features.auth.models import User
 from backend.features.auth.repository import UserRepository
+from backend.core.auth.principal import UserPrincipalCache
 from backend.core.auth.providers.credentials import CredentialsAuthProvider
 from .exceptions import (
     UserNotFoundException,
@@ -31,16 +32,19 @@ class UserService:
         user_repo: UserRepository,
         credentials_provider: CredentialsAuthProvider,
         db_session: AsyncSession,
+        principal_cache: Optional[UserPrincipalCache] = None,
     ):
         """
         Args:
             user_repo: 사용자 레포지토리
             credentials_provider: 비밀번호 인증 제공자
             db_session: 비동기 데이터베이스 세션
+            principal_cache: 인증 사용자 캐시 (수정 / 삭제 시 무효화)
         """
         self.user_repo = user_repo
         self.credentials_provider = credentials_provider
         self.db_session = db_session
+        self.principal_cache = principal_cache
 
     async def get_user(self, user_id: uuid.UUID) -> User:
         """
@@ -89,7 +93,7 @@ class UserService:
         if password is not None:
             # 비밀번호 유효성 검증은 Pydantic 스키마에서 처리
             # 여기서는 해싱만 수행
-            user.password_hash = self.credentials_provider.hash_password(password)
+            user.password_hash = await self.credentials_provider.hash_password_async(password)
 
         # 저장
         try:
@@ -99,6 +103,7 @@ class UserService:
             await self.db_session.rollback()
             raise UserUpdateFailedException(reason=str(e))
 
+        await self._invalidate_principal(user_id)
         return user
 
     async def delete_user(self, user_id: uuid.UUID) -> bool:
@@ -123,8 +128,14 @@ class UserService:
         result = await self.user_repo.delete(user_id)
         if result:
             await self.db_session.commit()
+            await self._invalidate_principal(user_id)
         else:
             await self.db_session.rollback()
 
         return result
 
+    async def _invalidate_principal(self, user_id: uuid.UUID) -> None:
+        """인증 사용자 캐시 무효화 (모든 프로세스)"""
+        if self.principal_cache is not None:
+            await self.principal_cache.invalidate(user_id)
+
@@ -5,7 +5,7 @@ AI Provider Abstract Base Classes
 
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
-from typing import Optional, Dict, Any, List
+from typing import AsyncIterator, Optional, Dict, Any, List
 from enum import Enum
 
 
@@ -216,6 +216,57 @@ class TTSProvider(ABC):
         """
         pass
 
+    async def text_to_speech_stream(
+        self,
+        text: str,
+        voice_id: Optional[str] = None,
+        model_id: Optional[str] = None,
+        language: str = "en",
+        speed: float = 1.0,
+    ) -> AsyncIterator[bytes]:
+        """
+        텍스트를 음성으로 변환 (청크 스트리밍)
+
+        생성되는 대로 오디오 청크를 반환하므로 스토리지/클라이언트로 바로 전달할 수 있습니다.
+        기본 구현은 text_to_speech() 결과를 한 번에 반환하므로, 구현체에서 재정의해야 합니다.
+
+        Args:
+            text: 변환할 텍스트
+            voice_id: 음성 ID (provider별 다름)
+            model_id: 모델 ID
+            language: 언어 코드 (en, ko 등)
+            speed: 재생 속도 (0.5~2.0)
+
+        Yields:
+            bytes: 오디오 청크
+        """
+        yield await self.text_to_speech(
+            text=text, voice_id=voice_id, model_id=model_id, language=language, speed=speed
+        )
+
+    def get_synthesis_profile(
+        self,
+        text: str,
+        model_id: Optional[str] = None,
+    ) -> Dict[str, Optional[str]]:
+        """
+        텍스트에 실제 적용될 합성 설정 조회 (API 호출 없음)
+
+        동일한 텍스트/음성이라도 모델이나 발음 사전이 바뀌면 결과 오디오가 달라지므로,
+        콘텐츠 주소 기반 캐시 키에 사용합니다.
+
+        Args:
+            text: 변환할 텍스트
+            model_id: 모델 ID (None이면 provider 기본 선택)
+
+        Returns:
+            Dict[str, Optional[str]]: {
+                "model_id": str,
+                "pronunciation_version": Optional[str]
+            }
+        """
+        return {"model_id": model_id or "default", "pronunciation_version": None}
+
     @abstractmethod
     async def get_available_voices(self) -> List[Dict[str, Any]]:
         """
@@ -292,6 +343,9 @@ class VideoGenerationProvider(ABC):
     이미지로부터 비디오를 생성하는 Provider
     """
 
+    # 생성된 비디오 다운로드에 사용할 공유 HTTP 클라이언트 이름
+    download_client: str = "cdn"
+
     @abstractmethod
     async def generate_video(
         self,
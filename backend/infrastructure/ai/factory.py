@@ -6,6 +6,8 @@ AI Provider Factory
 from functools import lru_cache
 from typing import Optional
 
+import httpx
+
 from ...core.config import settings
 from .base import (
     StoryGenerationProvider,
@@ -21,11 +23,33 @@ from .providers.elevenlabs_tts import ElevenLabsTTSProvider
 from .providers.kling import KlingVideoProvider
 from .providers.runware import RunwareProvider
 from .providers.custom_model import CustomModelProvider
+from .http_client import HTTPClientRegistry, http_clients
 
 
 class AIProviderFactory:
     """AI Provider Factory"""
 
+    # Provider가 공유하는 HTTP 클라이언트 풀 (프로세스 전역, lifespan 종료 시 close)
+    http_clients: HTTPClientRegistry = http_clients
+
+    @staticmethod
+    def get_http_client(name: str) -> httpx.AsyncClient:
+        """
+        공유 HTTP 클라이언트 반환
+
+        Args:
+            name: 클라이언트 이름 (예: "runware", "kling", "google_ai", "cdn")
+
+        Returns:
+            httpx.AsyncClient: Keep-Alive 연결 풀을 가진 공유 클라이언트
+        """
+        return AIProviderFactory.http_clients.get(name)
+
+    @staticmethod
+    async def close() -> None:
+        """공유 HTTP 클라이언트 종료 (애플리케이션 종료 시 호출)"""
+        await AIProviderFactory.http_clients.aclose()
+
     @staticmethod
     def get_story_provider(provider_type: Optional[str] = None) -> StoryGenerationProvider:
         """스토리 생성 Provider 반환"""
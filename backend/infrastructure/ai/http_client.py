@@ -0,0 +1,276 @@
+"""
+AI HTTP Client Registry
+AI Provider / CDN 다운로드용 장수명 httpx 클라이언트 풀 (Keep-Alive, HTTP/2, Provider별 연결 제한)
+"""
+
+import asyncio
+import logging
+import threading
+import time
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Dict
+
+import httpx
+
+from ...core.config import settings
+
+logger = logging.getLogger(__name__)
+
+try:
+    import h2  # noqa: F401 - httpx HTTP/2 지원 여부 확인용
+
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+
+class PoolStats:
+    """연결 풀 대기 시간 / 요청 수 통계"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.requests = 0
+        self.errors = 0
+        self.total_wait_time = 0.0
+        self.max_wait_time = 0.0
+
+    def record_wait(self, duration: float):
+        """연결 획득 대기 시간 기록"""
+        with self._lock:
+            self.requests += 1
+            self.total_wait_time += duration
+            self.max_wait_time = max(self.max_wait_time, duration)
+
+    def record_error(self):
+        """요청 오류 기록"""
+        with self._lock:
+            self.errors += 1
+
+    @property
+    def avg_wait_time(self) -> float:
+        """평균 연결 획득 대기 시간 (초)"""
+        return self.total_wait_time / self.requests if self.requests > 0 else 0.0
+
+    def reset(self):
+        """통계 초기화"""
+        with self._lock:
+            self.requests = 0
+            self.errors = 0
+            self.total_wait_time = 0.0
+            self.max_wait_time = 0.0
+
+
+class InstrumentedTransport(httpx.AsyncHTTPTransport):
+    """
+    연결 풀 대기 시간을 측정하는 Transport
+
+    httpcore는 풀에서 연결을 배정받은 뒤에야 connect_tcp / send_request_headers 등
+    trace 이벤트를 발생시키므로, 요청 시작 ~ 첫 trace 이벤트까지를 대기 시간으로 기록합니다.
+    """
+
+    def __init__(self, stats: PoolStats, **kwargs):
+        super().__init__(**kwargs)
+        self.stats = stats
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        started = time.perf_counter()
+        acquired = False
+        user_trace = request.extensions.get("trace")
+
+        async def trace(event_name: str, info: Dict[str, Any]) -> None:
+            nonlocal acquired
+            if not acquired:
+                acquired = True
+                self.stats.record_wait(time.perf_counter() - started)
+            if user_trace is not None:
+                await user_trace(event_name, info)
+
+        request.extensions = {**request.extensions, "trace": trace}
+
+        try:
+            return await super().handle_async_request(request)
+        except Exception:
+            self.stats.record_error()
+            raise
+
+    def pool_snapshot(self) -> Dict[str, int]:
+        """현재 연결 풀 상태 (연결 수, 사용 중, 유휴, 대기 중 요청)"""
+        pool = getattr(self, "_pool", None)
+        connections = list(getattr(pool, "connections", []) or [])
+        requests = list(getattr(pool, "_requests", []) or [])
+
+        idle = sum(1 for c in connections if c.is_idle())
+        queued = sum(1 for r in requests if r.is_queued())
+
+        return {
+            "connections": len(connections),
+            "in_use": len(connections) - idle,
+            "idle": idle,
+            "active_requests": len(requests) - queued,
+            "queued_requests": queued,
+        }
+
+
+class _PooledClient:
+    """레지스트리 내부 항목 (클라이언트 + 생성된 이벤트 루프 + 통계)"""
+
+    def __init__(
+        self,
+        client: httpx.AsyncClient,
+        transport: InstrumentedTransport,
+        loop: asyncio.AbstractEventLoop,
+        limits: httpx.Limits,
+        http2: bool,
+    ):
+        self.client = client
+        self.transport = transport
+        self.loop = loop
+        self.limits = limits
+        self.http2 = http2
+
+
+class HTTPClientRegistry:
+    """
+    이름별 공유 httpx.AsyncClient 레지스트리
+
+    Features:
+    - 이름(Provider)별 클라이언트 1개를 재사용 → TCP/TLS 핸드셰이크 재사용 (Keep-Alive)
+    - h2 패키지가 설치되어 있으면 HTTP/2 사용 (서버가 지원하는 경우 ALPN으로 협상)
+    - Provider별 연결 풀 제한 (settings.http_pool_max_connections)
+    - 연결 풀 메트릭 (사용 중 / 유휴 / 대기 요청 / 연결 획득 대기 시간)
+
+    Example:
+        async with http_clients.client("runware") as client:
+            response = await client.post(url, json=payload)
+    """
+
+    def __init__(self):
+        self._clients: Dict[str, _PooledClient] = {}
+        self._stats: Dict[str, PoolStats] = {}
+
+    def limits_for(self, name: str) -> httpx.Limits:
+        """
+        Provider별 연결 풀 제한
+
+        Args:
+            name: 클라이언트 이름 (예: "runware", "kling", "google_ai", "cdn")
+
+        Returns:
+            httpx.Limits: 연결 제한 설정
+        """
+        max_connections = settings.http_pool_max_connections.get(
+            name, settings.http_max_connections
+        )
+        return httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_connections,
+            keepalive_expiry=settings.http_keepalive_expiry,
+        )
+
+    def get(self, name: str) -> httpx.AsyncClient:
+        """
+        공유 클라이언트 반환 (없으면 생성)
+
+        클라이언트의 연결은 생성된 이벤트 루프에 묶이므로, 다른 루프에서 호출되면
+        새 클라이언트를 만듭니다 (이전 루프의 클라이언트는 해당 루프와 함께 폐기).
+
+        Args:
+            name: 클라이언트 이름
+
+        Returns:
+            httpx.AsyncClient: 공유 클라이언트 (호출자가 닫으면 안 됨)
+        """
+        loop = asyncio.get_running_loop()
+        entry = self._clients.get(name)
+
+        if entry is not None and entry.loop is loop and not entry.client.is_closed:
+            return entry.client
+
+        stats = self._stats.setdefault(name, PoolStats())
+        limits = self.limits_for(name)
+        http2 = settings.http2_enabled and HTTP2_AVAILABLE
+        transport = InstrumentedTransport(stats=stats, limits=limits, http2=http2)
+        client = httpx.AsyncClient(
+            transport=transport,
+            timeout=httpx.Timeout(settings.http_timeout, read=settings.http_read_timeout),
+            limits=limits,
+            http2=http2,
+        )
+        self._clients[name] = _PooledClient(client, transport, loop, limits, http2)
+
+        logger.info(
+            f"[HTTPClientRegistry] Created client '{name}' "
+            f"(max_connections={limits.max_connections}, http2={http2})"
+        )
+        return client
+
+    @asynccontextmanager
+    async def client(self, name: str) -> AsyncIterator[httpx.AsyncClient]:
+        """
+        공유 클라이언트 컨텍스트 (블록 종료 시 클라이언트를 닫지 않음)
+
+        기존 `async with httpx.AsyncClient(...) as client:` 패턴을 그대로 대체합니다.
+
+        Args:
+            name: 클라이언트 이름
+        """
+        yield self.get(name)
+
+    def get_stats(self) -> Dict[str, Dict[str, Any]]:
+        """
+        클라이언트별 연결 풀 메트릭
+
+        Returns:
+            Dict[str, Dict[str, Any]]: 이름 → 메트릭
+                - max_connections: 최대 연결 수
+                - connections / in_use / idle: 현재 연결 수 / 사용 중 / 유휴
+                - active_requests / queued_requests: 처리 중 / 연결 대기 중 요청 수
+                - requests / errors: 누적 요청 / 오류 수
+                - avg_wait_time_ms / max_wait_time_ms: 연결 획득 대기 시간 (밀리초)
+        """
+        stats: Dict[str, Dict[str, Any]] = {}
+
+        for name, pool_stats in self._stats.items():
+            entry = self._clients.get(name)
+            snapshot = (
+                entry.transport.pool_snapshot()
+                if entry is not None and not entry.client.is_closed
+                else {
+                    "connections": 0,
+                    "in_use": 0,
+                    "idle": 0,
+                    "active_requests": 0,
+                    "queued_requests": 0,
+                }
+            )
+            stats[name] = {
+                "max_connections": entry.limits.max_connections if entry else None,
+                "http2": entry.http2 if entry else False,
+                **snapshot,
+                "requests": pool_stats.requests,
+                "errors": pool_stats.errors,
+                "avg_wait_time_ms": round(pool_stats.avg_wait_time * 1000, 3),
+                "max_wait_time_ms": round(pool_stats.max_wait_time * 1000, 3),
+            }
+
+        return stats
+
+    async def aclose(self) -> None:
+        """모든 클라이언트 종료 (현재 이벤트 루프에 속한 클라이언트만 graceful close)"""
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            loop = None
+
+        clients, self._clients = self._clients, {}
+        for name, entry in clients.items():
+            if entry.loop is not loop or entry.client.is_closed:
+                continue
+            try:
+                await entry.client.aclose()
+            except Exception as e:
+                logger.warning(f"[HTTPClientRegistry] Failed to close client '{name}': {e}")
+
+
+# 프로세스 전역 레지스트리 (AIProviderFactory.http_clients로 노출)
+http_clients = HTTPClientRegistry()
@@ -0,0 +1,291 @@
+"""
+Task Status Poller
+프로세스 전역 비동기 작업 상태 폴러 (여러 Book의 작업을 묶어서 일괄 조회)
+"""
+
+import asyncio
+import logging
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Dict, List, Literal, Optional, Tuple
+
+from ...core.config import settings
+
+logger = logging.getLogger(__name__)
+
+# 폴링 종료 상태
+_FINAL_STATUSES = {"completed", "failed"}
+
+BatchStatusChecker = Callable[[List[str]], Awaitable[Dict[str, Dict[str, Any]]]]
+
+
+@dataclass
+class _PendingTask:
+    """폴링 대기 중인 작업"""
+
+    task_id: str
+    future: asyncio.Future
+    started_at: float
+    next_check_at: float
+    waiters: int = 1
+    checks: int = field(default=0)
+
+
+class TaskStatusPoller:
+    """
+    비동기 작업 상태 폴러
+
+    Features:
+    - 모든 Book의 대기 작업을 하나의 백그라운드 루프에서 폴링
+    - batch_size 단위로 묶어 한 번의 요청으로 조회 (Runware getResponse 배열)
+    - 결과는 작업별 Future로 분배 (wait / wait_many)
+    - 작업별 폴링 간격을 대기 시간에 비례해 늘림 (min_interval → max_interval)
+
+    Example:
+        poller = get_task_poller(image_provider, "image")
+        statuses = await poller.wait_many(task_uuids, timeout=300)
+        # {task_uuid: {"status": "completed", ...} 또는 None(타임아웃)}
+    """
+
+    def __init__(
+        self,
+        check_batch: BatchStatusChecker,
+        name: str,
+        max_interval: float,
+        min_interval: Optional[float] = None,
+        backoff_factor: Optional[float] = None,
+        batch_size: Optional[int] = None,
+    ):
+        """
+        Args:
+            check_batch: task_id 리스트 → {task_id: 상태 dict} 조회 함수
+            name: 로깅용 이름 (예: "RunwareProvider:image")
+            max_interval: 최대 폴링 간격 (초)
+            min_interval: 최소 폴링 간격 (초, 기본값: settings.task_poll_min_interval)
+            backoff_factor: 대기 시간 대비 폴링 간격 비율 (기본값: settings.task_poll_backoff_factor)
+            batch_size: 요청당 최대 작업 수 (기본값: settings.task_poll_batch_size)
+        """
+        self.check_batch = check_batch
+        self.name = name
+        self.max_interval = max_interval
+        self.min_interval = min(
+            min_interval if min_interval is not None else settings.task_poll_min_interval,
+            max_interval,
+        )
+        self.backoff_factor = (
+            backoff_factor if backoff_factor is not None else settings.task_poll_backoff_factor
+        )
+        self.batch_size = batch_size or settings.task_poll_batch_size
+
+        self._pending: Dict[str, _PendingTask] = {}
+        self._wakeup: Optional[asyncio.Event] = None
+        self._loop_task: Optional[asyncio.Task] = None
+
+    def next_interval(self, age: float) -> float:
+        """
+        대기 시간에 따른 다음 폴링 간격
+
+        갓 제출된 작업은 자주, 오래 걸리는 작업은 드물게 확인합니다.
+
+        Args:
+            age: 작업 제출 후 경과 시간 (초)
+
+        Returns:
+            float: min_interval ~ max_interval 사이의 간격 (초)
+        """
+        return max(self.min_interval, min(self.max_interval, age * self.backoff_factor))
+
+    @property
+    def pending_count(self) -> int:
+        """폴링 대기 중인 작업 수"""
+        return len(self._pending)
+
+    async def wait(self, task_id: str, timeout: float) -> Optional[Dict[str, Any]]:
+        """
+        작업이 종료(completed/failed)될 때까지 대기
+
+        Args:
+            task_id: 작업 ID
+            timeout: 최대 대기 시간 (초)
+
+        Returns:
+            Optional[Dict[str, Any]]: 최종 상태 dict, 타임아웃 시 None
+        """
+        loop = asyncio.get_running_loop()
+        entry = self._pending.get(task_id)
+
+        if entry is not None and entry.future.get_loop() is loop:
+            entry.waiters += 1
+        else:
+            now = loop.time()
+            entry = _PendingTask(
+                task_id=task_id,
+                future=loop.create_future(),
+                started_at=now,
+                next_check_at=now + self.min_interval,
+            )
+            self._pending[task_id] = entry
+            self._ensure_running(loop)
+
+        try:
+            return await asyncio.wait_for(asyncio.shield(entry.future), timeout)
+        except asyncio.TimeoutError:
+            return None
+        finally:
+            entry.waiters -= 1
+            if entry.waiters <= 0 and self._pending.get(task_id) is entry:
+                del self._pending[task_id]
+                if not entry.future.done():
+                    entry.future.cancel()
+
+    async def wait_many(
+        self, task_ids: List[str], timeout: float
+    ) -> Dict[str, Optional[Dict[str, Any]]]:
+        """
+        여러 작업을 동시에 대기
+
+        Args:
+            task_ids: 작업 ID 리스트
+            timeout: 최대 대기 시간 (초, 전체 공통)
+
+        Returns:
+            Dict[str, Optional[Dict[str, Any]]]: task_id → 최종 상태 dict (타임아웃 시 None)
+        """
+        results = await asyncio.gather(*(self.wait(task_id, timeout) for task_id in task_ids))
+        return dict(zip(task_ids, results))
+
+    def _ensure_running(self, loop: asyncio.AbstractEventLoop) -> None:
+        """폴링 루프 시작 (대기 작업이 생기면 자동 시작, 없으면 자동 종료)"""
+        if (
+            self._loop_task is not None
+            and not self._loop_task.done()
+            and self._loop_task.get_loop() is loop
+        ):
+            self._wakeup.set()
+            return
+
+        # 다른 이벤트 루프에서 남은 작업은 폐기 (Future가 해당 루프에 묶여 있음)
+        self._pending = {
+            task_id: entry
+            for task_id, entry in self._pending.items()
+            if entry.future.get_loop() is loop
+        }
+        self._wakeup = asyncio.Event()
+        self._loop_task = loop.create_task(self._run(), name=f"task_poller:{self.name}")
+
+    async def _run(self) -> None:
+        """폴링 루프: 확인 시점이 된 작업만 모아서 batch 조회"""
+        loop = asyncio.get_running_loop()
+
+        while self._pending:
+            now = loop.time()
+            due = [e for e in self._pending.values() if e.next_check_at <= now]
+
+            if not due:
+                sleep_for = min(e.next_check_at for e in self._pending.values()) - now
+                self._wakeup.clear()
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), timeout=sleep_for)
+                except asyncio.TimeoutError:
+                    pass
+                continue
+
+            batches = [due[i:i + self.batch_size] for i in range(0, len(due), self.batch_size)]
+            await asyncio.gather(*(self._poll_batch(batch) for batch in batches))
+
+        logger.debug(f"[TaskPoller] {self.name}: no pending tasks, loop stopped")
+
+    async def _poll_batch(self, batch: List[_PendingTask]) -> None:
+        """batch 1개 조회 후 결과 분배"""
+        loop = asyncio.get_running_loop()
+        task_ids = [e.task_id for e in batch]
+
+        try:
+            statuses = await self.check_batch(task_ids)
+        except Exception as e:
+            logger.error(f"[TaskPoller] {self.name}: status check error ({len(task_ids)} tasks): {e}")
+            statuses = {}
+
+        now = loop.time()
+        done = 0
+        for entry in batch:
+            entry.checks += 1
+            status = statuses.get(entry.task_id)
+
+            if status is not None and status.get("status") in _FINAL_STATUSES:
+                if not entry.future.done():
+                    entry.future.set_result(status)
+                if self._pending.get(entry.task_id) is entry:
+                    del self._pending[entry.task_id]
+                done += 1
+            else:
+                entry.next_check_at = now + self.next_interval(now - entry.started_at)
+
+        logger.debug(
+            f"[TaskPoller] {self.name}: checked {len(batch)} tasks in 1 request, "
+            f"{done} finished, {len(self._pending)} pending"
+        )
+
+
+# ============================================================
+# Process-wide Registry
+# ============================================================
+
+_pollers: Dict[Tuple[type, str], TaskStatusPoller] = {}
+
+
+def _build_checker(provider: Any, kind: Literal["image", "video"]) -> BatchStatusChecker:
+    """
+    Provider별 일괄 조회 함수 생성
+
+    - supports_batch_status=True: check_images_status / check_videos_status (단일 요청)
+    - 그 외: check_image_status / check_video_status 동시 호출 (폴링 루프는 공유)
+    """
+    if getattr(provider, "supports_batch_status", False) is True:
+        return getattr(provider, f"check_{kind}s_status")
+
+    check_single = getattr(provider, f"check_{kind}_status")
+
+    async def check_each(task_ids: List[str]) -> Dict[str, Dict[str, Any]]:
+        results = await asyncio.gather(
+            *(check_single(task_id) for task_id in task_ids), return_exceptions=True
+        )
+        statuses = {}
+        for task_id, result in zip(task_ids, results):
+            if isinstance(result, Exception):
+                logger.error(f"[TaskPoller] status check error: task_id={task_id}: {result}")
+                continue
+            statuses[task_id] = result
+        return statuses
+
+    return check_each
+
+
+def get_task_poller(provider: Any, kind: Literal["image", "video"]) -> TaskStatusPoller:
+    """
+    Provider 종류별 전역 TaskStatusPoller 반환 (프로세스당 1개)
+
+    Args:
+        provider: 이미지/비디오 Provider 인스턴스
+        kind: "image" 또는 "video"
+
+    Returns:
+        TaskStatusPoller: 공유 폴러
+    """
+    key = (type(provider), kind)
+    poller = _pollers.get(key)
+
+    if poller is None:
+        max_interval = (
+            settings.task_image_poll_interval if kind == "image" else settings.task_video_poll_interval
+        )
+        poller = TaskStatusPoller(
+            check_batch=_build_checker(provider, kind),
+            name=f"{type(provider).__name__}:{kind}",
+            max_interval=max_interval,
+        )
+        _pollers[key] = poller
+    else:
+        # 최신 Provider 인스턴스로 조회 함수 갱신 (같은 클래스는 설정이 동일)
+        poller.check_batch = _build_checker(provider, kind)
+
+    return poller
@@ -1,15 +1,17 @@
 """
 ElevenLabs TTS Provider (SDK-based)
-ElevenLabs Python SDK를 사용한 고품질 음성 합성
+ElevenLabs Python SDK(비동기 클라이언트)를 사용한 고품질 음성 합성
 """
 
-from typing import Optional, Dict, Any, List
+from typing import AsyncIterator, Optional, Dict, Any, List, NoReturn
 import logging
 
-from elevenlabs.client import ElevenLabs
+import httpx
+from elevenlabs.client import AsyncElevenLabs
 from elevenlabs.types import PronunciationDictionaryVersionLocator
 
 from ..base import TTSProvider
+from ..http_client import http_clients
 from ....core.config import settings
 from ....features.tts.exceptions import (
     TTSAPIKeyNotConfiguredException,
@@ -27,6 +29,8 @@ class ElevenLabsTTSProvider(TTSProvider):
     고품질 음성 합성 서비스 with automatic optimization:
     - Smart model selection (eleven_flash_v2 for single characters)
     - Automatic pronunciation dictionary application for alphabet letters
+    - Non-blocking: AsyncElevenLabs + 공유 HTTP 연결 풀 ("elevenlabs")
+    - Streaming: text_to_speech_stream()으로 MP3 청크를 생성되는 대로 전달
     """
 
     def __init__(self, api_key: Optional[str] = None):
@@ -41,8 +45,9 @@ class ElevenLabsTTSProvider(TTSProvider):
         if not self.api_key:
             raise TTSAPIKeyNotConfiguredException(provider="elevenlabs")
 
-        # Initialize SDK client
-        self.client = ElevenLabs(api_key=self.api_key)
+        # SDK client (공유 httpx 클라이언트에 묶어 첫 호출 시 생성)
+        self._client: Optional[AsyncElevenLabs] = None
+        self._client_http: Optional[httpx.AsyncClient] = None
 
         # Default settings
         self.default_voice_id = settings.tts_default_voice_id
@@ -52,6 +57,19 @@ class ElevenLabsTTSProvider(TTSProvider):
         self.pronunciation_dict_id = settings.pronunciation_dictionary_id
         self.pronunciation_version_id = settings.pronunciation_version_id
 
+    @property
+    def client(self) -> AsyncElevenLabs:
+        """
+        비동기 SDK 클라이언트 (프로세스 공유 연결 풀 사용, 이벤트 루프를 블로킹하지 않음)
+
+        공유 httpx 클라이언트가 교체되면(다른 이벤트 루프 등) SDK 클라이언트도 다시 만듭니다.
+        """
+        http_client = http_clients.get("elevenlabs")
+        if self._client is None or self._client_http is not http_client:
+            self._client = AsyncElevenLabs(api_key=self.api_key, httpx_client=http_client)
+            self._client_http = http_client
+        return self._client
+
     def _select_model_for_text(self, text: str, model_id: Optional[str]) -> str:
         """
         Smart model selection based on text characteristics
@@ -103,6 +121,30 @@ class ElevenLabsTTSProvider(TTSProvider):
             )]
         return None
 
+    def get_synthesis_profile(
+        self,
+        text: str,
+        model_id: Optional[str] = None,
+    ) -> Dict[str, Optional[str]]:
+        """
+        텍스트에 실제 적용될 모델 / 발음 사전 버전 (text_to_speech와 동일한 선택 규칙)
+
+        Args:
+            text: 변환할 텍스트
+            model_id: 모델 ID (None이면 자동 선택)
+
+        Returns:
+            Dict[str, Optional[str]]: model_id, pronunciation_version
+        """
+        pronunciation_version = None
+        if self._should_use_pronunciation_dict(text):
+            pronunciation_version = f"{self.pronunciation_dict_id}:{self.pronunciation_version_id}"
+
+        return {
+            "model_id": self._select_model_for_text(text, model_id),
+            "pronunciation_version": pronunciation_version,
+        }
+
     async def text_to_speech(
         self,
         text: str,
@@ -124,6 +166,44 @@ class ElevenLabsTTSProvider(TTSProvider):
         Returns:
             bytes: MP3 오디오 데이터
 
+        Raises:
+            TTSAPIAuthenticationFailedException: API 인증 실패
+            TTSGenerationFailedException: TTS 생성 실패
+        """
+        audio = bytearray()
+        async for chunk in self.text_to_speech_stream(
+            text=text,
+            voice_id=voice_id,
+            model_id=model_id,
+            language=language,
+            speed=speed,
+        ):
+            audio += chunk
+
+        logger.info(f"TTS Success: {len(audio)} bytes generated")
+        return bytes(audio)
+
+    async def text_to_speech_stream(
+        self,
+        text: str,
+        voice_id: Optional[str] = None,
+        model_id: Optional[str] = None,
+        language: str = "en",
+        speed: float = 1.0,
+    ) -> AsyncIterator[bytes]:
+        """
+        텍스트를 음성으로 변환 (MP3 청크 스트리밍)
+
+        Args:
+            text: 변환할 텍스트
+            voice_id: ElevenLabs 음성 ID
+            model_id: ElevenLabs 모델 ID (None이면 자동 선택)
+            language: 언어 코드 (en, ko 등)
+            speed: 재생 속도
+
+        Yields:
+            bytes: MP3 오디오 청크
+
         Raises:
             TTSAPIAuthenticationFailedException: API 인증 실패
             TTSGenerationFailedException: TTS 생성 실패
@@ -142,45 +222,51 @@ class ElevenLabsTTSProvider(TTSProvider):
         )
 
         try:
-            # Generate audio using SDK
-            audio_generator = self.client.text_to_speech.convert(
+            # Stream audio using async SDK (응답 본문을 받는 대로 전달)
+            async for chunk in self.client.text_to_speech.convert(
                 voice_id=voice_id or self.default_voice_id,
                 text=text,
                 model_id=selected_model,
                 pronunciation_dictionary_locators=pronunciation_locators,
-            )
-
-            # Collect audio bytes
-            audio_bytes = b"".join(audio_generator)
-
-            logger.info(f"TTS Success: {len(audio_bytes)} bytes generated")
-            return audio_bytes
+            ):
+                if chunk:
+                    yield chunk
 
         except Exception as e:
-            error_msg = str(e)
-            logger.error(
-                f"ElevenLabs TTS SDK Error: text='{text[:50]}...', "
-                f"model={selected_model}, error={error_msg}"
-            )
+            self._raise_tts_error(e, text, selected_model, voice_id)
 
-            # Check for authentication errors
-            if "401" in error_msg or "unauthorized" in error_msg.lower():
-                raise TTSAPIAuthenticationFailedException(
-                    provider="elevenlabs",
-                    reason=f"API 키가 유효하지 않거나 만료되었습니다: {error_msg}"
-                )
+    def _raise_tts_error(
+        self,
+        error: Exception,
+        text: str,
+        model_id: str,
+        voice_id: Optional[str],
+    ) -> NoReturn:
+        """SDK 예외를 TTS 도메인 예외로 변환"""
+        error_msg = str(error)
+        logger.error(
+            f"ElevenLabs TTS SDK Error: text='{text[:50]}...', "
+            f"model={model_id}, error={error_msg}"
+        )
 
-            # Check for voice not found errors
-            if "404" in error_msg or "not found" in error_msg.lower():
-                raise TTSGenerationFailedException(
-                    reason=f"Voice ID '{voice_id or self.default_voice_id}'를 찾을 수 없습니다: {error_msg}"
-                )
+        # Check for authentication errors
+        if "401" in error_msg or "unauthorized" in error_msg.lower():
+            raise TTSAPIAuthenticationFailedException(
+                provider="elevenlabs",
+                reason=f"API 키가 유효하지 않거나 만료되었습니다: {error_msg}"
+            )
 
-            # Generic error
+        # Check for voice not found errors
+        if "404" in error_msg or "not found" in error_msg.lower():
             raise TTSGenerationFailedException(
-                reason=f"ElevenLabs TTS 생성 실패: {error_msg}"
+                reason=f"Voice ID '{voice_id or self.default_voice_id}'를 찾을 수 없습니다: {error_msg}"
             )
 
+        # Generic error
+        raise TTSGenerationFailedException(
+            reason=f"ElevenLabs TTS 생성 실패: {error_msg}"
+        )
+
     async def get_available_voices(self) -> List[Dict[str, Any]]:
         """
         사용 가능한 음성 목록 조회
@@ -194,7 +280,7 @@ class ElevenLabsTTSProvider(TTSProvider):
         """
         try:
             # Get voices using SDK
-            voices_response = self.client.voices.get_all()
+            voices_response = await self.client.voices.get_all()
 
             # Convert to standard format
             voices = []
@@ -240,7 +326,7 @@ class ElevenLabsTTSProvider(TTSProvider):
         """
         try:
             # Get voice settings using SDK
-            settings_response = self.client.voices.get_settings(voice_id=voice_id)
+            settings_response = await self.client.voices.settings.get(voice_id)
 
             # Convert to dictionary
             return {
@@ -277,7 +363,7 @@ class ElevenLabsTTSProvider(TTSProvider):
         """
         try:
             # Get user info using SDK
-            user_response = self.client.user.get()
+            user_response = await self.client.user.get()
 
             # Convert to dictionary
             return {
@@ -331,8 +417,8 @@ class ElevenLabsTTSProvider(TTSProvider):
             audio_file_obj = BytesIO(audio_file)
             audio_file_obj.name = "audio.mp3"
 
-            # Clone voice using SDK
-            voice_response = self.client.voices.clone(
+            # Clone voice using SDK (Instant Voice Cloning)
+            voice_response = await self.client.voices.ivc.create(
                 name=name,
                 files=[audio_file_obj],
                 description=description,
@@ -341,7 +427,7 @@ class ElevenLabsTTSProvider(TTSProvider):
             # Convert to standard format
             return {
                 "voice_id": voice_response.voice_id,
-                "name": voice_response.name,
+                "name": getattr(voice_response, "name", name),
                 "language": getattr(voice_response.labels, "language", "en") if hasattr(voice_response, "labels") else "en",
                 "gender": getattr(voice_response.labels, "gender", "unknown") if hasattr(voice_response, "labels") else "unknown",
                 "category": "cloned",
@@ -379,7 +465,7 @@ class ElevenLabsTTSProvider(TTSProvider):
         """
         try:
             # Get voice details using SDK
-            voice_response = self.client.voices.get(voice_id=voice_id)
+            voice_response = await self.client.voices.get(voice_id=voice_id)
 
             # Determine status based on preview_url availability
             preview_url = voice_response.preview_url if hasattr(voice_response, "preview_url") else None
@@ -5,11 +5,11 @@ Google Gemini를 사용한 스토리 및 이미지 생성
 
 import json
 from typing import Optional, Dict, Any, List, Type, Union
-import httpx
 from pydantic import BaseModel
 
 from ..base import StoryGenerationProvider, ImageGenerationProvider, StoryResponse
 from ....core.config import settings
+from ..http_client import http_clients
 from google import genai
 from google.genai import types as genai_types
 import logging
@@ -32,9 +32,6 @@ class GoogleAIProvider(StoryGenerationProvider, ImageGenerationProvider):
         """
         self.api_key = api_key or settings.google_api_key
         self.base_url = "https://generativelanguage.googleapis.com/v1beta"
-        self.timeout = httpx.Timeout(
-            settings.http_timeout, read=settings.http_read_timeout
-        )
         self.client: genai.Client = None  # 초기에는 None
         self._init_client()
 
@@ -282,7 +279,7 @@ Format your response as JSON:
         if context:
             full_prompt += f"\n\nAdditional Context: {json.dumps(context)}"
 
-        async with httpx.AsyncClient(timeout=self.timeout) as client:
+        async with http_clients.client("google_ai") as client:
             response = await client.post(
                 f"{self.base_url}/models/gemini-pro:generateContent",
                 params={"key": self.api_key},
@@ -401,7 +398,7 @@ Format your response as JSON:
 
         full_prompt = f"Generate a high-quality illustration based on this sketch/image. Style: {style or 'cartoon'}. Prompt: {prompt}"
 
-        async with httpx.AsyncClient(timeout=self.timeout) as client:
+        async with http_clients.client("google_ai") as client:
             # Gemini 1.5 Flash 등 비전 모델 사용
             response = await client.post(
                 f"{self.base_url}/models/gemini-1.5-flash:generateContent",
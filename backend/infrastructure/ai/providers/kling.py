@@ -6,10 +6,10 @@ Kling AI API를 사용한 비디오 생성
 import asyncio
 import json
 from typing import Optional, Dict, Any
-import httpx
 
 from ..base import VideoGenerationProvider
 from ....core.config import settings
+from ..http_client import http_clients
 
 
 class KlingVideoProvider(VideoGenerationProvider):
@@ -19,6 +19,8 @@ class KlingVideoProvider(VideoGenerationProvider):
     Kling AI API를 사용하여 이미지로부터 비디오를 생성
     """
 
+    download_client = "kling"
+
     def __init__(self, api_key: Optional[str] = None):
         """
         Args:
@@ -26,7 +28,6 @@ class KlingVideoProvider(VideoGenerationProvider):
         """
         self.api_key = api_key or settings.kling_api_key
         self.base_url = "https://api.klingai.com/v1"  # 가상의 URL, 실제 API 문서 확인 필요
-        self.timeout = httpx.Timeout(settings.http_timeout, read=settings.http_read_timeout)
 
     async def generate_video(
         self,
@@ -58,7 +59,7 @@ class KlingVideoProvider(VideoGenerationProvider):
         if prompt:
             data["prompt"] = prompt
 
-        async with httpx.AsyncClient(timeout=self.timeout) as client:
+        async with http_clients.client("kling") as client:
             # 1. 이미지 업로드 및 생성 요청
             response = await client.post(
                 f"{self.base_url}/videos/image2video",
@@ -86,7 +87,7 @@ class KlingVideoProvider(VideoGenerationProvider):
                 "error": Optional[str]
             }
         """
-        async with httpx.AsyncClient(timeout=self.timeout) as client:
+        async with http_clients.client("kling") as client:
             response = await client.get(
                 f"{self.base_url}/videos/{task_id}",
                 headers={"Authorization": f"Bearer {self.api_key}"},
@@ -123,7 +124,7 @@ class KlingVideoProvider(VideoGenerationProvider):
         Returns:
             bytes: 비디오 바이너리 데이터
         """
-        async with httpx.AsyncClient(timeout=self.timeout) as client:
+        async with http_clients.client("kling") as client:
             response = await client.get(video_url)
             response.raise_for_status()
             return response.content
@@ -3,16 +3,18 @@ Runware Video Provider
 Runware API를 사용한 비디오 생성
 """
 
+import asyncio
 import uuid
 import base64
 import logging
 from dataclasses import dataclass
-from typing import Optional, Dict, Any, Literal
+from typing import Optional, Dict, Any, List, Literal
 import httpx
 
 from ..base import VideoGenerationProvider, ImageGenerationProvider
 from ..utils import detect_and_validate_image
 from ....core.config import settings
+from ..http_client import http_clients
 
 logger = logging.getLogger(__name__)
 
@@ -147,6 +149,9 @@ class RunwareProvider(VideoGenerationProvider, ImageGenerationProvider):
     Runware API를 사용하여 이미지로부터 비디오를 생성
     """
 
+    # getResponse 일괄 조회 지원 (check_images_status / check_videos_status)
+    supports_batch_status = True
+
     def __init__(self, api_key: Optional[str] = None):
         """
         Args:
@@ -154,9 +159,6 @@ class RunwareProvider(VideoGenerationProvider, ImageGenerationProvider):
         """
         self.api_key = api_key or settings.runware_api_key
         self.base_url = settings.runware_api_url
-        self.timeout = httpx.Timeout(
-            settings.http_timeout, read=settings.http_read_timeout
-        )
 
     async def generate_image(
         self,
@@ -198,7 +200,7 @@ class RunwareProvider(VideoGenerationProvider, ImageGenerationProvider):
             }
         ]
 
-        async with httpx.AsyncClient(timeout=self.timeout) as client:
+        async with http_clients.client("runware") as client:
             response = await client.post(
                 self.base_url,
                 headers={
@@ -365,7 +367,7 @@ class RunwareProvider(VideoGenerationProvider, ImageGenerationProvider):
 
         logger.info(f"[Image Task] Using model: {model}, size: {payload[0]['width']}x{payload[0]['height']}")
 
-        async with httpx.AsyncClient(timeout=self.timeout) as client:
+        async with http_clients.client("runware") as client:
             response = await client.post(
                 self.base_url,
                 headers={
@@ -422,10 +424,10 @@ class RunwareProvider(VideoGenerationProvider, ImageGenerationProvider):
         task_type: Literal["image", "video"],
     ) -> TaskStatusResponse:
         """
-        Runware 비동기 작업 상태 확인 (공통 로직)
+        Runware 비동기 작업 상태 확인 (단건)
 
-        이미지와 비디오 작업의 상태 확인 로직을 통합한 내부 메서드.
-        check_image_status()와 check_video_status()에서 래퍼로 호출됨.
+        check_tasks_status()의 단건 래퍼.
+        check_image_status()와 check_video_status()에서 호출됨.
 
         Args:
             task_id: Runware task UUID
@@ -433,25 +435,51 @@ class RunwareProvider(VideoGenerationProvider, ImageGenerationProvider):
 
         Returns:
             TaskStatusResponse: 표준화된 작업 상태 응답
+        """
+        results = await self.check_tasks_status([task_id], task_type)
+        return results[task_id]
+
+    async def check_tasks_status(
+        self,
+        task_ids: List[str],
+        task_type: Literal["image", "video"],
+    ) -> Dict[str, TaskStatusResponse]:
+        """
+        Runware 비동기 작업 상태 일괄 확인 (단일 요청)
+
+        여러 getResponse 항목을 하나의 payload로 전송하고,
+        응답의 taskUUID 기준으로 결과를 분배합니다.
+
+        Args:
+            task_ids: Runware task UUID 리스트
+            task_type: "image" 또는 "video"
+
+        Returns:
+            Dict[str, TaskStatusResponse]: task_id → 표준화된 작업 상태 응답
 
         상태 매핑 (Runware API → 내부 상태):
             - imageURL/videoURL 있음 -> "completed"
             - status="processing" -> "processing"
             - status="success" (URL 없음) -> "processing" (대기)
             - status="error" -> "failed"
-            - errors 배열 있음 -> "failed"
+            - errors 배열 있음 -> "failed" (해당 taskUUID만, taskUUID가 없으면 작업별로 재조회)
             - 빈 응답/데이터 없음 -> "processing"
         """
-        # 타입별 설정
-        url_key = "imageURL" if task_type == "image" else "videoURL"
-        uuid_key = "imageUUID" if task_type == "image" else None
         log_tag = f"[{task_type.capitalize()} Task]"
+        processing = {
+            task_id: TaskStatusResponse(status="processing", progress=50)
+            for task_id in task_ids
+        }
+        if not task_ids:
+            return processing
 
-        payload = [{"taskType": "getResponse", "taskUUID": task_id}]
-        logger.info(f"{log_tag} 상태 확인: task_id={task_id[:8]}...")
+        payload = [
+            {"taskType": "getResponse", "taskUUID": task_id} for task_id in task_ids
+        ]
+        logger.debug(f"{log_tag} 상태 확인: {len(task_ids)} tasks")
 
         # ========== API 호출 ==========
-        async with httpx.AsyncClient(timeout=self.timeout) as client:
+        async with http_clients.client("runware") as client:
             try:
                 response = await client.post(
                     self.base_url,
@@ -466,28 +494,70 @@ class RunwareProvider(VideoGenerationProvider, ImageGenerationProvider):
 
             except httpx.HTTPStatusError as e:
                 logger.warning(f"{log_tag} HTTP 에러 (재시도): {e.response.status_code}")
-                return TaskStatusResponse(status="processing", progress=50)
+                return processing
 
             except Exception as e:
                 logger.warning(f"{log_tag} 예외 (재시도): {type(e).__name__}")
-                return TaskStatusResponse(status="processing", progress=50)
+                return processing
 
         # ========== 응답 파싱 ==========
         if not result:
-            return TaskStatusResponse(status="processing", progress=50)
+            return processing
+
+        statuses = dict(processing)
 
         # errors 배열 확인 (Runware 에러 형식)
-        if "errors" in result and result["errors"]:
-            err = result["errors"][0]
+        for err in result.get("errors") or []:
             error_msg = f"[{err.get('code', 'unknown')}] {err.get('message', 'Unknown')}"
-            logger.error(f"{log_tag} ❌ API 에러: {error_msg}")
-            return TaskStatusResponse(status="failed", progress=0, error=error_msg)
-
-        # data 배열 확인
-        if "data" not in result or not result["data"]:
-            return TaskStatusResponse(status="processing", progress=50)
-
-        task_result = result["data"][0]
+            failed = TaskStatusResponse(status="failed", progress=0, error=error_msg)
+            err_task_id = err.get("taskUUID")
+            if err_task_id in statuses:
+                logger.error(f"{log_tag} ❌ API 에러: task_id={err_task_id[:8]}..., {error_msg}")
+                statuses[err_task_id] = failed
+            elif not err_task_id:
+                if len(task_ids) > 1:
+                    # 배치는 여러 Book의 작업을 함께 조회하므로 어느 작업의 에러인지 알 수 없음
+                    # → 작업별로 다시 조회 (다른 Book 작업까지 실패 처리하지 않음)
+                    logger.warning(f"{log_tag} taskUUID 없는 API 에러, 작업별 재조회: {error_msg}")
+                    return await self._check_tasks_individually(task_ids, task_type)
+                logger.error(f"{log_tag} ❌ API 에러: {error_msg}")
+                return {task_ids[0]: failed}
+
+        # data 배열 확인 (동일 taskUUID가 여러 번 오면 완료 응답 우선)
+        for task_result in result.get("data") or []:
+            task_id = task_result.get("taskUUID")
+            if task_id not in statuses and len(task_ids) == 1:
+                task_id = task_ids[0]
+            if task_id not in statuses or statuses[task_id].status == "completed":
+                continue
+            statuses[task_id] = self._parse_task_result(task_result, task_type)
+
+        return statuses
+
+    async def _check_tasks_individually(
+        self,
+        task_ids: List[str],
+        task_type: Literal["image", "video"],
+    ) -> Dict[str, TaskStatusResponse]:
+        """작업별 getResponse 조회 후 병합 (배치 에러의 원인 작업 식별용)"""
+        results = await asyncio.gather(
+            *(self.check_tasks_status([task_id], task_type) for task_id in task_ids)
+        )
+        statuses: Dict[str, TaskStatusResponse] = {}
+        for result in results:
+            statuses.update(result)
+        return statuses
+
+    @staticmethod
+    def _parse_task_result(
+        task_result: Dict[str, Any],
+        task_type: Literal["image", "video"],
+    ) -> TaskStatusResponse:
+        """getResponse data 항목 1개 → TaskStatusResponse"""
+        # 타입별 설정
+        url_key = "imageURL" if task_type == "image" else "videoURL"
+        uuid_key = "imageUUID" if task_type == "image" else None
+        log_tag = f"[{task_type.capitalize()} Task]"
 
         # ========== 완료 확인 (타입별 URL 키 사용) ==========
         if url_key in task_result:
@@ -507,7 +577,7 @@ class RunwareProvider(VideoGenerationProvider, ImageGenerationProvider):
         # Runware API 상태값: "processing", "success", "error"
         if "status" in task_result:
             status = task_result["status"]
-            logger.info(f"{log_tag} 작업 상태: {status}")
+            logger.debug(f"{log_tag} 작업 상태: {status}")
 
             if status == "processing":
                 return TaskStatusResponse(status="processing", progress=50)
@@ -557,6 +627,28 @@ class RunwareProvider(VideoGenerationProvider, ImageGenerationProvider):
             "error": result.error,
         }
 
+    async def check_images_status(self, task_ids: List[str]) -> Dict[str, Dict[str, Any]]:
+        """
+        비동기 이미지 생성 상태 일괄 확인 (TaskStatusPoller용)
+
+        Args:
+            task_ids: Runware task UUID 리스트
+
+        Returns:
+            Dict[str, Dict[str, Any]]: task_id → check_image_status()와 동일한 형식
+        """
+        results = await self.check_tasks_status(task_ids, "image")
+        return {
+            task_id: {
+                "status": result.status,
+                "progress": result.progress,
+                "image_url": result.result_url,
+                "image_uuid": result.result_uuid,
+                "error": result.error,
+            }
+            for task_id, result in results.items()
+        }
+
     async def generate_video(
         self,
         image_data: Optional[bytes] = None,
@@ -666,9 +758,9 @@ class RunwareProvider(VideoGenerationProvider, ImageGenerationProvider):
             # 이미지가 없는 경우: Text-to-Video
             logger.info("[Video Task] Mode: Text-to-Video (no frameImages)")
 
-        async with httpx.AsyncClient(timeout=self.timeout) as client:
+        async with http_clients.client("runware") as client:
             logger.info(f"[Video Task] Sending request to {self.base_url}")
-            logger.info(f"[Video Task] Payload: {payload}")
+            logger.debug(f"[Video Task] Payload: {payload}")
 
             try:
                 response = await client.post(
@@ -682,7 +774,7 @@ class RunwareProvider(VideoGenerationProvider, ImageGenerationProvider):
                 response.raise_for_status()
 
                 result = response.json()
-                logger.info(f"[Video Task] API Response: {result}")
+                logger.debug(f"[Video Task] API Response: {result}")
 
                 # 에러 체크
                 if "errors" in result and len(result["errors"]) > 0:
@@ -742,6 +834,27 @@ class RunwareProvider(VideoGenerationProvider, ImageGenerationProvider):
             "error": result.error,
         }
 
+    async def check_videos_status(self, task_ids: List[str]) -> Dict[str, Dict[str, Any]]:
+        """
+        비디오 생성 상태 일괄 확인 (TaskStatusPoller용)
+
+        Args:
+            task_ids: Runware task UUID 리스트
+
+        Returns:
+            Dict[str, Dict[str, Any]]: task_id → check_video_status()와 동일한 형식
+        """
+        results = await self.check_tasks_status(task_ids, "video")
+        return {
+            task_id: {
+                "status": result.status,
+                "progress": result.progress,
+                "video_url": result.result_url,
+                "error": result.error,
+            }
+            for task_id, result in results.items()
+        }
+
     async def download_video(self, video_url: str) -> bytes:
         """
         생성된 비디오 다운로드
@@ -753,7 +866,7 @@ class RunwareProvider(VideoGenerationProvider, ImageGenerationProvider):
             bytes: 비디오 바이너리 데이터
         """
         logger.info(f"[Video Task] Downloading video from {video_url}")
-        async with httpx.AsyncClient(timeout=self.timeout) as client:
+        async with http_clients.client("cdn") as client:
             response = await client.get(video_url)
             response.raise_for_status()
             video_size = len(response.content)
@@ -3,8 +3,30 @@ Storage Service Interface
 파일 저장소 추상화 계층
 """
 
+import hashlib
 from abc import ABC, abstractmethod
-from typing import Optional, BinaryIO, Union
+from dataclasses import dataclass
+from typing import AsyncIterator, Optional, BinaryIO, Union
+
+from ...core.config import settings
+
+
+@dataclass
+class FileStat:
+    """
+    파일 메타데이터 (본문 없이 조회)
+
+    Attributes:
+        size: 파일 크기 (bytes)
+        etag: 파일 버전 식별자 (따옴표 제외, 없으면 None)
+        last_modified: 마지막 수정 시각 (Unix timestamp, 없으면 None)
+        content_type: 저장 시 지정된 MIME 타입 (없으면 None)
+    """
+
+    size: int
+    etag: Optional[str] = None
+    last_modified: Optional[float] = None
+    content_type: Optional[str] = None
 
 
 class AbstractStorageService(ABC):
@@ -34,6 +56,30 @@ class AbstractStorageService(ABC):
         """
         pass
 
+    async def save_stream(
+        self,
+        chunks: AsyncIterator[bytes],
+        path: str,
+        content_type: Optional[str] = None,
+    ) -> str:
+        """
+        비동기 청크 스트림 저장 (예: CDN 다운로드 → 스토리지 직접 전송)
+
+        기본 구현은 청크를 모두 모은 뒤 save()를 호출하므로, 구현체에서 재정의해야 합니다.
+
+        Args:
+            chunks: 파일 데이터 청크 스트림
+            path: 저장 경로 (파일명 포함)
+            content_type: MIME 타입 (옵션)
+
+        Returns:
+            str: 저장된 파일의 접근 URL 또는 경로
+        """
+        data = bytearray()
+        async for chunk in chunks:
+            data += chunk
+        return await self.save(bytes(data), path, content_type=content_type)
+
     @abstractmethod
     def get_url(
         self,
@@ -96,3 +142,52 @@ class AbstractStorageService(ABC):
             bool: 존재 여부
         """
         pass
+
+    async def stat(self, path: str) -> FileStat:
+        """
+        파일 메타데이터 조회 (본문을 읽지 않음)
+
+        기본 구현은 파일 전체를 읽어 크기를 계산하므로, 구현체에서 재정의해야 합니다.
+
+        Args:
+            path: 파일 경로
+
+        Returns:
+            FileStat: 파일 메타데이터
+
+        Raises:
+            FileNotFoundError: 파일이 없는 경우
+        """
+        data = await self.get(path)
+        return FileStat(size=len(data), etag=hashlib.md5(data).hexdigest())
+
+    async def stream(
+        self,
+        path: str,
+        start: int = 0,
+        end: Optional[int] = None,
+        chunk_size: Optional[int] = None,
+    ) -> AsyncIterator[bytes]:
+        """
+        파일 스트리밍 조회 (byte range 지원, 메모리에 전체 파일을 올리지 않음)
+
+        기본 구현은 get()으로 전체를 읽은 뒤 잘라서 반환하므로, 구현체에서 재정의해야 합니다.
+
+        Args:
+            path: 파일 경로
+            start: 시작 오프셋 (bytes, 포함)
+            end: 끝 오프셋 (bytes, 포함 - HTTP Range와 동일). None이면 파일 끝까지
+            chunk_size: 청크 크기 (기본값: settings.storage_stream_chunk_size)
+
+        Yields:
+            bytes: 파일 청크
+
+        Raises:
+            FileNotFoundError: 파일이 없는 경우 (첫 청크를 요청할 때 발생)
+        """
+        chunk_size = chunk_size or settings.storage_stream_chunk_size
+        data = await self.get(path)
+        stop = len(data) if end is None else min(end + 1, len(data))
+
+        for offset in range(start, stop, chunk_size):
+            yield data[offset:min(offset + chunk_size, stop)]
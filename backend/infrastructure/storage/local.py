@@ -4,11 +4,12 @@ Local Storage Service
 """
 
 import os
+import asyncio
 import aiofiles
-from typing import Optional, BinaryIO, Union
+from typing import AsyncIterator, Optional, BinaryIO, Union
 from pathlib import Path
 
-from .base import AbstractStorageService
+from .base import AbstractStorageService, FileStat
 from ...core.config import settings
 
 
@@ -62,6 +63,34 @@ class LocalStorageService(AbstractStorageService):
         # API 응답 시 get_url()로 /api/v1/files/ 경로 생성
         return path.lstrip("/")
 
+    async def save_stream(
+        self,
+        chunks: AsyncIterator[bytes],
+        path: str,
+        content_type: Optional[str] = None,
+    ) -> str:
+        """
+        청크 스트림 저장 (임시 파일에 기록 후 rename - 중간 상태의 파일이 보이지 않음)
+
+        Returns:
+            str: 파일 경로
+        """
+        full_path = self.base_path / path
+        os.makedirs(full_path.parent, exist_ok=True)
+        temp_path = full_path.with_name(f".{full_path.name}.{os.getpid()}.{id(chunks):x}.part")
+
+        try:
+            async with aiofiles.open(temp_path, "wb") as f:
+                async for chunk in chunks:
+                    await f.write(chunk)
+            os.replace(temp_path, full_path)
+        except BaseException:
+            if temp_path.exists():
+                temp_path.unlink()
+            raise
+
+        return path.lstrip("/")
+
     async def get(self, path: str) -> bytes:
         """파일 조회"""
         full_path = self.base_path / path
@@ -72,6 +101,51 @@ class LocalStorageService(AbstractStorageService):
         async with aiofiles.open(full_path, "rb") as f:
             return await f.read()
 
+    async def stat(self, path: str) -> FileStat:
+        """
+        파일 메타데이터 조회 (os.stat, 본문을 읽지 않음)
+
+        ETag는 수정 시각(ns)과 크기로 생성합니다 (nginx 방식).
+        """
+        full_path = self.base_path / path
+
+        try:
+            st = await asyncio.to_thread(os.stat, full_path)
+        except FileNotFoundError:
+            raise FileNotFoundError(f"File not found: {path}")
+
+        return FileStat(
+            size=st.st_size,
+            etag=f"{st.st_mtime_ns:x}-{st.st_size:x}",
+            last_modified=st.st_mtime,
+        )
+
+    async def stream(
+        self,
+        path: str,
+        start: int = 0,
+        end: Optional[int] = None,
+        chunk_size: Optional[int] = None,
+    ) -> AsyncIterator[bytes]:
+        """파일 스트리밍 조회 (seek 후 청크 단위로 읽기)"""
+        full_path = self.base_path / path
+        chunk_size = chunk_size or settings.storage_stream_chunk_size
+
+        if not full_path.exists():
+            raise FileNotFoundError(f"File not found: {path}")
+
+        remaining = None if end is None else end - start + 1
+
+        async with aiofiles.open(full_path, "rb") as f:
+            await f.seek(start)
+            while remaining is None or remaining > 0:
+                chunk = await f.read(chunk_size if remaining is None else min(chunk_size, remaining))
+                if not chunk:
+                    break
+                if remaining is not None:
+                    remaining -= len(chunk)
+                yield chunk
+
     async def delete(self, path: str) -> bool:
         """파일 삭제"""
         full_path = self.base_path / path
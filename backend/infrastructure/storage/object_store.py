@@ -0,0 +1,494 @@
+"""
+S3-Compatible Object Storage
+S3 / R2 공통 비동기 스토리지 구현 (전용 스레드 풀 + boto3 연결 풀, 동시 멀티파트 업로드)
+"""
+
+import asyncio
+import functools
+import io
+import logging
+import mimetypes
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, AsyncIterator, BinaryIO, Callable, Dict, Hashable, List, Optional, Union
+
+from botocore.config import Config
+from botocore.exceptions import ClientError
+
+from .base import AbstractStorageService, FileStat
+from ...core.config import settings
+
+logger = logging.getLogger(__name__)
+
+# S3 멀티파트 최소 파트 크기 (마지막 파트 제외)
+MIN_PART_SIZE = 5 * 1024 * 1024
+
+NOT_FOUND_CODES = ("404", "NoSuchKey", "NotFound")
+
+_executor: Optional[ThreadPoolExecutor] = None
+
+
+def get_storage_executor() -> ThreadPoolExecutor:
+    """
+    오브젝트 스토리지 전용 스레드 풀 (lazy)
+
+    boto3 호출은 동기 네트워크 I/O이므로 이벤트 루프가 아닌 이 풀에서 실행합니다.
+    기본 executor와 분리되어 대용량 업로드가 다른 to_thread 작업을 굶기지 않습니다.
+    """
+    global _executor
+    if _executor is None:
+        _executor = ThreadPoolExecutor(
+            max_workers=settings.storage_io_max_workers,
+            thread_name_prefix="storage-io",
+        )
+    return _executor
+
+
+def shutdown_storage_executor(wait: bool = True) -> None:
+    """스토리지 스레드 풀 종료 (lifespan 종료 시 호출)"""
+    global _executor
+    if _executor is not None:
+        _executor.shutdown(wait=wait, cancel_futures=True)
+        _executor = None
+
+
+def client_config() -> Config:
+    """
+    S3/R2 boto3 클라이언트 설정
+
+    연결 풀 크기를 스레드 풀 이상으로 맞춰, 동시 파트 업로드가 연결을 기다리지 않도록 합니다.
+    """
+    return Config(
+        signature_version="s3v4",
+        max_pool_connections=max(settings.storage_max_pool_connections, settings.storage_io_max_workers),
+        retries={"max_attempts": 3, "mode": "standard"},
+    )
+
+
+class SignedURLCache:
+    """
+    서명 URL 시간 버킷 + 프로세스 메모리 LRU
+
+    만료 시각을 고정 간격(bucket_seconds) 경계로 올림하여 같은 버킷 안에서는
+    같은 만료 시각으로 서명합니다. 서명 결과가 버킷 동안 바이트 단위로 같으므로
+    응답 ETag / 브라우저 / CDN 캐시가 동작하고, 서명 자체도 LRU에서 재사용합니다.
+
+    만료 시각 = 버킷 종료 시각 + expires_in 이므로 어느 시점에 받은 URL이든
+    남은 유효 시간은 항상 expires_in 이상입니다.
+
+    Args:
+        bucket_seconds: 버킷 간격 (초, 0이면 버킷/캐시 없이 매번 서명)
+        max_entries: LRU 최대 항목 수
+    """
+
+    def __init__(self, bucket_seconds: int, max_entries: int):
+        self.bucket_seconds = bucket_seconds
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[tuple, str]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get_or_sign(self, key: Hashable, expires_in: int, sign: Callable[[int], str]) -> str:
+        """
+        버킷 내 캐시된 URL 반환 (없으면 서명 후 저장)
+
+        Args:
+            key: 캐시 키 (경로, 공개 여부 등 URL을 결정하는 값)
+            expires_in: 최소 유효 시간 (초)
+            sign: 만료 시각(epoch 초)을 받아 URL을 생성하는 함수
+
+        Returns:
+            str: 서명 URL
+        """
+        now = time.time()
+        if self.bucket_seconds <= 0:
+            return sign(int(now + expires_in))
+
+        bucket = int(now // self.bucket_seconds)
+        cache_key = (key, expires_in, bucket)
+        url = self._entries.get(cache_key)
+        if url is not None:
+            self._entries.move_to_end(cache_key)
+            self.hits += 1
+            return url
+
+        self.misses += 1
+        url = sign((bucket + 1) * self.bucket_seconds + expires_in)
+        self._entries[cache_key] = url
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+        return url
+
+
+class S3CompatibleStorageService(AbstractStorageService):
+    """
+    S3 호환 스토리지 공통 구현 (S3StorageService / R2StorageService)
+
+    - 모든 boto3 호출은 전용 스레드 풀에서 실행 (이벤트 루프 블로킹 없음)
+    - storage_multipart_threshold를 넘는 업로드는 멀티파트로 분할하고,
+      파트는 storage_multipart_concurrency개씩 동시에 전송
+    - 실패한 멀티파트 업로드는 abort하여 미완성 파트를 남기지 않음
+
+    하위 클래스는 s3_client / bucket_name / _normalize_key / get_url을 제공합니다.
+    """
+
+    provider_name = "S3"
+
+    s3_client: Any
+    bucket_name: str
+
+    def _normalize_key(self, path: str) -> str:
+        return path.lstrip("/")
+
+    async def _call(self, func: Callable, *args, **kwargs) -> Any:
+        """
+        동기 boto3 호출을 스토리지 스레드 풀에서 실행
+
+        Args:
+            func: 호출할 함수 (예: self.s3_client.put_object)
+
+        Returns:
+            Any: 함수 반환값
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            get_storage_executor(), functools.partial(func, *args, **kwargs)
+        )
+
+    @staticmethod
+    def _is_not_found(error: ClientError) -> bool:
+        return error.response.get("Error", {}).get("Code") in NOT_FOUND_CODES
+
+    async def save(
+        self,
+        file_data: Union[bytes, BinaryIO],
+        path: str,
+        content_type: Optional[str] = None
+    ) -> str:
+        """
+        파일 업로드 (작은 파일: PutObject, 큰 파일: 동시 멀티파트 업로드)
+
+        Returns:
+            str: 파일 경로 (Pre-signed URL 아님, API 응답 시 get_url()로 동적 생성)
+                 예: "shared/books/{id}/audios/page_1.mp3"
+        """
+        key = self._normalize_key(path)
+
+        if not content_type:
+            content_type, _ = mimetypes.guess_type(path)
+            if not content_type:
+                content_type = "application/octet-stream"
+
+        part_size = max(settings.storage_multipart_part_size, MIN_PART_SIZE)
+        threshold = max(settings.storage_multipart_threshold, part_size)
+
+        try:
+            if isinstance(file_data, (bytes, bytearray, memoryview)):
+                if len(file_data) <= threshold:
+                    await self._put_object(key, bytes(file_data), content_type)
+                else:
+                    await self._multipart_upload(
+                        key, content_type, _iter_byte_parts(bytes(file_data), part_size)
+                    )
+            else:
+                # file-like object: 첫 블록만 읽어 크기 판단 (전체를 메모리에 올리지 않음)
+                head = await self._call(_read_full, file_data, threshold + 1)
+                if len(head) <= threshold:
+                    await self._put_object(key, head, content_type)
+                else:
+                    await self._multipart_upload(
+                        key, content_type, self._iter_reader_parts(_PrefixedReader(head, file_data), part_size)
+                    )
+
+            return key
+
+        except ClientError as e:
+            logger.error(f"{self.provider_name} upload failed for {key}: {e}")
+            raise e
+
+    async def _put_object(self, key: str, data: bytes, content_type: str) -> None:
+        await self._call(
+            self.s3_client.put_object,
+            Bucket=self.bucket_name,
+            Key=key,
+            Body=data,
+            ContentType=content_type,
+        )
+
+    async def save_stream(
+        self,
+        chunks: AsyncIterator[bytes],
+        path: str,
+        content_type: Optional[str] = None,
+    ) -> str:
+        """
+        비동기 청크 스트림 업로드 (한 파트 이하: PutObject, 그 이상: 동시 멀티파트 업로드)
+
+        전체 파일을 메모리에 올리지 않습니다 (최대 동시 파트 수 × 파트 크기).
+
+        Returns:
+            str: 파일 경로
+        """
+        key = self._normalize_key(path)
+        content_type = content_type or mimetypes.guess_type(path)[0] or "application/octet-stream"
+        part_size = max(settings.storage_multipart_part_size, MIN_PART_SIZE)
+
+        parts = _rechunk(chunks, part_size)
+        first = await anext(parts, b"")
+        second = await anext(parts, None) if len(first) >= part_size else None
+
+        try:
+            if second is None:
+                await self._put_object(key, first, content_type)
+            else:
+                await self._multipart_upload(key, content_type, _prepend([first, second], parts))
+            return key
+
+        except ClientError as e:
+            logger.error(f"{self.provider_name} stream upload failed for {key}: {e}")
+            raise e
+
+    async def _iter_reader_parts(self, source: BinaryIO, part_size: int) -> AsyncIterator[bytes]:
+        """동기 스트림을 스토리지 스레드 풀에서 파트 단위로 읽기"""
+        while True:
+            chunk = await self._call(_read_full, source, part_size)
+            if not chunk:
+                return
+            yield chunk
+
+    async def _multipart_upload(
+        self,
+        key: str,
+        content_type: str,
+        parts: AsyncIterator[bytes],
+    ) -> None:
+        """
+        멀티파트 업로드 (파트 동시 전송, 메모리 사용량은 동시 파트 수 × 파트 크기로 제한)
+
+        Args:
+            key: 오브젝트 키
+            content_type: MIME 타입
+            parts: 파트 데이터 스트림 (마지막을 제외하고 MIN_PART_SIZE 이상)
+        """
+        response = await self._call(
+            self.s3_client.create_multipart_upload,
+            Bucket=self.bucket_name,
+            Key=key,
+            ContentType=content_type,
+        )
+        upload_id = response["UploadId"]
+
+        slots = asyncio.Semaphore(max(1, settings.storage_multipart_concurrency))
+        tasks: List[asyncio.Task] = []
+
+        async def upload_part(part_number: int, body: bytes) -> Dict[str, Any]:
+            try:
+                result = await self._call(
+                    self.s3_client.upload_part,
+                    Bucket=self.bucket_name,
+                    Key=key,
+                    UploadId=upload_id,
+                    PartNumber=part_number,
+                    Body=body,
+                )
+                return {"PartNumber": part_number, "ETag": result["ETag"]}
+            finally:
+                slots.release()
+
+        try:
+            part_number = 0
+            while True:
+                # 빈 슬롯이 생길 때까지 다음 파트를 읽지 않음 (메모리 상한)
+                await slots.acquire()
+                failed = next((t for t in tasks if t.done() and t.exception() is not None), None)
+                if failed is not None:
+                    slots.release()
+                    raise failed.exception()
+
+                chunk = await anext(parts, None)
+                if chunk is None:
+                    slots.release()
+                    break
+                part_number += 1
+                tasks.append(asyncio.create_task(upload_part(part_number, chunk)))
+
+            uploaded = await asyncio.gather(*tasks)
+            await self._call(
+                self.s3_client.complete_multipart_upload,
+                Bucket=self.bucket_name,
+                Key=key,
+                UploadId=upload_id,
+                MultipartUpload={"Parts": sorted(uploaded, key=lambda p: p["PartNumber"])},
+            )
+            logger.info(f"{self.provider_name} multipart upload completed: {key} ({part_number} parts)")
+
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            try:
+                await self._call(
+                    self.s3_client.abort_multipart_upload,
+                    Bucket=self.bucket_name,
+                    Key=key,
+                    UploadId=upload_id,
+                )
+            except Exception as abort_error:
+                logger.warning(f"{self.provider_name} multipart abort failed for {key}: {abort_error}")
+            raise
+
+    async def get(self, path: str) -> bytes:
+        """파일 다운로드"""
+        key = self._normalize_key(path)
+
+        try:
+            response = await self._call(self.s3_client.get_object, Bucket=self.bucket_name, Key=key)
+        except ClientError as e:
+            if self._is_not_found(e):
+                raise FileNotFoundError(f"File not found in {self.provider_name}: {path}")
+            raise e
+
+        body = response["Body"]
+        try:
+            return await self._call(body.read)
+        finally:
+            body.close()
+
+    async def stat(self, path: str) -> FileStat:
+        """파일 메타데이터 조회 (HeadObject)"""
+        key = self._normalize_key(path)
+
+        try:
+            response = await self._call(
+                self.s3_client.head_object, Bucket=self.bucket_name, Key=key
+            )
+        except ClientError as e:
+            if self._is_not_found(e):
+                raise FileNotFoundError(f"File not found in {self.provider_name}: {path}")
+            raise e
+
+        last_modified = response.get("LastModified")
+        return FileStat(
+            size=response["ContentLength"],
+            etag=(response.get("ETag") or "").strip('"') or None,
+            last_modified=last_modified.timestamp() if last_modified else None,
+            content_type=response.get("ContentType"),
+        )
+
+    async def stream(
+        self,
+        path: str,
+        start: int = 0,
+        end: Optional[int] = None,
+        chunk_size: Optional[int] = None,
+    ) -> AsyncIterator[bytes]:
+        """파일 스트리밍 조회 (GetObject Range + 청크 단위 읽기)"""
+        key = self._normalize_key(path)
+        chunk_size = chunk_size or settings.storage_stream_chunk_size
+
+        params = {"Bucket": self.bucket_name, "Key": key}
+        if start > 0 or end is not None:
+            params["Range"] = f"bytes={start}-{'' if end is None else end}"
+
+        try:
+            response = await self._call(self.s3_client.get_object, **params)
+        except ClientError as e:
+            if self._is_not_found(e):
+                raise FileNotFoundError(f"File not found in {self.provider_name}: {path}")
+            raise e
+
+        body = response["Body"]
+        try:
+            while True:
+                chunk = await self._call(body.read, chunk_size)
+                if not chunk:
+                    break
+                yield chunk
+        finally:
+            body.close()
+
+    async def delete(self, path: str) -> bool:
+        """파일 삭제"""
+        key = self._normalize_key(path)
+
+        try:
+            await self._call(self.s3_client.delete_object, Bucket=self.bucket_name, Key=key)
+            return True
+        except ClientError:
+            return False
+
+    async def exists(self, path: str) -> bool:
+        """파일 존재 여부 확인"""
+        key = self._normalize_key(path)
+
+        try:
+            await self._call(self.s3_client.head_object, Bucket=self.bucket_name, Key=key)
+            return True
+        except ClientError:
+            return False
+
+
+async def _iter_byte_parts(data: bytes, part_size: int) -> AsyncIterator[bytes]:
+    """메모리의 bytes를 파트 단위로 분할"""
+    view = memoryview(data)
+    for offset in range(0, len(data), part_size):
+        yield bytes(view[offset:offset + part_size])
+
+
+async def _rechunk(chunks: AsyncIterator[bytes], part_size: int) -> AsyncIterator[bytes]:
+    """임의 크기 청크 스트림을 part_size 단위로 재분할 (마지막 파트만 작을 수 있음)"""
+    buffer = bytearray()
+    async for chunk in chunks:
+        buffer += chunk
+        while len(buffer) >= part_size:
+            yield bytes(buffer[:part_size])
+            del buffer[:part_size]
+    if buffer:
+        yield bytes(buffer)
+
+
+async def _prepend(items: List[bytes], rest: AsyncIterator[bytes]) -> AsyncIterator[bytes]:
+    """이미 읽은 파트를 앞에 붙인 스트림"""
+    for item in items:
+        yield item
+    async for item in rest:
+        yield item
+
+
+def _read_full(source: BinaryIO, size: int) -> bytes:
+    """size 바이트를 채울 때까지 읽기 (raw 스트림은 요청보다 적게 반환할 수 있음)"""
+    buffer = bytearray()
+    while len(buffer) < size:
+        chunk = source.read(size - len(buffer))
+        if not chunk:
+            break
+        buffer += chunk
+    return bytes(buffer)
+
+
+class _PrefixedReader(io.RawIOBase):
+    """이미 읽은 앞부분(prefix) + 나머지 스트림을 하나의 스트림처럼 읽기"""
+
+    def __init__(self, prefix: bytes, stream: BinaryIO):
+        self._prefix = prefix
+        self._stream = stream
+
+    def readable(self) -> bool:
+        return True
+
+    def read(self, size: int = -1) -> bytes:
+        if size is None or size < 0:
+            data, self._prefix = self._prefix + self._stream.read(), b""
+            return data
+
+        if self._prefix:
+            data, self._prefix = self._prefix[:size], self._prefix[size:]
+            if len(data) < size:
+                data += self._stream.read(size - len(data)) or b""
+            return data
+
+        return self._stream.read(size)
@@ -6,29 +6,26 @@ Cloudflare R2를 사용하고 CDN Signed URL을 발급하는 스토리지 서비
 import boto3
 import hmac
 import hashlib
-import time
 import logging
-import mimetypes
-from typing import Optional, BinaryIO, Union
+from typing import Optional
 from urllib.parse import urlparse, urlencode
 
-from botocore.exceptions import ClientError
-from botocore.config import Config
-
-from .base import AbstractStorageService
+from .object_store import S3CompatibleStorageService, SignedURLCache, client_config
 from ...core.config import settings
 
 logger = logging.getLogger(__name__)
 
 
-class R2StorageService(AbstractStorageService):
+class R2StorageService(S3CompatibleStorageService):
     """
     Cloudflare R2 스토리지 서비스
     
-    - 데이터 저장: AWS S3 호환 API 사용 (R2)
+    - 데이터 저장: AWS S3 호환 API 사용 (R2, 비동기 I/O는 S3CompatibleStorageService)
     - 데이터 서빙: Cloudflare CDN Signed URL 사용
     """
 
+    provider_name = "R2"
+
     def __init__(self):
         self.bucket_name = settings.r2_bucket_name
         self.region_name = settings.r2_region_name
@@ -39,6 +36,7 @@ class R2StorageService(AbstractStorageService):
         # CDN 설정
         self.cdn_domain = settings.cloudflare_cdn_domain
         self.signing_key = settings.cloudflare_signing_key
+        self.url_cache = SignedURLCache(settings.signed_url_bucket_seconds, settings.signed_url_cache_size)
 
         if not self.endpoint_url:
             raise ValueError("R2_ENDPOINT_URL is not set")
@@ -56,7 +54,7 @@ class R2StorageService(AbstractStorageService):
             aws_access_key_id=self.access_key,
             aws_secret_access_key=self.secret_key,
             region_name=self.region_name,
-            config=Config(signature_version='s3v4')
+            config=client_config()
         )
 
     def _normalize_key(self, path: str) -> str:
@@ -77,70 +75,6 @@ class R2StorageService(AbstractStorageService):
         
         return key
 
-    async def save(
-        self, 
-        file_data: Union[bytes, BinaryIO], 
-        path: str, 
-        content_type: Optional[str] = None
-    ) -> str:
-        """R2에 파일 업로드"""
-        key = self._normalize_key(path)
-        
-        if not content_type:
-            content_type, _ = mimetypes.guess_type(path)
-            if not content_type:
-                content_type = "application/octet-stream"
-        
-        try:
-            if isinstance(file_data, bytes):
-                self.s3_client.put_object(
-                    Bucket=self.bucket_name,
-                    Key=key,
-                    Body=file_data,
-                    ContentType=content_type
-                )
-            else:
-                self.s3_client.upload_fileobj(
-                    file_data,
-                    self.bucket_name,
-                    key,
-                    ExtraArgs={"ContentType": content_type}
-                )
-            return key
-            
-        except ClientError as e:
-            logger.error(f"R2 upload failed for {key}: {e}")
-            raise e
-
-    async def get(self, path: str) -> bytes:
-        """R2에서 파일 다운로드"""
-        key = self._normalize_key(path)
-        try:
-            response = self.s3_client.get_object(Bucket=self.bucket_name, Key=key)
-            return response["Body"].read()
-        except ClientError as e:
-            if e.response['Error']['Code'] == "NoSuchKey":
-                raise FileNotFoundError(f"File not found in R2: {path}")
-            raise e
-
-    async def delete(self, path: str) -> bool:
-        """R2 파일 삭제"""
-        key = self._normalize_key(path)
-        try:
-            self.s3_client.delete_object(Bucket=self.bucket_name, Key=key)
-            return True
-        except ClientError:
-            return False
-
-    async def exists(self, path: str) -> bool:
-        """R2 파일 존재 확인"""
-        key = self._normalize_key(path)
-        try:
-            self.s3_client.head_object(Bucket=self.bucket_name, Key=key)
-            return True
-        except ClientError:
-            return False
-
     def get_url(
         self,
         path: str,
@@ -153,7 +87,8 @@ class R2StorageService(AbstractStorageService):
 
         Args:
             path: 파일 경로
-            expires_in: 만료 시간 (초), 기본값: 3시간
+            expires_in: 최소 유효 시간 (초), 기본값: 3시간
+                (만료 시각은 signed_url_bucket_seconds 경계로 올림)
             bypass_cdn: True면 Backend API(/api/v1/files/...) URL 반환 (On-demand 생성용)
             is_shared: 공개 여부 (서명에 포함되어 공개/비공개 전환 시 URL 무효화)
 
@@ -182,20 +117,37 @@ class R2StorageService(AbstractStorageService):
             # (is_shared 변경 시 빠른 무효화를 위해)
             expires_in = 3 * 60 * 60  # 3시간
 
-        # 1. 만료 시간 설정
-        expiration = int(time.time() + expires_in)
+        # 만료 시각을 시간 버킷 경계로 올림하여 서명 (버킷 동안 같은 URL, LRU 재사용)
+        return self.url_cache.get_or_sign(
+            (url_path, is_shared),
+            expires_in,
+            lambda expiration: self._sign_url(base_url, url_path, expiration, is_shared),
+        )
+
+    def _sign_url(self, base_url: str, url_path: str, expiration: int, is_shared: bool) -> str:
+        """
+        CDN Signed URL 생성
 
-        # 2. 서명 문자열 생성 (is_shared 포함으로 공개/비공개 전환 시 URL 무효화)
+        Args:
+            base_url: CDN 도메인
+            url_path: /{key}
+            expiration: 만료 시각 (epoch 초)
+            is_shared: 공개 여부
+
+        Returns:
+            str: Signed URL
+        """
+        # 1. 서명 문자열 생성 (is_shared 포함으로 공개/비공개 전환 시 URL 무효화)
         sign_string = f"{url_path}-{expiration}-{int(is_shared)}"
 
-        # 3. HMAC-SHA256 서명 생성
+        # 2. HMAC-SHA256 서명 생성
         signature = hmac.new(
             self.signing_key.encode('utf-8'),
             sign_string.encode('utf-8'),
             hashlib.sha256
         ).hexdigest()
 
-        # 4. Signed URL 조합
+        # 3. Signed URL 조합
         params = {
             'verify': expiration,
             'token': signature,
@@ -5,21 +5,23 @@ AWS S3를 사용하는 스토리지 서비스 구현체
 
 import boto3
 from botocore.exceptions import ClientError
-from typing import Optional, BinaryIO, Union
-import mimetypes
+from typing import Optional
 import logging
+import time
 
-from .base import AbstractStorageService
+from .object_store import S3CompatibleStorageService, SignedURLCache, client_config
 from ...core.config import settings
 
 logger = logging.getLogger(__name__)
 
 
-class S3StorageService(AbstractStorageService):
+class S3StorageService(S3CompatibleStorageService):
     """
-    AWS S3 스토리지 서비스
+    AWS S3 스토리지 서비스 (비동기 I/O / 멀티파트 업로드는 S3CompatibleStorageService)
     """
 
+    provider_name = "S3"
+
     def __init__(self):
         """
         AWS 자격 증명은 환경 변수 또는 settings에서 로드
@@ -28,19 +30,18 @@ class S3StorageService(AbstractStorageService):
         self.region_name = settings.aws_s3_region
         self.access_key = settings.aws_access_key_id
         self.secret_key = settings.aws_secret_access_key
-        
-        from botocore.config import Config
-        
+
         self.s3_client = boto3.client(
             "s3",
             region_name=self.region_name,
             aws_access_key_id=self.access_key,
             aws_secret_access_key=self.secret_key,
             endpoint_url=f"https://s3.{self.region_name}.amazonaws.com",
-            config=Config(signature_version='s3v4')
+            config=client_config()
         )
         
         self.base_url = f"https://{self.bucket_name}.s3.{self.region_name}.amazonaws.com"
+        self.url_cache = SignedURLCache(settings.signed_url_bucket_seconds, settings.signed_url_cache_size)
 
     def _normalize_key(self, path: str) -> str:
         """
@@ -74,85 +75,6 @@ class S3StorageService(AbstractStorageService):
 
         return key
 
-    async def save(
-        self, 
-        file_data: Union[bytes, BinaryIO], 
-        path: str, 
-        content_type: Optional[str] = None
-    ) -> str:
-        """
-        파일 S3 업로드
-        
-        Returns:
-            str: 파일 경로 (Pre-signed URL 아님)
-                 예: "shared/books/{id}/audios/page_1.mp3"
-        """
-        # path 앞의 슬래시 제거
-        key = path.lstrip("/")
-        
-        # Content-Type 추론
-        if not content_type:
-            content_type, _ = mimetypes.guess_type(path)
-            if not content_type:
-                content_type = "application/octet-stream"
-        
-        try:
-            if isinstance(file_data, bytes):
-                self.s3_client.put_object(
-                    Bucket=self.bucket_name,
-                    Key=key,
-                    Body=file_data,
-                    ContentType=content_type
-                )
-            else:
-                # file-like object
-                self.s3_client.upload_fileobj(
-                    file_data,
-                    self.bucket_name,
-                    key,
-                    ExtraArgs={"ContentType": content_type}
-                )
-            
-            # ✅ 경로만 반환 (Pre-signed URL 생성하지 않음)
-            # API 응답 시 get_url()로 동적 생성
-            return key
-            
-        except ClientError as e:
-            logger.error(f"S3 upload failed for {key}: {e}")
-            raise e
-
-    async def get(self, path: str) -> bytes:
-        """파일 S3 다운로드"""
-        key = self._normalize_key(path)
-        
-        try:
-            response = self.s3_client.get_object(Bucket=self.bucket_name, Key=key)
-            return response["Body"].read()
-        except ClientError as e:
-            if e.response['Error']['Code'] == "NoSuchKey":
-                raise FileNotFoundError(f"File not found in S3: {path}")
-            raise e
-
-    async def delete(self, path: str) -> bool:
-        """파일 S3 삭제"""
-        key = self._normalize_key(path)
-        
-        try:
-            self.s3_client.delete_object(Bucket=self.bucket_name, Key=key)
-            return True
-        except ClientError:
-            return False
-
-    async def exists(self, path: str) -> bool:
-        """파일 존재 여부 확인"""
-        key = self._normalize_key(path)
-        
-        try:
-            self.s3_client.head_object(Bucket=self.bucket_name, Key=key)
-            return True
-        except ClientError:
-            return False
-
     def get_url(
         self,
         path: str,
@@ -168,7 +90,8 @@ class S3StorageService(AbstractStorageService):
 
         Args:
             path: 파일 경로
-            expires_in: URL 만료 시간 (초). None이면 settings에서 가져옴
+            expires_in: URL 최소 유효 시간 (초). None이면 settings에서 가져옴
+                (만료 시각은 signed_url_bucket_seconds 경계로 올림)
             bypass_cdn: S3에서는 CDN을 사용하지 않으므로 무시됨 (호환성 유지)
             is_shared: 공개 여부 (S3에서는 모두 Pre-signed URL 사용)
             content_type: 콘텐츠 타입 (만료 시간 결정용)
@@ -193,17 +116,22 @@ class S3StorageService(AbstractStorageService):
                 # 공개 파일도 Pre-signed URL (S3 특성)
                 expires_in = settings.aws_s3_presigned_url_expiration
 
-        try:
+        def sign(expiration: int) -> str:
+            # SigV4는 서명 시각 기준 상대 만료 → 버킷 종료 시각 + expires_in까지 남은 시간으로 서명
             presigned_url = self.s3_client.generate_presigned_url(
                 'get_object',
                 Params={
                     'Bucket': self.bucket_name,
                     'Key': key
                 },
-                ExpiresIn=expires_in
+                ExpiresIn=expiration - int(time.time())
             )
-            logger.debug(f"Generated pre-signed URL for {key}, expires in {expires_in}s")
+            logger.debug(f"Generated pre-signed URL for {key}, expires at {expiration}")
             return presigned_url
+
+        try:
+            # 버킷 동안 같은 URL 재사용 (LRU)
+            return self.url_cache.get_or_sign((key, is_shared), expires_in, sign)
         except ClientError as e:
             logger.error(f"Failed to generate pre-signed URL for {key}: {e}")
             # Fallback: 공개 URL 반환 (버킷이 public일 경우)
@@ -19,10 +19,21 @@ from .core.middleware.auth import UserContextMiddleware
 from .core.events.redis_streams_bus import RedisStreamsEventBus
 from .core.dependencies import set_event_bus
 from .core.cache.config import initialize_cache
+from .core.cache.media import close_media_cache
+from .features.tts.word_store import close_word_audio_index
+from .features.tts.single_flight import close_word_audio_single_flight
+from .features.tts.word_prewarm import close_word_prewarm_jobs, get_word_prewarm_jobs
+from .infrastructure.storage.object_store import shutdown_storage_executor
+from .core.auth.password_pool import shutdown_password_hash_pool
+from .core.auth.providers.google_jwks import close_google_jwks_cache
+from .core.auth.revocation import close_access_token_revocations, get_access_token_revocations
+from .features.storybook.tasks.durable import close_dag_store
 from .core.tasks.voice_sync import sync_voice_status_periodically
 from .core.logging import configure_logging, get_logger
 from backend.features.tts.producer import TTSProducer
 from backend.features.storybook.dependencies import set_tts_producer
+from backend.features.storybook.cache import get_book_response_cache
+from backend.infrastructure.ai.factory import AIProviderFactory
 
 # Sentry 초기화
 if settings.sentry_dsn:
@@ -49,6 +60,11 @@ voice_sync_task: asyncio.Task = None
 from backend.features.tts.worker import TTSWorker
 tts_worker: TTSWorker = None
 
+# 전역 DAG Worker 인스턴스 (DAG_EMBEDDED_WORKER=true인 경우)
+from backend.features.storybook.tasks.worker import DAGWorker
+from backend.features.storybook.tasks.durable import TTS_PRODUCER_REF
+dag_worker: DAGWorker = None
+
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
@@ -100,6 +116,12 @@ async def lifespan(app: FastAPI):
         )
         await event_bus.start()
         set_event_bus(event_bus)  # 의존성 주입을 위해 설정
+        # 공유 책 응답 캐시 무효화 이벤트 구독
+        await get_book_response_cache().register(event_bus)
+        # 책 단어 오디오 사전 생성 작업 이벤트 구독
+        await get_word_prewarm_jobs().register(event_bus)
+        # 로그아웃된 access token 폐기 목록 동기화
+        await get_access_token_revocations().register(event_bus)
         print("✓ Event Bus started")
     except Exception as e:
         print(f"⚠ Event Bus failed to start: {e}")
@@ -125,13 +147,28 @@ async def lifespan(app: FastAPI):
         print(f"⚠ Voice sync task failed to start: {e}")
 
     # TTS Worker 시작 (이벤트 컨슈머)
+    # 전용 워커 프로세스 사용 시: TTS_EMBEDDED_WORKER=false
+    #   python -m backend.features.tts.worker
     global tts_worker
-    try:
-        tts_worker = TTSWorker()
-        asyncio.create_task(tts_worker.start())
-        print("✓ TTS Worker started")
-    except Exception as e:
-        print(f"⚠ TTS Worker failed to start: {e}")
+    if settings.tts_embedded_worker:
+        try:
+            tts_worker = TTSWorker()
+            asyncio.create_task(tts_worker.start())
+            print("✓ TTS Worker started")
+        except Exception as e:
+            print(f"⚠ TTS Worker failed to start: {e}")
+
+    # DAG Worker 시작 (동화책 생성 파이프라인)
+    # 전용 워커 프로세스 사용 시: DAG_EMBEDDED_WORKER=false
+    #   python -m backend.features.storybook.tasks.worker
+    global dag_worker
+    if settings.dag_embedded_worker:
+        try:
+            dag_worker = DAGWorker(resources={TTS_PRODUCER_REF: tts_producer})
+            asyncio.create_task(dag_worker.start())
+            print("✓ DAG Worker started")
+        except Exception as e:
+            print(f"⚠ DAG Worker failed to start: {e}")
 
     print(f"✓ {settings.app_title} Started Successfully")
     print("=" * 60)
@@ -169,6 +206,91 @@ async def lifespan(app: FastAPI):
             print("✓ TTS Worker stopped")
         except Exception as e:
             print(f"⚠ TTS Worker stop error: {e}")
+
+    # DAG Worker 중지 (실행 중인 노드는 ACK되지 않아 다른 Worker가 재개)
+    if dag_worker:
+        try:
+            await dag_worker.shutdown()
+            print("✓ DAG Worker stopped")
+        except Exception as e:
+            print(f"⚠ DAG Worker stop error: {e}")
+
+    # 미디어 캐시 Redis 연결 종료
+    try:
+        await close_media_cache()
+        print("✓ Media cache closed")
+    except Exception as e:
+        print(f"⚠ Media cache close error: {e}")
+
+    # 단어 오디오 인덱스 Redis 연결 종료
+    try:
+        await close_word_audio_index()
+        print("✓ Word audio index closed")
+    except Exception as e:
+        print(f"⚠ Word audio index close error: {e}")
+
+    # 단어 오디오 Single-Flight Redis 연결 종료
+    try:
+        await close_word_audio_single_flight()
+        print("✓ Word audio single-flight closed")
+    except Exception as e:
+        print(f"⚠ Word audio single-flight close error: {e}")
+
+    # 책 단어 오디오 사전 생성 작업 종료
+    try:
+        await close_word_prewarm_jobs()
+        print("✓ Word prewarm jobs closed")
+    except Exception as e:
+        print(f"⚠ Word prewarm jobs close error: {e}")
+
+    # DAG 저장소 Redis 연결 종료 (동화책 생성 요청 시 DAG 저장용)
+    try:
+        await close_dag_store()
+        print("✓ DAG store closed")
+    except Exception as e:
+        print(f"⚠ DAG store close error: {e}")
+
+    # 공유 책 응답 캐시 Redis 연결 종료
+    try:
+        await get_book_response_cache().close()
+        print("✓ Book response cache closed")
+    except Exception as e:
+        print(f"⚠ Book response cache close error: {e}")
+
+    # 오브젝트 스토리지 스레드 풀 종료 (Worker 종료 후: 진행 중인 업로드 완료 대기)
+    try:
+        shutdown_storage_executor()
+        print("✓ Storage executor stopped")
+    except Exception as e:
+        print(f"⚠ Storage executor stop error: {e}")
+
+    # Access token 폐기 목록 종료 (재로딩 Task 취소 + Redis 연결 종료)
+    try:
+        await close_access_token_revocations()
+        print("✓ Access token revocations closed")
+    except Exception as e:
+        print(f"⚠ Access token revocations close error: {e}")
+
+    # Google 서명 키 캐시 종료 (백그라운드 갱신 취소 + HTTP 연결 종료)
+    try:
+        await close_google_jwks_cache()
+        print("✓ Google JWKS cache closed")
+    except Exception as e:
+        print(f"⚠ Google JWKS cache close error: {e}")
+
+    # 비밀번호 해싱 스레드 풀 종료
+    try:
+        shutdown_password_hash_pool()
+        print("✓ Password hash pool stopped")
+    except Exception as e:
+        print(f"⚠ Password hash pool stop error: {e}")
+
+    # AI Provider HTTP 연결 풀 종료 (Worker 종료 후: 진행 중인 요청이 없는 상태)
+    try:
+        await AIProviderFactory.close()
+        print("✓ AI HTTP clients closed")
+    except Exception as e:
+        print(f"⚠ AI HTTP clients close error: {e}")
     
     await engine.dispose()
     print("✓ Database connections closed")
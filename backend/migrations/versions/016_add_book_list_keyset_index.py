@@ -0,0 +1,28 @@
+"""add_book_list_keyset_index
+
+Revision ID: 016
+Revises: 015
+Create Date: 2026-10-16
+
+Add (user_id, created_at, id) index on books for keyset pagination of the book list.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '016'
+down_revision: Union[str, None] = '015'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Add keyset pagination index to books table"""
+    op.create_index('idx_book_user_created', 'books', ['user_id', 'created_at', 'id'])
+
+
+def downgrade() -> None:
+    """Remove keyset pagination index from books table"""
+    op.drop_index('idx_book_user_created', table_name='books')
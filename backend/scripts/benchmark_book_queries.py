@@ -0,0 +1,175 @@
+#!/usr/bin/env python3
+"""
+동화책 조회 벤치마크 (상세/목록 엔드포인트의 DB 조회 + DTO 변환 구간)
+
+책 1권(pages × dialogues, 대사마다 번역 2개 + 오디오 1개)에 대해 두 방식을 비교합니다:
+- orm:        get_with_pages (selectinload 체인 + 세션 분리) → BookResponse.from_orm_with_urls
+- projection: get_book_detail (JSON 집계 쿼리 1회)            → BookResponse.from_projection
+
+목록은 get_user_books (전체 그래프 로딩)와 get_user_books_summary (컬럼 프로젝션)를 비교합니다.
+방식마다 호출당 실행된 SQL statement 수(DB 왕복)도 함께 출력합니다.
+
+실제 PostgreSQL(DATABASE_URL)이 필요합니다. 데이터는 트랜잭션 롤백으로 남기지 않습니다.
+
+사용법:
+    python -m backend.scripts.benchmark_book_queries --pages 20 --dialogues 3 --runs 20
+"""
+
+import argparse
+import asyncio
+import statistics
+import sys
+import time
+import uuid
+from pathlib import Path
+
+# Add project root to Python path
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from sqlalchemy import event, text
+
+from backend.core.database.session import AsyncSessionLocal, engine
+from backend.features.auth.models import User
+from backend.features.storybook.repository import BookRepository
+from backend.features.storybook.schemas import BookResponse, BookSummaryResponse
+
+
+class PassthroughStorage:
+    """URL 변환 비용을 제외하기 위한 Storage (경로 그대로 반환)"""
+
+    def get_url(self, path: str, is_shared: bool = False) -> str:
+        return path
+
+
+async def create_fixture_book(session, pages: int, dialogues: int):
+    """벤치마크용 사용자/책/페이지/대사/번역/오디오 생성 (커밋하지 않음)"""
+    user = User(email=f"bench_{uuid.uuid4()}@example.com", password_hash="x", is_active=True)
+    session.add(user)
+    await session.flush()
+    await session.execute(
+        text(f"SELECT set_config('app.current_user_id', '{user.id}', true)")
+    )
+
+    repo = BookRepository(session)
+    book = await repo.create(user_id=user.id, title="bench", voice_id="bench-voice", status="completed")
+    audios = []
+    for page_idx in range(pages):
+        page = await repo.add_page(
+            book.id, {"sequence": page_idx + 1, "image_prompt": "", "image_url": f"bench/{page_idx}.png"}
+        )
+        for dialogue_idx in range(dialogues):
+            dialogue = await repo.add_dialogue_with_translation(
+                page_id=page.id,
+                speaker="Narrator",
+                sequence=dialogue_idx + 1,
+                translations=[
+                    {"language_code": "en", "text": "Hello there.", "is_primary": True},
+                    {"language_code": "ko", "text": "안녕.", "is_primary": False},
+                ],
+            )
+            audios.append(
+                {
+                    "dialogue_id": dialogue.id,
+                    "language_code": "en",
+                    "voice_id": book.voice_id,
+                    "audio_url": f"bench/{uuid.uuid4()}.mp3",
+                    "status": "COMPLETED",
+                }
+            )
+    await repo.add_dialogue_audios(audios)
+    session.expunge_all()
+    return user, book
+
+
+class QueryCounter:
+    """실행된 SQL statement 수 집계 (engine before_cursor_execute 이벤트)"""
+
+    def __init__(self):
+        self.count = 0
+
+    def __call__(self, *args) -> None:
+        self.count += 1
+
+
+async def timed(coro_factory, runs: int, counter: QueryCounter) -> dict:
+    samples = []
+    start_count = counter.count
+    for _ in range(runs):
+        start = time.perf_counter()
+        await coro_factory()
+        samples.append(time.perf_counter() - start)
+    return {"samples": samples, "queries": (counter.count - start_count) / runs}
+
+
+async def benchmark(pages: int, dialogues: int, runs: int) -> None:
+    storage = PassthroughStorage()
+    counter = QueryCounter()
+
+    async with AsyncSessionLocal() as session:
+        user, book = await create_fixture_book(session, pages, dialogues)
+        repo = BookRepository(session)
+
+        async def detail_orm():
+            BookResponse.from_orm_with_urls(await repo.get_with_pages(book.id), storage)
+
+        async def detail_projection():
+            BookResponse.from_projection(await repo.get_book_detail(book.id), storage)
+
+        async def list_orm():
+            for item in await repo.get_user_books(user.id):
+                BookSummaryResponse.from_orm_with_urls(item, storage)
+
+        async def list_projection():
+            for row in await repo.get_user_books_summary(user.id):
+                BookSummaryResponse.from_row(row, storage)
+
+        # 워밍업 (커넥션/statement 캐시)
+        for runner in (detail_orm, detail_projection, list_orm, list_projection):
+            await runner()
+
+        event.listen(engine.sync_engine, "before_cursor_execute", counter)
+        try:
+            results = {
+                "detail": {
+                    "orm": await timed(detail_orm, runs, counter),
+                    "projection": await timed(detail_projection, runs, counter),
+                },
+                "list": {
+                    "orm": await timed(list_orm, runs, counter),
+                    "projection": await timed(list_projection, runs, counter),
+                },
+            }
+        finally:
+            event.remove(engine.sync_engine, "before_cursor_execute", counter)
+        await session.rollback()
+
+    total = pages * dialogues
+    print(f"\nBook queries ({pages} pages x {dialogues} dialogues = {total} dialogues, {runs} runs)")
+    for endpoint, modes in results.items():
+        print(f"  {endpoint}")
+        for mode, result in modes.items():
+            samples = result["samples"]
+            print(
+                f"    {mode:<10} median {statistics.median(samples) * 1000:8.2f} ms   "
+                f"min {min(samples) * 1000:8.2f} ms   "
+                f"queries {result['queries']:.0f}"
+            )
+        speedup = statistics.median(modes["orm"]["samples"]) / statistics.median(modes["projection"]["samples"])
+        print(f"    speedup    x{speedup:.1f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--pages", type=int, default=20)
+    parser.add_argument("--dialogues", type=int, default=3)
+    parser.add_argument("--runs", type=int, default=20)
+    args = parser.parse_args()
+    try:
+        asyncio.run(benchmark(args.pages, args.dialogues, args.runs))
+    except OSError as e:
+        sys.exit(f"PostgreSQL 연결 실패 (DATABASE_URL 확인): {e}")
+
+
+if __name__ == "__main__":
+    main()
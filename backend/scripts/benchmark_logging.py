@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+"""
+로그 출력 경로 부하 벤치마크 (로그가 많은 엔드포인트의 처리량 / p99)
+
+요청마다 extra가 붙은 INFO 로그 여러 줄을 남기는 최소 FastAPI 앱을 동시 요청으로 호출하고,
+로그 설정 세 가지를 비교합니다:
+- off: 로그 레벨 WARNING (INFO 로그 미출력, 기준선)
+- sync: StreamHandler (이벤트 루프에서 포맷 + write + flush)
+- async: AsyncLogHandler (큐에 넣기만 하고 writer 스레드가 배치 출력)
+
+출력 대상은 임시 파일입니다 (stdout 파이프 대용). --flush-latency로 flush마다 지연을 주어
+느린 로그 수집기에 연결된 파이프를 흉내낼 수 있습니다. 외부 서비스 없이 실행됩니다 (DB / Redis 불필요).
+
+사용법:
+    python -m backend.scripts.benchmark_logging --requests 2000 --concurrency 50 --lines 5
+    python -m backend.scripts.benchmark_logging --flush-latency 0.5
+"""
+
+import argparse
+import asyncio
+import logging
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+from unittest.mock import patch
+
+# Add project root to Python path
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+import httpx
+from fastapi import FastAPI
+
+from backend.core.config import settings
+from backend.core.logging import configure_logging
+
+MODES = {
+    "off": {"log_level": "WARNING", "log_async_enabled": False},
+    "sync": {"log_level": "INFO", "log_async_enabled": False},
+    "async": {"log_level": "INFO", "log_async_enabled": True},
+}
+
+
+class SlowSink:
+    """flush마다 지연되는 출력 stream (파이프가 가득 찬 stdout 대용)"""
+
+    def __init__(self, stream, flush_latency: float):
+        self.stream = stream
+        self.flush_latency = flush_latency
+
+    def write(self, text: str) -> int:
+        return self.stream.write(text)
+
+    def flush(self) -> None:
+        self.stream.flush()
+        time.sleep(self.flush_latency)
+
+
+def percentile(samples: list, pct: float) -> float:
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * pct))]
+
+
+def create_app(lines: int) -> FastAPI:
+    app = FastAPI()
+    logger = logging.getLogger("backend.features.benchmark")
+
+    @app.get("/items/{item_id}")
+    async def get_item(item_id: int):
+        for step in range(lines):
+            logger.info(
+                "Processing item",
+                extra={"item_id": item_id, "step": step, "payload": {"size": item_id % 97}},
+            )
+        return {"id": item_id}
+
+    return app
+
+
+async def run(app: FastAPI, requests: int, concurrency: int) -> dict:
+    latencies = []
+    semaphore = asyncio.Semaphore(concurrency)
+    transport = httpx.ASGITransport(app=app)
+
+    async with httpx.AsyncClient(transport=transport, base_url="http://benchmark") as client:
+
+        async def call(item_id: int) -> None:
+            async with semaphore:
+                start = time.perf_counter()
+                response = await client.get(f"/items/{item_id}")
+                latencies.append(time.perf_counter() - start)
+                assert response.status_code == 200
+
+        start = time.perf_counter()
+        await asyncio.gather(*(call(i) for i in range(requests)))
+        elapsed = time.perf_counter() - start
+
+    return {"elapsed": elapsed, "latencies": latencies}
+
+
+def run_mode(mode: str, args) -> dict:
+    app = create_app(args.lines)
+    with tempfile.TemporaryFile(mode="w+", encoding="utf-8") as sink, \
+            patch.multiple(settings, log_json_format=True, **MODES[mode]):
+        configure_logging(stream=SlowSink(sink, args.flush_latency / 1e3))
+        try:
+            result = asyncio.run(run(app, args.requests, args.concurrency))
+        finally:
+            for handler in logging.getLogger().handlers:
+                handler.close()  # async: 남은 레코드 출력 대기
+            logging.getLogger().handlers = []
+        sink.seek(0)
+        result["written"] = sum(1 for _ in sink)
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=50)
+    parser.add_argument("--lines", type=int, default=5, help="요청당 INFO 로그 수")
+    parser.add_argument("--flush-latency", type=float, default=0.0, help="flush당 지연 (ms)")
+    args = parser.parse_args()
+
+    results = {mode: run_mode(mode, args) for mode in MODES}
+
+    print(f"\nRequests: {args.requests} (concurrency={args.concurrency}, {args.lines} log lines/request, "
+          f"flush latency {args.flush_latency} ms)")
+    for mode, result in results.items():
+        latencies = result["latencies"]
+        throughput = len(latencies) / result["elapsed"]
+        print(
+            f"  {mode:<6} {throughput:8.1f} req/s   "
+            f"p50 {statistics.median(latencies) * 1e3:7.2f} ms   "
+            f"p99 {percentile(latencies, 0.99) * 1e3:7.2f} ms   "
+            f"lines written {result['written']}"
+        )
+
+
+if __name__ == "__main__":
+    main()
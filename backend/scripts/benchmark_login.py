@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+"""
+로그인 비밀번호 검증 부하 벤치마크 (동시 로그인 폭주 시 처리량 / p99 / 이벤트 루프 지연)
+
+동시 로그인 N건의 Argon2 검증을 두 방식으로 실행합니다:
+- inline: 이벤트 루프에서 직접 검증 (기존 방식, 검증 동안 다른 요청 전부 정지)
+- pool: 전용 비밀번호 해싱 스레드 풀에서 검증 (대기열 상한 초과 시 503)
+
+검증과 동시에 10ms 주기의 probe 코루틴을 돌려, 다른 요청이 체감하는 이벤트 루프 지연을 측정합니다.
+외부 서비스 없이 실행됩니다 (DB / Redis 불필요).
+
+사용법:
+    python -m backend.scripts.benchmark_login --logins 64 --workers 4 --max-pending 128
+"""
+
+import argparse
+import asyncio
+import statistics
+import sys
+import time
+from pathlib import Path
+
+# Add project root to Python path
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from backend.core.auth.exceptions import PasswordHashingBusyException
+from backend.core.auth.password_pool import PasswordHashPool
+from backend.core.auth.providers.credentials import CredentialsAuthProvider
+
+PASSWORD = "benchmark-password-123"
+PROBE_INTERVAL = 0.01
+
+
+def percentile(samples: list, pct: float) -> float:
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * pct))]
+
+
+async def probe(stop: asyncio.Event, lags: list) -> None:
+    """이벤트 루프 지연 측정 (예정 시각 대비 실제 깨어난 시각)"""
+    while not stop.is_set():
+        start = time.perf_counter()
+        await asyncio.sleep(PROBE_INTERVAL)
+        lags.append(time.perf_counter() - start - PROBE_INTERVAL)
+
+
+async def run(mode: str, hashed: str, logins: int, pool: PasswordHashPool) -> dict:
+    verify = CredentialsAuthProvider.pwd_context.verify
+    latencies, lags = [], []
+    rejected = 0
+
+    async def login() -> None:
+        nonlocal rejected
+        start = time.perf_counter()
+        try:
+            if mode == "inline":
+                await asyncio.sleep(0)  # 요청 수신 지점
+                assert verify(PASSWORD, hashed)
+            else:
+                assert await pool.run(verify, PASSWORD, hashed)
+        except PasswordHashingBusyException:
+            rejected += 1
+            return
+        latencies.append(time.perf_counter() - start)
+
+    stop = asyncio.Event()
+    probe_task = asyncio.create_task(probe(stop, lags))
+    await asyncio.sleep(PROBE_INTERVAL)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(login() for _ in range(logins)))
+    elapsed = time.perf_counter() - start
+
+    stop.set()
+    await probe_task
+    return {
+        "elapsed": elapsed,
+        "latencies": latencies,
+        "lags": lags or [0.0],
+        "rejected": rejected,
+    }
+
+
+async def main_async(args) -> None:
+    hashed = CredentialsAuthProvider.hash_password(PASSWORD)
+    pool = PasswordHashPool(max_workers=args.workers, max_pending=args.max_pending)
+    try:
+        results = {mode: await run(mode, hashed, args.logins, pool) for mode in ("inline", "pool")}
+    finally:
+        pool.shutdown()
+
+    print(f"\nConcurrent logins: {args.logins} (pool workers={args.workers}, max pending={args.max_pending})")
+    for mode, result in results.items():
+        latencies = result["latencies"] or [0.0]
+        throughput = len(result["latencies"]) / result["elapsed"]
+        print(
+            f"  {mode:<7} {throughput:6.1f} logins/s   "
+            f"p50 {statistics.median(latencies) * 1e3:8.1f} ms   "
+            f"p99 {percentile(latencies, 0.99) * 1e3:8.1f} ms   "
+            f"loop lag max {max(result['lags']) * 1e3:8.1f} ms   "
+            f"rejected {result['rejected']}"
+        )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--logins", type=int, default=32)
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--max-pending", type=int, default=128)
+    args = parser.parse_args()
+    asyncio.run(main_async(args))
+
+
+if __name__ == "__main__":
+    main()
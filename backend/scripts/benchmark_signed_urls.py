@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""
+Signed URL 벤치마크 (책 1권 응답의 R2 CDN URL 서명 구간)
+
+책 1권(표지 + pages 이미지 + pages × dialogues 오디오)의 URL을 두 방식으로 서명합니다:
+- uncached: 요청마다 HMAC 서명 (signed_url_bucket_seconds=0, 매번 다른 URL)
+- bucketed: 만료 시각을 시간 버킷으로 올림 + LRU 재사용 (버킷 동안 같은 URL)
+
+외부 서비스 없이 실행됩니다 (R2 설정은 더미 값 사용).
+
+사용법:
+    python -m backend.scripts.benchmark_signed_urls --pages 20 --dialogues 3 --requests 1000
+"""
+
+import argparse
+import statistics
+import sys
+import time
+import uuid
+from pathlib import Path
+from unittest.mock import patch
+
+# Add project root to Python path
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from backend.core.config import settings
+from backend.infrastructure.storage.r2 import R2StorageService
+
+DUMMY_R2 = {
+    "r2_endpoint_url": "https://bench.r2.cloudflarestorage.com",
+    "r2_bucket_name": "bench",
+    "r2_access_key_id": "bench",
+    "r2_secret_access_key": "bench",
+    "cloudflare_cdn_domain": "https://cdn.bench.example.com",
+    "cloudflare_signing_key": "bench-signing-key",
+}
+
+
+def book_paths(pages: int, dialogues: int) -> list:
+    base = f"users/{uuid.uuid4()}/books/{uuid.uuid4()}"
+    paths = [f"{base}/cover.png"]
+    for page in range(1, pages + 1):
+        paths.append(f"{base}/images/page_{page}.png")
+        paths.extend(f"{base}/audios/page_{page}_{d}.mp3" for d in range(1, dialogues + 1))
+    return paths
+
+
+def make_storage(bucket_seconds: int) -> R2StorageService:
+    with patch.multiple(settings, signed_url_bucket_seconds=bucket_seconds, **DUMMY_R2):
+        return R2StorageService()
+
+
+def run(storage: R2StorageService, paths: list, requests: int) -> list:
+    samples = []
+    for _ in range(requests):
+        start = time.perf_counter()
+        for path in paths:
+            storage.get_url(path, is_shared=False)
+        samples.append(time.perf_counter() - start)
+    return samples
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--pages", type=int, default=20)
+    parser.add_argument("--dialogues", type=int, default=3)
+    parser.add_argument("--requests", type=int, default=1000)
+    args = parser.parse_args()
+
+    paths = book_paths(args.pages, args.dialogues)
+    results = {
+        "uncached": run(make_storage(0), paths, args.requests),
+        "bucketed": run(make_storage(settings.signed_url_bucket_seconds), paths, args.requests),
+    }
+
+    print(f"\nURL signing per book response ({len(paths)} URLs, {args.requests} requests)")
+    for mode, samples in results.items():
+        print(
+            f"  {mode:<10} median {statistics.median(samples) * 1e6:8.1f} us   "
+            f"min {min(samples) * 1e6:8.1f} us"
+        )
+    speedup = statistics.median(results["uncached"]) / statistics.median(results["bucketed"])
+    print(f"  speedup    x{speedup:.1f}")
+
+
+if __name__ == "__main__":
+    main()
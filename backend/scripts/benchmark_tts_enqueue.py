@@ -0,0 +1,163 @@
+#!/usr/bin/env python3
+"""
+TTS Stage 벤치마크 (generate_tts_task의 DB INSERT + Redis enqueue 구간)
+
+책 1권(pages × dialogues)에 대해 두 방식을 비교합니다:
+- sequential: 대사마다 add_dialogue_audio (flush + refresh) + publish (XADD 1회)
+- batched:    add_dialogue_audios (multi-row INSERT ... RETURNING) + publish_many (XADD 파이프라인)
+
+방식마다 책 1권당 실행된 SQL statement 수(DB 왕복)도 함께 출력합니다.
+
+실제 PostgreSQL/Redis(DATABASE_URL, REDIS_URL)가 필요합니다.
+- DB 데이터는 트랜잭션 롤백으로 남기지 않습니다.
+- XADD는 "bench:events:*" 스트림에 기록하고 종료 시 삭제합니다 (TTS Worker가 소비하지 않음).
+
+사용법:
+    python -m backend.scripts.benchmark_tts_enqueue --pages 10 --dialogues 4 --runs 5
+"""
+
+import argparse
+import asyncio
+import statistics
+import sys
+import time
+import uuid
+from pathlib import Path
+
+# Add project root to Python path
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from redis.exceptions import ConnectionError as RedisConnectionError
+from sqlalchemy import event, text
+
+from backend.core.database.session import AsyncSessionLocal, engine
+from backend.core.events.redis_streams_bus import RedisStreamsEventBus
+from backend.core.events.types import EventType
+from backend.features.auth.models import User
+from backend.features.storybook.repository import BookRepository
+
+BENCH_STREAM_PREFIX = "bench:events"
+
+
+async def create_fixture_book(session, pages: int, dialogues: int):
+    """벤치마크용 사용자/책/페이지/대사 생성 (커밋하지 않음)"""
+    user = User(email=f"bench_{uuid.uuid4()}@example.com", password_hash="x", is_active=True)
+    session.add(user)
+    await session.flush()
+    await session.execute(
+        text(f"SELECT set_config('app.current_user_id', '{user.id}', true)")
+    )
+
+    repo = BookRepository(session)
+    book = await repo.create(user_id=user.id, title="bench", voice_id="bench-voice")
+    dialogue_ids = []
+    for page_idx in range(pages):
+        page = await repo.add_page(book.id, {"sequence": page_idx + 1, "image_prompt": ""})
+        for dialogue_idx in range(dialogues):
+            dialogue = await repo.add_dialogue_with_translation(
+                page_id=page.id,
+                speaker="Narrator",
+                sequence=dialogue_idx + 1,
+                translations=[{"language_code": "en", "text": "Hello there.", "is_primary": True}],
+            )
+            dialogue_ids.append(dialogue.id)
+    return book, dialogue_ids
+
+
+class QueryCounter:
+    """실행된 SQL statement 수 집계 (engine before_cursor_execute 이벤트)"""
+
+    def __init__(self):
+        self.count = 0
+
+    def __call__(self, *args) -> None:
+        self.count += 1
+
+
+def audio_rows(book, dialogue_ids):
+    return [
+        {
+            "dialogue_id": dialogue_id,
+            "language_code": "en",
+            "voice_id": book.voice_id,
+            "audio_url": f"bench/{uuid.uuid4()}.mp3",
+            "status": "PENDING",
+        }
+        for dialogue_id in dialogue_ids
+    ]
+
+
+async def run_sequential(repo, bus, book, dialogue_ids) -> float:
+    start = time.perf_counter()
+    audios = []
+    for row in audio_rows(book, dialogue_ids):
+        audios.append(await repo.add_dialogue_audio(**row))
+    for audio in audios:
+        await bus.publish(EventType.TTS_CREATION, {"uuid": str(audio.id), "text": "Hello there."})
+    return time.perf_counter() - start
+
+
+async def run_batched(repo, bus, book, dialogue_ids) -> float:
+    start = time.perf_counter()
+    audios = await repo.add_dialogue_audios(audio_rows(book, dialogue_ids))
+    await bus.publish_many(
+        EventType.TTS_CREATION,
+        [{"uuid": str(audio.id), "text": "Hello there."} for audio in audios],
+    )
+    return time.perf_counter() - start
+
+
+async def benchmark(pages: int, dialogues: int, runs: int) -> None:
+    bus = RedisStreamsEventBus(consumer_group="bench", stream_prefix=BENCH_STREAM_PREFIX)
+    await bus.connect()
+    results = {"sequential": [], "batched": []}
+    queries = {}
+    counter = QueryCounter()
+
+    try:
+        for _ in range(runs):
+            for mode, runner in (("sequential", run_sequential), ("batched", run_batched)):
+                async with AsyncSessionLocal() as session:
+                    book, dialogue_ids = await create_fixture_book(session, pages, dialogues)
+                    start_count = counter.count
+                    event.listen(engine.sync_engine, "before_cursor_execute", counter)
+                    try:
+                        results[mode].append(
+                            await runner(BookRepository(session), bus, book, dialogue_ids)
+                        )
+                    finally:
+                        event.remove(engine.sync_engine, "before_cursor_execute", counter)
+                    queries[mode] = counter.count - start_count
+                    await session.rollback()
+    finally:
+        for event_type in EventType:
+            await bus.redis.delete(f"{BENCH_STREAM_PREFIX}:{event_type.value}")
+        await bus.redis.close()
+
+    total = pages * dialogues
+    print(f"\nTTS stage per book ({pages} pages x {dialogues} dialogues = {total} audios, {runs} runs)")
+    for mode, samples in results.items():
+        print(
+            f"  {mode:<10} median {statistics.median(samples) * 1000:8.1f} ms   "
+            f"min {min(samples) * 1000:8.1f} ms   "
+            f"queries {queries[mode]}"
+        )
+    speedup = statistics.median(results["sequential"]) / statistics.median(results["batched"])
+    print(f"  speedup    x{speedup:.1f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--pages", type=int, default=10)
+    parser.add_argument("--dialogues", type=int, default=4)
+    parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args()
+    try:
+        asyncio.run(benchmark(args.pages, args.dialogues, args.runs))
+    except (OSError, RedisConnectionError) as e:
+        sys.exit(f"PostgreSQL / Redis 연결 실패 (DATABASE_URL, REDIS_URL 확인): {e}")
+
+
+if __name__ == "__main__":
+    main()
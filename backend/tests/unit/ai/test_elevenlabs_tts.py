@@ -0,0 +1,86 @@
+"""
+ElevenLabs TTS Provider Tests
+비동기 SDK 클라이언트 + 공유 연결 풀 + 스트리밍 변환 테스트
+"""
+
+import asyncio
+import pytest
+import httpx
+from unittest.mock import patch
+
+from backend.features.tts.exceptions import (
+    TTSAPIAuthenticationFailedException,
+    TTSGenerationFailedException,
+)
+from backend.infrastructure.ai.http_client import http_clients
+from backend.infrastructure.ai.providers.elevenlabs_tts import ElevenLabsTTSProvider
+
+
+def patch_pool(handler):
+    """공유 "elevenlabs" 클라이언트를 MockTransport 클라이언트로 교체"""
+    client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    return patch.object(http_clients, "get", return_value=client)
+
+
+class ChunkedBody(httpx.AsyncByteStream):
+    def __init__(self, chunks):
+        self.chunks = chunks
+
+    async def __aiter__(self):
+        for chunk in self.chunks:
+            await asyncio.sleep(0)
+            yield chunk
+
+
+@pytest.fixture
+def provider():
+    return ElevenLabsTTSProvider(api_key="key")
+
+
+class TestElevenLabsStreaming:
+    """스트리밍 TTS 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_stream_yields_chunks_as_they_arrive(self, provider):
+        requests = []
+
+        def handler(request):
+            requests.append(request)
+            return httpx.Response(200, stream=ChunkedBody([b"ID3", b"frame1", b"frame2"]))
+
+        with patch_pool(handler):
+            chunks = [c async for c in provider.text_to_speech_stream("Hello", voice_id="v1")]
+
+        assert b"".join(chunks) == b"ID3frame1frame2"
+        assert requests[0].url.path.endswith("/v1/text-to-speech/v1")
+        assert requests[0].headers["xi-api-key"] == "key"
+
+    @pytest.mark.asyncio
+    async def test_text_to_speech_collects_stream(self, provider):
+        with patch_pool(lambda request: httpx.Response(200, content=b"mp3-data")):
+            audio = await provider.text_to_speech("Hello", voice_id="v1")
+
+        assert audio == b"mp3-data"
+
+    @pytest.mark.asyncio
+    async def test_sdk_client_reuses_shared_pool(self, provider):
+        client = httpx.AsyncClient(transport=httpx.MockTransport(lambda r: httpx.Response(200)))
+
+        with patch.object(http_clients, "get", return_value=client):
+            first = provider.client
+            second = provider.client
+
+        assert first is second
+
+    @pytest.mark.asyncio
+    async def test_unauthorized_maps_to_auth_exception(self, provider):
+        with patch_pool(lambda request: httpx.Response(401, json={"detail": "unauthorized"})):
+            with pytest.raises(TTSAPIAuthenticationFailedException):
+                await provider.text_to_speech("Hello", voice_id="v1")
+
+    @pytest.mark.asyncio
+    async def test_server_error_maps_to_generation_failed(self, provider):
+        with patch_pool(lambda request: httpx.Response(500, json={"detail": "boom"})):
+            with pytest.raises(TTSGenerationFailedException):
+                async for _ in provider.text_to_speech_stream("Hello", voice_id="v1"):
+                    pass
@@ -0,0 +1,118 @@
+"""
+AI HTTP Client Registry Tests
+공유 httpx 클라이언트 (재사용, Provider별 연결 제한, 풀 메트릭, 종료) 테스트
+"""
+
+import asyncio
+import pytest
+import httpx
+from unittest.mock import AsyncMock, patch
+
+from backend.infrastructure.ai.factory import AIProviderFactory
+from backend.infrastructure.ai.http_client import (
+    HTTPClientRegistry,
+    InstrumentedTransport,
+    PoolStats,
+)
+
+
+@pytest.fixture
+def registry():
+    return HTTPClientRegistry()
+
+
+class TestHTTPClientRegistry:
+    """HTTPClientRegistry 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_client_reused_across_calls(self, registry):
+        first = registry.get("runware")
+        async with registry.client("runware") as second:
+            pass
+
+        assert first is second
+        assert not first.is_closed  # 컨텍스트 종료 후에도 닫히지 않음
+        assert registry.get("kling") is not first
+
+        await registry.aclose()
+
+    @pytest.mark.asyncio
+    async def test_per_provider_limits(self, registry):
+        with patch(
+            "backend.infrastructure.ai.http_client.settings.http_pool_max_connections",
+            {"runware": 7},
+        ), patch("backend.infrastructure.ai.http_client.settings.http_max_connections", 3):
+            assert registry.limits_for("runware").max_connections == 7
+            assert registry.limits_for("unknown").max_connections == 3
+
+            registry.get("runware")
+            stats = registry.get_stats()
+
+        assert stats["runware"]["max_connections"] == 7
+        assert stats["runware"]["connections"] == 0
+        await registry.aclose()
+
+    @pytest.mark.asyncio
+    async def test_aclose_closes_clients(self, registry):
+        client = registry.get("cdn")
+        await registry.aclose()
+
+        assert client.is_closed
+        assert registry.get("cdn") is not client
+        await registry.aclose()
+
+    def test_new_client_per_event_loop(self, registry):
+        """다른 이벤트 루프에서는 이전 루프의 연결을 재사용하지 않음"""
+
+        async def get_client():
+            return registry.get("runware")
+
+        first = asyncio.run(get_client())
+        second = asyncio.run(get_client())
+
+        assert first is not second
+
+    def test_factory_owns_registry(self):
+        assert isinstance(AIProviderFactory.http_clients, HTTPClientRegistry)
+
+
+class TestInstrumentedTransport:
+    """연결 풀 대기 시간 측정 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_wait_time_recorded_until_first_trace_event(self):
+        stats = PoolStats()
+        transport = InstrumentedTransport(stats=stats)
+
+        async def fake_handle(self, request):
+            await asyncio.sleep(0.02)  # 연결 대기
+            await request.extensions["trace"]("http11.send_request_headers.started", {})
+            await request.extensions["trace"]("http11.send_request_headers.complete", {})
+            return httpx.Response(200)
+
+        user_trace = AsyncMock()
+        request = httpx.Request("GET", "https://cdn.test/a.webp", extensions={"trace": user_trace})
+
+        with patch.object(httpx.AsyncHTTPTransport, "handle_async_request", fake_handle):
+            response = await transport.handle_async_request(request)
+
+        assert response.status_code == 200
+        assert stats.requests == 1
+        assert stats.max_wait_time >= 0.015
+        assert user_trace.await_count == 2  # 기존 trace 콜백도 계속 호출
+
+    @pytest.mark.asyncio
+    async def test_errors_counted(self):
+        stats = PoolStats()
+        transport = InstrumentedTransport(stats=stats)
+
+        async def failing_handle(self, request):
+            raise httpx.ConnectError("refused")
+
+        with patch.object(httpx.AsyncHTTPTransport, "handle_async_request", failing_handle):
+            with pytest.raises(httpx.ConnectError):
+                await transport.handle_async_request(httpx.Request("GET", "https://x.test"))
+
+        assert stats.errors == 1
+        assert transport.pool_snapshot()["connections"] == 0
+        await transport.aclose()
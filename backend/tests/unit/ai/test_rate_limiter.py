@@ -0,0 +1,140 @@
+"""
+Rate Limiter Tests
+Provider별 분산 제한 (우선순위 예약, 429/지연 적응, Redis 장애 시 로컬 대체) 테스트
+"""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import httpx
+import pytest
+import redis.asyncio as aioredis
+
+from backend.core.config import settings
+from backend.core.limiters import Priority, RateLimiter, is_throttle_error
+
+POLICIES = {"elevenlabs:tts": {"concurrency": 2, "reserved": 1, "latency_target": 0.05}}
+
+
+@pytest.fixture(autouse=True)
+def policies():
+    with patch.object(settings, "rate_limit_policies", POLICIES):
+        yield
+
+
+def redis_limiter(acquire_results):
+    """Lua 스크립트 호출만 흉내내는 Redis 기반 Limiter"""
+    limiter = RateLimiter(redis_url="redis://unused", distributed=True)
+    limiter.redis = MagicMock()
+    limiter.redis.zrem = AsyncMock()
+    limiter._acquire_script = AsyncMock(side_effect=acquire_results)
+    limiter._adapt_script = AsyncMock(return_value="0.5")
+    return limiter
+
+
+class TestThrottleDetection:
+    def test_status_code_and_message(self):
+        response = httpx.Response(429, request=httpx.Request("POST", "https://api.example.com"))
+        assert is_throttle_error(httpx.HTTPStatusError("x", request=response.request, response=response))
+        assert is_throttle_error(Exception("ElevenLabs TTS 생성 실패: status_code: 429"))
+        assert is_throttle_error(Exception("Too Many Requests"))
+        assert not is_throttle_error(Exception("HTTP 500: boom"))
+
+
+class TestLocalLimits:
+    """Redis 없이 프로세스 로컬 제한"""
+
+    @pytest.mark.asyncio
+    async def test_batch_cannot_use_reserved_slot(self):
+        limiter = RateLimiter(distributed=False)
+        release = asyncio.Event()
+
+        async def hold(priority):
+            async with limiter.limit("elevenlabs", "tts", priority):
+                await release.wait()
+
+        batch = asyncio.create_task(hold(Priority.BATCH))
+        await asyncio.sleep(0)
+        second_batch = asyncio.create_task(hold(Priority.BATCH))
+        interactive = asyncio.create_task(hold(Priority.INTERACTIVE))
+        await asyncio.sleep(0.01)
+
+        # 슬롯 2개 중 1개는 INTERACTIVE 전용
+        gate = limiter._local_gates["elevenlabs:tts"]
+        assert gate.active == 2
+        assert not second_batch.done()
+
+        release.set()
+        await asyncio.wait_for(asyncio.gather(batch, second_batch, interactive), timeout=1)
+        assert gate.active == 0
+
+    @pytest.mark.asyncio
+    async def test_throttle_halves_and_success_recovers(self):
+        limiter = RateLimiter(distributed=False)
+
+        with pytest.raises(Exception):
+            async with limiter.limit("elevenlabs", "tts"):
+                raise Exception("status_code: 429")
+        assert limiter._local_factors["elevenlabs:tts"] == 0.5
+
+        async with limiter.limit("elevenlabs", "tts"):
+            pass
+        assert limiter._local_factors["elevenlabs:tts"] == pytest.approx(0.5 + settings.rate_limit_recovery_step)
+
+    @pytest.mark.asyncio
+    async def test_latency_spike_reduces_allowance(self):
+        limiter = RateLimiter(distributed=False)
+
+        async with limiter.limit("elevenlabs", "tts"):
+            await asyncio.sleep(0.06)
+
+        assert limiter._local_factors["elevenlabs:tts"] == pytest.approx(0.8)
+        assert limiter.get_stats()["elevenlabs:tts"]["slow"] == 1
+
+
+class TestDistributedLimits:
+    """Redis 공유 제한"""
+
+    @pytest.mark.asyncio
+    async def test_waits_for_token_then_releases_lease(self):
+        limiter = redis_limiter([[0, 20, "1.0"], [1, 0, "1.0"]])
+
+        with patch.object(limiter, "_connect", AsyncMock()):
+            async with limiter.limit("elevenlabs", "tts", Priority.INTERACTIVE):
+                pass
+
+        first, second = limiter._acquire_script.await_args_list
+        assert first.kwargs["keys"] == ["ratelimit:elevenlabs:tts", "ratelimit:elevenlabs:tts:leases"]
+        # args: rate, burst, concurrency, reserved, is_batch, lease_id, lease_ttl_ms
+        assert first.kwargs["args"][2:5] == [2, 1, 0]
+        lease_id = second.kwargs["args"][5]
+        limiter.redis.zrem.assert_awaited_once_with("ratelimit:elevenlabs:tts:leases", lease_id)
+        limiter._adapt_script.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_throttle_reported_to_shared_state(self):
+        limiter = redis_limiter([[1, 0, "1.0"]])
+
+        with patch.object(limiter, "_connect", AsyncMock()):
+            with pytest.raises(Exception):
+                async with limiter.limit("elevenlabs", "tts"):
+                    raise Exception("429 Too Many Requests")
+
+        assert limiter._adapt_script.await_args.kwargs["args"][0] == "throttle"
+        assert limiter.get_stats()["elevenlabs:tts"]["factor"] == 0.5
+        limiter.redis.zrem.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_redis_failure_falls_back_to_local(self):
+        limiter = redis_limiter([aioredis.ConnectionError("down")])
+
+        with patch.object(limiter, "_connect", AsyncMock()):
+            async with limiter.limit("elevenlabs", "tts"):
+                pass
+            async with limiter.limit("elevenlabs", "tts"):
+                pass
+
+        # 장애 후 재시도 대기 시간 동안은 Redis를 다시 호출하지 않음
+        assert limiter._acquire_script.await_count == 1
+        assert limiter.get_stats()["elevenlabs:tts"]["fallback"] == 2
+        limiter.redis.zrem.assert_not_awaited()
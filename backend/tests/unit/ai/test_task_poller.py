@@ -0,0 +1,219 @@
+"""
+Task Status Poller Tests
+공유 폴러 (일괄 조회, 결과 분배, 적응형 간격, 타임아웃) 및 Runware 일괄 상태 조회 테스트
+"""
+
+import asyncio
+import pytest
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from backend.infrastructure.ai.http_client import http_clients
+from backend.infrastructure.ai.poller import TaskStatusPoller, get_task_poller
+from backend.infrastructure.ai.providers.runware import RunwareProvider
+
+
+def _poller(check_batch, **kwargs):
+    params = dict(
+        check_batch=check_batch,
+        name="test",
+        max_interval=0.05,
+        min_interval=0.01,
+        backoff_factor=0.5,
+        batch_size=50,
+    )
+    params.update(kwargs)
+    return TaskStatusPoller(**params)
+
+
+class TestTaskStatusPoller:
+    """TaskStatusPoller 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_batches_tasks_from_multiple_waiters(self):
+        """여러 Book의 작업이 하나의 요청으로 조회되고 각자 결과를 받음"""
+        calls = []
+
+        async def check_batch(task_ids):
+            calls.append(list(task_ids))
+            return {tid: {"status": "completed", "image_url": f"url-{tid}"} for tid in task_ids}
+
+        poller = _poller(check_batch)
+
+        book_a, book_b = await asyncio.gather(
+            poller.wait_many(["a1", "a2"], timeout=1),
+            poller.wait_many(["b1"], timeout=1),
+        )
+
+        assert len(calls) == 1
+        assert sorted(calls[0]) == ["a1", "a2", "b1"]
+        assert book_a["a2"]["image_url"] == "url-a2"
+        assert book_b["b1"]["status"] == "completed"
+        assert poller.pending_count == 0
+
+    @pytest.mark.asyncio
+    async def test_respects_batch_size(self):
+        calls = []
+
+        async def check_batch(task_ids):
+            calls.append(len(task_ids))
+            return {tid: {"status": "failed", "error": "x"} for tid in task_ids}
+
+        poller = _poller(check_batch, batch_size=2)
+        results = await poller.wait_many(["t1", "t2", "t3", "t4", "t5"], timeout=1)
+
+        assert sorted(calls) == [1, 2, 2]
+        assert all(r["status"] == "failed" for r in results.values())
+
+    @pytest.mark.asyncio
+    async def test_keeps_polling_until_final_status(self):
+        responses = iter(["processing", "processing", "completed"])
+
+        async def check_batch(task_ids):
+            return {tid: {"status": next(responses)} for tid in task_ids}
+
+        poller = _poller(check_batch)
+        result = await poller.wait("t1", timeout=1)
+
+        assert result == {"status": "completed"}
+
+    @pytest.mark.asyncio
+    async def test_timeout_returns_none_and_drops_task(self):
+        async def check_batch(task_ids):
+            return {tid: {"status": "processing"} for tid in task_ids}
+
+        poller = _poller(check_batch)
+        results = await poller.wait_many(["slow"], timeout=0.05)
+
+        assert results == {"slow": None}
+        assert poller.pending_count == 0
+
+    @pytest.mark.asyncio
+    async def test_check_errors_are_retried(self):
+        check_batch = AsyncMock(
+            side_effect=[RuntimeError("network"), {"t1": {"status": "completed"}}]
+        )
+
+        poller = _poller(check_batch)
+        result = await poller.wait("t1", timeout=1)
+
+        assert result["status"] == "completed"
+        assert check_batch.await_count == 2
+
+    def test_interval_grows_with_task_age(self):
+        poller = TaskStatusPoller(
+            check_batch=AsyncMock(),
+            name="test",
+            max_interval=10,
+            min_interval=1,
+            backoff_factor=0.1,
+        )
+
+        assert poller.next_interval(0) == 1
+        assert poller.next_interval(50) == 5
+        assert poller.next_interval(600) == 10
+
+    @pytest.mark.asyncio
+    async def test_non_batch_provider_checked_per_task(self):
+        """batch 미지원 Provider(Kling 등)는 단건 조회를 동시에 호출"""
+
+        class SingleProvider:
+            def __init__(self):
+                self.check_video_status = AsyncMock(return_value={"status": "completed"})
+
+        provider = SingleProvider()
+        poller = get_task_poller(provider, "video")
+        poller.min_interval = 0.01
+
+        results = await poller.wait_many(["v1", "v2"], timeout=1)
+
+        assert provider.check_video_status.await_count == 2
+        assert results["v1"]["status"] == "completed"
+
+
+class TestRunwareBatchStatus:
+    """Runware getResponse 일괄 조회 테스트"""
+
+    @pytest.fixture
+    def provider(self):
+        with patch("backend.infrastructure.ai.providers.runware.settings") as mock_settings:
+            mock_settings.runware_api_key = "test-key"
+            mock_settings.runware_api_url = "https://api.runware.test/v1"
+            mock_settings.http_timeout = 10.0
+            mock_settings.http_read_timeout = 10.0
+            yield RunwareProvider()
+
+    def _mock_client(self, json_body):
+        response = MagicMock()
+        response.json.return_value = json_body
+        response.raise_for_status = MagicMock()
+
+        client = AsyncMock()
+        client.post = AsyncMock(return_value=response)
+        client.__aenter__.return_value = client
+        client.__aexit__.return_value = None
+        return client
+
+    @pytest.mark.asyncio
+    async def test_single_request_fans_out_by_task_uuid(self, provider):
+        client = self._mock_client(
+            {
+                "data": [
+                    {"taskUUID": "t1", "imageURL": "https://cdn/1.webp", "imageUUID": "img-1"},
+                    {"taskUUID": "t2", "status": "processing"},
+                ],
+                "errors": [{"taskUUID": "t3", "code": "bad", "message": "nope"}],
+            }
+        )
+
+        with patch.object(http_clients, "get", return_value=client):
+            results = await provider.check_images_status(["t1", "t2", "t3"])
+
+        client.post.assert_awaited_once()
+        payload = client.post.await_args.kwargs["json"]
+        assert [item["taskUUID"] for item in payload] == ["t1", "t2", "t3"]
+        assert all(item["taskType"] == "getResponse" for item in payload)
+
+        assert results["t1"]["status"] == "completed"
+        assert results["t1"]["image_uuid"] == "img-1"
+        assert results["t2"]["status"] == "processing"
+        assert results["t3"]["status"] == "failed"
+
+    @pytest.mark.asyncio
+    async def test_single_status_check_still_supported(self, provider):
+        client = self._mock_client({"data": [{"videoURL": "https://cdn/v.mp4"}]})
+
+        with patch.object(http_clients, "get", return_value=client):
+            result = await provider.check_video_status("only")
+
+        assert result["status"] == "completed"
+        assert result["video_url"] == "https://cdn/v.mp4"
+
+    @pytest.mark.asyncio
+    async def test_error_without_task_uuid_requeries_per_task(self, provider):
+        """taskUUID 없는 에러는 배치 전체가 아닌 원인 작업만 실패 처리"""
+        batch = MagicMock()
+        batch.json.return_value = {
+            "data": [{"taskUUID": "a1", "status": "processing"}],
+            "errors": [{"code": "invalidTaskUUID", "message": "bad uuid"}],
+        }
+        single = {
+            "a1": {"data": [{"taskUUID": "a1", "imageURL": "https://cdn/a1.webp"}]},
+            "b1": {"errors": [{"code": "invalidTaskUUID", "message": "bad uuid"}]},
+        }
+
+        async def post(url, headers, json):
+            if len(json) > 1:
+                return batch
+            response = MagicMock()
+            response.json.return_value = single[json[0]["taskUUID"]]
+            return response
+
+        client = self._mock_client({})
+        client.post = AsyncMock(side_effect=post)
+
+        with patch.object(http_clients, "get", return_value=client):
+            results = await provider.check_images_status(["a1", "b1"])
+
+        assert client.post.await_count == 3
+        assert results["a1"]["status"] == "completed"
+        assert results["b1"]["status"] == "failed"
@@ -1,89 +1,219 @@
 """
 Google OAuth Provider Unit Tests
-Google OAuth 토큰 검증 테스트
+Google OAuth 토큰 검증 테스트 (로컬 생성 키 세트로 Google JWKS 엔드포인트 대체)
 """
 
+import asyncio
+import time
+from unittest.mock import patch
+
+import httpx
 import pytest
-from unittest.mock import AsyncMock, patch
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import rsa
+from jose import jwk, jwt
 
+from backend.core.auth.providers import google_jwks
+from backend.core.auth.providers.google_jwks import GoogleJWKSCache
 from backend.core.auth.providers.google_oauth import GoogleOAuthProvider
+from backend.core.config import settings
+
+CLIENT_ID = "test-client.apps.googleusercontent.com"
+CERTS_URL = "https://certs.test/oauth2/v3/certs"
+
+
+class FakeGoogle:
+    """서명 키를 생성하고 JWKS를 응답하는 Google 대역"""
+
+    def __init__(self, max_age=3600):
+        self.max_age = max_age
+        self.keys = {}
+        self.requests = 0
+        self.fail = False
+        self.add_key("k1")
+
+    def add_key(self, kid):
+        private_key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+        self.keys[kid] = private_key.private_bytes(
+            serialization.Encoding.PEM,
+            serialization.PrivateFormat.PKCS8,
+            serialization.NoEncryption(),
+        )
+
+    def jwks(self):
+        keys = []
+        for kid, pem in self.keys.items():
+            public = jwk.construct(pem, "RS256").public_key().to_dict()
+            keys.append({**public, "kid": kid, "use": "sig"})
+        return {"keys": keys}
+
+    def handler(self, request):
+        self.requests += 1
+        if self.fail:
+            return httpx.Response(503)
+        return httpx.Response(
+            200,
+            json=self.jwks(),
+            headers={"Cache-Control": f"public, max-age={self.max_age}, must-revalidate"},
+        )
+
+    def token(self, kid="k1", **claims):
+        now = int(time.time())
+        payload = {
+            "iss": "https://accounts.google.com",
+            "aud": CLIENT_ID,
+            "sub": "google_user_123",
+            "email": "test@gmail.com",
+            "name": "Test User",
+            "picture": "https://example.com/photo.jpg",
+            "iat": now,
+            "exp": now + 3600,
+            **claims,
+        }
+        payload = {k: v for k, v in payload.items() if v is not None}
+        return jwt.encode(payload, self.keys[kid], algorithm="RS256", headers={"kid": kid})
+
+
+@pytest.fixture
+def google():
+    return FakeGoogle()
+
+
+@pytest.fixture
+def jwks_cache(google):
+    client = httpx.AsyncClient(transport=httpx.MockTransport(google.handler))
+    cache = GoogleJWKSCache(certs_url=CERTS_URL, client=client)
+    with patch.object(google_jwks, "_google_jwks_cache", cache), \
+            patch.object(settings, "google_oauth_client_id", CLIENT_ID):
+        yield cache
 
 
 class TestGoogleOAuthProvider:
     """Google OAuth Provider 단위 테스트"""
 
     @pytest.mark.asyncio
-    async def test_verify_token_valid(self):
+    async def test_verify_token_valid(self, google, jwks_cache):
         """유효한 Google 토큰 검증 테스트"""
-        mock_user_info = {
+        result = await GoogleOAuthProvider.verify_token(google.token())
+
+        assert result == {
             "sub": "google_user_123",
             "email": "test@gmail.com",
             "name": "Test User",
             "picture": "https://example.com/photo.jpg",
         }
 
-        with patch(
-            "backend.core.auth.providers.google_oauth.id_token.verify_oauth2_token",
-            return_value=mock_user_info,
-        ):
-            result = await GoogleOAuthProvider.verify_token("valid_token")
-
-            assert result is not None
-            assert result["sub"] == "google_user_123"
-            assert result["email"] == "test@gmail.com"
-            assert result["name"] == "Test User"
-            assert result["picture"] == "https://example.com/photo.jpg"
-
     @pytest.mark.asyncio
-    async def test_verify_token_invalid(self):
+    async def test_verify_token_invalid(self, google, jwks_cache):
         """잘못된 Google 토큰 검증 테스트"""
-        with patch(
-            "backend.core.auth.providers.google_oauth.id_token.verify_oauth2_token",
-            side_effect=ValueError("Invalid token"),
-        ):
-            result = await GoogleOAuthProvider.verify_token("invalid_token")
+        assert await GoogleOAuthProvider.verify_token("invalid_token") is None
+
+    @pytest.mark.asyncio
+    async def test_verify_token_forged_signature(self, google, jwks_cache):
+        """다른 키로 서명된 토큰 (kid만 위조)"""
+        forger = FakeGoogle()
+
+        assert await GoogleOAuthProvider.verify_token(forger.token(kid="k1")) is None
 
-            assert result is None
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        "claims",
+        [
+            {"aud": "other-client"},
+            {"iss": "https://evil.example.com"},
+            {"exp": int(time.time()) - 60},
+        ],
+        ids=["audience", "issuer", "expired"],
+    )
+    async def test_verify_token_rejected_claims(self, google, jwks_cache, claims):
+        """audience / 발급자 / 만료 검증 실패"""
+        assert await GoogleOAuthProvider.verify_token(google.token(**claims)) is None
 
     @pytest.mark.asyncio
-    async def test_verify_token_missing_fields(self):
+    async def test_verify_token_missing_fields(self, google, jwks_cache):
         """필수 필드 누락된 토큰 테스트"""
-        mock_user_info = {
-            "sub": "google_user_123",
-            "email": "test@gmail.com",
-            # name과 picture 누락
-        }
+        result = await GoogleOAuthProvider.verify_token(google.token(name=None, picture=None))
 
-        with patch(
-            "backend.core.auth.providers.google_oauth.id_token.verify_oauth2_token",
-            return_value=mock_user_info,
-        ):
-            result = await GoogleOAuthProvider.verify_token("token_without_name")
+        assert result is not None
+        assert result["name"] == ""  # 기본값
+        assert result["picture"] == ""  # 기본값
+
+    @pytest.mark.asyncio
+    async def test_verify_token_network_error(self, google, jwks_cache):
+        """키 세트를 가져올 수 없으면 검증 실패"""
+        google.fail = True
 
-            assert result is not None
-            assert result["sub"] == "google_user_123"
-            assert result["email"] == "test@gmail.com"
-            assert result["name"] == ""  # 기본값
-            assert result["picture"] == ""  # 기본값
+        assert await GoogleOAuthProvider.verify_token(google.token()) is None
+
+
+class TestGoogleJWKSCache:
+    """GoogleJWKSCache 단위 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_keys_fetched_once_for_many_logins(self, google, jwks_cache):
+        tokens = [google.token(sub=f"user_{i}") for i in range(20)]
+
+        results = await asyncio.gather(*(GoogleOAuthProvider.verify_token(t) for t in tokens))
+
+        assert all(results)
+        assert google.requests == 1
 
     @pytest.mark.asyncio
-    async def test_verify_token_network_error(self):
-        """네트워크 에러 처리 테스트"""
-        with patch(
-            "backend.core.auth.providers.google_oauth.id_token.verify_oauth2_token",
-            side_effect=Exception("Network error"),
-        ):
-            result = await GoogleOAuthProvider.verify_token("any_token")
+    async def test_max_age_honored(self, google, jwks_cache):
+        google.max_age = 600
+        await jwks_cache.get_key("k1")
+        now = time.monotonic()
+
+        with patch("backend.core.auth.providers.google_jwks.time.monotonic", return_value=now + 200):
+            await jwks_cache.get_key("k1")
+        assert google.requests == 1
+
+        with patch("backend.core.auth.providers.google_jwks.time.monotonic", return_value=now + 601):
+            await jwks_cache.get_key("k1")
+        assert google.requests == 2
+
+    @pytest.mark.asyncio
+    async def test_refreshes_in_background_before_expiry(self, google, jwks_cache):
+        google.max_age = 600
+        await jwks_cache.get_key("k1")
+        now = time.monotonic()
+
+        with patch("backend.core.auth.providers.google_jwks.time.monotonic", return_value=now + 400):
+            key = await jwks_cache.get_key("k1")
+            assert key is not None
+            assert google.requests == 1  # 기존 키로 즉시 응답
+            await jwks_cache._refresh_task
 
-            assert result is None
+        assert google.requests == 2
 
     @pytest.mark.asyncio
-    async def test_verify_token_expired(self):
-        """만료된 토큰 검증 테스트"""
-        with patch(
-            "backend.core.auth.providers.google_oauth.id_token.verify_oauth2_token",
-            side_effect=ValueError("Token expired"),
-        ):
-            result = await GoogleOAuthProvider.verify_token("expired_token")
-
-            assert result is None
+    async def test_rotated_key_triggers_refresh(self, google, jwks_cache):
+        await GoogleOAuthProvider.verify_token(google.token())
+        google.add_key("k2")
+
+        with patch.object(settings, "google_jwks_min_refresh_interval", 0):
+            result = await GoogleOAuthProvider.verify_token(google.token(kid="k2"))
+
+        assert result is not None
+        assert google.requests == 2
+
+    @pytest.mark.asyncio
+    async def test_unknown_kid_refresh_rate_limited(self, google, jwks_cache):
+        await jwks_cache.get_key("k1")
+
+        for _ in range(5):
+            assert await jwks_cache.get_key("random-kid") is None
+
+        assert google.requests == 1
+
+    @pytest.mark.asyncio
+    async def test_fetch_failure_keeps_previous_keys(self, google, jwks_cache):
+        await jwks_cache.get_key("k1")
+        google.fail = True
+        now = time.monotonic()
+
+        with patch("backend.core.auth.providers.google_jwks.time.monotonic", return_value=now + 3601):
+            assert await jwks_cache.get_key("k1") is not None
+            assert await jwks_cache.get_key("k1") is not None
+
+        assert google.requests == 2  # 실패 후 min_refresh_interval 동안 재시도 안 함
@@ -0,0 +1,156 @@
+"""
+Password Hash Pool Tests
+비밀번호 해싱 전용 스레드 풀 (이벤트 루프 비차단, 대기열 상한, 로그인 시 재해싱) 테스트
+"""
+
+import asyncio
+import threading
+import uuid
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from passlib.context import CryptContext
+
+from backend.core.auth import password_pool
+from backend.core.auth.exceptions import PasswordHashingBusyException
+from backend.core.auth.password_pool import PasswordHashPool
+from backend.core.auth.providers.credentials import CredentialsAuthProvider
+from backend.features.auth.models import User
+from backend.features.auth.service import AuthService
+
+PASSWORD = "test_password_123"
+
+
+def cheap_context(rounds: int) -> CryptContext:
+    """테스트용 저비용 Argon2 컨텍스트"""
+    return CryptContext(schemes=["argon2"], argon2__rounds=rounds, argon2__memory_cost=1024)
+
+
+@pytest.fixture
+def pool():
+    pool = PasswordHashPool(max_workers=2, max_pending=2)
+    with patch.object(password_pool, "_password_hash_pool", pool):
+        yield pool
+    pool.shutdown()
+
+
+class TestPasswordHashPool:
+    """PasswordHashPool 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_runs_off_event_loop_thread(self, pool):
+        thread_name = await pool.run(lambda: threading.current_thread().name)
+
+        assert thread_name.startswith("password-hash")
+        assert pool.pending == 0
+        assert pool.get_stats()["completed"] == 1
+
+    @pytest.mark.asyncio
+    async def test_rejects_when_queue_full(self, pool):
+        release = threading.Event()
+        running = [asyncio.create_task(pool.run(release.wait)) for _ in range(2)]
+        await asyncio.sleep(0)
+
+        with pytest.raises(PasswordHashingBusyException) as exc_info:
+            await pool.run(lambda: None)
+
+        release.set()
+        await asyncio.gather(*running)
+        assert exc_info.value.status_code == 503
+        assert pool.get_stats()["rejected"] == 1
+        assert await pool.run(lambda: "ok") == "ok"
+
+    @pytest.mark.asyncio
+    async def test_cancelled_caller_keeps_slot_until_thread_finishes(self, pool):
+        started, release = threading.Event(), threading.Event()
+
+        def hash_slowly():
+            started.set()
+            release.wait()
+
+        tasks = [asyncio.create_task(pool.run(hash_slowly)) for _ in range(2)]
+        try:
+            await asyncio.to_thread(started.wait)
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+            assert pool.pending == 2  # 스레드는 아직 해싱 중
+            with pytest.raises(PasswordHashingBusyException):
+                await pool.run(lambda: None)
+        finally:
+            release.set()
+
+        assert await asyncio.wait_for(self._wait_idle(pool), timeout=5) == 0
+        assert await pool.run(lambda: "ok") == "ok"
+
+    @staticmethod
+    async def _wait_idle(pool):
+        while pool.pending:
+            await asyncio.sleep(0.01)
+        return pool.pending
+
+
+class TestCredentialsAsync:
+    """CredentialsAuthProvider 비동기 해싱 / 재해싱 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_hash_and_verify_in_pool(self, pool):
+        with patch.object(CredentialsAuthProvider, "pwd_context", cheap_context(rounds=2)):
+            hashed = await CredentialsAuthProvider.hash_password_async(PASSWORD)
+
+            assert await CredentialsAuthProvider.verify_and_update_async(PASSWORD, hashed) == (True, None)
+            assert await CredentialsAuthProvider.verify_and_update_async("wrong", hashed) == (False, None)
+
+    @pytest.mark.asyncio
+    async def test_cost_change_returns_new_hash(self, pool):
+        old_hash = cheap_context(rounds=2).hash(PASSWORD)
+
+        with patch.object(CredentialsAuthProvider, "pwd_context", cheap_context(rounds=3)):
+            ok, new_hash = await CredentialsAuthProvider.verify_and_update_async(PASSWORD, old_hash)
+
+        assert ok is True
+        assert new_hash is not None and "t=3" in new_hash
+
+
+class TestLoginRehash:
+    """AuthService.login 재해싱 테스트"""
+
+    def make_service(self, new_hash):
+        user = User(id=uuid.uuid4(), email="a@example.com", password_hash="old-hash")
+        user_repo = MagicMock()
+        user_repo.get_by_email = AsyncMock(return_value=user)
+        user_repo.save = AsyncMock(side_effect=lambda u: u)
+        credentials_provider = MagicMock()
+        credentials_provider.verify_and_update_async = AsyncMock(return_value=(True, new_hash))
+        jwt_manager = MagicMock()
+        jwt_manager.create_access_token.return_value = "access"
+        jwt_manager.create_refresh_token.return_value = "refresh"
+        service = AuthService(
+            user_repo=user_repo,
+            credentials_provider=credentials_provider,
+            google_oauth_provider=MagicMock(),
+            jwt_manager=jwt_manager,
+            db=AsyncMock(),
+            cache_service=AsyncMock(),
+        )
+        return service, user
+
+    @pytest.mark.asyncio
+    async def test_outdated_hash_replaced_on_login(self):
+        service, user = self.make_service(new_hash="new-hash")
+
+        await service.login(user.email, PASSWORD)
+
+        assert user.password_hash == "new-hash"
+        service.user_repo.save.assert_awaited_once_with(user)
+        service.db.commit.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_current_hash_not_rewritten(self):
+        service, user = self.make_service(new_hash=None)
+
+        await service.login(user.email, PASSWORD)
+
+        assert user.password_hash == "old-hash"
+        service.user_repo.save.assert_not_awaited()
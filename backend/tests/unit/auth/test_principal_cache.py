@@ -0,0 +1,157 @@
+"""
+User Principal Cache Tests
+인증 사용자 조회 캐시 (요청 내 재사용, 요청 간 캐시, 수정 / 탈퇴 시 무효화) 테스트
+"""
+
+import json
+import uuid
+from datetime import datetime
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from backend.core.auth.dependencies import get_current_user_object, get_optional_user_object
+from backend.core.auth.jwt_manager import JWTManager
+from backend.core.auth.principal import UserPrincipalCache
+from backend.core.cache.local import LocalCache
+from backend.core.cache.service import CacheService
+from backend.core.events.types import EventType
+from backend.features.auth.models import User
+from backend.features.user.service import UserService
+
+
+class FakeAioCache:
+    """aiocache(JsonSerializer) 대역"""
+
+    def __init__(self):
+        self.store = {}
+
+    async def get(self, key):
+        raw = self.store.get(key)
+        return None if raw is None else json.loads(raw)
+
+    async def set(self, key, value, ttl=None):
+        self.store[key] = json.dumps(value)
+
+    async def delete(self, key):
+        self.store.pop(key, None)
+
+
+def make_user():
+    return User(
+        id=uuid.uuid4(),
+        email="a@example.com",
+        password_hash="secret-hash",
+        oauth_provider=None,
+        oauth_id=None,
+        is_active=True,
+        created_at=datetime(2026, 1, 1),
+        updated_at=datetime(2026, 1, 2),
+    )
+
+
+def make_request():
+    return SimpleNamespace(state=SimpleNamespace())
+
+
+@pytest.fixture
+def cache_service():
+    service = CacheService(event_bus=AsyncMock(), local=LocalCache(max_entries=100))
+    service._cache = FakeAioCache()
+    return service
+
+
+@pytest.fixture
+def user_db():
+    """_resolve_user의 DB 조회 경로 (세션 / UserRepository) 대역"""
+    users = {}
+    repo = MagicMock()
+    repo.get = AsyncMock(side_effect=lambda user_id: users.get(user_id))
+    session = MagicMock()
+    session.__aenter__ = AsyncMock(return_value=session)
+    session.__aexit__ = AsyncMock(return_value=False)
+
+    with patch("backend.core.auth.dependencies.AsyncSessionLocalReadOnly", return_value=session), \
+            patch("backend.features.auth.repository.UserRepository", return_value=repo):
+        yield SimpleNamespace(users=users, repo=repo)
+
+
+class TestUserPrincipalCache:
+    """UserPrincipalCache 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_round_trip_without_password_hash(self, cache_service):
+        principals = UserPrincipalCache(cache_service)
+        user = make_user()
+
+        await principals.put(user)
+        cached = await principals.get(user.id)
+
+        assert (cached.id, cached.email, cached.created_at) == (user.id, user.email, user.created_at)
+        assert cached.password_hash is None
+        assert "secret-hash" not in json.dumps(cache_service._cache.store)
+
+    @pytest.mark.asyncio
+    async def test_invalidate_broadcasts(self, cache_service):
+        principals = UserPrincipalCache(cache_service)
+        user = make_user()
+        await principals.put(user)
+        cache_service.event_bus.publish.reset_mock()
+
+        await principals.invalidate(user.id)
+
+        assert await principals.get(user.id) is None
+        cache_service.event_bus.publish.assert_awaited_once_with(
+            EventType.CACHE_INVALIDATED, {"keys": [f"auth:principal:{user.id}"]}
+        )
+
+
+class TestUserDependencies:
+    """get_current_user_object / get_optional_user_object 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_dependencies_share_one_lookup_per_request(self, cache_service, user_db):
+        user = make_user()
+        user_db.users[user.id] = user
+        request = make_request()
+        token = JWTManager.create_access_token(data={"sub": str(user.id)})
+        credentials = SimpleNamespace(credentials=token)
+
+        current = await get_current_user_object(
+            request, {"user_id": str(user.id)}, cache_service=cache_service
+        )
+        optional = await get_optional_user_object(request, credentials, cache_service=cache_service)
+
+        assert current is optional is user
+        assert user_db.repo.get.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_later_requests_skip_database(self, cache_service, user_db):
+        user = make_user()
+        user_db.users[user.id] = user
+
+        for _ in range(3):
+            resolved = await get_current_user_object(
+                make_request(), {"user_id": str(user.id)}, cache_service=cache_service
+            )
+            assert resolved.id == user.id
+
+        assert user_db.repo.get.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_update_invalidates_cached_principal(self, cache_service, user_db):
+        user = make_user()
+        user_db.users[user.id] = user
+        await get_current_user_object(make_request(), {"user_id": str(user.id)}, cache_service=cache_service)
+
+        service = UserService(
+            user_repo=MagicMock(get=AsyncMock(return_value=user), save=AsyncMock(return_value=user)),
+            credentials_provider=MagicMock(),
+            db_session=AsyncMock(),
+            principal_cache=UserPrincipalCache(cache_service),
+        )
+        await service.update_user(user.id)
+
+        await get_current_user_object(make_request(), {"user_id": str(user.id)}, cache_service=cache_service)
+        assert user_db.repo.get.await_count == 2
@@ -0,0 +1,180 @@
+"""
+Access Token Revocation Filter Tests
+로그아웃된 access token 폐기 목록 (로컬 판정, 이벤트 동기화, exp 만료, Redis 확인 경로) 테스트
+"""
+
+import hashlib
+import time
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from fastapi.security import HTTPAuthorizationCredentials
+
+from backend.core.auth import revocation
+from backend.core.auth.dependencies import get_current_user
+from backend.core.auth.jwt_manager import JWTManager
+from backend.core.auth.revocation import REVOKED_ACCESS_KEY, AccessTokenRevocations, token_expiry
+from backend.core.events.types import BROADCAST_EVENT_TYPES, Event, EventType
+from backend.core.exceptions import AuthenticationException
+
+
+class FakePipeline:
+    def __init__(self, redis):
+        self.redis = redis
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    def zadd(self, key, mapping):
+        self.redis.zsets.setdefault(key, {}).update(mapping)
+
+    def zremrangebyscore(self, key, min_score, max_score):
+        zset = self.redis.zsets.get(key, {})
+        for member in [m for m, score in zset.items() if score <= max_score]:
+            del zset[member]
+
+    def expire(self, key, ttl):
+        pass
+
+    async def execute(self):
+        return []
+
+
+class FakeRedis:
+    def __init__(self):
+        self.zsets = {}
+
+    def pipeline(self, transaction=True):
+        return FakePipeline(self)
+
+    async def zrangebyscore(self, key, min_score, max_score, withscores=False):
+        return [(m, s) for m, s in self.zsets.get(key, {}).items() if s >= min_score]
+
+
+def make_revocations(redis=None, event_bus=None):
+    revocations = AccessTokenRevocations(redis_url="redis://unused", event_bus=event_bus)
+    revocations._redis = redis or FakeRedis()
+    return revocations
+
+
+class TestAccessTokenRevocations:
+    """AccessTokenRevocations 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_unloaded_filter_defers_to_redis(self):
+        revocations = make_revocations()
+
+        assert revocations.might_be_revoked("abc") is True
+
+        await revocations.load()
+        assert revocations.might_be_revoked("abc") is False
+
+    @pytest.mark.asyncio
+    async def test_revoke_records_and_broadcasts(self):
+        redis = FakeRedis()
+        bus = AsyncMock()
+        revocations = make_revocations(redis, bus)
+        await revocations.load()
+        exp = time.time() + 600
+
+        await revocations.revoke("abc", exp)
+
+        assert revocations.might_be_revoked("abc") is True
+        assert redis.zsets[REVOKED_ACCESS_KEY] == {"abc": exp}
+        bus.publish.assert_awaited_once_with(
+            EventType.ACCESS_TOKEN_REVOKED, {"token_hash": "abc", "exp": exp}
+        )
+        assert EventType.ACCESS_TOKEN_REVOKED in BROADCAST_EVENT_TYPES
+
+    @pytest.mark.asyncio
+    async def test_event_from_other_process_applied(self):
+        revocations = make_revocations()
+        await revocations.load()
+
+        await revocations._handle_revoked(
+            Event.create(EventType.ACCESS_TOKEN_REVOKED, {"token_hash": "abc", "exp": time.time() + 600})
+        )
+
+        assert revocations.might_be_revoked("abc") is True
+
+    @pytest.mark.asyncio
+    async def test_entry_expires_at_token_exp(self):
+        revocations = make_revocations()
+        await revocations.load()
+        now = time.time()
+        await revocations.revoke("abc", now + 600)
+
+        with patch("backend.core.auth.revocation.time.time", return_value=now + 601):
+            assert revocations.might_be_revoked("abc") is False
+
+        assert len(revocations) == 0
+
+    @pytest.mark.asyncio
+    async def test_load_picks_up_missed_revocations(self):
+        redis = FakeRedis()
+        redis.zsets[REVOKED_ACCESS_KEY] = {"missed": time.time() + 600, "old": time.time() - 1}
+        revocations = make_revocations(redis)
+
+        await revocations.load()
+
+        assert revocations.might_be_revoked("missed") is True
+        assert revocations.might_be_revoked("old") is False
+
+    @pytest.mark.asyncio
+    async def test_load_failure_keeps_filter_unloaded(self):
+        redis = FakeRedis()
+        redis.zrangebyscore = AsyncMock(side_effect=ConnectionError("down"))
+        revocations = make_revocations(redis)
+
+        await revocations.load()
+
+        assert revocations.loaded is False
+        assert revocations.might_be_revoked("abc") is True
+
+    def test_token_expiry_reads_exp_claim(self):
+        token = JWTManager.create_access_token(data={"sub": "u1"})
+
+        exp = token_expiry(token)
+
+        assert time.time() < exp <= time.time() + 15 * 60 + 1
+
+
+class TestGetCurrentUser:
+    """get_current_user 블랙리스트 확인 경로 테스트"""
+
+    @pytest.fixture
+    async def revocations(self):
+        revocations = make_revocations()
+        await revocations.load()
+        with patch.object(revocation, "_access_token_revocations", revocations):
+            yield revocations
+
+    @staticmethod
+    def credentials(token):
+        return HTTPAuthorizationCredentials(scheme="Bearer", credentials=token)
+
+    @pytest.mark.asyncio
+    async def test_common_path_skips_redis(self, revocations):
+        token = JWTManager.create_access_token(data={"sub": "u1", "email": "a@example.com"})
+        cache_service = AsyncMock()
+
+        user = await get_current_user(self.credentials(token), cache_service=cache_service)
+
+        assert user["user_id"] == "u1"
+        cache_service.get.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_revoked_token_confirmed_in_redis(self, revocations):
+        token = JWTManager.create_access_token(data={"sub": "u1"})
+        token_hash = hashlib.sha256(token.encode()).hexdigest()[:16]
+        await revocations.revoke(token_hash, token_expiry(token))
+        cache_service = AsyncMock()
+        cache_service.get.return_value = "1"
+
+        with pytest.raises(AuthenticationException):
+            await get_current_user(self.credentials(token), cache_service=cache_service)
+
+        cache_service.get.assert_awaited_once_with(f"blacklist:access:{token_hash}")
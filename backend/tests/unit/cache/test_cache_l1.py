@@ -0,0 +1,189 @@
+"""
+Cache L1 Tier Tests
+CacheService 프로세스 메모리 L1 (네임스페이스 정책, 음성 캐싱, 무효화 이벤트, L1/L2 메트릭) 테스트
+"""
+
+import json
+import time
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from backend.core.cache.local import CachePolicy, LocalCache
+from backend.core.cache.metrics import cache_metrics
+from backend.core.cache.service import CacheService
+from backend.core.events.redis_streams_bus import RedisStreamsEventBus
+from backend.core.events.types import Event, EventType
+
+POLICIES = {
+    "blacklist:access:": CachePolicy(ttl=300.0, negative_ttl=5.0),
+    "tts:voices:": CachePolicy(ttl=60.0),
+}
+
+
+class FakeAioCache:
+    """aiocache(JsonSerializer) 대역"""
+
+    def __init__(self):
+        self.store = {}
+        self.get_calls = 0
+
+    async def get(self, key):
+        self.get_calls += 1
+        raw = self.store.get(key)
+        return None if raw is None else json.loads(raw)
+
+    async def set(self, key, value, ttl=None):
+        self.store[key] = json.dumps(value)
+
+    async def delete(self, key):
+        self.store.pop(key, None)
+
+
+@pytest.fixture
+def redis_cache():
+    return FakeAioCache()
+
+
+@pytest.fixture
+def service(redis_cache):
+    service = CacheService(event_bus=AsyncMock(), local=LocalCache(max_entries=100, policies=POLICIES))
+    service._cache = redis_cache
+    cache_metrics.reset()
+    return service
+
+
+class TestLocalCache:
+    """LocalCache 테스트"""
+
+    def test_only_keys_with_policy_are_stored(self):
+        local = LocalCache(max_entries=10, policies=POLICIES)
+
+        local.put("refresh_token:u1", "token")
+        local.put("tts:voices:u1", [{"id": 1}])
+
+        assert local.get("refresh_token:u1") == (False, None)
+        assert local.get("tts:voices:u1") == (True, [{"id": 1}])
+
+    def test_returns_fresh_copy(self):
+        local = LocalCache(max_entries=10, policies=POLICIES)
+        local.put("tts:voices:u1", [{"id": 1}])
+
+        local.get("tts:voices:u1")[1].append("mutated")
+
+        assert local.get("tts:voices:u1") == (True, [{"id": 1}])
+
+    def test_negative_entry_expires(self):
+        local = LocalCache(max_entries=10, policies=POLICIES)
+        now = time.monotonic()
+
+        with patch("backend.core.cache.local.time.monotonic", return_value=now):
+            local.put("blacklist:access:abc", None)
+            local.put("tts:voices:u1", None)  # negative_ttl=0 → 저장 안 함
+            assert local.get("blacklist:access:abc") == (True, None)
+            assert local.get("tts:voices:u1") == (False, None)
+
+        with patch("backend.core.cache.local.time.monotonic", return_value=now + 5.0):
+            assert local.get("blacklist:access:abc") == (False, None)
+
+    def test_ttl_capped_by_redis_ttl_and_lru_bounded(self):
+        local = LocalCache(max_entries=2, policies=POLICIES)
+        now = time.monotonic()
+
+        with patch("backend.core.cache.local.time.monotonic", return_value=now):
+            local.put("tts:voices:a", 1, ttl=2)
+            local.put("tts:voices:b", 2)
+            local.get("tts:voices:a")
+            local.put("tts:voices:c", 3)
+
+        assert len(local) == 2
+        assert local.evictions == 1
+        with patch("backend.core.cache.local.time.monotonic", return_value=now + 3):
+            assert local.get("tts:voices:a") == (False, None)
+            assert local.get("tts:voices:c") == (True, 3)
+
+
+class TestCacheServiceL1:
+    """CacheService L1 / L2 연동 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_hot_key_served_from_l1(self, service, redis_cache):
+        await service.set("tts:voices:u1", [{"id": 1}], ttl=3600)
+
+        for _ in range(3):
+            assert await service.get("tts:voices:u1") == [{"id": 1}]
+
+        assert redis_cache.get_calls == 0
+        stats = cache_metrics.get_stats()
+        assert (stats["l1_hits"], stats["l2_hits"]) == (3, 0)
+
+    @pytest.mark.asyncio
+    async def test_blacklist_miss_is_negatively_cached(self, service, redis_cache):
+        assert await service.get("blacklist:access:abc") is None
+        assert await service.get("blacklist:access:abc") is None
+
+        assert redis_cache.get_calls == 1
+        stats = cache_metrics.get_stats()
+        assert (stats["l1_hits"], stats["l1_misses"], stats["misses"]) == (1, 1, 1)
+        assert stats["l1_hit_rate"] == 0.5
+        assert stats["l2_hit_rate"] == 0.0
+
+    @pytest.mark.asyncio
+    async def test_set_replaces_negative_entry_and_broadcasts(self, service):
+        await service.get("blacklist:access:abc")
+
+        await service.set("blacklist:access:abc", "1", ttl=60)
+
+        assert await service.get("blacklist:access:abc") == 1
+        service.event_bus.publish.assert_awaited_once_with(
+            EventType.CACHE_INVALIDATED, {"keys": ["blacklist:access:abc"]}
+        )
+
+    @pytest.mark.asyncio
+    async def test_keys_without_policy_skip_l1(self, service, redis_cache):
+        await service.set("refresh_token:u1", "token", ttl=60)
+
+        assert await service.get("refresh_token:u1") == "token"
+        assert redis_cache.get_calls == 1
+        service.event_bus.publish.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_invalidation_event_drops_local_entry_only(self, service, redis_cache):
+        await service.set("tts:voices:u1", ["v"], ttl=3600)
+
+        await service._handle_cache_invalidated(
+            Event.create(EventType.CACHE_INVALIDATED, {"keys": ["tts:voices:u1"]})
+        )
+
+        assert "tts:voices:u1" in redis_cache.store
+        assert await service.get("tts:voices:u1") == ["v"]
+        assert redis_cache.get_calls == 1
+        assert cache_metrics.get_stats()["l1_invalidations"] == 1
+
+
+class TestBroadcastEvents:
+    """브로드캐스트 이벤트 수신 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_broadcast_events_read_without_consumer_group(self):
+        bus = RedisStreamsEventBus(redis_url="redis://unused")
+        handler = AsyncMock()
+        await bus.subscribe(EventType.CACHE_INVALIDATED, handler)
+        event = Event.create(EventType.CACHE_INVALIDATED, {"keys": ["k"]})
+        stream = "events:cache.invalidated"
+
+        async def xread(streams, count=None, block=None):
+            bus._running = False
+            assert streams == {stream: "5-0"}
+            return [(stream, [("6-0", {"event": event.model_dump_json(), "type": "cache.invalidated"})])]
+
+        bus.redis = AsyncMock()
+        bus.redis.xrevrange.return_value = [("5-0", {})]
+        bus.redis.xread.side_effect = xread
+        bus._running = True
+
+        await bus._listen_broadcast()
+
+        handler.assert_awaited_once()
+        assert handler.await_args.args[0].payload == {"keys": ["k"]}
+        bus.redis.xreadgroup.assert_not_called()
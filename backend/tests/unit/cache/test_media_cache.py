@@ -0,0 +1,208 @@
+"""
+Media Cache Tests
+미디어 캐시 (메모리 LRU 바이트 제한, Redis raw bytes 티어, ETag 메타데이터, 메트릭) 테스트
+"""
+
+import pytest
+from unittest.mock import MagicMock
+
+from backend.core.cache.media import CachedMedia, MediaCache, MemoryLRUTier
+from backend.core.cache.metrics import media_cache_metrics
+
+
+class FakeRedis:
+    """Hash + TTL만 흉내내는 Redis 대역"""
+
+    def __init__(self):
+        self.hashes = {}
+        self.ttls = {}
+        self.hmget_calls = []
+
+    def pipeline(self, transaction=True):
+        return FakePipeline(self)
+
+    async def hget(self, key, field):
+        return self.hashes.get(key, {}).get(field)
+
+    async def delete(self, key):
+        self.hashes.pop(key, None)
+        self.ttls.pop(key, None)
+
+    async def close(self):
+        pass
+
+
+class FakePipeline:
+    def __init__(self, redis):
+        self.redis = redis
+        self.ops = []
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    def hmget(self, key, *fields):
+        self.ops.append(("hmget", key, fields))
+
+    def pttl(self, key):
+        self.ops.append(("pttl", key))
+
+    def hset(self, key, mapping):
+        self.ops.append(("hset", key, mapping))
+
+    def expire(self, key, ttl):
+        self.ops.append(("expire", key, ttl))
+
+    def delete(self, key):
+        self.ops.append(("delete", key))
+
+    async def execute(self):
+        results = []
+        for op in self.ops:
+            if op[0] == "hmget":
+                self.redis.hmget_calls.append(op[2])
+                stored = self.redis.hashes.get(op[1], {})
+                results.append([stored.get(f) for f in op[2]])
+            elif op[0] == "pttl":
+                results.append(self.redis.ttls.get(op[1], -2) * 1000)
+            elif op[0] == "hset":
+                self.redis.hashes.setdefault(op[1], {}).update(op[2])
+                results.append(len(op[2]))
+            elif op[0] == "expire":
+                self.redis.ttls[op[1]] = op[2]
+                results.append(True)
+            elif op[0] == "delete":
+                self.redis.hashes.pop(op[1], None)
+                results.append(1)
+        return results
+
+
+@pytest.fixture(autouse=True)
+def reset_metrics():
+    media_cache_metrics.reset()
+    yield
+    media_cache_metrics.reset()
+
+
+@pytest.fixture
+def fake_redis():
+    return FakeRedis()
+
+
+@pytest.fixture
+def cache(fake_redis):
+    media_cache = MediaCache(
+        redis_url="redis://unused",
+        memory_max_bytes=100,
+        memory_entry_max_bytes=60,
+        entry_max_bytes=200,
+        ttl=60,
+    )
+    media_cache._redis = fake_redis
+    return media_cache
+
+
+class TestMemoryLRUTier:
+    """메모리 LRU 티어 테스트"""
+
+    def test_evicts_least_recently_used_by_bytes(self):
+        tier = MemoryLRUTier(max_bytes=100, entry_max_bytes=100)
+        tier.put("a", CachedMedia(data=b"a" * 40, etag="a"))
+        tier.put("b", CachedMedia(data=b"b" * 40, etag="b"))
+        tier.get("a")  # a를 최근 사용으로
+        tier.put("c", CachedMedia(data=b"c" * 40, etag="c"))
+
+        assert tier.get("b") is None
+        assert tier.get("a") is not None
+        assert tier.total_bytes == 80
+        assert media_cache_metrics.evictions == 1
+
+    def test_rejects_oversized_entry(self):
+        tier = MemoryLRUTier(max_bytes=100, entry_max_bytes=10)
+
+        assert tier.put("big", CachedMedia(data=b"x" * 11, etag="e")) is False
+        assert len(tier) == 0
+
+    def test_replacing_entry_updates_byte_count(self):
+        tier = MemoryLRUTier(max_bytes=100, entry_max_bytes=100)
+        tier.put("a", CachedMedia(data=b"x" * 50, etag="1"))
+        tier.put("a", CachedMedia(data=b"x" * 10, etag="2"))
+
+        assert tier.total_bytes == 10
+        assert tier.get("a").etag == "2"
+
+    def test_expired_entry_removed(self):
+        tier = MemoryLRUTier(max_bytes=100, entry_max_bytes=100)
+        tier.put("a", CachedMedia(data=b"x", etag="1", expires_at=1.0))
+
+        assert tier.get("a") is None
+        assert tier.total_bytes == 0
+
+
+class TestMediaCache:
+    """MediaCache 2단계 캐시 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_stores_raw_bytes_with_metadata(self, cache, fake_redis):
+        data = bytes(range(50))
+        assert await cache.set("file:a.webp", data, etag="abc", content_type="image/webp")
+
+        stored = fake_redis.hashes["media:file:a.webp"]
+        assert stored["body"] == data  # base64/JSON 아님
+        assert stored["etag"] == b"abc"
+        assert fake_redis.ttls["media:file:a.webp"] == 60
+
+    @pytest.mark.asyncio
+    async def test_memory_hit_then_redis_hit(self, cache):
+        await cache.set("k", b"x" * 50, etag="e1")
+        assert (await cache.get("k")).data == b"x" * 50
+
+        cache.memory.clear()
+        entry = await cache.get("k")
+
+        assert entry.etag == "e1"
+        assert media_cache_metrics.memory_hits == 1
+        assert media_cache_metrics.redis_hits == 1
+        assert len(cache.memory) == 1  # Redis 히트 후 메모리로 승격
+
+    @pytest.mark.asyncio
+    async def test_large_entry_kept_only_in_redis(self, cache, fake_redis):
+        await cache.set("video", b"v" * 150, etag="e")
+
+        assert len(cache.memory) == 0
+        assert "media:video" in fake_redis.hashes
+
+    @pytest.mark.asyncio
+    async def test_entry_over_limit_rejected(self, cache, fake_redis):
+        assert await cache.set("huge", b"h" * 201, etag="e") is False
+
+        assert fake_redis.hashes == {}
+        assert media_cache_metrics.rejected == 1
+
+    @pytest.mark.asyncio
+    async def test_get_etag_without_body(self, cache, fake_redis):
+        await cache.set("k", b"x" * 150, etag="etag-1")
+
+        assert await cache.get_etag("k") == "etag-1"
+        assert fake_redis.hmget_calls == []  # 본문 조회 없음
+
+    @pytest.mark.asyncio
+    async def test_miss_and_delete(self, cache):
+        assert await cache.get("missing") is None
+        assert media_cache_metrics.misses == 1
+
+        await cache.set("k", b"x", etag="e")
+        await cache.delete("k")
+        assert await cache.get("k") is None
+
+    @pytest.mark.asyncio
+    async def test_redis_error_is_a_miss(self, cache):
+        broken = MagicMock()
+        broken.pipeline.side_effect = ConnectionError("down")
+        cache._redis = broken
+
+        assert await cache.get("k") is None
+        assert await cache.set("k", b"x", etag="e") is False
+        assert media_cache_metrics.errors == 2
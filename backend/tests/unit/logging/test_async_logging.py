@@ -0,0 +1,190 @@
+"""
+Async Logging Tests
+비동기 배치 로그 출력 (writer 스레드 포맷, 큐 초과 시 버림, contextvars 캡처) 및 속도 제한 / 샘플링 테스트
+"""
+
+import io
+import logging
+import sys
+import threading
+import time
+from unittest.mock import patch
+
+import structlog
+
+from backend.core.logging import AsyncLogHandler, LogRateFilter, merge_captured_contextvars
+
+
+class ThreadRecordingFormatter(logging.Formatter):
+    """포맷이 실행된 스레드를 기록하는 포맷터"""
+
+    def __init__(self):
+        super().__init__("%(name)s %(message)s")
+        self.threads = set()
+
+    def format(self, record):
+        self.threads.add(threading.current_thread().name)
+        return super().format(record)
+
+
+class CountingStream(io.StringIO):
+    def __init__(self):
+        super().__init__()
+        self.writes = 0
+
+    def write(self, text):
+        self.writes += 1
+        return super().write(text)
+
+
+def make_logger(handler, name="test.async"):
+    logger = logging.getLogger(name)
+    logger.handlers = [handler]
+    logger.propagate = False
+    logger.setLevel(logging.DEBUG)
+    return logger
+
+
+def record(name="app", level=logging.INFO, msg="event"):
+    return logging.LogRecord(name, level, __file__, 1, msg, None, None)
+
+
+class TestAsyncLogHandler:
+    """AsyncLogHandler 테스트"""
+
+    def test_formats_on_writer_thread_in_batches(self):
+        stream = CountingStream()
+        handler = AsyncLogHandler(stream=stream, queue_size=1000, batch_size=100, flush_interval=0.05)
+        formatter = ThreadRecordingFormatter()
+        handler.setFormatter(formatter)
+        logger = make_logger(handler)
+
+        for i in range(50):
+            logger.info("item %d", i)
+        handler.close()
+
+        lines = stream.getvalue().splitlines()
+        assert lines[0] == "test.async item 0"
+        assert len(lines) == 50
+        assert formatter.threads == {"log-writer"}
+        assert stream.writes < 50
+
+    def test_message_args_fixed_at_call_time(self):
+        stream = io.StringIO()
+        handler = AsyncLogHandler(stream=stream, flush_interval=0.05)
+        handler.setFormatter(logging.Formatter("%(message)s"))
+        logger = make_logger(handler)
+        payload = {"state": "before"}
+
+        logger.info("payload=%s", payload)
+        payload["state"] = "after"
+        handler.close()
+
+        assert stream.getvalue() == "payload={'state': 'before'}\n"
+
+    def test_full_queue_drops_without_blocking(self):
+        stream = io.StringIO()
+        release = threading.Event()
+
+        class BlockingFormatter(logging.Formatter):
+            def format(self, record):
+                release.wait()
+                return super().format(record)
+
+        handler = AsyncLogHandler(stream=stream, queue_size=2, batch_size=1, flush_interval=0)
+        handler.setFormatter(BlockingFormatter("%(message)s"))
+        logger = make_logger(handler)
+
+        logger.info("first")
+        time.sleep(0.05)  # writer가 첫 레코드를 꺼내 포맷 중
+        start = time.perf_counter()
+        for i in range(10):
+            logger.info("burst %d", i)
+        elapsed = time.perf_counter() - start
+        release.set()
+        handler.close()
+
+        assert elapsed < 0.5
+        assert handler.dropped == 8
+        assert "8 log records dropped" in stream.getvalue()
+
+    def test_traceback_rendered_on_caller_thread(self):
+        stream = io.StringIO()
+        handler = AsyncLogHandler(stream=stream, flush_interval=0.05)
+        handler.setFormatter(logging.Formatter("%(message)s %(exception)s"))
+        logger = make_logger(handler)
+
+        try:
+            raise ValueError("boom")
+        except ValueError:
+            logger.exception("failed")
+        handler.close()
+
+        output = stream.getvalue()
+        assert output.startswith("failed Traceback (most recent call last):")
+        assert "ValueError: boom" in output
+
+    def test_prepare_leaves_original_record_untouched(self):
+        handler = AsyncLogHandler(stream=io.StringIO())
+        try:
+            raise ValueError("boom")
+        except ValueError:
+            original = logging.LogRecord("app", logging.ERROR, __file__, 1, "item %d", (1,), sys.exc_info())
+        try:
+            prepared = handler.prepare(original)
+        finally:
+            handler.close()
+
+        assert prepared is not original
+        assert prepared.msg == "item 1" and prepared.exc_info is None
+        assert (original.msg, original.args) == ("item %d", (1,))
+        assert original.exc_info[0] is ValueError  # 다른 핸들러는 원래 traceback을 포맷
+
+    def test_contextvars_captured_on_caller_thread(self):
+        handler = AsyncLogHandler(stream=io.StringIO())
+        structlog.contextvars.bind_contextvars(request_id="req-1")
+        try:
+            prepared = handler.prepare(record())
+        finally:
+            structlog.contextvars.clear_contextvars()
+            handler.close()
+
+        event_dict = {"event": "event", "_log_context": prepared._log_context}
+        assert merge_captured_contextvars(None, "info", event_dict) == {
+            "event": "event",
+            "request_id": "req-1",
+        }
+
+
+class TestLogRateFilter:
+    """LogRateFilter 테스트"""
+
+    def test_rate_limit_per_logger_prefix(self):
+        log_filter = LogRateFilter(rate_limits={"backend.infrastructure.ai": 2.0}, sample_rates={})
+        now = time.monotonic()
+
+        with patch("backend.core.logging.time.monotonic", return_value=now):
+            passed = [log_filter.filter(record("backend.infrastructure.ai.poller")) for _ in range(5)]
+            assert log_filter.filter(record("backend.features.tts")) is True
+
+        assert passed == [True, True, False, False, False]
+
+        with patch("backend.core.logging.time.monotonic", return_value=now + 1.0):
+            resumed = record("backend.infrastructure.ai.poller")
+            assert log_filter.filter(resumed) is True
+        assert resumed.suppressed == 3
+
+    def test_warnings_always_pass(self):
+        log_filter = LogRateFilter(rate_limits={"app": 0.0}, sample_rates={"app": 0.0})
+
+        assert log_filter.filter(record("app", logging.INFO)) is False
+        assert log_filter.filter(record("app", logging.WARNING)) is True
+
+    def test_sampling_keeps_fraction(self):
+        log_filter = LogRateFilter(rate_limits={}, sample_rates={"httpx": 0.25})
+
+        with patch("backend.core.logging.random.random", side_effect=[0.1, 0.3, 0.2, 0.9]):
+            kept = [log_filter.filter(record("httpx")) for _ in range(4)]
+
+        assert kept == [True, False, True, False]
+        assert log_filter.filter(record("httpcore")) is True  # prefix는 로거 계층 단위로만 매칭
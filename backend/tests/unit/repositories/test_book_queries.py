@@ -0,0 +1,124 @@
+"""
+Book Query Compilation Tests
+DB 없이 BookRepository 프로젝션 / keyset / 일괄 INSERT 쿼리와 마이그레이션 016 검증
+(실행 결과는 DB가 필요한 test_book_repository.py에서 검증)
+"""
+
+import importlib.util
+import uuid
+from datetime import datetime
+from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from backend.features.storybook.repository import _SUMMARY_COLUMNS, BookRepository
+
+MIGRATION_016 = Path(__file__).parents[3] / "migrations" / "versions" / "016_add_book_list_keyset_index.py"
+
+
+def compile_sql(statement) -> str:
+    return " ".join(str(statement.compile(dialect=postgresql.dialect())).split())
+
+
+@pytest.fixture
+def session():
+    session = MagicMock()
+    result = MagicMock()
+    result.mappings.return_value.all.return_value = []
+    result.mappings.return_value.one_or_none.return_value = None
+    session.execute = AsyncMock(return_value=result)
+    session.scalars = AsyncMock(return_value=MagicMock(all=MagicMock(return_value=[])))
+    return session
+
+
+def executed(session):
+    session.execute.assert_awaited_once()
+    return session.execute.await_args.args[0]
+
+
+class TestBooksSummaryQuery:
+    """목록 프로젝션 + keyset 페이지네이션 쿼리"""
+
+    @pytest.mark.asyncio
+    async def test_projects_summary_columns_only(self, session):
+        await BookRepository(session).get_user_books_summary(uuid.uuid4(), limit=20)
+
+        query = executed(session)
+        assert [column.key for column in query.selected_columns] == [c.key for c in _SUMMARY_COLUMNS]
+        sql = compile_sql(query)
+        assert "task_metadata" not in sql and "pages" not in sql
+        assert "ORDER BY books.created_at ASC, books.id ASC LIMIT" in sql
+        assert "OFFSET" not in sql
+        assert "(books.created_at, books.id) >" not in sql  # 첫 페이지
+
+    @pytest.mark.asyncio
+    async def test_after_adds_keyset_predicate(self, session):
+        after = (datetime(2026, 1, 1), uuid.uuid4())
+
+        await BookRepository(session).get_user_books_summary(uuid.uuid4(), after=after)
+
+        query = executed(session)
+        assert "(books.created_at, books.id) > (%(param_1)s, %(param_2)s::UUID)" in compile_sql(query)
+        params = query.compile(dialect=postgresql.dialect()).params
+        assert (params["param_1"], params["param_2"]) == after
+
+
+class TestBookDetailQuery:
+    """상세 JSON 집계 프로젝션 쿼리"""
+
+    @pytest.mark.asyncio
+    async def test_single_query_aggregates_page_tree(self, session):
+        assert await BookRepository(session).get_book_detail(uuid.uuid4()) is None
+
+        query = executed(session)
+        assert [column.key for column in query.selected_columns][-2:] == ["task_metadata", "pages"]
+        sql = compile_sql(query)
+        for key in ("'dialogues'", "'translations'", "'audios'", "'image_url'"):
+            assert f"{key}," in sql
+        assert "json_agg(json_build_object(" in sql
+        assert "ORDER BY pages.sequence" in sql and "ORDER BY dialogues.sequence" in sql
+        assert "coalesce(json_agg(" in sql  # 하위 행이 없으면 빈 배열
+
+
+class TestBulkDialogueAudioInsert:
+    """대사 오디오 multi-row INSERT"""
+
+    @pytest.mark.asyncio
+    async def test_single_insert_returning_rows(self, session):
+        audios = [
+            {"dialogue_id": uuid.uuid4(), "language_code": "en", "voice_id": "v", "audio_url": f"a/{i}.mp3"}
+            for i in range(3)
+        ]
+
+        await BookRepository(session).add_dialogue_audios(audios)
+
+        session.scalars.assert_awaited_once()
+        statement, rows = session.scalars.await_args.args
+        assert compile_sql(statement).startswith("INSERT INTO dialogue_audios")
+        assert "RETURNING" in compile_sql(statement)
+        assert [row["audio_url"] for row in rows] == ["a/0.mp3", "a/1.mp3", "a/2.mp3"]
+        assert all(row["status"] == "PENDING" and row["id"] for row in rows)
+
+    @pytest.mark.asyncio
+    async def test_empty_input_skips_query(self, session):
+        assert await BookRepository(session).add_dialogue_audios([]) == []
+        session.scalars.assert_not_awaited()
+
+
+class TestKeysetIndexMigration:
+    """마이그레이션 016 (목록 keyset 인덱스)"""
+
+    def test_index_matches_keyset_order(self):
+        spec = importlib.util.spec_from_file_location("migration_016", MIGRATION_016)
+        migration = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(migration)
+
+        with patch.object(migration, "op") as op:
+            migration.upgrade()
+            migration.downgrade()
+
+        op.create_index.assert_called_once_with("idx_book_user_created", "books", ["user_id", "created_at", "id"])
+        op.drop_index.assert_called_once_with("idx_book_user_created", table_name="books")
+        assert migration.down_revision == "015"
@@ -109,3 +109,77 @@ class TestBookRepository:
         from backend.domain.models.book import Page
         result = await db_session.get(Page, page.id)
         assert result is None
+
+    async def test_add_dialogue_audios_bulk(self, db_session: AsyncSession):
+        """대사 오디오 일괄 추가 (단일 INSERT ... RETURNING) 테스트"""
+        user = await self.create_user(db_session)
+        await self.set_db_user(db_session, user.id)
+        repo = BookRepository(db_session)
+        book = await repo.create(user_id=user.id, title="Audio Book", status="draft")
+        page = await repo.add_page(book.id, {"sequence": 1})
+        dialogues = [
+            await repo.add_dialogue_with_translation(
+                page.id, speaker="N", sequence=i + 1,
+                translations=[{"language_code": "en", "text": f"Line {i}", "is_primary": True}],
+            )
+            for i in range(3)
+        ]
+
+        audios = await repo.add_dialogue_audios([
+            {
+                "dialogue_id": d.id,
+                "language_code": "en",
+                "voice_id": "voice-1",
+                "audio_url": f"{book.base_path}/{i}.mp3",
+            }
+            for i, d in enumerate(dialogues)
+        ])
+
+        assert [a.dialogue_id for a in audios] == [d.id for d in dialogues]
+        assert all(a.id is not None and a.status == "PENDING" for a in audios)
+        assert await repo.add_dialogue_audios([]) == []
+
+    async def test_book_detail_projection(self, db_session: AsyncSession):
+        """상세 조회 프로젝션 (JSON 집계) 테스트"""
+        user = await self.create_user(db_session)
+        await self.set_db_user(db_session, user.id)
+        repo = BookRepository(db_session)
+        book = await repo.create(user_id=user.id, title="Projection Book", status="completed")
+        for sequence in (2, 1):
+            page = await repo.add_page(book.id, {"sequence": sequence})
+            dialogue = await repo.add_dialogue_with_translation(
+                page.id, speaker="N", sequence=1,
+                translations=[
+                    {"language_code": "ko", "text": f"줄 {sequence}", "is_primary": False},
+                    {"language_code": "en", "text": f"Line {sequence}", "is_primary": True},
+                ],
+            )
+        await repo.add_dialogue_audios([
+            {"dialogue_id": dialogue.id, "language_code": "en", "voice_id": "v", "audio_url": "a.mp3"}
+        ])
+
+        detail = await repo.get_book_detail(book.id)
+
+        assert detail["title"] == "Projection Book"
+        assert [p["sequence"] for p in detail["pages"]] == [1, 2]
+        translations = detail["pages"][1]["dialogues"][0]["translations"]
+        assert [t["language_code"] for t in translations] == ["en", "ko"]
+        assert detail["pages"][0]["dialogues"][0]["audios"][0]["audio_url"] == "a.mp3"
+        assert await repo.get_book_detail(uuid.uuid4()) is None
+
+    async def test_books_summary_keyset_pagination(self, db_session: AsyncSession):
+        """목록 keyset 페이지네이션 테스트"""
+        user = await self.create_user(db_session)
+        await self.set_db_user(db_session, user.id)
+        repo = BookRepository(db_session)
+        for i in range(3):
+            await repo.create(user_id=user.id, title=f"Book {i}", status="completed")
+
+        first = await repo.get_user_books_summary(user.id, limit=2)
+        rest = await repo.get_user_books_summary(
+            user.id, limit=2, after=(first[-1]["created_at"], first[-1]["id"])
+        )
+
+        own = [row["title"] for row in first + rest if row["user_id"] == user.id]
+        assert sorted(own) == ["Book 0", "Book 1", "Book 2"]
+        assert not {row["id"] for row in first} & {row["id"] for row in rest}
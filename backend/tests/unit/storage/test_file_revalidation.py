@@ -0,0 +1,61 @@
+"""
+File Revalidation Tests
+같은 경로에 다시 저장된 파일의 If-None-Match 재검증 (캐시된 ETag가 아닌 stat() 기준) 테스트
+"""
+
+import os
+import shutil
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from backend.api.v1.endpoints.files import get_file
+from backend.core.cache.media import CachedMedia
+from backend.infrastructure.storage.local import LocalStorageService
+
+TEST_STORAGE_PATH = "test_data/file_revalidation"
+FILE_PATH = "shared/books/book-1/images/page_1.png"
+
+
+@pytest.fixture
+async def storage():
+    service = LocalStorageService(base_path=TEST_STORAGE_PATH, base_url="http://test/static")
+    yield service
+    if os.path.exists(TEST_STORAGE_PATH):
+        shutil.rmtree(TEST_STORAGE_PATH)
+
+
+async def _get(storage, media_cache, headers):
+    with patch("backend.api.v1.endpoints.files.FileAccessService") as access_service:
+        access_service.return_value.check_file_access = AsyncMock()
+        return await get_file(
+            FILE_PATH,
+            SimpleNamespace(headers=headers),
+            db=AsyncMock(),
+            current_user=None,
+            storage_service=storage,
+            media_cache=media_cache,
+            tts_service=SimpleNamespace(word_index=MagicMock()),
+        )
+
+
+@pytest.mark.asyncio
+async def test_regenerated_file_not_answered_with_stale_304(storage):
+    await storage.save(b"first-image", FILE_PATH)
+    old_etag = (await storage.stat(FILE_PATH)).etag
+    media_cache = MagicMock()
+    media_cache.get_etag = AsyncMock(return_value=old_etag)
+    media_cache.get = AsyncMock(return_value=CachedMedia(data=b"first-image", etag=old_etag))
+    media_cache.set = AsyncMock(return_value=True)
+
+    # 재시도로 같은 경로에 다시 생성 (미디어 캐시에는 이전 ETag가 남아 있음)
+    await storage.save(b"regenerated-image", FILE_PATH)
+    response = await _get(storage, media_cache, {"If-None-Match": f'"{old_etag}"'})
+
+    assert response.status_code == 200
+    assert response.body == b"regenerated-image"
+
+    new_etag = (await storage.stat(FILE_PATH)).etag
+    response = await _get(storage, media_cache, {"If-None-Match": f'"{new_etag}"'})
+    assert response.status_code == 304
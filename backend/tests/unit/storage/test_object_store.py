@@ -0,0 +1,191 @@
+"""
+S3-Compatible Object Storage Tests
+moto 로컬 S3 대역으로 비동기 I/O, 동시 멀티파트 업로드, 실패 시 abort 검증
+"""
+
+import asyncio
+import io
+import time
+import pytest
+from unittest.mock import patch
+
+import moto
+
+from backend.core.config import settings
+from backend.infrastructure.storage.object_store import (
+    MIN_PART_SIZE,
+    S3CompatibleStorageService,
+    get_storage_executor,
+)
+from backend.infrastructure.storage.r2 import R2StorageService
+from backend.infrastructure.storage.s3 import S3StorageService
+
+BUCKET = "test-bucket"
+
+
+@pytest.fixture
+def aws_env(monkeypatch):
+    monkeypatch.setenv("AWS_ACCESS_KEY_ID", "testing")
+    monkeypatch.setenv("AWS_SECRET_ACCESS_KEY", "testing")
+    monkeypatch.setenv("AWS_DEFAULT_REGION", "us-east-1")
+
+
+@pytest.fixture
+def service(aws_env):
+    with moto.mock_aws():
+        with patch("backend.infrastructure.storage.s3.settings") as mock_settings:
+            mock_settings.aws_s3_bucket_name = BUCKET
+            mock_settings.aws_s3_region = "us-east-1"
+            mock_settings.aws_access_key_id = "testing"
+            mock_settings.aws_secret_access_key = "testing"
+            storage = S3StorageService()
+
+        storage.s3_client.create_bucket(Bucket=BUCKET)
+
+        with patch.multiple(
+            settings,
+            storage_multipart_part_size=MIN_PART_SIZE,
+            storage_multipart_threshold=MIN_PART_SIZE,
+            storage_multipart_concurrency=2,
+        ):
+            yield storage
+
+
+def object_etag(storage, key):
+    return storage.s3_client.head_object(Bucket=BUCKET, Key=key)["ETag"].strip('"')
+
+
+class TestS3CompatibleStorage:
+    """moto 기반 S3 호환 스토리지 테스트"""
+
+    def test_r2_and_s3_share_async_implementation(self):
+        assert issubclass(S3StorageService, S3CompatibleStorageService)
+        assert issubclass(R2StorageService, S3CompatibleStorageService)
+
+    @pytest.mark.asyncio
+    async def test_small_file_roundtrip(self, service):
+        key = await service.save(b"hello", "/shared/books/1/audios/page_1.mp3")
+
+        assert key == "shared/books/1/audios/page_1.mp3"
+        assert await service.get(key) == b"hello"
+        assert await service.exists(key) is True
+
+        file_stat = await service.stat(key)
+        assert file_stat.size == 5
+        assert file_stat.content_type == "audio/mpeg"
+        assert "-" not in object_etag(service, key)  # 단일 PutObject
+
+        assert await service.delete(key) is True
+        assert await service.exists(key) is False
+        with pytest.raises(FileNotFoundError):
+            await service.get(key)
+
+    @pytest.mark.asyncio
+    async def test_large_bytes_use_multipart(self, service):
+        data = bytes(range(256)) * (MIN_PART_SIZE * 2 // 256 + 10)  # 3 parts
+
+        await service.save(data, "videos/page_1.mp4", content_type="video/mp4")
+
+        assert await service.get("videos/page_1.mp4") == data
+        assert object_etag(service, "videos/page_1.mp4").endswith("-3")
+        assert (await service.stat("videos/page_1.mp4")).content_type == "video/mp4"
+
+    @pytest.mark.asyncio
+    async def test_file_like_streamed_in_parts(self, service):
+        data = b"v" * (MIN_PART_SIZE + 1024)
+
+        await service.save(io.BytesIO(data), "videos/page_2.mp4")
+
+        assert (await service.stat("videos/page_2.mp4")).size == len(data)
+        assert object_etag(service, "videos/page_2.mp4").endswith("-2")
+
+    @pytest.mark.asyncio
+    async def test_failed_part_aborts_upload(self, service):
+        original_upload_part = service.s3_client.upload_part
+
+        def flaky_upload_part(**kwargs):
+            if kwargs["PartNumber"] == 2:
+                raise ConnectionError("network reset")
+            return original_upload_part(**kwargs)
+
+        service.s3_client.upload_part = flaky_upload_part
+
+        with pytest.raises(ConnectionError):
+            await service.save(b"x" * (MIN_PART_SIZE * 3), "videos/broken.mp4")
+
+        uploads = service.s3_client.list_multipart_uploads(Bucket=BUCKET)
+        assert uploads.get("Uploads", []) == []
+        assert await service.exists("videos/broken.mp4") is False
+
+    @pytest.mark.asyncio
+    async def test_stream_range(self, service):
+        await service.save(b"0123456789", "a.bin")
+
+        chunks = [c async for c in service.stream("a.bin", start=2, end=5, chunk_size=2)]
+
+        assert b"".join(chunks) == b"2345"
+
+    @pytest.mark.asyncio
+    async def test_upload_does_not_block_event_loop(self, service):
+        original_put = service.s3_client.put_object
+
+        def slow_put(**kwargs):
+            time.sleep(0.2)  # 느린 네트워크 전송
+            return original_put(**kwargs)
+
+        service.s3_client.put_object = slow_put
+        finished = []
+
+        async def upload():
+            await service.save(b"data", "slow.bin")
+            finished.append("upload")
+
+        async def ticker():
+            for _ in range(5):
+                await asyncio.sleep(0.01)
+            finished.append("ticker")
+
+        await asyncio.gather(upload(), ticker())
+
+        # 업로드가 루프를 막았다면 ticker가 업로드보다 늦게 끝남
+        assert finished == ["ticker", "upload"]
+        assert await service.get("slow.bin") == b"data"
+
+    @pytest.mark.asyncio
+    async def test_calls_run_on_storage_executor(self, service):
+        import threading
+
+        thread_names = []
+        original_head = service.s3_client.head_object
+
+        def recording_head(**kwargs):
+            thread_names.append(threading.current_thread().name)
+            return original_head(**kwargs)
+
+        service.s3_client.head_object = recording_head
+        await service.exists("missing.bin")
+
+        assert thread_names and thread_names[0].startswith("storage-io")
+        assert get_storage_executor()._max_workers >= 1
+
+    @pytest.mark.asyncio
+    async def test_save_stream_rechunks_into_parts(self, service):
+        async def chunks():
+            for _ in range(11):
+                yield b"s" * (MIN_PART_SIZE // 5)  # 작은 청크 → 파트 크기로 재분할
+
+        await service.save_stream(chunks(), "videos/streamed.mp4", content_type="video/mp4")
+
+        assert (await service.stat("videos/streamed.mp4")).size == (MIN_PART_SIZE // 5) * 11
+        assert object_etag(service, "videos/streamed.mp4").endswith("-3")
+
+    @pytest.mark.asyncio
+    async def test_small_save_stream_uses_put_object(self, service):
+        async def chunks():
+            yield b"ab"
+            yield b"cd"
+
+        await service.save_stream(chunks(), "images/page_1.webp", content_type="image/webp")
+
+        assert await service.get("images/page_1.webp") == b"abcd"
+        assert "-" not in object_etag(service, "images/page_1.webp")
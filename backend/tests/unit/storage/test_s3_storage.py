@@ -70,3 +70,37 @@ class TestS3StorageService:
         exists = await service.exists("test.txt")
         
         assert exists is False
+
+    @pytest.mark.asyncio
+    async def test_stream_range(self, service):
+        mock_body = MagicMock()
+        mock_body.read.side_effect = [b"da", b"ta", b""]
+        service.s3_client.get_object.return_value = {"Body": mock_body}
+
+        chunks = [c async for c in service.stream("test.txt", start=10, end=13, chunk_size=2)]
+
+        assert chunks == [b"da", b"ta"]
+        assert service.s3_client.get_object.call_args.kwargs["Range"] == "bytes=10-13"
+        mock_body.close.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_stat(self, service):
+        service.s3_client.head_object.return_value = {
+            "ContentLength": 1234,
+            "ETag": '"abc123"',
+            "ContentType": "video/mp4",
+        }
+
+        stat = await service.stat("test.mp4")
+
+        assert stat.size == 1234
+        assert stat.etag == "abc123"
+        assert stat.content_type == "video/mp4"
+
+    @pytest.mark.asyncio
+    async def test_stat_not_found(self, service):
+        error = ClientError({"Error": {"Code": "404", "Message": "Not Found"}}, "HeadObject")
+        service.s3_client.head_object.side_effect = error
+
+        with pytest.raises(FileNotFoundError):
+            await service.stat("missing.mp4")
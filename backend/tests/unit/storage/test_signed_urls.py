@@ -0,0 +1,106 @@
+"""
+Signed URL Cache Tests
+시간 버킷 만료 시각, LRU 재사용, R2 CDN URL 안정성 테스트
+"""
+
+from unittest.mock import MagicMock, patch
+from urllib.parse import parse_qs, urlparse
+
+import pytest
+
+from backend.core.config import settings
+from backend.infrastructure.storage.object_store import SignedURLCache
+from backend.infrastructure.storage.r2 import R2StorageService
+
+R2_SETTINGS = {
+    "r2_endpoint_url": "https://test.r2.cloudflarestorage.com",
+    "r2_bucket_name": "test",
+    "r2_access_key_id": "test",
+    "r2_secret_access_key": "test",
+    "cloudflare_cdn_domain": "https://cdn.example.com",
+    "cloudflare_signing_key": "signing-key",
+}
+
+
+def clock(now):
+    return patch("backend.infrastructure.storage.object_store.time.time", return_value=now)
+
+
+@pytest.fixture
+def r2():
+    with patch.multiple(settings, signed_url_bucket_seconds=900, signed_url_cache_size=16, **R2_SETTINGS):
+        return R2StorageService()
+
+
+class TestSignedURLCache:
+    """시간 버킷 + LRU 테스트"""
+
+    def test_expiration_rounded_up_to_bucket_end(self):
+        cache = SignedURLCache(bucket_seconds=900, max_entries=16)
+        sign = MagicMock(side_effect=lambda expiration: f"url?verify={expiration}")
+
+        with clock(1000.0):
+            first = cache.get_or_sign("a", 3600, sign)
+        with clock(1799.0):
+            second = cache.get_or_sign("a", 3600, sign)
+
+        # 버킷 [900, 1800) 종료 시각 + expires_in → 남은 유효 시간은 항상 expires_in 이상
+        assert first == second == "url?verify=5400"
+        sign.assert_called_once_with(5400)
+        assert (cache.hits, cache.misses) == (1, 1)
+
+    def test_new_bucket_signs_again(self):
+        cache = SignedURLCache(bucket_seconds=900, max_entries=16)
+
+        with clock(1000.0):
+            first = cache.get_or_sign("a", 60, lambda expiration: str(expiration))
+        with clock(1800.0):
+            second = cache.get_or_sign("a", 60, lambda expiration: str(expiration))
+
+        assert (first, second) == ("1860", "2760")
+
+    def test_lru_evicts_least_recently_used(self):
+        cache = SignedURLCache(bucket_seconds=900, max_entries=2)
+
+        with clock(1000.0):
+            cache.get_or_sign("a", 60, str)
+            cache.get_or_sign("b", 60, str)
+            cache.get_or_sign("a", 60, str)
+            cache.get_or_sign("c", 60, str)
+
+        assert len(cache) == 2
+        assert ("b", 60, 1) not in cache._entries
+
+    def test_disabled_bucket_signs_every_time(self):
+        cache = SignedURLCache(bucket_seconds=0, max_entries=16)
+        sign = MagicMock(return_value="url")
+
+        with clock(1000.0):
+            cache.get_or_sign("a", 60, sign)
+            cache.get_or_sign("a", 60, sign)
+
+        assert sign.call_count == 2
+        assert len(cache) == 0
+
+
+class TestR2SignedURL:
+    """R2 CDN Signed URL 테스트"""
+
+    def test_url_stable_within_bucket(self, r2):
+        with clock(1000.0):
+            first = r2.get_url("users/1/books/2/images/page_1.png", is_shared=False)
+        with clock(1700.0):
+            second = r2.get_url("/api/v1/files/users/1/books/2/images/page_1.png", is_shared=False)
+
+        assert first == second
+        params = parse_qs(urlparse(first).query)
+        assert params["verify"] == [str(1800 + 3 * 60 * 60)]
+        assert params["shared"] == ["0"]
+
+    def test_sharing_state_changes_url(self, r2):
+        with clock(1000.0):
+            private = r2.get_url("shared/books/2/cover.png", is_shared=False)
+            public = r2.get_url("shared/books/2/cover.png", is_shared=True)
+
+        assert private != public
+        assert len(r2.url_cache) == 2
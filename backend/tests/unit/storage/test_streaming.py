@@ -0,0 +1,118 @@
+"""
+Storage Streaming Unit Tests
+스토리지 스트리밍 조회 (byte range, stat) 및 HTTP Range 헤더 파싱 테스트
+"""
+
+import os
+import shutil
+import pytest
+
+from backend.api.v1.endpoints.files_helper import parse_range_header, RangeNotSatisfiable
+from backend.infrastructure.storage.base import AbstractStorageService
+from backend.infrastructure.storage.local import LocalStorageService
+
+TEST_STORAGE_PATH = "test_data/streaming"
+CONTENT = bytes(range(256)) * 40  # 10,240 bytes
+
+
+async def _collect(stream) -> bytes:
+    return b"".join([chunk async for chunk in stream])
+
+
+class TestLocalStorageStreaming:
+    @pytest.fixture
+    async def service(self):
+        service = LocalStorageService(base_path=TEST_STORAGE_PATH, base_url="http://test/static")
+        await service.save(CONTENT, "media/video.mp4")
+        yield service
+        if os.path.exists(TEST_STORAGE_PATH):
+            shutil.rmtree(TEST_STORAGE_PATH)
+
+    @pytest.mark.asyncio
+    async def test_stream_whole_file_in_chunks(self, service):
+        chunks = [c async for c in service.stream("media/video.mp4", chunk_size=4096)]
+
+        assert [len(c) for c in chunks] == [4096, 4096, 2048]
+        assert b"".join(chunks) == CONTENT
+
+    @pytest.mark.asyncio
+    async def test_stream_byte_range(self, service):
+        data = await _collect(service.stream("media/video.mp4", start=100, end=5099, chunk_size=1000))
+
+        assert data == CONTENT[100:5100]
+
+    @pytest.mark.asyncio
+    async def test_stat_does_not_read_body(self, service):
+        stat = await service.stat("media/video.mp4")
+
+        assert stat.size == len(CONTENT)
+        assert stat.etag
+        assert stat.last_modified
+
+    @pytest.mark.asyncio
+    async def test_stat_and_stream_not_found(self, service):
+        with pytest.raises(FileNotFoundError):
+            await service.stat("missing.mp4")
+        with pytest.raises(FileNotFoundError):
+            await _collect(service.stream("missing.mp4"))
+
+
+class TestDefaultStreaming:
+    """stream/stat을 재정의하지 않은 구현체의 기본 동작"""
+
+    class InMemoryStorage(AbstractStorageService):
+        def __init__(self, files):
+            self.files = files
+
+        async def save(self, file_data, path, content_type=None):
+            self.files[path] = file_data
+            return path
+
+        def get_url(self, path, expires_in=None, bypass_cdn=False, is_shared=True, content_type="default"):
+            return path
+
+        async def get(self, path):
+            if path not in self.files:
+                raise FileNotFoundError(path)
+            return self.files[path]
+
+        async def delete(self, path):
+            return self.files.pop(path, None) is not None
+
+        async def exists(self, path):
+            return path in self.files
+
+    @pytest.mark.asyncio
+    async def test_fallback_stream_and_stat(self):
+        storage = self.InMemoryStorage({"a.mp3": CONTENT})
+
+        assert (await storage.stat("a.mp3")).size == len(CONTENT)
+        assert await _collect(storage.stream("a.mp3", start=10, end=19, chunk_size=3)) == CONTENT[10:20]
+
+
+class TestParseRangeHeader:
+    def test_no_header(self):
+        assert parse_range_header(None, 1000) is None
+
+    def test_closed_range(self):
+        assert parse_range_header("bytes=0-499", 1000) == (0, 499)
+
+    def test_open_ended_range(self):
+        assert parse_range_header("bytes=500-", 1000) == (500, 999)
+
+    def test_suffix_range(self):
+        assert parse_range_header("bytes=-200", 1000) == (800, 999)
+        assert parse_range_header("bytes=-5000", 1000) == (0, 999)
+
+    def test_end_clamped_to_file_size(self):
+        assert parse_range_header("bytes=900-5000", 1000) == (900, 999)
+
+    def test_multi_range_and_malformed_ignored(self):
+        assert parse_range_header("bytes=0-1,5-9", 1000) is None
+        assert parse_range_header("items=0-1", 1000) is None
+        assert parse_range_header("bytes=abc-", 1000) is None
+        assert parse_range_header("bytes=10-5", 1000) is None
+
+    def test_unsatisfiable(self):
+        with pytest.raises(RangeNotSatisfiable):
+            parse_range_header("bytes=1000-", 1000)
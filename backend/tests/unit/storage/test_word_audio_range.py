@@ -0,0 +1,85 @@
+"""
+Word Audio Range Tests
+Book별 인덱스로 해석된 공유 단어 오디오의 GET Range 요청 (206 Partial Content) 및
+단어 TTS 응답 URL의 로컬 파일 엔드포인트 접근 테스트
+"""
+
+import os
+import shutil
+import uuid
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from backend.api.v1.endpoints.files import get_file
+from backend.features.tts.service import TTSService
+from backend.features.tts.word_store import WordAudioEntry
+from backend.infrastructure.storage.local import LocalStorageService
+
+TEST_STORAGE_PATH = "test_data/word_audio_range"
+CONTENT = bytes(range(256)) * 8  # 2,048 bytes
+SHARED_PATH = "shared/words/voice-1/abc123.mp3"
+
+
+async def _collect(stream) -> bytes:
+    return b"".join([chunk async for chunk in stream])
+
+
+@pytest.fixture
+async def storage():
+    service = LocalStorageService(base_path=TEST_STORAGE_PATH, base_url="http://test/static")
+    await service.save(CONTENT, SHARED_PATH)
+    yield service
+    if os.path.exists(TEST_STORAGE_PATH):
+        shutil.rmtree(TEST_STORAGE_PATH)
+
+
+@pytest.mark.asyncio
+async def test_indexed_word_audio_served_with_range(storage):
+    book_path = f"shared/books/{uuid.uuid4()}/words/apple.mp3"  # Book 경로에는 파일 없음
+    tts_service = SimpleNamespace(
+        word_index=MagicMock(resolve=AsyncMock(return_value=WordAudioEntry(path=SHARED_PATH, voice_id="voice-1"))),
+        get_or_create_word_audio=AsyncMock(),
+    )
+    request = SimpleNamespace(headers={"Range": "bytes=100-199"})
+
+    with patch("backend.api.v1.endpoints.files.FileAccessService") as access_service:
+        access_service.return_value.check_file_access = AsyncMock()
+        response = await get_file(
+            book_path,
+            request,
+            db=AsyncMock(),
+            current_user=None,
+            storage_service=storage,
+            media_cache=MagicMock(),
+            tts_service=tts_service,
+        )
+
+    assert response.status_code == 206
+    assert response.headers["Content-Range"] == f"bytes 100-199/{len(CONTENT)}"
+    assert await _collect(response.body_iterator) == CONTENT[100:200]
+    tts_service.get_or_create_word_audio.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_word_tts_audio_url_served_anonymously_in_local_mode(storage):
+    entry = WordAudioEntry(path=SHARED_PATH, voice_id="voice-1")
+    result = TTSService._word_tts_result(SimpleNamespace(storage_service=storage), "apple", entry, cached=True)
+    file_path = result["audio_url"].removeprefix("/api/v1/files/")
+    tts_service = SimpleNamespace(word_index=MagicMock(resolve=AsyncMock(return_value=None)))
+
+    # 실제 FileAccessService로 권한 확인 (비인증 사용자)
+    with patch("backend.api.v1.endpoints.files.settings.storage_provider", "local"):
+        response = await get_file(
+            file_path,
+            SimpleNamespace(headers={}),
+            db=AsyncMock(),
+            current_user=None,
+            storage_service=storage,
+            media_cache=MagicMock(),
+            tts_service=tts_service,
+        )
+
+    assert response.status_code == 200
+    assert await _collect(response.body_iterator) == CONTENT
@@ -0,0 +1,217 @@
+"""
+Book Progress Event Tests
+진행 이벤트 발행 (Pub/Sub + 페이지 상태 보관), SSE 스트림, 진행 상황 권한 테스트
+"""
+
+import json
+import uuid
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from backend.api.v1.endpoints.storybook import stream_book_progress
+from backend.features.storybook.exceptions import StorybookUnauthorizedException
+from backend.features.storybook.models import BookStatus
+from backend.features.storybook.progress import (
+    PAGE_EVENT,
+    STAGE_EVENT,
+    BookProgressNotifier,
+    stream_book_events,
+)
+from backend.features.storybook.service import BookOrchestratorService
+
+
+class FakePipeline:
+    def __init__(self, redis):
+        self.redis = redis
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    def publish(self, channel, payload):
+        self.redis.ops.append(("publish", channel, json.loads(payload)))
+
+    def hset(self, key, field, payload):
+        self.redis.ops.append(("hset", key, field))
+
+    def expire(self, key, ttl):
+        self.redis.ops.append(("expire", key, ttl))
+
+    async def execute(self):
+        if self.redis.fail:
+            raise ConnectionError("redis down")
+
+
+class FakeRedis:
+    def __init__(self, fail=False):
+        self.ops = []
+        self.fail = fail
+
+    def pipeline(self, transaction=True):
+        return FakePipeline(self)
+
+
+class FakeSubscription:
+    def __init__(self, events):
+        self.events = list(events)
+        self.closed = False
+
+    async def get(self, timeout):
+        return self.events.pop(0) if self.events else None
+
+    async def close(self):
+        self.closed = True
+
+
+async def never_disconnected():
+    return False
+
+
+class TestPublish:
+    """이벤트 발행 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_page_event_published_and_kept_for_late_subscribers(self):
+        notifier = BookProgressNotifier(redis_url="redis://unused")
+        notifier.redis = FakeRedis()
+        book_id = uuid.uuid4()
+
+        await notifier.publish(book_id, PAGE_EVENT, stage="audio", page=2, dialogue=1, status="completed")
+        await notifier.publish(book_id, STAGE_EVENT, stage="image", progress=60)
+
+        ops = notifier.redis.ops
+        assert ops[0][:2] == ("publish", f"book_progress:{book_id}")
+        assert ops[0][2]["page"] == 2 and ops[0][2]["book_id"] == str(book_id)
+        assert ops[1] == ("hset", f"book_progress:{book_id}:pages", "audio:2:1")
+        assert ops[2][0] == "expire"
+        # 단계 이벤트는 보관하지 않음 (스냅샷은 DB 상태 사용)
+        assert [op[0] for op in ops[3:]] == ["publish"]
+
+    @pytest.mark.asyncio
+    async def test_publish_failure_is_swallowed(self):
+        notifier = BookProgressNotifier(redis_url="redis://unused")
+        notifier.redis = FakeRedis(fail=True)
+
+        await notifier.publish(uuid.uuid4(), STAGE_EVENT, stage="story", progress=30)
+
+
+class TestStream:
+    """SSE 스트림 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_snapshot_then_events_until_status(self):
+        subscription = FakeSubscription([
+            None,
+            {"type": "page", "stage": "image", "page": 1, "status": "completed"},
+            {"type": "status", "status": BookStatus.COMPLETED},
+            {"type": "page", "stage": "video", "page": 1, "status": "completed"},
+        ])
+        snapshot = {"status": BookStatus.CREATING, "stage": "story", "progress": 30, "pages": []}
+
+        chunks = [
+            chunk async for chunk in stream_book_events(snapshot, subscription, never_disconnected, heartbeat=0.01)
+        ]
+
+        assert chunks[0].startswith("retry:")
+        assert chunks[1].startswith("event: snapshot\n")
+        assert chunks[2] == ": keepalive\n\n"
+        assert chunks[3].startswith("event: page\n")
+        assert json.loads(chunks[4].split("data: ", 1)[1])["status"] == BookStatus.COMPLETED
+        assert len(chunks) == 5
+        assert subscription.closed
+
+    @pytest.mark.asyncio
+    async def test_finished_book_sends_snapshot_only(self):
+        subscription = FakeSubscription([{"type": "page"}])
+        snapshot = {"status": BookStatus.FAILED, "stage": "failed", "progress": 60, "pages": []}
+
+        chunks = [chunk async for chunk in stream_book_events(snapshot, subscription, never_disconnected)]
+
+        assert len(chunks) == 2
+        assert subscription.closed
+
+
+class TestProgressAccess:
+    """진행 상황 조회 권한 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_private_book_requires_owner(self):
+        owner = uuid.uuid4()
+        repo = AsyncMock()
+        repo.get_progress.return_value = {"user_id": owner, "is_shared": False, "status": "creating"}
+        service = BookOrchestratorService(
+            book_repo=repo,
+            storage_service=MagicMock(),
+            ai_factory=MagicMock(),
+            db_session=AsyncMock(),
+            tts_producer=AsyncMock(),
+        )
+
+        assert (await service.get_book_progress(uuid.uuid4(), owner))["status"] == "creating"
+        with pytest.raises(StorybookUnauthorizedException):
+            await service.get_book_progress(uuid.uuid4(), uuid.uuid4())
+        repo.get_with_pages.assert_not_called()
+
+
+class TestStreamEndpoint:
+    """SSE 엔드포인트 구독 / 스냅샷 순서 테스트"""
+
+    @staticmethod
+    def make_notifier(calls, subscription):
+        async def subscribe(book_id):
+            calls.append("subscribe")
+            return subscription
+
+        notifier = MagicMock()
+        notifier.subscribe = AsyncMock(side_effect=subscribe)
+        notifier.get_page_events = AsyncMock(return_value=[])
+        return notifier
+
+    @pytest.mark.asyncio
+    async def test_subscribes_before_snapshot(self):
+        calls = []
+        # 구독 후 스냅샷 조회 전에 완료된 책: 종료 이벤트는 구독으로 전달됨
+        subscription = FakeSubscription([{"type": "status", "status": BookStatus.COMPLETED}])
+        service = MagicMock()
+
+        async def get_book_progress(book_id, user_id):
+            calls.append("snapshot")
+            return {
+                "status": BookStatus.CREATING,
+                "pipeline_stage": "video",
+                "progress_percentage": 90,
+                "error_message": None,
+            }
+
+        service.get_book_progress = AsyncMock(side_effect=get_book_progress)
+        request = SimpleNamespace(is_disconnected=AsyncMock(return_value=False))
+
+        with patch(
+            "backend.api.v1.endpoints.storybook.get_progress_notifier",
+            return_value=self.make_notifier(calls, subscription),
+        ):
+            response = await stream_book_progress(uuid.uuid4(), request, current_user=None, service=service)
+            chunks = [chunk async for chunk in response.body_iterator]
+
+        assert calls == ["subscribe", "snapshot"]
+        assert chunks[-1].startswith("event: status\n")
+        assert subscription.closed
+
+    @pytest.mark.asyncio
+    async def test_subscription_closed_when_access_denied(self):
+        subscription = FakeSubscription([])
+        service = MagicMock()
+        service.get_book_progress = AsyncMock(side_effect=StorybookUnauthorizedException(storybook_id="b", user_id="u"))
+        request = SimpleNamespace(is_disconnected=AsyncMock(return_value=False))
+
+        with patch(
+            "backend.api.v1.endpoints.storybook.get_progress_notifier",
+            return_value=self.make_notifier([], subscription),
+        ), pytest.raises(StorybookUnauthorizedException):
+            await stream_book_progress(uuid.uuid4(), request, current_user=None, service=service)
+
+        assert subscription.closed
@@ -0,0 +1,193 @@
+"""
+Book Read Projection Tests
+조회 프로젝션 → DTO 변환, keyset 커서, 목록 페이지네이션 테스트
+"""
+
+import uuid
+from datetime import datetime
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from starlette.requests import Request
+
+from backend.api.v1.endpoints.storybook import etag_response
+from backend.features.storybook.cache import compute_etag
+from backend.features.storybook.exceptions import (
+    InvalidBookCursorException,
+    StorybookUnauthorizedException,
+)
+from backend.features.storybook.schemas import (
+    BookResponse,
+    BookSummaryResponse,
+    decode_book_cursor,
+    encode_book_cursor,
+)
+from backend.features.storybook.service import BookOrchestratorService
+
+
+def storage():
+    storage_service = MagicMock()
+    storage_service.get_url.side_effect = lambda path, is_shared=False: (
+        f"https://cdn/{path}" if is_shared else f"https://signed/{path}"
+    )
+    return storage_service
+
+
+def book_row(**overrides):
+    row = {
+        "id": uuid.uuid4(),
+        "user_id": uuid.uuid4(),
+        "title": "Cat",
+        "cover_image": "covers/cat.png",
+        "status": "completed",
+        "created_at": datetime(2025, 1, 1, 12, 0),
+        "pipeline_stage": "completed",
+        "progress_percentage": 100,
+        "error_message": None,
+        "retry_count": 0,
+        "is_shared": False,
+        "task_metadata": None,
+    }
+    row.update(overrides)
+    return row
+
+
+def make_service(repo):
+    return BookOrchestratorService(
+        book_repo=repo,
+        storage_service=MagicMock(),
+        ai_factory=MagicMock(),
+        db_session=AsyncMock(),
+        tts_producer=AsyncMock(),
+    )
+
+
+class TestProjectionToResponse:
+    """조회 프로젝션 → DTO 변환 테스트"""
+
+    def test_detail_projection_builds_nested_response(self):
+        # JSON 집계 결과: UUID는 문자열로 옴
+        dialogue_id = str(uuid.uuid4())
+        book = book_row(
+            is_shared=True,
+            pages=[
+                {
+                    "id": str(uuid.uuid4()),
+                    "sequence": 1,
+                    "image_url": "pages/1.png",
+                    "image_prompt": "cat",
+                    "video_prompt": None,
+                    "dialogues": [
+                        {
+                            "id": dialogue_id,
+                            "sequence": 1,
+                            "speaker": "Narrator",
+                            "translations": [
+                                {"language_code": "en", "text": "Hi", "is_primary": True},
+                            ],
+                            "audios": [
+                                {"language_code": "en", "voice_id": "v", "audio_url": "audio/1.mp3", "duration": 1.5},
+                                {"language_code": "ko", "voice_id": "v", "audio_url": "", "duration": None},
+                            ],
+                        }
+                    ],
+                },
+                {
+                    "id": str(uuid.uuid4()),
+                    "sequence": 2,
+                    "image_url": None,
+                    "image_prompt": None,
+                    "video_prompt": None,
+                    "dialogues": [],
+                },
+            ],
+        )
+
+        response = BookResponse.from_projection(book, storage())
+
+        assert response.cover_image == "https://cdn/covers/cat.png"
+        page = response.pages[0]
+        assert page.image_url == "https://cdn/pages/1.png"
+        assert page.dialogues[0].id == uuid.UUID(dialogue_id)
+        assert page.dialogues[0].translations[0].text == "Hi"
+        assert [a.audio_url for a in page.dialogues[0].audios] == ["https://cdn/audio/1.mp3", ""]
+        assert response.pages[1].image_url is None
+
+    def test_summary_row_uses_private_url_for_unshared_book(self):
+        response = BookSummaryResponse.from_row(book_row(), storage())
+
+        assert response.cover_image == "https://signed/covers/cat.png"
+        assert response.progress_percentage == 100
+
+
+class TestCursor:
+    """keyset 커서 테스트"""
+
+    def test_round_trip(self):
+        created_at = datetime(2025, 1, 1, 12, 0, 0, 123456)
+        book_id = uuid.uuid4()
+
+        assert decode_book_cursor(encode_book_cursor(created_at, book_id)) == (created_at, book_id)
+
+    @pytest.mark.parametrize("cursor", ["!!!", "bm90LWEtY3Vyc29y", "MjAyNS0wMS0wMXxub3QtdXVpZA"])
+    def test_invalid_cursor_rejected(self, cursor):
+        with pytest.raises(InvalidBookCursorException):
+            decode_book_cursor(cursor)
+
+
+class TestListPagination:
+    """목록 keyset 페이지네이션 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_next_cursor_only_when_page_is_full(self):
+        rows = [book_row(created_at=datetime(2025, 1, day)) for day in (1, 2)]
+        repo = AsyncMock()
+        repo.get_user_books_summary.return_value = rows
+        service = make_service(repo)
+        user_id = uuid.uuid4()
+
+        page, next_cursor = await service.get_books_summary(user_id, limit=2)
+        assert page == rows
+        assert decode_book_cursor(next_cursor) == (rows[-1]["created_at"], rows[-1]["id"])
+
+        repo.get_user_books_summary.return_value = rows[:1]
+        _, last_cursor = await service.get_books_summary(user_id, limit=2, cursor=next_cursor)
+        assert last_cursor is None
+        assert repo.get_user_books_summary.await_args.kwargs["after"] == (
+            rows[-1]["created_at"], rows[-1]["id"]
+        )
+
+
+class TestDetailAccess:
+    """상세 조회 권한 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_private_book_requires_owner(self):
+        book = book_row()
+        repo = AsyncMock()
+        repo.get_book_detail.return_value = book
+        service = make_service(repo)
+
+        assert await service.get_book(book["id"], book["user_id"]) is book
+        with pytest.raises(StorybookUnauthorizedException):
+            await service.get_book(book["id"], None)
+        repo.get_with_pages.assert_not_called()
+
+
+class TestDetailETag:
+    """상세 응답 ETag 테스트"""
+
+    def test_matching_etag_returns_not_modified(self):
+        def request(headers):
+            return Request({"type": "http", "headers": [(k.lower().encode(), v.encode()) for k, v in headers.items()]})
+
+        body = BookResponse.from_projection(book_row(pages=[]), storage()).model_dump_json().encode()
+        etag = compute_etag(body)
+
+        first = etag_response(request({}), body, etag)
+        assert first.status_code == 200
+        assert first.headers["ETag"] == etag
+
+        second = etag_response(request({"If-None-Match": etag}), body, etag)
+        assert second.status_code == 304
+        assert second.body == b""
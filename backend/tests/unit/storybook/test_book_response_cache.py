@@ -0,0 +1,215 @@
+"""
+Book Response Cache Tests
+공유 책 응답 캐시 (메모리 티어 + Redis, 버킷 만료, 이벤트 무효화) 테스트
+"""
+
+import uuid
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from backend.api.v1.endpoints.storybook import get_book
+from backend.core.config import settings
+from backend.core.events.types import Event, EventType
+from backend.features.storybook.cache import BookResponseCache, compute_etag
+from backend.features.storybook.exceptions import StorybookUnauthorizedException
+
+
+class FakePipeline:
+    def __init__(self, redis):
+        self.redis = redis
+        self.ops = []
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    def hmget(self, key, *fields):
+        self.ops.append(lambda: [self.redis.store.get(key, {}).get(f) for f in fields])
+
+    def pttl(self, key):
+        self.ops.append(lambda: self.redis.ttls.get(key, -2))
+
+    def get(self, key):
+        self.ops.append(lambda: self.redis.values.get(key))
+
+    def incr(self, key):
+        def op():
+            self.redis.values[key] = str(int(self.redis.values.get(key, b"0")) + 1).encode()
+            return int(self.redis.values[key])
+        self.ops.append(op)
+
+    def expire(self, key, ttl):
+        self.ops.append(lambda: True)
+
+    def delete(self, key):
+        self.ops.append(lambda: self.redis.store.pop(key, None))
+
+    async def execute(self):
+        if self.redis.fail:
+            raise ConnectionError("redis down")
+        return [op() for op in self.ops]
+
+
+class FakeRedis:
+    """decode_responses=False Redis 대역 (세대 조건부 저장 스크립트 포함)"""
+
+    def __init__(self, fail=False):
+        self.store = {}
+        self.values = {}
+        self.ttls = {}
+        self.fail = fail
+
+    def pipeline(self, transaction=True):
+        return FakePipeline(self)
+
+    async def get(self, key):
+        if self.fail:
+            raise ConnectionError("redis down")
+        return self.values.get(key)
+
+    async def eval(self, script, numkeys, key, gen_key, generation, body, etag, ttl_ms):
+        if self.fail:
+            raise ConnectionError("redis down")
+        if self.values.get(gen_key, b"0").decode() != generation:
+            return 0
+        self.store[key] = {"body": body, "etag": etag.encode(), "gen": generation.encode()}
+        self.ttls[key] = ttl_ms
+        return 1
+
+
+@pytest.fixture
+def cache():
+    cache = BookResponseCache(redis_url="redis://unused")
+    cache.redis = FakeRedis()
+    return cache
+
+
+class TestCacheTiers:
+    """메모리 티어 / Redis 조회 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_put_then_get_from_local_tier(self, cache):
+        book_id = uuid.uuid4()
+
+        entry = await cache.put(book_id, b'{"id": 1}', 0)
+        cache.redis.fail = True  # 메모리 티어 히트면 Redis 미사용
+
+        hit = await cache.get(book_id)
+        assert hit.body == b'{"id": 1}'
+        assert hit.etag == entry.etag == compute_etag(b'{"id": 1}')
+
+    @pytest.mark.asyncio
+    async def test_redis_hit_fills_local_tier(self, cache):
+        book_id = uuid.uuid4()
+        await cache.put(book_id, b"body", 0)
+        cache._local.clear()
+
+        assert (await cache.get(book_id)).body == b"body"
+        assert len(cache._local) == 1
+        assert cache.get_stats()["hits"] == 1
+
+    @pytest.mark.asyncio
+    async def test_entry_expires_with_signed_url_bucket(self, cache):
+        with patch.multiple(settings, signed_url_bucket_seconds=900, book_response_cache_ttl=3600), \
+                patch("backend.features.storybook.cache.time.time", return_value=1000.0):
+            await cache.put("book", b"body", 0)
+
+        # 버킷 [900, 1800) 종료까지 800초
+        assert cache.redis.ttls["book_response:book"] == 800_000
+
+    @pytest.mark.asyncio
+    async def test_redis_failure_is_a_miss(self, cache):
+        cache.redis.fail = True
+
+        assert await cache.get(uuid.uuid4()) is None
+        assert cache.get_stats()["misses"] == 1
+
+
+class TestInvalidation:
+    """무효화 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_invalidate_clears_tiers_and_publishes(self, cache):
+        book_id = uuid.uuid4()
+        cache.event_bus = AsyncMock()
+        await cache.put(book_id, b"body", 0)
+
+        await cache.invalidate(book_id)
+
+        assert await cache.get(book_id) is None
+        cache.event_bus.publish.assert_awaited_once_with(
+            EventType.BOOK_UPDATED, {"book_id": str(book_id), "generation": 1}
+        )
+
+    @pytest.mark.asyncio
+    async def test_event_drops_local_entry(self, cache):
+        book_id = uuid.uuid4()
+        bus = AsyncMock()
+        await cache.register(bus)
+        await cache.put(book_id, b"body", 0)
+
+        handler = bus.subscribe.await_args.args[1]
+        await handler(Event.create(EventType.BOOK_UPDATED, {"book_id": str(book_id)}))
+
+        assert not cache._local
+
+    @pytest.mark.asyncio
+    async def test_put_started_before_invalidate_is_not_stored(self, cache):
+        book_id = uuid.uuid4()
+
+        generation = await cache.generation(book_id)  # 공유 상태일 때 조회 시작
+        await cache.invalidate(book_id)               # 조회 중 비공개 전환
+        await cache.put(book_id, b"stale", generation)
+
+        assert await cache.get(book_id) is None
+        assert not cache._local
+
+    @pytest.mark.asyncio
+    async def test_entry_from_previous_generation_is_a_miss(self, cache):
+        book_id = uuid.uuid4()
+        await cache.put(book_id, b"body", 0)
+        cache._local.clear()
+        cache.redis.values[f"book_response:{book_id}:gen"] = b"1"
+
+        assert await cache.get(book_id) is None
+
+    @pytest.mark.asyncio
+    async def test_event_generation_blocks_stale_local_entry(self, cache):
+        book_id = uuid.uuid4()
+        await cache._handle_book_updated(
+            Event.create(EventType.BOOK_UPDATED, {"book_id": str(book_id), "generation": 3})
+        )
+
+        cache._local_put(f"book_response:{book_id}", SimpleNamespace(body=b"x", etag="e", generation=2), None)
+
+        assert not cache._local
+
+
+class TestGetBookEndpoint:
+    """상세 조회 엔드포인트 캐시 경로 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_access_checked_before_serving_cached_body(self, cache):
+        book_id = uuid.uuid4()
+        await cache.put(book_id, b"cached", 0)
+        service = MagicMock()
+        service.get_book_progress = AsyncMock(
+            side_effect=StorybookUnauthorizedException(storybook_id=str(book_id), user_id="anonymous")
+        )
+        service.get_book = AsyncMock()
+
+        with pytest.raises(StorybookUnauthorizedException):
+            await get_book(
+                book_id,
+                SimpleNamespace(headers={}),
+                current_user=None,
+                service=service,
+                storage_service=MagicMock(),
+                response_cache=cache,
+            )
+
+        service.get_book.assert_not_awaited()
@@ -0,0 +1,364 @@
+"""
+Durable DAG Tests
+Redis 영속 DAG (인자 직렬화, 스케줄링, Worker 진행/실패 전파/복구) 테스트
+"""
+
+import json
+import uuid
+import pytest
+from typing import Dict, List
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from backend.features.storybook.tasks.durable import (
+    DAGStore,
+    DurableTaskRunner,
+    TASK_REGISTRY,
+    TTS_PRODUCER_REF,
+    encode_task_arg,
+    decode_task_arg,
+    serialize_node,
+    deserialize_node,
+)
+from backend.features.storybook.tasks.runner import TaskNode
+from backend.features.storybook.tasks.schemas import TaskContext, TaskResult, TaskStatus
+from backend.features.storybook.tasks.worker import DAGWorker, NodeLeaseHeld
+from backend.features.tts.producer import TTSProducer
+
+
+class InMemoryDAGStore(DAGStore):
+    """Redis 없이 DAGStore 동작을 흉내내는 테스트용 저장소"""
+
+    def __init__(self):
+        super().__init__(redis_url="redis://unused")
+        self.meta: Dict[str, Dict[str, str]] = {}
+        self.nodes: Dict[str, Dict[str, str]] = {}
+        self.states: Dict[str, Dict[str, str]] = {}
+        self.enqueued: Dict[str, set] = {}
+        self.leases: set = set()
+        self.active: set = set()
+        self.queue: List[tuple] = []
+
+    async def save_dag(self, execution_id, book_id, nodes):
+        self.meta[execution_id] = {"book_id": book_id}
+        self.nodes[execution_id] = {n.task_id: serialize_node(n) for n in nodes}
+        self.states[execution_id] = {n.task_id: TaskStatus.PENDING.value for n in nodes}
+        self.active.add(execution_id)
+
+    async def enqueue(self, execution_id, task_id, force=False):
+        marks = self.enqueued.setdefault(execution_id, set())
+        if not force and task_id in marks:
+            return False
+        marks.add(task_id)
+        self.queue.append((execution_id, task_id))
+        return True
+
+    async def get_meta(self, execution_id):
+        return self.meta.get(execution_id, {})
+
+    async def get_node(self, execution_id, task_id, resources=None):
+        raw = self.nodes[execution_id].get(task_id)
+        return deserialize_node(raw, resources) if raw else None
+
+    async def get_dependencies(self, execution_id):
+        return {
+            tid: json.loads(raw)["depends_on"]
+            for tid, raw in self.nodes.get(execution_id, {}).items()
+        }
+
+    async def get_states(self, execution_id):
+        return dict(self.states.get(execution_id, {}))
+
+    async def set_state(self, execution_id, task_id, status):
+        self.states[execution_id][task_id] = status.value
+
+    async def acquire_lease(self, execution_id, task_id, owner, ttl):
+        if (execution_id, task_id) in self.leases:
+            return False
+        self.leases.add((execution_id, task_id))
+        return True
+
+    async def refresh_lease(self, execution_id, task_id, ttl):
+        pass
+
+    async def release_lease(self, execution_id, task_id):
+        self.leases.discard((execution_id, task_id))
+
+    async def has_lease(self, execution_id, task_id):
+        return (execution_id, task_id) in self.leases
+
+    async def get_active_executions(self):
+        return list(self.active)
+
+    async def complete_dag(self, execution_id, retention):
+        self.active.discard(execution_id)
+
+    async def close(self):
+        pass
+
+
+@pytest.fixture
+def task_context():
+    return TaskContext(
+        book_id=str(uuid.uuid4()),
+        user_id=str(uuid.uuid4()),
+        execution_id=str(uuid.uuid4()),
+    )
+
+
+@pytest.fixture
+def dag_store():
+    return InMemoryDAGStore()
+
+
+@pytest.fixture
+def worker(dag_store):
+    task_store = MagicMock()
+    task_store.set_task_result = AsyncMock(return_value=True)
+    task_store.close = AsyncMock()
+    return DAGWorker(
+        resources={TTS_PRODUCER_REF: MagicMock()},
+        dag_store=dag_store,
+        task_store=task_store,
+        concurrency=2,
+    )
+
+
+async def _build_dag(dag_store, task_context, funcs: Dict[str, str]):
+    """
+    story → (image, tts) → finalize 형태의 DAG 구성
+
+    funcs: 노드 이름 → TASK_REGISTRY 함수 이름
+    """
+    runner = DurableTaskRunner(dag_store=dag_store)
+    t_story = await runner.submit_task(
+        "generate_story", TASK_REGISTRY[funcs["story"]], args=(task_context.book_id, task_context)
+    )
+    t_image = await runner.submit_task(
+        "generate_image_batch",
+        TASK_REGISTRY[funcs["image"]],
+        args=(task_context.book_id, [b"\x89PNG"], task_context),
+        depends_on=[t_story],
+    )
+    t_tts = await runner.submit_task(
+        "generate_tts_batch",
+        TASK_REGISTRY[funcs["tts"]],
+        args=(task_context.book_id, TTSProducer(event_bus=MagicMock()), task_context),
+        depends_on=[t_story],
+    )
+    t_final = await runner.submit_task(
+        "finalize_book",
+        TASK_REGISTRY[funcs["final"]],
+        args=(task_context.book_id, task_context),
+        depends_on=[t_story, t_image, t_tts],
+    )
+    ids = [t_story, t_image, t_tts, t_final]
+    await runner.schedule(task_context.execution_id, task_context.book_id, ids)
+    return ids
+
+
+def _registry_patch(results: Dict[str, TaskResult]):
+    """TASK_REGISTRY 함수를 이름을 유지한 AsyncMock으로 교체"""
+    patched = {}
+    for name, result in results.items():
+        mock = AsyncMock(return_value=result)
+        mock.__name__ = name
+        patched[name] = mock
+    return patch.dict(TASK_REGISTRY, patched), patched
+
+
+DEFAULT_FUNCS = {
+    "story": "generate_story_task",
+    "image": "generate_image_task",
+    "tts": "generate_tts_task",
+    "final": "finalize_book_task",
+}
+
+
+class TestArgumentEncoding:
+    """Task 인자 직렬화 테스트"""
+
+    def test_roundtrip_bytes_and_context(self, task_context):
+        encoded = encode_task_arg([b"\x00\x01", task_context, {"k": uuid.UUID(int=1)}])
+        decoded = decode_task_arg(encoded)
+
+        assert decoded[0] == b"\x00\x01"
+        assert decoded[1] == task_context
+        assert decoded[2] == {"k": str(uuid.UUID(int=1))}
+
+    def test_tts_producer_resolved_from_worker_resources(self):
+        producer = TTSProducer(event_bus=MagicMock())
+        encoded = encode_task_arg(producer)
+
+        local_producer = object()
+        assert decode_task_arg(encoded, {TTS_PRODUCER_REF: local_producer}) is local_producer
+
+    def test_unregistered_function_rejected(self):
+        async def not_registered():
+            pass
+
+        node = TaskNode("id", "x", not_registered, (), {}, [])
+        with pytest.raises(ValueError):
+            serialize_node(node)
+
+
+class TestDurableScheduling:
+    """DAG 스케줄링 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_only_root_nodes_enqueued(self, dag_store, task_context):
+        ids = await _build_dag(dag_store, task_context, DEFAULT_FUNCS)
+
+        assert dag_store.queue == [(task_context.execution_id, ids[0])]
+        assert task_context.execution_id in dag_store.active
+        assert set(dag_store.states[task_context.execution_id].values()) == {"pending"}
+
+    def test_runners_share_process_dag_store(self):
+        with patch("backend.features.storybook.tasks.durable._dag_store", None):
+            assert DurableTaskRunner().dag_store is DurableTaskRunner().dag_store
+
+
+class TestDAGWorker:
+    """DAG Worker 실행 테스트"""
+
+    async def _drain(self, worker, dag_store):
+        while dag_store.queue:
+            execution_id, task_id = dag_store.queue.pop(0)
+            await worker.run_node(execution_id, task_id)
+
+    @pytest.mark.asyncio
+    async def test_runs_dag_to_completion(self, worker, dag_store, task_context):
+        ok = TaskResult(status=TaskStatus.COMPLETED, result={})
+        registry, mocks = _registry_patch({name: ok for name in DEFAULT_FUNCS.values()})
+
+        with registry:
+            ids = await _build_dag(dag_store, task_context, DEFAULT_FUNCS)
+            await self._drain(worker, dag_store)
+
+        states = dag_store.states[task_context.execution_id]
+        assert all(states[tid] == "completed" for tid in ids)
+        assert task_context.execution_id not in dag_store.active
+        for mock in mocks.values():
+            mock.assert_awaited_once()
+
+        # 이미지 바이트가 복원되어 전달됨
+        image_args = mocks["generate_image_task"].await_args.args
+        assert image_args[1] == [b"\x89PNG"]
+
+    @pytest.mark.asyncio
+    async def test_failure_cascades_and_marks_book_failed(self, worker, dag_store, task_context):
+        ok = TaskResult(status=TaskStatus.COMPLETED, result={})
+        failed = TaskResult(status=TaskStatus.FAILED, error="boom")
+        registry, mocks = _registry_patch(
+            {
+                "generate_story_task": ok,
+                "generate_image_task": failed,
+                "generate_tts_task": ok,
+                "finalize_book_task": ok,
+            }
+        )
+
+        with registry, patch.object(worker, "_mark_book_failed", AsyncMock()) as mark_failed:
+            ids = await _build_dag(dag_store, task_context, DEFAULT_FUNCS)
+            await self._drain(worker, dag_store)
+
+        states = dag_store.states[task_context.execution_id]
+        assert states[ids[1]] == "failed"
+        assert states[ids[2]] == "completed"  # 독립 브랜치는 계속 실행
+        assert states[ids[3]] == "failed"
+        mocks["finalize_book_task"].assert_not_awaited()
+        mark_failed.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_resume_from_last_completed_node(self, worker, dag_store, task_context):
+        ok = TaskResult(status=TaskStatus.COMPLETED, result={})
+        registry, mocks = _registry_patch({name: ok for name in DEFAULT_FUNCS.values()})
+
+        with registry:
+            ids = await _build_dag(dag_store, task_context, DEFAULT_FUNCS)
+            execution_id = task_context.execution_id
+
+            # Story 완료 + Image 실행 중 크래시 (lease 없음) 상황
+            dag_store.queue.clear()
+            dag_store.states[execution_id][ids[0]] = "completed"
+            dag_store.states[execution_id][ids[1]] = "in_progress"
+
+            requeued = await worker.recover()
+            assert requeued == 2  # image(재실행) + tts
+            await self._drain(worker, dag_store)
+
+        mocks["generate_story_task"].assert_not_awaited()
+        assert all(s == "completed" for s in dag_store.states[execution_id].values())
+
+    @pytest.mark.asyncio
+    async def test_leased_node_is_skipped(self, worker, dag_store, task_context):
+        ok = TaskResult(status=TaskStatus.COMPLETED, result={})
+        registry, mocks = _registry_patch({name: ok for name in DEFAULT_FUNCS.values()})
+
+        with registry:
+            ids = await _build_dag(dag_store, task_context, DEFAULT_FUNCS)
+            dag_store.leases.add((task_context.execution_id, ids[0]))
+
+            with pytest.raises(NodeLeaseHeld):
+                await worker.run_node(task_context.execution_id, ids[0])
+
+        mocks["generate_story_task"].assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_reclaimed_message_kept_pending_until_lease_owner_dies(
+        self, worker, dag_store, task_context
+    ):
+        ok = TaskResult(status=TaskStatus.COMPLETED, result={})
+        registry, mocks = _registry_patch({name: ok for name in DEFAULT_FUNCS.values()})
+        worker.redis = AsyncMock()
+
+        with registry:
+            ids = await _build_dag(dag_store, task_context, DEFAULT_FUNCS)
+            execution_id = task_context.execution_id
+            data = {"execution_id": execution_id, "task_id": ids[0]}
+
+            # 다른 Worker가 Lease를 보유한 채 실행 중일 때 XAUTOCLAIM으로 회수됨 → ACK 하지 않음
+            dag_store.states[execution_id][ids[0]] = "in_progress"
+            dag_store.leases.add((execution_id, ids[0]))
+            await worker.process_message("1-0", data)
+
+            worker.redis.xack.assert_not_awaited()
+            mocks["generate_story_task"].assert_not_awaited()
+
+            # Lease 보유 Worker가 죽어 Lease 만료 → 다음 회수 주기에 재실행 후 ACK
+            dag_store.leases.clear()
+            await worker.process_message("1-0", data)
+
+        mocks["generate_story_task"].assert_awaited_once()
+        assert dag_store.states[execution_id][ids[0]] == "completed"
+        worker.redis.xack.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_duplicate_message_after_completion_not_rerun(self, worker, dag_store, task_context):
+        ok = TaskResult(status=TaskStatus.COMPLETED, result={})
+        registry, mocks = _registry_patch({name: ok for name in DEFAULT_FUNCS.values()})
+        worker.redis = AsyncMock()
+
+        with registry:
+            ids = await _build_dag(dag_store, task_context, DEFAULT_FUNCS)
+            execution_id = task_context.execution_id
+            data = {"execution_id": execution_id, "task_id": ids[0]}
+            await worker.process_message("1-0", data)
+            mocks["generate_story_task"].assert_awaited_once()
+            dag_store.queue.clear()
+
+            # 중복 메시지가 상태 조회 시점에는 PENDING을 보고,
+            # Lease 획득 직전에 다른 Worker가 COMPLETED 설정 후 Lease를 해제한 상황
+            dag_store.states[execution_id][ids[0]] = "pending"
+            acquire_lease = dag_store.acquire_lease
+
+            async def complete_then_acquire(*args):
+                dag_store.states[execution_id][ids[0]] = "completed"
+                return await acquire_lease(*args)
+
+            with patch.object(dag_store, "acquire_lease", side_effect=complete_then_acquire):
+                await worker.process_message("2-0", data)
+
+        mocks["generate_story_task"].assert_awaited_once()
+        assert dag_store.queue == []  # 후속 노드 중복 enqueue 없음
+        assert not dag_store.leases
+        assert worker.redis.xack.await_count == 2
@@ -14,6 +14,17 @@ from backend.features.storybook.tasks.schemas import TaskContext, TaskResult, Ta
 from backend.features.storybook.models import Book, BookStatus
 
 
+@pytest.fixture(autouse=True)
+def fast_polling():
+    """공유 폴러 대기 시간 단축 (폴러 타임아웃은 실제 경과 시간 기준)"""
+    with patch.dict("backend.infrastructure.ai.poller._pollers", clear=True), \
+         patch("backend.core.config.settings.task_poll_min_interval", 0.01), \
+         patch("backend.core.config.settings.task_image_poll_interval", 0.01), \
+         patch("backend.core.config.settings.task_video_poll_interval", 0.01), \
+         patch("backend.core.config.settings.task_image_max_wait_time", 0.2):
+        yield
+
+
 @pytest.fixture
 def task_context():
     """테스트용 TaskContext"""
@@ -44,8 +55,8 @@ def mock_book():
 
 @pytest.fixture
 def mock_images():
-    """테스트용 이미지 데이터 (5개)"""
-    return [b"image_data_0", b"image_data_1", b"image_data_2", b"image_data_3", b"image_data_4"]
+    """테스트용 원본 이미지 스토리지 키 (5개)"""
+    return [f"users/test/books/test/originals/page_{i + 1}.png" for i in range(5)]
 
 
 class TestImageTaskPartialFailureRetry:
@@ -0,0 +1,112 @@
+"""
+Source Image Upload Tests
+업로드 원본 이미지를 스토리지에 스트리밍 저장하고 DAG에는 키만 전달하는지 테스트
+"""
+
+import uuid
+from io import BytesIO
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from fastapi import UploadFile
+from starlette.datastructures import Headers
+
+from backend.core.config import settings
+from backend.features.storybook.exceptions import (
+    ImageTooLargeException,
+    ImageUploadFailedException,
+)
+from backend.features.storybook.service import BookOrchestratorService
+from backend.infrastructure.storage.local import LocalStorageService
+
+
+def make_upload(data: bytes, filename: str = "page.png", content_type: str = "image/png"):
+    return UploadFile(
+        file=BytesIO(data),
+        filename=filename,
+        headers=Headers({"content-type": content_type}),
+    )
+
+
+@pytest.fixture
+def storage(tmp_path):
+    return LocalStorageService(base_path=str(tmp_path))
+
+
+@pytest.fixture
+def book():
+    book = MagicMock()
+    book.id = uuid.uuid4()
+    book.base_path = f"users/test/books/{book.id}"
+    return book
+
+
+@pytest.fixture
+def service(storage):
+    return BookOrchestratorService(
+        book_repo=AsyncMock(),
+        storage_service=storage,
+        ai_factory=MagicMock(),
+        db_session=AsyncMock(),
+        tts_producer=AsyncMock(),
+    )
+
+
+class TestStoreSourceImages:
+    """원본 이미지 저장 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_streams_uploads_to_storage(self, service, book, tmp_path):
+        body = b"p" * 200_000
+
+        with patch.object(settings, "storage_stream_chunk_size", 64 * 1024):
+            keys = await service._store_source_images(
+                book, [make_upload(body), make_upload(b"jpg", "b.jpg", "image/jpeg")]
+            )
+
+        assert keys == [
+            f"{book.base_path}/originals/page_1.png",
+            f"{book.base_path}/originals/page_2.jpg",
+        ]
+        assert (tmp_path / keys[0]).read_bytes() == body
+        assert (tmp_path / keys[1]).read_bytes() == b"jpg"
+
+    @pytest.mark.asyncio
+    async def test_oversized_upload_rejected_and_cleaned_up(self, service, book, tmp_path):
+        uploads = [make_upload(b"ok"), make_upload(b"x" * 2048, "big.png")]
+
+        with patch.object(settings, "max_upload_image_bytes", 1024), \
+                patch.object(settings, "storage_stream_chunk_size", 256):
+            with pytest.raises(ImageTooLargeException):
+                await service._store_source_images(book, uploads)
+
+        assert not any((tmp_path / book.base_path / "originals").iterdir())
+
+    @pytest.mark.asyncio
+    async def test_storage_error_wrapped(self, service, book, storage):
+        with patch.object(storage, "save_stream", AsyncMock(side_effect=OSError("disk full"))):
+            with pytest.raises(ImageUploadFailedException):
+                await service._store_source_images(book, [make_upload(b"img")])
+
+    @pytest.mark.asyncio
+    async def test_dag_receives_only_storage_keys(self, service, book):
+        service._check_book_quota = AsyncMock()
+        service.book_repo.create.return_value = book
+        service.book_repo.get_with_pages.return_value = book
+
+        with patch(
+            "backend.features.storybook.service.create_storybook_dag",
+            AsyncMock(return_value={}),
+        ) as create_dag:
+            await service.create_storybook_async(
+                user_id=uuid.uuid4(),
+                stories=["one"],
+                images=[make_upload(b"img")],
+                voice_id="voice",
+                level=1,
+                is_default=False,
+            )
+
+        assert create_dag.await_args.kwargs["image_keys"] == [
+            f"{book.base_path}/originals/page_1.png"
+        ]
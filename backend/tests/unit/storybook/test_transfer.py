@@ -0,0 +1,192 @@
+"""
+CDN → Storage Transfer Tests
+스트리밍 전송 (바이트 예산, 병렬 처리, 항목별 재시도, 스토리지 save_stream) 테스트
+"""
+
+import asyncio
+import pytest
+import httpx
+from unittest.mock import patch
+
+from backend.core.config import settings
+from backend.features.storybook.tasks.retry import BatchRetryTracker
+from backend.features.storybook.tasks.transfer import (
+    ByteBudget,
+    TransferItem,
+    transfer_all,
+    transfer_to_storage,
+)
+from backend.infrastructure.ai.factory import AIProviderFactory
+from backend.infrastructure.storage.local import LocalStorageService
+
+
+def patch_cdn(handler):
+    """공유 HTTP 클라이언트를 MockTransport 클라이언트로 교체"""
+    client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    return patch.object(AIProviderFactory.http_clients, "get", return_value=client)
+
+
+@pytest.fixture
+def storage(tmp_path):
+    return LocalStorageService(base_path=str(tmp_path))
+
+
+@pytest.fixture(autouse=True)
+def no_retry_delay():
+    with patch(
+        "backend.features.storybook.tasks.transfer.calculate_retry_delay",
+        return_value=0,
+    ):
+        yield
+
+
+def make_items(count, suffix="webp"):
+    return [
+        TransferItem(
+            idx=i,
+            url=f"https://cdn.example.com/{i}.{suffix}",
+            path=f"shared/books/1/images/page_{i + 1}.{suffix}",
+            content_type="image/webp",
+        )
+        for i in range(count)
+    ]
+
+
+class TestByteBudget:
+    """바이트 예산 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_waits_until_bytes_released(self):
+        budget = ByteBudget(100)
+        order = []
+
+        async def hold(name, nbytes, delay):
+            async with budget.reserve(nbytes):
+                order.append(f"{name}:start")
+                assert budget.in_use <= budget.capacity
+                await asyncio.sleep(delay)
+                order.append(f"{name}:end")
+
+        await asyncio.gather(hold("a", 70, 0.05), hold("b", 50, 0))
+
+        assert order == ["a:start", "a:end", "b:start", "b:end"]
+        assert budget.in_use == 0
+
+    @pytest.mark.asyncio
+    async def test_oversized_item_reserves_whole_budget(self):
+        budget = ByteBudget(100)
+
+        async with budget.reserve(10_000) as reserved:
+            assert reserved == 100
+            assert budget.available == 0
+
+
+class TestTransferToStorage:
+    """단일 항목 스트리밍 전송 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_streams_body_to_storage(self, storage, tmp_path):
+        body = b"x" * 300_000
+
+        with patch_cdn(lambda request: httpx.Response(200, content=body)), \
+                patch.multiple(settings, storage_stream_chunk_size=64 * 1024):
+            size = await transfer_to_storage(make_items(1)[0], storage, ByteBudget(1 << 20))
+
+        assert size == len(body)
+        assert (tmp_path / "shared/books/1/images/page_1.webp").read_bytes() == body
+        assert list((tmp_path / "shared/books/1/images").glob("*.part")) == []
+
+    @pytest.mark.asyncio
+    async def test_http_error_leaves_no_file(self, storage, tmp_path):
+        with patch_cdn(lambda request: httpx.Response(404)):
+            with pytest.raises(httpx.HTTPStatusError):
+                await transfer_to_storage(make_items(1)[0], storage, ByteBudget(1 << 20))
+
+        assert not (tmp_path / "shared/books/1/images/page_1.webp").exists()
+
+
+class TestTransferAll:
+    """병렬 전송 + 항목별 재시도 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_transfers_run_concurrently(self, storage):
+        in_flight = 0
+        peak = 0
+
+        async def slow_chunks(chunks, path, content_type=None):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.02)
+            async for _ in chunks:
+                pass
+            in_flight -= 1
+            return path
+
+        tracker = BatchRetryTracker(total_items=4, max_retries=2)
+
+        with patch_cdn(lambda request: httpx.Response(200, content=b"img")), \
+                patch.object(storage, "save_stream", side_effect=slow_chunks):
+            await transfer_all(make_items(4), storage, tracker, concurrency=3)
+
+        assert peak == 3
+        assert sorted(tracker.completed) == [0, 1, 2, 3]
+
+    @pytest.mark.asyncio
+    async def test_failed_item_retried_individually(self, storage, tmp_path):
+        calls = {}
+
+        def handler(request):
+            calls[request.url.path] = calls.get(request.url.path, 0) + 1
+            if request.url.path == "/1.webp" and calls[request.url.path] == 1:
+                return httpx.Response(503)
+            if request.url.path == "/2.webp":
+                return httpx.Response(500)
+            return httpx.Response(200, content=request.url.path.encode())
+
+        tracker = BatchRetryTracker(total_items=3, max_retries=2)
+
+        with patch_cdn(handler):
+            await transfer_all(make_items(3), storage, tracker)
+
+        assert calls == {"/0.webp": 1, "/1.webp": 2, "/2.webp": 2}
+        assert tracker.completed == {
+            0: "shared/books/1/images/page_1.webp",
+            1: "shared/books/1/images/page_2.webp",
+        }
+        assert tracker.get_failed_indices() == [2]
+        assert (tmp_path / "shared/books/1/images/page_2.webp").read_bytes() == b"/1.webp"
+
+    @pytest.mark.asyncio
+    async def test_skips_items_without_retry_budget(self, storage):
+        requested = []
+        tracker = BatchRetryTracker(total_items=2, max_retries=1)
+        tracker.mark_failure(1, "Generation failed - skipping storage")
+
+        def handler(request):
+            requested.append(request.url.path)
+            return httpx.Response(200, content=b"ok")
+
+        with patch_cdn(handler):
+            await transfer_all(make_items(2), storage, tracker)
+
+        assert requested == ["/0.webp"]
+
+    @pytest.mark.asyncio
+    async def test_on_saved_called_per_stored_item(self, storage):
+        saved = []
+
+        async def on_saved(idx, path):
+            saved.append((idx, path))
+
+        def handler(request):
+            if request.url.path == "/1.webp":
+                return httpx.Response(500)
+            return httpx.Response(200, content=b"ok")
+
+        tracker = BatchRetryTracker(total_items=2, max_retries=1)
+
+        with patch_cdn(handler):
+            await transfer_all(make_items(2), storage, tracker, on_saved=on_saved)
+
+        assert saved == [(0, "shared/books/1/images/page_1.webp")]
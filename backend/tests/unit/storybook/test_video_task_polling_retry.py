@@ -14,6 +14,17 @@ from backend.features.storybook.tasks.schemas import TaskContext, TaskResult, Ta
 from backend.features.storybook.models import Book, Page, BookStatus
 
 
+@pytest.fixture(autouse=True)
+def fast_polling():
+    """공유 폴러 대기 시간 단축 (폴러 타임아웃은 실제 경과 시간 기준)"""
+    with patch.dict("backend.infrastructure.ai.poller._pollers", clear=True), \
+         patch("backend.core.config.settings.task_poll_min_interval", 0.01), \
+         patch("backend.core.config.settings.task_image_poll_interval", 0.01), \
+         patch("backend.core.config.settings.task_video_poll_interval", 0.01), \
+         patch("backend.core.config.settings.task_video_max_wait_time", 0.2):
+        yield
+
+
 @pytest.fixture
 def task_context():
     """테스트용 TaskContext"""
@@ -175,7 +186,7 @@ class TestVideoTaskPollingWithTimeout:
         mock_semaphore.__aexit__ = AsyncMock()
 
         mock_limiters = MagicMock()
-        mock_limiters.video_generation = mock_semaphore
+        mock_limiters.limit.return_value = mock_semaphore
 
         with patch("backend.features.storybook.tasks.core.get_ai_factory", return_value=mock_ai_factory):
             with patch("backend.features.storybook.tasks.core.get_storage_service", return_value=mock_storage):
@@ -326,7 +337,7 @@ class TestVideoTaskPollingWithFailedStatus:
         mock_semaphore.__aenter__ = AsyncMock()
         mock_semaphore.__aexit__ = AsyncMock()
         mock_limiters = MagicMock()
-        mock_limiters.video_generation = mock_semaphore
+        mock_limiters.limit.return_value = mock_semaphore
 
         with patch("backend.features.storybook.tasks.core.get_ai_factory", return_value=mock_ai_factory):
             with patch("backend.features.storybook.tasks.core.get_storage_service", return_value=mock_storage):
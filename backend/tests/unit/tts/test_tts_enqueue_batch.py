@@ -0,0 +1,154 @@
+"""
+TTS Batch Enqueue Tests
+DialogueAudio 일괄 생성 + XADD 파이프라인 일괄 발행 테스트
+"""
+
+import json
+import uuid
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from backend.core.events.redis_streams_bus import RedisStreamsEventBus
+from backend.core.events.types import EventType
+from backend.features.storybook.tasks.core import generate_tts_task
+from backend.features.storybook.tasks.schemas import TaskContext, TaskStatus
+from backend.features.tts.producer import TTSProducer
+
+
+class FakePipeline:
+    def __init__(self, redis):
+        self.redis = redis
+        self.ops = []
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    def xadd(self, stream, fields, maxlen=None):
+        self.ops.append((stream, fields, maxlen))
+
+    async def execute(self):
+        self.redis.executed.append(self.ops)
+        return [f"{i}-0" for i in range(len(self.ops))]
+
+
+class FakeRedis:
+    """pipeline()/xadd()만 흉내내는 Redis 대역"""
+
+    def __init__(self):
+        self.executed = []
+        self.xadd = AsyncMock()
+
+    def pipeline(self, transaction=True):
+        return FakePipeline(self)
+
+
+class TestPublishMany:
+    """EventBus 일괄 발행 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_all_xadds_sent_in_one_pipeline(self):
+        bus = RedisStreamsEventBus(redis_url="redis://unused")
+        bus.redis = FakeRedis()
+
+        await bus.publish_many(
+            EventType.TTS_CREATION, [{"uuid": str(i), "text": f"t{i}"} for i in range(5)]
+        )
+
+        assert len(bus.redis.executed) == 1
+        ops = bus.redis.executed[0]
+        assert [stream for stream, _, _ in ops] == [f"events:{EventType.TTS_CREATION.value}"] * 5
+        assert [json.loads(fields["event"])["payload"]["uuid"] for _, fields, _ in ops] == [
+            "0", "1", "2", "3", "4"
+        ]
+        bus.redis.xadd.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_empty_payloads_skip_redis(self):
+        bus = RedisStreamsEventBus(redis_url="redis://unused")
+        bus.redis = FakeRedis()
+
+        await bus.publish_many(EventType.TTS_CREATION, [])
+
+        assert bus.redis.executed == []
+
+    @pytest.mark.asyncio
+    async def test_producer_enqueue_many(self):
+        event_bus = MagicMock()
+        event_bus.publish_many = AsyncMock()
+        ids = [uuid.uuid4(), uuid.uuid4()]
+
+        await TTSProducer(event_bus).enqueue_many([(ids[0], "hello"), (ids[1], "world")])
+
+        event_bus.publish_many.assert_awaited_once_with(
+            EventType.TTS_CREATION,
+            [{"uuid": str(ids[0]), "text": "hello"}, {"uuid": str(ids[1]), "text": "world"}],
+        )
+
+
+class TestGenerateTTSTaskBatch:
+    """generate_tts_task 일괄 처리 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_single_insert_and_single_enqueue(self):
+        book_id = uuid.uuid4()
+
+        def dialogue(seq, text):
+            return SimpleNamespace(
+                id=uuid.uuid4(),
+                sequence=seq,
+                translations=[
+                    SimpleNamespace(is_primary=True, text=text, language_code="en")
+                ],
+            )
+
+        pages = [
+            SimpleNamespace(sequence=1, dialogues=[dialogue(1, "a"), dialogue(2, "b")]),
+            SimpleNamespace(sequence=2, dialogues=[dialogue(1, "c"), dialogue(2, "  ")]),
+        ]
+        book = SimpleNamespace(
+            id=book_id,
+            user_id=uuid.uuid4(),
+            voice_id="voice-1",
+            is_default=False,
+            base_path=f"users/u/books/{book_id}",
+            pages=pages,
+        )
+
+        repo = AsyncMock()
+        repo.get_with_pages.return_value = book
+        repo.add_dialogue_audios.side_effect = lambda rows: [
+            SimpleNamespace(id=uuid.uuid4(), **row) for row in rows
+        ]
+        task_store = AsyncMock()
+        task_store.get.return_value = {"dialogues": [["[happy] a", "b"], ["c"]]}
+        producer = MagicMock()
+        producer.enqueue_many = AsyncMock()
+
+        context = TaskContext(
+            book_id=str(book_id), user_id=str(book.user_id), execution_id="e", retry_count=0
+        )
+
+        with patch("backend.features.storybook.tasks.core.AsyncSessionLocal") as session_cls, \
+                patch("backend.features.storybook.tasks.core.BookRepository", return_value=repo), \
+                patch("backend.features.storybook.tasks.core.TaskStore", return_value=task_store):
+            session_cls.return_value.__aenter__.return_value = AsyncMock()
+            result = await generate_tts_task(str(book_id), producer, context)
+
+        assert result.status == TaskStatus.COMPLETED
+        assert result.result == {"total_count": 3}
+
+        repo.add_dialogue_audios.assert_awaited_once()
+        rows = repo.add_dialogue_audios.await_args.args[0]
+        assert [row["dialogue_id"] for row in rows] == [
+            pages[0].dialogues[0].id, pages[0].dialogues[1].id, pages[1].dialogues[0].id
+        ]
+        assert all(row["status"] == "PENDING" and row["voice_id"] == "voice-1" for row in rows)
+
+        producer.enqueue_many.assert_awaited_once()
+        enqueued = producer.enqueue_many.await_args.args[0]
+        assert [text for _, text in enqueued] == ["[happy] a", "b", "c"]
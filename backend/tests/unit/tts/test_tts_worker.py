@@ -0,0 +1,186 @@
+"""
+TTS Worker Tests
+배치 읽기, XAUTOCLAIM 회수, Dead-letter 이동, 메트릭 테스트
+"""
+
+import asyncio
+import json
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from backend.features.tts.worker import (
+    TTS_DEAD_LETTER_STREAM,
+    TTS_STREAM,
+    TTS_WORKER_GROUP,
+    TTSWorker,
+    collect_tts_metrics,
+)
+
+
+def tts_message(uuid_str="00000000-0000-0000-0000-000000000001", text="hello"):
+    return {"event": json.dumps({"payload": {"uuid": uuid_str, "text": text}})}
+
+
+def make_redis():
+    redis = MagicMock()
+    for name in ("xgroup_create", "xreadgroup", "xautoclaim", "xpending_range",
+                 "xadd", "xack", "set", "close"):
+        setattr(redis, name, AsyncMock())
+    return redis
+
+
+@pytest.fixture
+def worker():
+    worker = TTSWorker(storage_service=MagicMock(), concurrency=3)
+    worker.redis = make_redis()
+    worker._mark_failed = AsyncMock()
+    return worker
+
+
+class TestBatchRead:
+    """빈 슬롯 수만큼 읽기 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_acquire_slots_takes_all_free_slots(self, worker):
+        await worker.semaphore.acquire()  # 1개는 처리 중
+
+        assert await worker._acquire_slots() == 2
+        assert worker.semaphore.locked()
+
+    @pytest.mark.asyncio
+    async def test_reads_batch_sized_to_free_slots(self, worker):
+        redis = worker.redis
+        counts = []
+
+        async def xreadgroup(group, consumer, streams, count, block):
+            counts.append(count)
+            if len(counts) == 1:
+                return [(TTS_STREAM, [("1-0", tts_message()), ("2-0", tts_message())])]
+            worker.running = False
+            return []
+
+        redis.xreadgroup.side_effect = xreadgroup
+        release = asyncio.Event()
+
+        async def process_message(msg_id, data):
+            await release.wait()
+
+        worker.process_message = process_message
+        worker.shutdown = AsyncMock()
+
+        with patch("backend.features.tts.worker.aioredis.from_url", return_value=redis):
+            runner = asyncio.create_task(worker.start())
+            await asyncio.sleep(0.01)
+            # 2개 처리 중 → 다음 읽기는 남은 1개 슬롯만큼
+            release.set()
+            await asyncio.wait_for(runner, timeout=1)
+
+        assert counts[0] == 3
+        assert counts[1] == 1
+
+        await asyncio.gather(*worker.active_tasks)
+        assert worker.semaphore._value == 3
+
+
+class TestReclaim:
+    """XAUTOCLAIM 회수 + Dead-letter 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_reclaims_stale_and_dead_letters_poison(self, worker):
+        worker.redis.xautoclaim.return_value = [
+            "0-0",
+            [("1-0", tts_message()), ("2-0", tts_message(text="poison")), ("3-0", None)],
+            [],
+        ]
+        deliveries = {"1-0": 2, "2-0": worker.max_deliveries + 1}
+        worker.redis.xpending_range.side_effect = lambda stream, group, min, max, count: [
+            {"message_id": min, "times_delivered": deliveries[min]}
+        ]
+        worker.process_message = AsyncMock()
+
+        spawned = await worker.reclaim()
+        await asyncio.gather(*worker.active_tasks)
+
+        assert spawned == 1
+        worker.process_message.assert_awaited_once_with("1-0", tts_message())
+        assert worker.redis.xautoclaim.await_args.kwargs["min_idle_time"] == (
+            worker.visibility_timeout * 1000
+        )
+
+        stream, fields = worker.redis.xadd.await_args.args
+        assert stream == TTS_DEAD_LETTER_STREAM
+        assert fields["original_id"] == "2-0"
+        assert json.loads(fields["event"])["payload"]["text"] == "poison"
+        worker.redis.xack.assert_awaited_once_with(TTS_STREAM, TTS_WORKER_GROUP, "2-0")
+        worker._mark_failed.assert_awaited_once()
+
+        assert worker.semaphore._value == 3
+        stats = worker.get_stats()
+        assert stats["reclaimed"] == 2
+        assert stats["dead_lettered"] == 1
+
+
+class TestProcessMessage:
+    """메시지 처리 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_success_acks_and_records_latency(self, worker):
+        worker.handle_tts_task = AsyncMock()
+
+        await worker.process_message("1700000000000-0", tts_message())
+
+        worker.redis.xack.assert_awaited_once_with(TTS_STREAM, TTS_WORKER_GROUP, "1700000000000-0")
+        stats = worker.get_stats()
+        assert stats["processed"] == 1
+        assert stats["avg_queue_time_ms"] > 0
+
+    @pytest.mark.asyncio
+    async def test_failure_left_pending_for_reclaim(self, worker):
+        worker.handle_tts_task = AsyncMock(side_effect=RuntimeError("db down"))
+
+        await worker.process_message("1-0", tts_message())
+
+        worker.redis.xack.assert_not_awaited()
+        worker.redis.xadd.assert_not_awaited()
+        assert worker.get_stats()["failed"] == 1
+
+    @pytest.mark.asyncio
+    async def test_invalid_message_dead_lettered(self, worker):
+        await worker.process_message("1-0", {"foo": "bar"})
+
+        assert worker.redis.xadd.await_args.args[0] == TTS_DEAD_LETTER_STREAM
+        worker.redis.xack.assert_awaited_once_with(TTS_STREAM, TTS_WORKER_GROUP, "1-0")
+        worker._mark_failed.assert_not_awaited()
+
+
+class TestCollectMetrics:
+    """큐/워커 메트릭 집계 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_aggregates_queue_and_worker_snapshots(self):
+        redis = MagicMock()
+        redis.xlen = AsyncMock(side_effect=lambda name: {TTS_STREAM: 50, TTS_DEAD_LETTER_STREAM: 2}[name])
+        redis.xinfo_groups = AsyncMock(return_value=[
+            {"name": "other", "pending": 9, "lag": 9},
+            {"name": TTS_WORKER_GROUP, "pending": 3, "lag": 7},
+        ])
+        snapshots = {
+            "tts_workers:metrics:a": json.dumps({"consumer": "a", "in_flight": 2}),
+            "tts_workers:metrics:b": json.dumps({"consumer": "b", "in_flight": 1}),
+        }
+
+        async def scan_iter(match):
+            for key in snapshots:
+                yield key
+
+        redis.scan_iter = scan_iter
+        redis.get = AsyncMock(side_effect=snapshots.get)
+
+        metrics = await collect_tts_metrics(redis)
+
+        assert metrics["queue_depth"] == 10
+        assert metrics["lag"] == 7
+        assert metrics["dead_letter_length"] == 2
+        assert metrics["in_flight"] == 3
+        assert [w["consumer"] for w in metrics["workers"]] == ["a", "b"]
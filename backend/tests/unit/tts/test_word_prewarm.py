@@ -0,0 +1,185 @@
+"""
+Book Word Prewarm Job Tests
+책 단어 오디오 사전 생성 작업 (등록, 중복 실행 방지, 진행 상황) 테스트
+"""
+
+import asyncio
+import time
+import uuid
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from backend.core.events.types import Event, EventType
+from backend.features.tts.word_prewarm import (
+    STATUS_COMPLETED,
+    STATUS_FAILED,
+    STATUS_QUEUED,
+    STATUS_RUNNING,
+    WordPrewarmJobs,
+)
+
+
+class FakePipeline:
+    def __init__(self, redis):
+        self.redis = redis
+        self.ops = []
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    def hset(self, key, mapping):
+        self.ops.append(lambda: self.redis.hashes.setdefault(key, {}).update(
+            {k: str(v) for k, v in mapping.items()}
+        ))
+
+    def expire(self, key, ttl):
+        self.ops.append(lambda: None)
+
+    async def execute(self):
+        return [op() for op in self.ops]
+
+
+class FakeRedis:
+    def __init__(self):
+        self.hashes = {}
+        self.strings = {}
+        self.expired = []
+
+    def pipeline(self, transaction=True):
+        return FakePipeline(self)
+
+    async def hgetall(self, key):
+        return dict(self.hashes.get(key, {}))
+
+    async def set(self, key, value, nx=False, ex=None):
+        if nx and key in self.strings:
+            return None
+        self.strings[key] = value
+        return True
+
+    async def get(self, key):
+        return self.strings.get(key)
+
+    async def delete(self, key):
+        self.strings.pop(key, None)
+
+    async def expire(self, key, ttl):
+        self.expired.append((key, ttl))
+
+
+@pytest.fixture
+def jobs():
+    jobs = WordPrewarmJobs(redis_url="redis://unused", event_bus=AsyncMock())
+    jobs._redis = FakeRedis()
+    return jobs
+
+
+class TestEnqueue:
+    """작업 등록 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_enqueue_publishes_and_records_queued(self, jobs):
+        book_id = uuid.uuid4()
+
+        progress = await jobs.enqueue(book_id)
+
+        assert progress["status"] == STATUS_QUEUED
+        assert progress["requested"] == 0
+        jobs.event_bus.publish.assert_awaited_once_with(
+            EventType.WORD_AUDIO_PREWARM, {"book_id": str(book_id)}
+        )
+
+    @pytest.mark.asyncio
+    async def test_enqueue_while_queued_is_noop(self, jobs):
+        book_id = uuid.uuid4()
+        await jobs.enqueue(book_id)
+        await jobs.enqueue(book_id)
+
+        assert jobs.event_bus.publish.await_count == 1
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("status", [STATUS_QUEUED, STATUS_RUNNING])
+    async def test_stalled_job_is_re_enqueued(self, jobs, status):
+        book_id = uuid.uuid4()
+        await jobs._save(book_id, status=status)
+        jobs._redis.hashes[f"tts:word_prewarm:{book_id}"]["updated_at"] = str(time.time() - 1000)
+
+        progress = await jobs.enqueue(book_id)
+
+        assert progress["status"] == STATUS_QUEUED
+        jobs.event_bus.publish.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_event_runs_job_in_background(self, jobs):
+        bus = AsyncMock()
+        await jobs.register(bus)
+        handler = bus.subscribe.await_args.args[1]
+
+        with patch.object(jobs, "run", AsyncMock()) as run:
+            await handler(Event.create(EventType.WORD_AUDIO_PREWARM, {"book_id": "b"}))
+            await next(iter(jobs._tasks))
+
+        run.assert_awaited_once_with("b")
+
+
+class TestRun:
+    """작업 실행 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_progress_saved_until_completed(self, jobs):
+        book_id = uuid.uuid4()
+
+        async def prewarm(book_id, on_progress):
+            await on_progress({"requested": 3, "existing": 1, "generated": 0, "failed": 0})
+            return {"requested": 3, "existing": 1, "generated": 2, "failed": 0}
+
+        with patch.object(jobs, "_prewarm", side_effect=prewarm):
+            summary = await jobs.run(book_id)
+
+        progress = await jobs.get_progress(book_id)
+        assert summary["generated"] == 2
+        assert progress["status"] == STATUS_COMPLETED
+        assert (progress["requested"], progress["generated"]) == (3, 2)
+        assert not jobs._redis.strings  # 락 해제
+
+    @pytest.mark.asyncio
+    async def test_heartbeat_refreshes_progress_and_lock(self, jobs):
+        book_id = uuid.uuid4()
+        progress_key = f"tts:word_prewarm:{book_id}"
+
+        async def prewarm(book_id, on_progress):
+            jobs._redis.hashes[progress_key]["updated_at"] = "0"
+            await asyncio.sleep(0.05)
+            assert float(jobs._redis.hashes[progress_key]["updated_at"]) > 0
+            return {"requested": 0, "existing": 0, "generated": 0, "failed": 0}
+
+        with patch.object(jobs, "_prewarm", side_effect=prewarm), \
+                patch("backend.features.tts.word_prewarm.settings.tts_word_prewarm_stale_seconds", 0.03):
+            assert await jobs.run(book_id) is not None
+
+        assert (f"tts:word_prewarm:{book_id}:lock", 0.03) in jobs._redis.expired
+
+    @pytest.mark.asyncio
+    async def test_running_job_is_not_duplicated(self, jobs):
+        book_id = uuid.uuid4()
+        await jobs._redis.set(f"tts:word_prewarm:{book_id}:lock", "other")
+
+        with patch.object(jobs, "_prewarm", AsyncMock()) as prewarm:
+            assert await jobs.run(book_id) is None
+
+        prewarm.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_failure_recorded(self, jobs):
+        book_id = uuid.uuid4()
+
+        with patch.object(jobs, "_prewarm", AsyncMock(side_effect=RuntimeError("no voice"))):
+            assert await jobs.run(book_id) is None
+
+        progress = await jobs.get_progress(book_id)
+        assert progress["status"] == STATUS_FAILED
+        assert progress["error"] == "no voice"
@@ -0,0 +1,172 @@
+"""
+Word Audio Single-Flight Tests
+단어 오디오 생성 요청 병합 (프로세스 내부 Future 공유, 프로세스 간 완료 알림 대기) 테스트
+"""
+
+import asyncio
+
+import pytest
+
+from backend.features.tts.exceptions import TTSGenerationFailedException
+from backend.features.tts.single_flight import DONE, FAILED, WordAudioSingleFlight
+
+
+class FakePubSub:
+    def __init__(self, redis):
+        self.redis = redis
+        self.channels = []
+
+    async def subscribe(self, channel):
+        self.channels.append(channel)
+        self.redis.subscribed.append(channel)
+
+    async def get_message(self, ignore_subscribe_messages=True, timeout=None):
+        if self.redis.messages:
+            return {"type": "message", "data": self.redis.messages.pop(0)}
+        await asyncio.sleep(timeout)
+        return None
+
+    async def unsubscribe(self, channel):
+        self.channels.remove(channel)
+
+    async def aclose(self):
+        pass
+
+
+class FakeRedis:
+    """락 / Pub/Sub 명령만 흉내내는 Redis 대역"""
+
+    def __init__(self, acquire=(), messages=()):
+        self.acquire = list(acquire)  # SET NX 결과 순서 (소진 후 성공)
+        self.messages = list(messages)
+        self.subscribed = []
+        self.published = []
+        self.released = []
+        self.set_calls = 0
+
+    async def set(self, key, value, nx=False, px=None):
+        self.set_calls += 1
+        return self.acquire.pop(0) if self.acquire else True
+
+    async def eval(self, script, numkeys, key, token):
+        self.released.append(key)
+        return 1
+
+    async def publish(self, channel, message):
+        self.published.append((channel, message))
+        return 1
+
+    def pubsub(self):
+        return FakePubSub(self)
+
+
+def make_single_flight(redis, timeout=1.0):
+    single_flight = WordAudioSingleFlight(redis_url="redis://unused", timeout=timeout)
+    single_flight._redis = redis
+    return single_flight
+
+
+async def not_done():
+    return False
+
+
+class TestInProcess:
+    """프로세스 내부 병합 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_calls_share_one_future(self):
+        redis = FakeRedis()
+        single_flight = make_single_flight(redis)
+        calls = 0
+
+        async def produce():
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            return b"audio"
+
+        results = await asyncio.gather(*(single_flight.run("h", not_done, produce) for _ in range(10)))
+
+        assert results == [b"audio"] * 10
+        assert calls == 1
+        assert redis.set_calls == 1
+        assert redis.published == [("tts:done:h", DONE)]
+        assert redis.released == ["tts:generating:h"]
+        assert not single_flight._inflight
+
+    @pytest.mark.asyncio
+    async def test_failure_reaches_waiters_and_is_not_cached(self):
+        redis = FakeRedis()
+        single_flight = make_single_flight(redis)
+
+        async def produce():
+            await asyncio.sleep(0.01)
+            raise TTSGenerationFailedException(reason="boom")
+
+        results = await asyncio.gather(
+            *(single_flight.run("h", not_done, produce) for _ in range(3)),
+            return_exceptions=True,
+        )
+
+        assert all(isinstance(r, TTSGenerationFailedException) for r in results)
+        assert redis.published == [("tts:done:h", FAILED)]
+        assert not single_flight._inflight
+
+
+class TestCrossProcess:
+    """프로세스 간 완료 알림 대기 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_waiter_returns_on_done_message(self):
+        redis = FakeRedis(acquire=[None], messages=[DONE])
+        single_flight = make_single_flight(redis)
+
+        async def produce():
+            raise AssertionError("lock holder generates")
+
+        assert await single_flight.run("h", not_done, produce) is None
+        assert redis.set_calls == 1
+        assert redis.subscribed == ["tts:done:h"]
+
+    @pytest.mark.asyncio
+    async def test_checks_store_after_subscribing(self):
+        redis = FakeRedis(acquire=[None])
+        single_flight = make_single_flight(redis)
+
+        async def is_done():
+            # 구독 이후에 확인해야 그 사이 완료된 생성을 놓치지 않음
+            return redis.subscribed == ["tts:done:h"]
+
+        assert await single_flight.run("h", is_done, not_done) is None
+
+    @pytest.mark.asyncio
+    async def test_remote_failure_takes_over_generation(self):
+        redis = FakeRedis(acquire=[None], messages=[FAILED])
+        single_flight = make_single_flight(redis)
+
+        async def produce():
+            return b"audio"
+
+        assert await single_flight.run("h", not_done, produce) == b"audio"
+        assert redis.set_calls == 2
+
+    @pytest.mark.asyncio
+    async def test_timeout_raises(self):
+        redis = FakeRedis(acquire=[None] * 10)
+        single_flight = make_single_flight(redis, timeout=0.05)
+
+        with pytest.raises(TTSGenerationFailedException):
+            await single_flight.run("h", not_done, not_done)
+
+    @pytest.mark.asyncio
+    async def test_redis_error_generates_without_lock(self):
+        class BrokenRedis(FakeRedis):
+            async def set(self, *args, **kwargs):
+                raise ConnectionError("down")
+
+        single_flight = make_single_flight(BrokenRedis())
+
+        async def produce():
+            return b"audio"
+
+        assert await single_flight.run("h", not_done, produce) == b"audio"
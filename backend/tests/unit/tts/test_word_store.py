@@ -0,0 +1,377 @@
+"""
+Word Audio Store Tests
+책 간 공유 단어 오디오 저장소 (콘텐츠 주소 키, Redis 인덱스, TTSService 재사용 / 사전 생성) 테스트
+"""
+
+import asyncio
+import uuid
+import pytest
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from backend.features.tts.exceptions import BookVoiceNotConfiguredException
+from backend.features.tts.service import TTSService
+from backend.features.tts.single_flight import WordAudioSingleFlight
+from backend.features.tts.word_store import (
+    WordAudioEntry,
+    WordAudioIndex,
+    build_word_audio_key,
+    extract_words,
+    normalize_word,
+)
+from backend.infrastructure.ai.providers.elevenlabs_tts import ElevenLabsTTSProvider
+from backend.infrastructure.storage.base import AbstractStorageService
+
+
+class FakeRedis:
+    """Hash 명령만 흉내내는 Redis 대역 (호출 횟수 기록)"""
+
+    def __init__(self):
+        self.hashes = {}
+        self.ttls = {}
+        self.calls = []
+
+    def pipeline(self, transaction=True):
+        return FakePipeline(self)
+
+    async def hget(self, key, field):
+        self.calls.append("hget")
+        return self.hashes.get(key, {}).get(field)
+
+    async def hmget(self, key, fields):
+        self.calls.append("hmget")
+        stored = self.hashes.get(key, {})
+        return [stored.get(f) for f in fields]
+
+    async def delete(self, key):
+        self.hashes.pop(key, None)
+
+    async def close(self):
+        pass
+
+
+class FakePipeline:
+    def __init__(self, redis):
+        self.redis = redis
+        self.ops = []
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    def hset(self, key, field=None, value=None, mapping=None):
+        self.ops.append(("hset", key, mapping if mapping is not None else {field: value}))
+
+    def expire(self, key, ttl):
+        self.ops.append(("expire", key, ttl))
+
+    async def execute(self):
+        self.redis.calls.append("pipeline")
+        for op in self.ops:
+            if op[0] == "hset":
+                self.redis.hashes.setdefault(op[1], {}).update(op[2])
+            elif op[0] == "expire":
+                self.redis.ttls[op[1]] = op[2]
+        return [True] * len(self.ops)
+
+
+@pytest.fixture
+def fake_redis():
+    return FakeRedis()
+
+
+@pytest.fixture
+def word_index(fake_redis):
+    index = WordAudioIndex(redis_url="redis://unused", book_ttl=100)
+    index._redis = fake_redis
+    return index
+
+
+@pytest.fixture
+def tts_provider():
+    provider = MagicMock()
+    provider.get_synthesis_profile = MagicMock(
+        return_value={"model_id": "eleven_v3", "pronunciation_version": None}
+    )
+
+    async def stream(**kwargs):
+        yield b"mp3-"
+        yield b"bytes"
+
+    provider.text_to_speech_stream = MagicMock(side_effect=stream)
+    return provider
+
+
+@pytest.fixture
+def storage():
+    storage = MagicMock(spec=AbstractStorageService)
+    storage.exists = AsyncMock(return_value=False)
+    storage.save = AsyncMock(side_effect=lambda data, path, content_type=None: path)
+
+    async def save_stream(chunks, path, content_type=None):
+        storage.streamed[path] = b"".join([chunk async for chunk in chunks])
+        return path
+
+    storage.streamed = {}
+    storage.save_stream = AsyncMock(side_effect=save_stream)
+    storage.get = AsyncMock(return_value=b"stored-bytes")
+    storage.get_url = MagicMock(side_effect=lambda path: f"/api/v1/files/{path}")
+    return storage
+
+
+@pytest.fixture
+def service(word_index, tts_provider, storage):
+    ai_factory = MagicMock()
+    ai_factory.get_tts_provider = MagicMock(return_value=tts_provider)
+
+    cache_service = MagicMock()
+    cache_service.get = AsyncMock(return_value=None)
+    cache_service.set = AsyncMock(return_value=True)
+    cache_service.delete = AsyncMock()
+
+    single_flight = WordAudioSingleFlight(redis_url="redis://unused")
+    single_flight._redis = MagicMock()
+    single_flight._redis.set = AsyncMock(return_value=True)
+    single_flight._redis.eval = AsyncMock(return_value=1)
+    single_flight._redis.publish = AsyncMock(return_value=0)
+
+    return TTSService(
+        audio_repo=MagicMock(),
+        voice_repo=MagicMock(),
+        storage_service=storage,
+        ai_factory=ai_factory,
+        db_session=MagicMock(),
+        cache_service=cache_service,
+        event_bus=MagicMock(),
+        word_index=word_index,
+        single_flight=single_flight,
+    )
+
+
+def make_book(voice_id="voice-1"):
+    return SimpleNamespace(
+        id=uuid.uuid4(),
+        voice_id=voice_id,
+        base_path=f"shared/books/{uuid.uuid4()}",
+    )
+
+
+def patch_book_repo(*books, texts=()):
+    books_by_id = {book.id: book for book in books}
+    repo = MagicMock()
+    repo.get = AsyncMock(side_effect=lambda book_id: books_by_id.get(book_id))
+    repo.get_dialogue_texts = AsyncMock(return_value=list(texts))
+    return patch("backend.features.storybook.repository.BookRepository", return_value=repo)
+
+
+class TestWordAudioKey:
+    """콘텐츠 주소 키 테스트"""
+
+    def test_normalize_word(self):
+        assert normalize_word("  Hello ") == "hello"
+        assert normalize_word("ice   cream") == "ice cream"
+        assert normalize_word("Café") == normalize_word("Café")
+
+    def test_same_inputs_same_key(self):
+        first = build_word_audio_key("Hello", "voice-1", "eleven_v3")
+        second = build_word_audio_key("hello ", "voice-1", "eleven_v3")
+
+        assert first.content_hash == second.content_hash
+        assert first.storage_path == (
+            f"shared/words/voice-1/{first.content_hash[:2]}/{first.content_hash}.mp3"
+        )
+
+    def test_extract_words_dedupes_in_order(self):
+        texts = ["The cat's hat, it’s RED!", "3 cats and the ice-cream.", "고양이가 좋아요"]
+
+        assert extract_words(texts) == [
+            "the", "cat's", "hat", "it's", "red", "cats", "and", "ice-cream", "고양이가", "좋아요",
+        ]
+        assert extract_words(["a " + "x" * 51]) == ["a"]
+
+    def test_voice_model_and_dictionary_change_key(self):
+        base = build_word_audio_key("a", "voice-1", "eleven_v3").content_hash
+
+        assert build_word_audio_key("a", "voice-2", "eleven_v3").content_hash != base
+        assert build_word_audio_key("a", "voice-1", "eleven_flash_v2").content_hash != base
+        assert build_word_audio_key("a", "voice-1", "eleven_v3", "dict:v2").content_hash != base
+
+
+class TestWordAudioIndex:
+    """Redis 인덱스 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_register_and_resolve(self, word_index, fake_redis):
+        book_id = uuid.uuid4()
+        key = build_word_audio_key("Hello", "voice-1", "eleven_v3")
+        await word_index.register(key, book_id=book_id)
+
+        fake_redis.calls.clear()
+        entry = await word_index.resolve(book_id, "HELLO")
+
+        assert entry == WordAudioEntry(path=key.storage_path, voice_id="voice-1")
+        assert fake_redis.calls == ["hget"]
+        assert await word_index.lookup(key.content_hash) == key.storage_path
+        assert fake_redis.ttls[word_index._book_key(book_id)] == 100
+
+    @pytest.mark.asyncio
+    async def test_redis_error_is_a_miss(self, word_index):
+        broken = MagicMock()
+        broken.hget = AsyncMock(side_effect=ConnectionError("down"))
+        broken.hmget = AsyncMock(side_effect=ConnectionError("down"))
+        word_index._redis = broken
+
+        assert await word_index.resolve(uuid.uuid4(), "hello") is None
+        assert await word_index.lookup_many(["a", "b"]) == {"a": None, "b": None}
+
+
+class TestTTSServiceWordStore:
+    """TTSService 전역 단어 오디오 재사용 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_same_word_shared_across_books(self, service, tts_provider, storage):
+        book_a, book_b = make_book(), make_book()
+
+        with patch_book_repo(book_a, book_b):
+            first = await service.generate_word_tts(book_id=book_a.id, word="Hello")
+            second = await service.generate_word_tts(book_id=book_b.id, word="hello")
+
+        assert tts_provider.text_to_speech_stream.call_count == 1
+        assert first["cached"] is False
+        assert second["cached"] is True
+        assert first["file_path"] == second["file_path"]
+        assert first["file_path"].startswith("/shared/words/voice-1/")
+        storage.save_stream.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_index_hit_skips_db_and_storage(self, service, storage, fake_redis):
+        book = make_book()
+        with patch_book_repo(book):
+            await service.generate_word_tts(book_id=book.id, word="cat")
+
+        storage.exists.reset_mock()
+        fake_redis.calls.clear()
+
+        with patch_book_repo() as repo_cls:
+            result = await service.generate_word_tts(book_id=book.id, word="cat")
+
+        assert result["cached"] is True
+        assert result["voice_id"] == "voice-1"
+        assert fake_redis.calls == ["hget"]
+        storage.exists.assert_not_awaited()
+        repo_cls.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_legacy_book_file_linked(self, service, tts_provider, storage):
+        book = make_book()
+        storage.exists = AsyncMock(return_value=True)
+
+        with patch_book_repo(book):
+            result = await service.generate_word_tts(book_id=book.id, word="dog")
+
+        assert result["file_path"] == f"/{book.base_path}/words/dog.mp3"
+        tts_provider.text_to_speech_stream.assert_not_called()
+        assert (await service.word_index.resolve(book.id, "dog")).path == f"{book.base_path}/words/dog.mp3"
+
+    @pytest.mark.asyncio
+    async def test_generate_and_save_loads_existing_audio(self, service, tts_provider, storage):
+        first = await service.generate_and_save_word_audio(word="sun", file_path="x/words/sun.mp3", voice_id="v")
+        second = await service.generate_and_save_word_audio(word="sun", file_path="y/words/sun.mp3", voice_id="v")
+
+        assert first == b"mp3-bytes"
+        assert second == b"stored-bytes"
+        assert tts_provider.text_to_speech_stream.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_concurrent_requests_share_one_generation(self, service, tts_provider, storage):
+        async def slow_stream(**kwargs):
+            await asyncio.sleep(0.01)
+            yield b"mp3-bytes"
+
+        tts_provider.text_to_speech_stream.side_effect = slow_stream
+
+        results = await asyncio.gather(*(
+            service.generate_and_save_word_audio(word="moon", file_path=f"b{i}/words/moon.mp3", voice_id="v")
+            for i in range(5)
+        ))
+
+        assert results == [b"mp3-bytes"] * 5
+        assert tts_provider.text_to_speech_stream.call_count == 1
+        storage.get.assert_not_awaited()
+        service.single_flight._redis.set.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_prewarm_generates_only_missing(self, service, tts_provider, fake_redis):
+        await service.generate_and_save_word_audio(word="the", file_path="p", voice_id="voice-1")
+        tts_provider.text_to_speech_stream.reset_mock()
+
+        summary = await service.prewarm_word_audio(
+            voice_id="voice-1",
+            words=["the", "and", "The", "a.b"],
+            concurrency=2,
+        )
+
+        assert summary == {"requested": 2, "existing": 1, "generated": 1, "failed": 0}
+        assert tts_provider.text_to_speech_stream.call_count == 1
+        assert "hmget" in fake_redis.calls
+
+    @pytest.mark.asyncio
+    async def test_prewarm_counts_concurrently_stored_as_existing(self, service):
+        # 조회 이후 다른 프로세스가 생성을 마친 단어 (_ensure_word_audio가 None 반환)
+        with patch.object(service, "_ensure_word_audio", AsyncMock(return_value=None)):
+            summary = await service.prewarm_word_audio(voice_id="voice-1", words=["the", "and"])
+
+        assert summary == {"requested": 2, "existing": 2, "generated": 0, "failed": 0}
+
+
+class TestBookWordPrewarm:
+    """책 전체 단어 사전 생성 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_generates_missing_and_links_all_words(self, service, tts_provider):
+        book = make_book()
+        await service.generate_and_save_word_audio(word="the", file_path="p", voice_id="voice-1")
+        tts_provider.text_to_speech_stream.reset_mock()
+        progress = []
+
+        async def on_progress(summary):
+            progress.append(summary)
+
+        with patch_book_repo(book, texts=["The cat.", "The dog and the cat!"]):
+            summary = await service.prewarm_book_word_audio(book.id, on_progress=on_progress)
+
+        assert summary == {"requested": 4, "existing": 1, "generated": 3, "failed": 0}
+        assert tts_provider.text_to_speech_stream.call_count == 3
+        assert progress[0]["generated"] == 0 and progress[-1] == summary
+        for word in ("the", "cat", "dog", "and"):
+            assert await service.word_index.resolve(book.id, word) is not None
+
+    @pytest.mark.asyncio
+    async def test_book_without_voice_rejected(self, service):
+        book = make_book(voice_id=None)
+
+        with patch_book_repo(book), pytest.raises(BookVoiceNotConfiguredException):
+            await service.prewarm_book_word_audio(book.id)
+
+
+class TestElevenLabsSynthesisProfile:
+    """Provider 합성 설정 (키에 포함되는 모델 / 발음 사전) 테스트"""
+
+    def test_single_letter_uses_flash_model_and_dictionary(self):
+        with patch("backend.infrastructure.ai.providers.elevenlabs_tts.AsyncElevenLabs"), \
+                patch("backend.infrastructure.ai.providers.elevenlabs_tts.settings") as mock_settings:
+            mock_settings.tts_default_model_id = "eleven_v3"
+            mock_settings.pronunciation_dictionary_id = "dict"
+            mock_settings.pronunciation_version_id = "v2"
+            provider = ElevenLabsTTSProvider(api_key="key")
+
+        assert provider.get_synthesis_profile("a") == {
+            "model_id": "eleven_flash_v2",
+            "pronunciation_version": "dict:v2",
+        }
+        assert provider.get_synthesis_profile("apple") == {
+            "model_id": "eleven_v3",
+            "pronunciation_version": None,
+        }